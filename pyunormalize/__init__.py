@@ -22,11 +22,42 @@ if sys.version_info < (3, 6):
 del sys
 
 __all__ = [
+    "FCC",
+    "IncrementalNormalizer",
+    "InterningNormalizer",
     "NFC",
     "NFD",
     "NFKC",
+    "NFKC_CF",
     "NFKD",
+    "NormalizedDict",
+    "NormalizedSet",
+    "NormalizingReader",
+    "NormalizingWriter",
+    "cached",
+    "canonical_caseless_key",
+    "compatibility_caseless_key",
+    "concat_normalized",
+    "dedupe",
+    "find_normalized",
+    "finditer_normalized",
+    "group_equivalent",
+    "has_boundary_after",
+    "has_boundary_before",
+    "is_FCD",
+    "iter_segments",
     "normalize",
+    "normalize_array",
+    "normalize_codepoints",
+    "normalize_column",
+    "normalize_file",
+    "normalize_identifiers",
+    "normalize_many",
+    "normalize_utf8",
+    "quick_check_many",
+    "register_codecs",
+    "renormalize_edit",
+    "strip_marks",
     "UCD_VERSION",
     "UNICODE_VERSION",
     "__version__",
@@ -49,3 +80,13 @@ if _UNICODE_VERSION != UNICODE_VERSION:
 del _UNICODE_VERSION
 
 from pyunormalize.normalization import *
+from pyunormalize.folding import *
+from pyunormalize.incremental import *
+from pyunormalize.search import *
+from pyunormalize.bulk import *
+from pyunormalize.buffers import *
+from pyunormalize.vectorized import *
+from pyunormalize.caching import *
+from pyunormalize.containers import *
+from pyunormalize.textcodecs import *
+from pyunormalize.streams import *
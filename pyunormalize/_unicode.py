@@ -8367,4 +8367,7974 @@ _NFKD_QC_NO = set([
     *range(0x2F800, 0x2FA1D + 1),
 ])
 
+# Dictionary mapping characters to their NFKC_Casefold (NFKC_CF) mappings,
+# with an empty mapping for characters removed by NFKC_Casefold
+_NFKC_CF_BY_CHARACTER = {
+    0x00041: [0x0061],
+    0x00042: [0x0062],
+    0x00043: [0x0063],
+    0x00044: [0x0064],
+    0x00045: [0x0065],
+    0x00046: [0x0066],
+    0x00047: [0x0067],
+    0x00048: [0x0068],
+    0x00049: [0x0069],
+    0x0004A: [0x006A],
+    0x0004B: [0x006B],
+    0x0004C: [0x006C],
+    0x0004D: [0x006D],
+    0x0004E: [0x006E],
+    0x0004F: [0x006F],
+    0x00050: [0x0070],
+    0x00051: [0x0071],
+    0x00052: [0x0072],
+    0x00053: [0x0073],
+    0x00054: [0x0074],
+    0x00055: [0x0075],
+    0x00056: [0x0076],
+    0x00057: [0x0077],
+    0x00058: [0x0078],
+    0x00059: [0x0079],
+    0x0005A: [0x007A],
+    0x000A0: [0x0020],
+    0x000A8: [0x0020, 0x0308],
+    0x000AA: [0x0061],
+    0x000AD: [],
+    0x000AF: [0x0020, 0x0304],
+    0x000B2: [0x0032],
+    0x000B3: [0x0033],
+    0x000B4: [0x0020, 0x0301],
+    0x000B5: [0x03BC],
+    0x000B8: [0x0020, 0x0327],
+    0x000B9: [0x0031],
+    0x000BA: [0x006F],
+    0x000BC: [0x0031, 0x2044, 0x0034],
+    0x000BD: [0x0031, 0x2044, 0x0032],
+    0x000BE: [0x0033, 0x2044, 0x0034],
+    0x000C0: [0x00E0],
+    0x000C1: [0x00E1],
+    0x000C2: [0x00E2],
+    0x000C3: [0x00E3],
+    0x000C4: [0x00E4],
+    0x000C5: [0x00E5],
+    0x000C6: [0x00E6],
+    0x000C7: [0x00E7],
+    0x000C8: [0x00E8],
+    0x000C9: [0x00E9],
+    0x000CA: [0x00EA],
+    0x000CB: [0x00EB],
+    0x000CC: [0x00EC],
+    0x000CD: [0x00ED],
+    0x000CE: [0x00EE],
+    0x000CF: [0x00EF],
+    0x000D0: [0x00F0],
+    0x000D1: [0x00F1],
+    0x000D2: [0x00F2],
+    0x000D3: [0x00F3],
+    0x000D4: [0x00F4],
+    0x000D5: [0x00F5],
+    0x000D6: [0x00F6],
+    0x000D8: [0x00F8],
+    0x000D9: [0x00F9],
+    0x000DA: [0x00FA],
+    0x000DB: [0x00FB],
+    0x000DC: [0x00FC],
+    0x000DD: [0x00FD],
+    0x000DE: [0x00FE],
+    0x000DF: [0x0073, 0x0073],
+    0x00100: [0x0101],
+    0x00102: [0x0103],
+    0x00104: [0x0105],
+    0x00106: [0x0107],
+    0x00108: [0x0109],
+    0x0010A: [0x010B],
+    0x0010C: [0x010D],
+    0x0010E: [0x010F],
+    0x00110: [0x0111],
+    0x00112: [0x0113],
+    0x00114: [0x0115],
+    0x00116: [0x0117],
+    0x00118: [0x0119],
+    0x0011A: [0x011B],
+    0x0011C: [0x011D],
+    0x0011E: [0x011F],
+    0x00120: [0x0121],
+    0x00122: [0x0123],
+    0x00124: [0x0125],
+    0x00126: [0x0127],
+    0x00128: [0x0129],
+    0x0012A: [0x012B],
+    0x0012C: [0x012D],
+    0x0012E: [0x012F],
+    0x00130: [0x0069, 0x0307],
+    0x00132: [0x0069, 0x006A],
+    0x00133: [0x0069, 0x006A],
+    0x00134: [0x0135],
+    0x00136: [0x0137],
+    0x00139: [0x013A],
+    0x0013B: [0x013C],
+    0x0013D: [0x013E],
+    0x0013F: [0x006C, 0x00B7],
+    0x00140: [0x006C, 0x00B7],
+    0x00141: [0x0142],
+    0x00143: [0x0144],
+    0x00145: [0x0146],
+    0x00147: [0x0148],
+    0x00149: [0x02BC, 0x006E],
+    0x0014A: [0x014B],
+    0x0014C: [0x014D],
+    0x0014E: [0x014F],
+    0x00150: [0x0151],
+    0x00152: [0x0153],
+    0x00154: [0x0155],
+    0x00156: [0x0157],
+    0x00158: [0x0159],
+    0x0015A: [0x015B],
+    0x0015C: [0x015D],
+    0x0015E: [0x015F],
+    0x00160: [0x0161],
+    0x00162: [0x0163],
+    0x00164: [0x0165],
+    0x00166: [0x0167],
+    0x00168: [0x0169],
+    0x0016A: [0x016B],
+    0x0016C: [0x016D],
+    0x0016E: [0x016F],
+    0x00170: [0x0171],
+    0x00172: [0x0173],
+    0x00174: [0x0175],
+    0x00176: [0x0177],
+    0x00178: [0x00FF],
+    0x00179: [0x017A],
+    0x0017B: [0x017C],
+    0x0017D: [0x017E],
+    0x0017F: [0x0073],
+    0x00181: [0x0253],
+    0x00182: [0x0183],
+    0x00184: [0x0185],
+    0x00186: [0x0254],
+    0x00187: [0x0188],
+    0x00189: [0x0256],
+    0x0018A: [0x0257],
+    0x0018B: [0x018C],
+    0x0018E: [0x01DD],
+    0x0018F: [0x0259],
+    0x00190: [0x025B],
+    0x00191: [0x0192],
+    0x00193: [0x0260],
+    0x00194: [0x0263],
+    0x00196: [0x0269],
+    0x00197: [0x0268],
+    0x00198: [0x0199],
+    0x0019C: [0x026F],
+    0x0019D: [0x0272],
+    0x0019F: [0x0275],
+    0x001A0: [0x01A1],
+    0x001A2: [0x01A3],
+    0x001A4: [0x01A5],
+    0x001A6: [0x0280],
+    0x001A7: [0x01A8],
+    0x001A9: [0x0283],
+    0x001AC: [0x01AD],
+    0x001AE: [0x0288],
+    0x001AF: [0x01B0],
+    0x001B1: [0x028A],
+    0x001B2: [0x028B],
+    0x001B3: [0x01B4],
+    0x001B5: [0x01B6],
+    0x001B7: [0x0292],
+    0x001B8: [0x01B9],
+    0x001BC: [0x01BD],
+    0x001C4: [0x0064, 0x017E],
+    0x001C5: [0x0064, 0x017E],
+    0x001C6: [0x0064, 0x017E],
+    0x001C7: [0x006C, 0x006A],
+    0x001C8: [0x006C, 0x006A],
+    0x001C9: [0x006C, 0x006A],
+    0x001CA: [0x006E, 0x006A],
+    0x001CB: [0x006E, 0x006A],
+    0x001CC: [0x006E, 0x006A],
+    0x001CD: [0x01CE],
+    0x001CF: [0x01D0],
+    0x001D1: [0x01D2],
+    0x001D3: [0x01D4],
+    0x001D5: [0x01D6],
+    0x001D7: [0x01D8],
+    0x001D9: [0x01DA],
+    0x001DB: [0x01DC],
+    0x001DE: [0x01DF],
+    0x001E0: [0x01E1],
+    0x001E2: [0x01E3],
+    0x001E4: [0x01E5],
+    0x001E6: [0x01E7],
+    0x001E8: [0x01E9],
+    0x001EA: [0x01EB],
+    0x001EC: [0x01ED],
+    0x001EE: [0x01EF],
+    0x001F1: [0x0064, 0x007A],
+    0x001F2: [0x0064, 0x007A],
+    0x001F3: [0x0064, 0x007A],
+    0x001F4: [0x01F5],
+    0x001F6: [0x0195],
+    0x001F7: [0x01BF],
+    0x001F8: [0x01F9],
+    0x001FA: [0x01FB],
+    0x001FC: [0x01FD],
+    0x001FE: [0x01FF],
+    0x00200: [0x0201],
+    0x00202: [0x0203],
+    0x00204: [0x0205],
+    0x00206: [0x0207],
+    0x00208: [0x0209],
+    0x0020A: [0x020B],
+    0x0020C: [0x020D],
+    0x0020E: [0x020F],
+    0x00210: [0x0211],
+    0x00212: [0x0213],
+    0x00214: [0x0215],
+    0x00216: [0x0217],
+    0x00218: [0x0219],
+    0x0021A: [0x021B],
+    0x0021C: [0x021D],
+    0x0021E: [0x021F],
+    0x00220: [0x019E],
+    0x00222: [0x0223],
+    0x00224: [0x0225],
+    0x00226: [0x0227],
+    0x00228: [0x0229],
+    0x0022A: [0x022B],
+    0x0022C: [0x022D],
+    0x0022E: [0x022F],
+    0x00230: [0x0231],
+    0x00232: [0x0233],
+    0x0023A: [0x2C65],
+    0x0023B: [0x023C],
+    0x0023D: [0x019A],
+    0x0023E: [0x2C66],
+    0x00241: [0x0242],
+    0x00243: [0x0180],
+    0x00244: [0x0289],
+    0x00245: [0x028C],
+    0x00246: [0x0247],
+    0x00248: [0x0249],
+    0x0024A: [0x024B],
+    0x0024C: [0x024D],
+    0x0024E: [0x024F],
+    0x002B0: [0x0068],
+    0x002B1: [0x0266],
+    0x002B2: [0x006A],
+    0x002B3: [0x0072],
+    0x002B4: [0x0279],
+    0x002B5: [0x027B],
+    0x002B6: [0x0281],
+    0x002B7: [0x0077],
+    0x002B8: [0x0079],
+    0x002D8: [0x0020, 0x0306],
+    0x002D9: [0x0020, 0x0307],
+    0x002DA: [0x0020, 0x030A],
+    0x002DB: [0x0020, 0x0328],
+    0x002DC: [0x0020, 0x0303],
+    0x002DD: [0x0020, 0x030B],
+    0x002E0: [0x0263],
+    0x002E1: [0x006C],
+    0x002E2: [0x0073],
+    0x002E3: [0x0078],
+    0x002E4: [0x0295],
+    0x00340: [0x0300],
+    0x00341: [0x0301],
+    0x00343: [0x0313],
+    0x00344: [0x0308, 0x0301],
+    0x00345: [0x03B9],
+    0x0034F: [],
+    0x00370: [0x0371],
+    0x00372: [0x0373],
+    0x00374: [0x02B9],
+    0x00376: [0x0377],
+    0x0037A: [0x0020, 0x03B9],
+    0x0037E: [0x003B],
+    0x0037F: [0x03F3],
+    0x00384: [0x0020, 0x0301],
+    0x00385: [0x0020, 0x0308, 0x0301],
+    0x00386: [0x03AC],
+    0x00387: [0x00B7],
+    0x00388: [0x03AD],
+    0x00389: [0x03AE],
+    0x0038A: [0x03AF],
+    0x0038C: [0x03CC],
+    0x0038E: [0x03CD],
+    0x0038F: [0x03CE],
+    0x00391: [0x03B1],
+    0x00392: [0x03B2],
+    0x00393: [0x03B3],
+    0x00394: [0x03B4],
+    0x00395: [0x03B5],
+    0x00396: [0x03B6],
+    0x00397: [0x03B7],
+    0x00398: [0x03B8],
+    0x00399: [0x03B9],
+    0x0039A: [0x03BA],
+    0x0039B: [0x03BB],
+    0x0039C: [0x03BC],
+    0x0039D: [0x03BD],
+    0x0039E: [0x03BE],
+    0x0039F: [0x03BF],
+    0x003A0: [0x03C0],
+    0x003A1: [0x03C1],
+    0x003A3: [0x03C3],
+    0x003A4: [0x03C4],
+    0x003A5: [0x03C5],
+    0x003A6: [0x03C6],
+    0x003A7: [0x03C7],
+    0x003A8: [0x03C8],
+    0x003A9: [0x03C9],
+    0x003AA: [0x03CA],
+    0x003AB: [0x03CB],
+    0x003C2: [0x03C3],
+    0x003CF: [0x03D7],
+    0x003D0: [0x03B2],
+    0x003D1: [0x03B8],
+    0x003D2: [0x03C5],
+    0x003D3: [0x03CD],
+    0x003D4: [0x03CB],
+    0x003D5: [0x03C6],
+    0x003D6: [0x03C0],
+    0x003D8: [0x03D9],
+    0x003DA: [0x03DB],
+    0x003DC: [0x03DD],
+    0x003DE: [0x03DF],
+    0x003E0: [0x03E1],
+    0x003E2: [0x03E3],
+    0x003E4: [0x03E5],
+    0x003E6: [0x03E7],
+    0x003E8: [0x03E9],
+    0x003EA: [0x03EB],
+    0x003EC: [0x03ED],
+    0x003EE: [0x03EF],
+    0x003F0: [0x03BA],
+    0x003F1: [0x03C1],
+    0x003F2: [0x03C3],
+    0x003F4: [0x03B8],
+    0x003F5: [0x03B5],
+    0x003F7: [0x03F8],
+    0x003F9: [0x03C3],
+    0x003FA: [0x03FB],
+    0x003FD: [0x037B],
+    0x003FE: [0x037C],
+    0x003FF: [0x037D],
+    0x00400: [0x0450],
+    0x00401: [0x0451],
+    0x00402: [0x0452],
+    0x00403: [0x0453],
+    0x00404: [0x0454],
+    0x00405: [0x0455],
+    0x00406: [0x0456],
+    0x00407: [0x0457],
+    0x00408: [0x0458],
+    0x00409: [0x0459],
+    0x0040A: [0x045A],
+    0x0040B: [0x045B],
+    0x0040C: [0x045C],
+    0x0040D: [0x045D],
+    0x0040E: [0x045E],
+    0x0040F: [0x045F],
+    0x00410: [0x0430],
+    0x00411: [0x0431],
+    0x00412: [0x0432],
+    0x00413: [0x0433],
+    0x00414: [0x0434],
+    0x00415: [0x0435],
+    0x00416: [0x0436],
+    0x00417: [0x0437],
+    0x00418: [0x0438],
+    0x00419: [0x0439],
+    0x0041A: [0x043A],
+    0x0041B: [0x043B],
+    0x0041C: [0x043C],
+    0x0041D: [0x043D],
+    0x0041E: [0x043E],
+    0x0041F: [0x043F],
+    0x00420: [0x0440],
+    0x00421: [0x0441],
+    0x00422: [0x0442],
+    0x00423: [0x0443],
+    0x00424: [0x0444],
+    0x00425: [0x0445],
+    0x00426: [0x0446],
+    0x00427: [0x0447],
+    0x00428: [0x0448],
+    0x00429: [0x0449],
+    0x0042A: [0x044A],
+    0x0042B: [0x044B],
+    0x0042C: [0x044C],
+    0x0042D: [0x044D],
+    0x0042E: [0x044E],
+    0x0042F: [0x044F],
+    0x00460: [0x0461],
+    0x00462: [0x0463],
+    0x00464: [0x0465],
+    0x00466: [0x0467],
+    0x00468: [0x0469],
+    0x0046A: [0x046B],
+    0x0046C: [0x046D],
+    0x0046E: [0x046F],
+    0x00470: [0x0471],
+    0x00472: [0x0473],
+    0x00474: [0x0475],
+    0x00476: [0x0477],
+    0x00478: [0x0479],
+    0x0047A: [0x047B],
+    0x0047C: [0x047D],
+    0x0047E: [0x047F],
+    0x00480: [0x0481],
+    0x0048A: [0x048B],
+    0x0048C: [0x048D],
+    0x0048E: [0x048F],
+    0x00490: [0x0491],
+    0x00492: [0x0493],
+    0x00494: [0x0495],
+    0x00496: [0x0497],
+    0x00498: [0x0499],
+    0x0049A: [0x049B],
+    0x0049C: [0x049D],
+    0x0049E: [0x049F],
+    0x004A0: [0x04A1],
+    0x004A2: [0x04A3],
+    0x004A4: [0x04A5],
+    0x004A6: [0x04A7],
+    0x004A8: [0x04A9],
+    0x004AA: [0x04AB],
+    0x004AC: [0x04AD],
+    0x004AE: [0x04AF],
+    0x004B0: [0x04B1],
+    0x004B2: [0x04B3],
+    0x004B4: [0x04B5],
+    0x004B6: [0x04B7],
+    0x004B8: [0x04B9],
+    0x004BA: [0x04BB],
+    0x004BC: [0x04BD],
+    0x004BE: [0x04BF],
+    0x004C0: [0x04CF],
+    0x004C1: [0x04C2],
+    0x004C3: [0x04C4],
+    0x004C5: [0x04C6],
+    0x004C7: [0x04C8],
+    0x004C9: [0x04CA],
+    0x004CB: [0x04CC],
+    0x004CD: [0x04CE],
+    0x004D0: [0x04D1],
+    0x004D2: [0x04D3],
+    0x004D4: [0x04D5],
+    0x004D6: [0x04D7],
+    0x004D8: [0x04D9],
+    0x004DA: [0x04DB],
+    0x004DC: [0x04DD],
+    0x004DE: [0x04DF],
+    0x004E0: [0x04E1],
+    0x004E2: [0x04E3],
+    0x004E4: [0x04E5],
+    0x004E6: [0x04E7],
+    0x004E8: [0x04E9],
+    0x004EA: [0x04EB],
+    0x004EC: [0x04ED],
+    0x004EE: [0x04EF],
+    0x004F0: [0x04F1],
+    0x004F2: [0x04F3],
+    0x004F4: [0x04F5],
+    0x004F6: [0x04F7],
+    0x004F8: [0x04F9],
+    0x004FA: [0x04FB],
+    0x004FC: [0x04FD],
+    0x004FE: [0x04FF],
+    0x00500: [0x0501],
+    0x00502: [0x0503],
+    0x00504: [0x0505],
+    0x00506: [0x0507],
+    0x00508: [0x0509],
+    0x0050A: [0x050B],
+    0x0050C: [0x050D],
+    0x0050E: [0x050F],
+    0x00510: [0x0511],
+    0x00512: [0x0513],
+    0x00514: [0x0515],
+    0x00516: [0x0517],
+    0x00518: [0x0519],
+    0x0051A: [0x051B],
+    0x0051C: [0x051D],
+    0x0051E: [0x051F],
+    0x00520: [0x0521],
+    0x00522: [0x0523],
+    0x00524: [0x0525],
+    0x00526: [0x0527],
+    0x00528: [0x0529],
+    0x0052A: [0x052B],
+    0x0052C: [0x052D],
+    0x0052E: [0x052F],
+    0x00531: [0x0561],
+    0x00532: [0x0562],
+    0x00533: [0x0563],
+    0x00534: [0x0564],
+    0x00535: [0x0565],
+    0x00536: [0x0566],
+    0x00537: [0x0567],
+    0x00538: [0x0568],
+    0x00539: [0x0569],
+    0x0053A: [0x056A],
+    0x0053B: [0x056B],
+    0x0053C: [0x056C],
+    0x0053D: [0x056D],
+    0x0053E: [0x056E],
+    0x0053F: [0x056F],
+    0x00540: [0x0570],
+    0x00541: [0x0571],
+    0x00542: [0x0572],
+    0x00543: [0x0573],
+    0x00544: [0x0574],
+    0x00545: [0x0575],
+    0x00546: [0x0576],
+    0x00547: [0x0577],
+    0x00548: [0x0578],
+    0x00549: [0x0579],
+    0x0054A: [0x057A],
+    0x0054B: [0x057B],
+    0x0054C: [0x057C],
+    0x0054D: [0x057D],
+    0x0054E: [0x057E],
+    0x0054F: [0x057F],
+    0x00550: [0x0580],
+    0x00551: [0x0581],
+    0x00552: [0x0582],
+    0x00553: [0x0583],
+    0x00554: [0x0584],
+    0x00555: [0x0585],
+    0x00556: [0x0586],
+    0x00587: [0x0565, 0x0582],
+    0x0061C: [],
+    0x00675: [0x0627, 0x0674],
+    0x00676: [0x0648, 0x0674],
+    0x00677: [0x06C7, 0x0674],
+    0x00678: [0x064A, 0x0674],
+    0x00958: [0x0915, 0x093C],
+    0x00959: [0x0916, 0x093C],
+    0x0095A: [0x0917, 0x093C],
+    0x0095B: [0x091C, 0x093C],
+    0x0095C: [0x0921, 0x093C],
+    0x0095D: [0x0922, 0x093C],
+    0x0095E: [0x092B, 0x093C],
+    0x0095F: [0x092F, 0x093C],
+    0x009DC: [0x09A1, 0x09BC],
+    0x009DD: [0x09A2, 0x09BC],
+    0x009DF: [0x09AF, 0x09BC],
+    0x00A33: [0x0A32, 0x0A3C],
+    0x00A36: [0x0A38, 0x0A3C],
+    0x00A59: [0x0A16, 0x0A3C],
+    0x00A5A: [0x0A17, 0x0A3C],
+    0x00A5B: [0x0A1C, 0x0A3C],
+    0x00A5E: [0x0A2B, 0x0A3C],
+    0x00B5C: [0x0B21, 0x0B3C],
+    0x00B5D: [0x0B22, 0x0B3C],
+    0x00E33: [0x0E4D, 0x0E32],
+    0x00EB3: [0x0ECD, 0x0EB2],
+    0x00EDC: [0x0EAB, 0x0E99],
+    0x00EDD: [0x0EAB, 0x0EA1],
+    0x00F0C: [0x0F0B],
+    0x00F43: [0x0F42, 0x0FB7],
+    0x00F4D: [0x0F4C, 0x0FB7],
+    0x00F52: [0x0F51, 0x0FB7],
+    0x00F57: [0x0F56, 0x0FB7],
+    0x00F5C: [0x0F5B, 0x0FB7],
+    0x00F69: [0x0F40, 0x0FB5],
+    0x00F73: [0x0F71, 0x0F72],
+    0x00F75: [0x0F71, 0x0F74],
+    0x00F76: [0x0FB2, 0x0F80],
+    0x00F77: [0x0FB2, 0x0F71, 0x0F80],
+    0x00F78: [0x0FB3, 0x0F80],
+    0x00F79: [0x0FB3, 0x0F71, 0x0F80],
+    0x00F81: [0x0F71, 0x0F80],
+    0x00F93: [0x0F92, 0x0FB7],
+    0x00F9D: [0x0F9C, 0x0FB7],
+    0x00FA2: [0x0FA1, 0x0FB7],
+    0x00FA7: [0x0FA6, 0x0FB7],
+    0x00FAC: [0x0FAB, 0x0FB7],
+    0x00FB9: [0x0F90, 0x0FB5],
+    0x010A0: [0x2D00],
+    0x010A1: [0x2D01],
+    0x010A2: [0x2D02],
+    0x010A3: [0x2D03],
+    0x010A4: [0x2D04],
+    0x010A5: [0x2D05],
+    0x010A6: [0x2D06],
+    0x010A7: [0x2D07],
+    0x010A8: [0x2D08],
+    0x010A9: [0x2D09],
+    0x010AA: [0x2D0A],
+    0x010AB: [0x2D0B],
+    0x010AC: [0x2D0C],
+    0x010AD: [0x2D0D],
+    0x010AE: [0x2D0E],
+    0x010AF: [0x2D0F],
+    0x010B0: [0x2D10],
+    0x010B1: [0x2D11],
+    0x010B2: [0x2D12],
+    0x010B3: [0x2D13],
+    0x010B4: [0x2D14],
+    0x010B5: [0x2D15],
+    0x010B6: [0x2D16],
+    0x010B7: [0x2D17],
+    0x010B8: [0x2D18],
+    0x010B9: [0x2D19],
+    0x010BA: [0x2D1A],
+    0x010BB: [0x2D1B],
+    0x010BC: [0x2D1C],
+    0x010BD: [0x2D1D],
+    0x010BE: [0x2D1E],
+    0x010BF: [0x2D1F],
+    0x010C0: [0x2D20],
+    0x010C1: [0x2D21],
+    0x010C2: [0x2D22],
+    0x010C3: [0x2D23],
+    0x010C4: [0x2D24],
+    0x010C5: [0x2D25],
+    0x010C7: [0x2D27],
+    0x010CD: [0x2D2D],
+    0x010FC: [0x10DC],
+    **dict.fromkeys(range(0x0115F, 0x01160 + 1), []),
+    0x013F8: [0x13F0],
+    0x013F9: [0x13F1],
+    0x013FA: [0x13F2],
+    0x013FB: [0x13F3],
+    0x013FC: [0x13F4],
+    0x013FD: [0x13F5],
+    **dict.fromkeys(range(0x017B4, 0x017B5 + 1), []),
+    **dict.fromkeys(range(0x0180B, 0x0180F + 1), []),
+    0x01C80: [0x0432],
+    0x01C81: [0x0434],
+    0x01C82: [0x043E],
+    0x01C83: [0x0441],
+    0x01C84: [0x0442],
+    0x01C85: [0x0442],
+    0x01C86: [0x044A],
+    0x01C87: [0x0463],
+    0x01C88: [0xA64B],
+    0x01C89: [0x1C8A],
+    0x01C90: [0x10D0],
+    0x01C91: [0x10D1],
+    0x01C92: [0x10D2],
+    0x01C93: [0x10D3],
+    0x01C94: [0x10D4],
+    0x01C95: [0x10D5],
+    0x01C96: [0x10D6],
+    0x01C97: [0x10D7],
+    0x01C98: [0x10D8],
+    0x01C99: [0x10D9],
+    0x01C9A: [0x10DA],
+    0x01C9B: [0x10DB],
+    0x01C9C: [0x10DC],
+    0x01C9D: [0x10DD],
+    0x01C9E: [0x10DE],
+    0x01C9F: [0x10DF],
+    0x01CA0: [0x10E0],
+    0x01CA1: [0x10E1],
+    0x01CA2: [0x10E2],
+    0x01CA3: [0x10E3],
+    0x01CA4: [0x10E4],
+    0x01CA5: [0x10E5],
+    0x01CA6: [0x10E6],
+    0x01CA7: [0x10E7],
+    0x01CA8: [0x10E8],
+    0x01CA9: [0x10E9],
+    0x01CAA: [0x10EA],
+    0x01CAB: [0x10EB],
+    0x01CAC: [0x10EC],
+    0x01CAD: [0x10ED],
+    0x01CAE: [0x10EE],
+    0x01CAF: [0x10EF],
+    0x01CB0: [0x10F0],
+    0x01CB1: [0x10F1],
+    0x01CB2: [0x10F2],
+    0x01CB3: [0x10F3],
+    0x01CB4: [0x10F4],
+    0x01CB5: [0x10F5],
+    0x01CB6: [0x10F6],
+    0x01CB7: [0x10F7],
+    0x01CB8: [0x10F8],
+    0x01CB9: [0x10F9],
+    0x01CBA: [0x10FA],
+    0x01CBD: [0x10FD],
+    0x01CBE: [0x10FE],
+    0x01CBF: [0x10FF],
+    0x01D2C: [0x0061],
+    0x01D2D: [0x00E6],
+    0x01D2E: [0x0062],
+    0x01D30: [0x0064],
+    0x01D31: [0x0065],
+    0x01D32: [0x01DD],
+    0x01D33: [0x0067],
+    0x01D34: [0x0068],
+    0x01D35: [0x0069],
+    0x01D36: [0x006A],
+    0x01D37: [0x006B],
+    0x01D38: [0x006C],
+    0x01D39: [0x006D],
+    0x01D3A: [0x006E],
+    0x01D3C: [0x006F],
+    0x01D3D: [0x0223],
+    0x01D3E: [0x0070],
+    0x01D3F: [0x0072],
+    0x01D40: [0x0074],
+    0x01D41: [0x0075],
+    0x01D42: [0x0077],
+    0x01D43: [0x0061],
+    0x01D44: [0x0250],
+    0x01D45: [0x0251],
+    0x01D46: [0x1D02],
+    0x01D47: [0x0062],
+    0x01D48: [0x0064],
+    0x01D49: [0x0065],
+    0x01D4A: [0x0259],
+    0x01D4B: [0x025B],
+    0x01D4C: [0x025C],
+    0x01D4D: [0x0067],
+    0x01D4F: [0x006B],
+    0x01D50: [0x006D],
+    0x01D51: [0x014B],
+    0x01D52: [0x006F],
+    0x01D53: [0x0254],
+    0x01D54: [0x1D16],
+    0x01D55: [0x1D17],
+    0x01D56: [0x0070],
+    0x01D57: [0x0074],
+    0x01D58: [0x0075],
+    0x01D59: [0x1D1D],
+    0x01D5A: [0x026F],
+    0x01D5B: [0x0076],
+    0x01D5C: [0x1D25],
+    0x01D5D: [0x03B2],
+    0x01D5E: [0x03B3],
+    0x01D5F: [0x03B4],
+    0x01D60: [0x03C6],
+    0x01D61: [0x03C7],
+    0x01D62: [0x0069],
+    0x01D63: [0x0072],
+    0x01D64: [0x0075],
+    0x01D65: [0x0076],
+    0x01D66: [0x03B2],
+    0x01D67: [0x03B3],
+    0x01D68: [0x03C1],
+    0x01D69: [0x03C6],
+    0x01D6A: [0x03C7],
+    0x01D78: [0x043D],
+    0x01D9B: [0x0252],
+    0x01D9C: [0x0063],
+    0x01D9D: [0x0255],
+    0x01D9E: [0x00F0],
+    0x01D9F: [0x025C],
+    0x01DA0: [0x0066],
+    0x01DA1: [0x025F],
+    0x01DA2: [0x0261],
+    0x01DA3: [0x0265],
+    0x01DA4: [0x0268],
+    0x01DA5: [0x0269],
+    0x01DA6: [0x026A],
+    0x01DA7: [0x1D7B],
+    0x01DA8: [0x029D],
+    0x01DA9: [0x026D],
+    0x01DAA: [0x1D85],
+    0x01DAB: [0x029F],
+    0x01DAC: [0x0271],
+    0x01DAD: [0x0270],
+    0x01DAE: [0x0272],
+    0x01DAF: [0x0273],
+    0x01DB0: [0x0274],
+    0x01DB1: [0x0275],
+    0x01DB2: [0x0278],
+    0x01DB3: [0x0282],
+    0x01DB4: [0x0283],
+    0x01DB5: [0x01AB],
+    0x01DB6: [0x0289],
+    0x01DB7: [0x028A],
+    0x01DB8: [0x1D1C],
+    0x01DB9: [0x028B],
+    0x01DBA: [0x028C],
+    0x01DBB: [0x007A],
+    0x01DBC: [0x0290],
+    0x01DBD: [0x0291],
+    0x01DBE: [0x0292],
+    0x01DBF: [0x03B8],
+    0x01E00: [0x1E01],
+    0x01E02: [0x1E03],
+    0x01E04: [0x1E05],
+    0x01E06: [0x1E07],
+    0x01E08: [0x1E09],
+    0x01E0A: [0x1E0B],
+    0x01E0C: [0x1E0D],
+    0x01E0E: [0x1E0F],
+    0x01E10: [0x1E11],
+    0x01E12: [0x1E13],
+    0x01E14: [0x1E15],
+    0x01E16: [0x1E17],
+    0x01E18: [0x1E19],
+    0x01E1A: [0x1E1B],
+    0x01E1C: [0x1E1D],
+    0x01E1E: [0x1E1F],
+    0x01E20: [0x1E21],
+    0x01E22: [0x1E23],
+    0x01E24: [0x1E25],
+    0x01E26: [0x1E27],
+    0x01E28: [0x1E29],
+    0x01E2A: [0x1E2B],
+    0x01E2C: [0x1E2D],
+    0x01E2E: [0x1E2F],
+    0x01E30: [0x1E31],
+    0x01E32: [0x1E33],
+    0x01E34: [0x1E35],
+    0x01E36: [0x1E37],
+    0x01E38: [0x1E39],
+    0x01E3A: [0x1E3B],
+    0x01E3C: [0x1E3D],
+    0x01E3E: [0x1E3F],
+    0x01E40: [0x1E41],
+    0x01E42: [0x1E43],
+    0x01E44: [0x1E45],
+    0x01E46: [0x1E47],
+    0x01E48: [0x1E49],
+    0x01E4A: [0x1E4B],
+    0x01E4C: [0x1E4D],
+    0x01E4E: [0x1E4F],
+    0x01E50: [0x1E51],
+    0x01E52: [0x1E53],
+    0x01E54: [0x1E55],
+    0x01E56: [0x1E57],
+    0x01E58: [0x1E59],
+    0x01E5A: [0x1E5B],
+    0x01E5C: [0x1E5D],
+    0x01E5E: [0x1E5F],
+    0x01E60: [0x1E61],
+    0x01E62: [0x1E63],
+    0x01E64: [0x1E65],
+    0x01E66: [0x1E67],
+    0x01E68: [0x1E69],
+    0x01E6A: [0x1E6B],
+    0x01E6C: [0x1E6D],
+    0x01E6E: [0x1E6F],
+    0x01E70: [0x1E71],
+    0x01E72: [0x1E73],
+    0x01E74: [0x1E75],
+    0x01E76: [0x1E77],
+    0x01E78: [0x1E79],
+    0x01E7A: [0x1E7B],
+    0x01E7C: [0x1E7D],
+    0x01E7E: [0x1E7F],
+    0x01E80: [0x1E81],
+    0x01E82: [0x1E83],
+    0x01E84: [0x1E85],
+    0x01E86: [0x1E87],
+    0x01E88: [0x1E89],
+    0x01E8A: [0x1E8B],
+    0x01E8C: [0x1E8D],
+    0x01E8E: [0x1E8F],
+    0x01E90: [0x1E91],
+    0x01E92: [0x1E93],
+    0x01E94: [0x1E95],
+    0x01E9A: [0x0061, 0x02BE],
+    0x01E9B: [0x1E61],
+    0x01E9E: [0x0073, 0x0073],
+    0x01EA0: [0x1EA1],
+    0x01EA2: [0x1EA3],
+    0x01EA4: [0x1EA5],
+    0x01EA6: [0x1EA7],
+    0x01EA8: [0x1EA9],
+    0x01EAA: [0x1EAB],
+    0x01EAC: [0x1EAD],
+    0x01EAE: [0x1EAF],
+    0x01EB0: [0x1EB1],
+    0x01EB2: [0x1EB3],
+    0x01EB4: [0x1EB5],
+    0x01EB6: [0x1EB7],
+    0x01EB8: [0x1EB9],
+    0x01EBA: [0x1EBB],
+    0x01EBC: [0x1EBD],
+    0x01EBE: [0x1EBF],
+    0x01EC0: [0x1EC1],
+    0x01EC2: [0x1EC3],
+    0x01EC4: [0x1EC5],
+    0x01EC6: [0x1EC7],
+    0x01EC8: [0x1EC9],
+    0x01ECA: [0x1ECB],
+    0x01ECC: [0x1ECD],
+    0x01ECE: [0x1ECF],
+    0x01ED0: [0x1ED1],
+    0x01ED2: [0x1ED3],
+    0x01ED4: [0x1ED5],
+    0x01ED6: [0x1ED7],
+    0x01ED8: [0x1ED9],
+    0x01EDA: [0x1EDB],
+    0x01EDC: [0x1EDD],
+    0x01EDE: [0x1EDF],
+    0x01EE0: [0x1EE1],
+    0x01EE2: [0x1EE3],
+    0x01EE4: [0x1EE5],
+    0x01EE6: [0x1EE7],
+    0x01EE8: [0x1EE9],
+    0x01EEA: [0x1EEB],
+    0x01EEC: [0x1EED],
+    0x01EEE: [0x1EEF],
+    0x01EF0: [0x1EF1],
+    0x01EF2: [0x1EF3],
+    0x01EF4: [0x1EF5],
+    0x01EF6: [0x1EF7],
+    0x01EF8: [0x1EF9],
+    0x01EFA: [0x1EFB],
+    0x01EFC: [0x1EFD],
+    0x01EFE: [0x1EFF],
+    0x01F08: [0x1F00],
+    0x01F09: [0x1F01],
+    0x01F0A: [0x1F02],
+    0x01F0B: [0x1F03],
+    0x01F0C: [0x1F04],
+    0x01F0D: [0x1F05],
+    0x01F0E: [0x1F06],
+    0x01F0F: [0x1F07],
+    0x01F18: [0x1F10],
+    0x01F19: [0x1F11],
+    0x01F1A: [0x1F12],
+    0x01F1B: [0x1F13],
+    0x01F1C: [0x1F14],
+    0x01F1D: [0x1F15],
+    0x01F28: [0x1F20],
+    0x01F29: [0x1F21],
+    0x01F2A: [0x1F22],
+    0x01F2B: [0x1F23],
+    0x01F2C: [0x1F24],
+    0x01F2D: [0x1F25],
+    0x01F2E: [0x1F26],
+    0x01F2F: [0x1F27],
+    0x01F38: [0x1F30],
+    0x01F39: [0x1F31],
+    0x01F3A: [0x1F32],
+    0x01F3B: [0x1F33],
+    0x01F3C: [0x1F34],
+    0x01F3D: [0x1F35],
+    0x01F3E: [0x1F36],
+    0x01F3F: [0x1F37],
+    0x01F48: [0x1F40],
+    0x01F49: [0x1F41],
+    0x01F4A: [0x1F42],
+    0x01F4B: [0x1F43],
+    0x01F4C: [0x1F44],
+    0x01F4D: [0x1F45],
+    0x01F59: [0x1F51],
+    0x01F5B: [0x1F53],
+    0x01F5D: [0x1F55],
+    0x01F5F: [0x1F57],
+    0x01F68: [0x1F60],
+    0x01F69: [0x1F61],
+    0x01F6A: [0x1F62],
+    0x01F6B: [0x1F63],
+    0x01F6C: [0x1F64],
+    0x01F6D: [0x1F65],
+    0x01F6E: [0x1F66],
+    0x01F6F: [0x1F67],
+    0x01F71: [0x03AC],
+    0x01F73: [0x03AD],
+    0x01F75: [0x03AE],
+    0x01F77: [0x03AF],
+    0x01F79: [0x03CC],
+    0x01F7B: [0x03CD],
+    0x01F7D: [0x03CE],
+    0x01F80: [0x1F00, 0x03B9],
+    0x01F81: [0x1F01, 0x03B9],
+    0x01F82: [0x1F02, 0x03B9],
+    0x01F83: [0x1F03, 0x03B9],
+    0x01F84: [0x1F04, 0x03B9],
+    0x01F85: [0x1F05, 0x03B9],
+    0x01F86: [0x1F06, 0x03B9],
+    0x01F87: [0x1F07, 0x03B9],
+    0x01F88: [0x1F00, 0x03B9],
+    0x01F89: [0x1F01, 0x03B9],
+    0x01F8A: [0x1F02, 0x03B9],
+    0x01F8B: [0x1F03, 0x03B9],
+    0x01F8C: [0x1F04, 0x03B9],
+    0x01F8D: [0x1F05, 0x03B9],
+    0x01F8E: [0x1F06, 0x03B9],
+    0x01F8F: [0x1F07, 0x03B9],
+    0x01F90: [0x1F20, 0x03B9],
+    0x01F91: [0x1F21, 0x03B9],
+    0x01F92: [0x1F22, 0x03B9],
+    0x01F93: [0x1F23, 0x03B9],
+    0x01F94: [0x1F24, 0x03B9],
+    0x01F95: [0x1F25, 0x03B9],
+    0x01F96: [0x1F26, 0x03B9],
+    0x01F97: [0x1F27, 0x03B9],
+    0x01F98: [0x1F20, 0x03B9],
+    0x01F99: [0x1F21, 0x03B9],
+    0x01F9A: [0x1F22, 0x03B9],
+    0x01F9B: [0x1F23, 0x03B9],
+    0x01F9C: [0x1F24, 0x03B9],
+    0x01F9D: [0x1F25, 0x03B9],
+    0x01F9E: [0x1F26, 0x03B9],
+    0x01F9F: [0x1F27, 0x03B9],
+    0x01FA0: [0x1F60, 0x03B9],
+    0x01FA1: [0x1F61, 0x03B9],
+    0x01FA2: [0x1F62, 0x03B9],
+    0x01FA3: [0x1F63, 0x03B9],
+    0x01FA4: [0x1F64, 0x03B9],
+    0x01FA5: [0x1F65, 0x03B9],
+    0x01FA6: [0x1F66, 0x03B9],
+    0x01FA7: [0x1F67, 0x03B9],
+    0x01FA8: [0x1F60, 0x03B9],
+    0x01FA9: [0x1F61, 0x03B9],
+    0x01FAA: [0x1F62, 0x03B9],
+    0x01FAB: [0x1F63, 0x03B9],
+    0x01FAC: [0x1F64, 0x03B9],
+    0x01FAD: [0x1F65, 0x03B9],
+    0x01FAE: [0x1F66, 0x03B9],
+    0x01FAF: [0x1F67, 0x03B9],
+    0x01FB2: [0x1F70, 0x03B9],
+    0x01FB3: [0x03B1, 0x03B9],
+    0x01FB4: [0x03AC, 0x03B9],
+    0x01FB7: [0x1FB6, 0x03B9],
+    0x01FB8: [0x1FB0],
+    0x01FB9: [0x1FB1],
+    0x01FBA: [0x1F70],
+    0x01FBB: [0x03AC],
+    0x01FBC: [0x03B1, 0x03B9],
+    0x01FBD: [0x0020, 0x0313],
+    0x01FBE: [0x03B9],
+    0x01FBF: [0x0020, 0x0313],
+    0x01FC0: [0x0020, 0x0342],
+    0x01FC1: [0x0020, 0x0308, 0x0342],
+    0x01FC2: [0x1F74, 0x03B9],
+    0x01FC3: [0x03B7, 0x03B9],
+    0x01FC4: [0x03AE, 0x03B9],
+    0x01FC7: [0x1FC6, 0x03B9],
+    0x01FC8: [0x1F72],
+    0x01FC9: [0x03AD],
+    0x01FCA: [0x1F74],
+    0x01FCB: [0x03AE],
+    0x01FCC: [0x03B7, 0x03B9],
+    0x01FCD: [0x0020, 0x0313, 0x0300],
+    0x01FCE: [0x0020, 0x0313, 0x0301],
+    0x01FCF: [0x0020, 0x0313, 0x0342],
+    0x01FD3: [0x0390],
+    0x01FD8: [0x1FD0],
+    0x01FD9: [0x1FD1],
+    0x01FDA: [0x1F76],
+    0x01FDB: [0x03AF],
+    0x01FDD: [0x0020, 0x0314, 0x0300],
+    0x01FDE: [0x0020, 0x0314, 0x0301],
+    0x01FDF: [0x0020, 0x0314, 0x0342],
+    0x01FE3: [0x03B0],
+    0x01FE8: [0x1FE0],
+    0x01FE9: [0x1FE1],
+    0x01FEA: [0x1F7A],
+    0x01FEB: [0x03CD],
+    0x01FEC: [0x1FE5],
+    0x01FED: [0x0020, 0x0308, 0x0300],
+    0x01FEE: [0x0020, 0x0308, 0x0301],
+    0x01FEF: [0x0060],
+    0x01FF2: [0x1F7C, 0x03B9],
+    0x01FF3: [0x03C9, 0x03B9],
+    0x01FF4: [0x03CE, 0x03B9],
+    0x01FF7: [0x1FF6, 0x03B9],
+    0x01FF8: [0x1F78],
+    0x01FF9: [0x03CC],
+    0x01FFA: [0x1F7C],
+    0x01FFB: [0x03CE],
+    0x01FFC: [0x03C9, 0x03B9],
+    0x01FFD: [0x0020, 0x0301],
+    0x01FFE: [0x0020, 0x0314],
+    0x02000: [0x0020],
+    0x02001: [0x0020],
+    0x02002: [0x0020],
+    0x02003: [0x0020],
+    0x02004: [0x0020],
+    0x02005: [0x0020],
+    0x02006: [0x0020],
+    0x02007: [0x0020],
+    0x02008: [0x0020],
+    0x02009: [0x0020],
+    0x0200A: [0x0020],
+    **dict.fromkeys(range(0x0200B, 0x0200F + 1), []),
+    0x02011: [0x2010],
+    0x02017: [0x0020, 0x0333],
+    0x02024: [0x002E],
+    0x02025: [0x002E, 0x002E],
+    0x02026: [0x002E, 0x002E, 0x002E],
+    **dict.fromkeys(range(0x0202A, 0x0202E + 1), []),
+    0x0202F: [0x0020],
+    0x02033: [0x2032, 0x2032],
+    0x02034: [0x2032, 0x2032, 0x2032],
+    0x02036: [0x2035, 0x2035],
+    0x02037: [0x2035, 0x2035, 0x2035],
+    0x0203C: [0x0021, 0x0021],
+    0x0203E: [0x0020, 0x0305],
+    0x02047: [0x003F, 0x003F],
+    0x02048: [0x003F, 0x0021],
+    0x02049: [0x0021, 0x003F],
+    0x02057: [0x2032, 0x2032, 0x2032, 0x2032],
+    0x0205F: [0x0020],
+    **dict.fromkeys(range(0x02060, 0x0206F + 1), []),
+    0x02070: [0x0030],
+    0x02071: [0x0069],
+    0x02074: [0x0034],
+    0x02075: [0x0035],
+    0x02076: [0x0036],
+    0x02077: [0x0037],
+    0x02078: [0x0038],
+    0x02079: [0x0039],
+    0x0207A: [0x002B],
+    0x0207B: [0x2212],
+    0x0207C: [0x003D],
+    0x0207D: [0x0028],
+    0x0207E: [0x0029],
+    0x0207F: [0x006E],
+    0x02080: [0x0030],
+    0x02081: [0x0031],
+    0x02082: [0x0032],
+    0x02083: [0x0033],
+    0x02084: [0x0034],
+    0x02085: [0x0035],
+    0x02086: [0x0036],
+    0x02087: [0x0037],
+    0x02088: [0x0038],
+    0x02089: [0x0039],
+    0x0208A: [0x002B],
+    0x0208B: [0x2212],
+    0x0208C: [0x003D],
+    0x0208D: [0x0028],
+    0x0208E: [0x0029],
+    0x02090: [0x0061],
+    0x02091: [0x0065],
+    0x02092: [0x006F],
+    0x02093: [0x0078],
+    0x02094: [0x0259],
+    0x02095: [0x0068],
+    0x02096: [0x006B],
+    0x02097: [0x006C],
+    0x02098: [0x006D],
+    0x02099: [0x006E],
+    0x0209A: [0x0070],
+    0x0209B: [0x0073],
+    0x0209C: [0x0074],
+    0x020A8: [0x0072, 0x0073],
+    0x02100: [0x0061, 0x002F, 0x0063],
+    0x02101: [0x0061, 0x002F, 0x0073],
+    0x02102: [0x0063],
+    0x02103: [0x00B0, 0x0063],
+    0x02105: [0x0063, 0x002F, 0x006F],
+    0x02106: [0x0063, 0x002F, 0x0075],
+    0x02107: [0x025B],
+    0x02109: [0x00B0, 0x0066],
+    0x0210A: [0x0067],
+    0x0210B: [0x0068],
+    0x0210C: [0x0068],
+    0x0210D: [0x0068],
+    0x0210E: [0x0068],
+    0x0210F: [0x0127],
+    0x02110: [0x0069],
+    0x02111: [0x0069],
+    0x02112: [0x006C],
+    0x02113: [0x006C],
+    0x02115: [0x006E],
+    0x02116: [0x006E, 0x006F],
+    0x02119: [0x0070],
+    0x0211A: [0x0071],
+    0x0211B: [0x0072],
+    0x0211C: [0x0072],
+    0x0211D: [0x0072],
+    0x02120: [0x0073, 0x006D],
+    0x02121: [0x0074, 0x0065, 0x006C],
+    0x02122: [0x0074, 0x006D],
+    0x02124: [0x007A],
+    0x02126: [0x03C9],
+    0x02128: [0x007A],
+    0x0212A: [0x006B],
+    0x0212B: [0x00E5],
+    0x0212C: [0x0062],
+    0x0212D: [0x0063],
+    0x0212F: [0x0065],
+    0x02130: [0x0065],
+    0x02131: [0x0066],
+    0x02132: [0x214E],
+    0x02133: [0x006D],
+    0x02134: [0x006F],
+    0x02135: [0x05D0],
+    0x02136: [0x05D1],
+    0x02137: [0x05D2],
+    0x02138: [0x05D3],
+    0x02139: [0x0069],
+    0x0213B: [0x0066, 0x0061, 0x0078],
+    0x0213C: [0x03C0],
+    0x0213D: [0x03B3],
+    0x0213E: [0x03B3],
+    0x0213F: [0x03C0],
+    0x02140: [0x2211],
+    0x02145: [0x0064],
+    0x02146: [0x0064],
+    0x02147: [0x0065],
+    0x02148: [0x0069],
+    0x02149: [0x006A],
+    0x02150: [0x0031, 0x2044, 0x0037],
+    0x02151: [0x0031, 0x2044, 0x0039],
+    0x02152: [0x0031, 0x2044, 0x0031, 0x0030],
+    0x02153: [0x0031, 0x2044, 0x0033],
+    0x02154: [0x0032, 0x2044, 0x0033],
+    0x02155: [0x0031, 0x2044, 0x0035],
+    0x02156: [0x0032, 0x2044, 0x0035],
+    0x02157: [0x0033, 0x2044, 0x0035],
+    0x02158: [0x0034, 0x2044, 0x0035],
+    0x02159: [0x0031, 0x2044, 0x0036],
+    0x0215A: [0x0035, 0x2044, 0x0036],
+    0x0215B: [0x0031, 0x2044, 0x0038],
+    0x0215C: [0x0033, 0x2044, 0x0038],
+    0x0215D: [0x0035, 0x2044, 0x0038],
+    0x0215E: [0x0037, 0x2044, 0x0038],
+    0x0215F: [0x0031, 0x2044],
+    0x02160: [0x0069],
+    0x02161: [0x0069, 0x0069],
+    0x02162: [0x0069, 0x0069, 0x0069],
+    0x02163: [0x0069, 0x0076],
+    0x02164: [0x0076],
+    0x02165: [0x0076, 0x0069],
+    0x02166: [0x0076, 0x0069, 0x0069],
+    0x02167: [0x0076, 0x0069, 0x0069, 0x0069],
+    0x02168: [0x0069, 0x0078],
+    0x02169: [0x0078],
+    0x0216A: [0x0078, 0x0069],
+    0x0216B: [0x0078, 0x0069, 0x0069],
+    0x0216C: [0x006C],
+    0x0216D: [0x0063],
+    0x0216E: [0x0064],
+    0x0216F: [0x006D],
+    0x02170: [0x0069],
+    0x02171: [0x0069, 0x0069],
+    0x02172: [0x0069, 0x0069, 0x0069],
+    0x02173: [0x0069, 0x0076],
+    0x02174: [0x0076],
+    0x02175: [0x0076, 0x0069],
+    0x02176: [0x0076, 0x0069, 0x0069],
+    0x02177: [0x0076, 0x0069, 0x0069, 0x0069],
+    0x02178: [0x0069, 0x0078],
+    0x02179: [0x0078],
+    0x0217A: [0x0078, 0x0069],
+    0x0217B: [0x0078, 0x0069, 0x0069],
+    0x0217C: [0x006C],
+    0x0217D: [0x0063],
+    0x0217E: [0x0064],
+    0x0217F: [0x006D],
+    0x02183: [0x2184],
+    0x02189: [0x0030, 0x2044, 0x0033],
+    0x0222C: [0x222B, 0x222B],
+    0x0222D: [0x222B, 0x222B, 0x222B],
+    0x0222F: [0x222E, 0x222E],
+    0x02230: [0x222E, 0x222E, 0x222E],
+    0x02329: [0x3008],
+    0x0232A: [0x3009],
+    0x02460: [0x0031],
+    0x02461: [0x0032],
+    0x02462: [0x0033],
+    0x02463: [0x0034],
+    0x02464: [0x0035],
+    0x02465: [0x0036],
+    0x02466: [0x0037],
+    0x02467: [0x0038],
+    0x02468: [0x0039],
+    0x02469: [0x0031, 0x0030],
+    0x0246A: [0x0031, 0x0031],
+    0x0246B: [0x0031, 0x0032],
+    0x0246C: [0x0031, 0x0033],
+    0x0246D: [0x0031, 0x0034],
+    0x0246E: [0x0031, 0x0035],
+    0x0246F: [0x0031, 0x0036],
+    0x02470: [0x0031, 0x0037],
+    0x02471: [0x0031, 0x0038],
+    0x02472: [0x0031, 0x0039],
+    0x02473: [0x0032, 0x0030],
+    0x02474: [0x0028, 0x0031, 0x0029],
+    0x02475: [0x0028, 0x0032, 0x0029],
+    0x02476: [0x0028, 0x0033, 0x0029],
+    0x02477: [0x0028, 0x0034, 0x0029],
+    0x02478: [0x0028, 0x0035, 0x0029],
+    0x02479: [0x0028, 0x0036, 0x0029],
+    0x0247A: [0x0028, 0x0037, 0x0029],
+    0x0247B: [0x0028, 0x0038, 0x0029],
+    0x0247C: [0x0028, 0x0039, 0x0029],
+    0x0247D: [0x0028, 0x0031, 0x0030, 0x0029],
+    0x0247E: [0x0028, 0x0031, 0x0031, 0x0029],
+    0x0247F: [0x0028, 0x0031, 0x0032, 0x0029],
+    0x02480: [0x0028, 0x0031, 0x0033, 0x0029],
+    0x02481: [0x0028, 0x0031, 0x0034, 0x0029],
+    0x02482: [0x0028, 0x0031, 0x0035, 0x0029],
+    0x02483: [0x0028, 0x0031, 0x0036, 0x0029],
+    0x02484: [0x0028, 0x0031, 0x0037, 0x0029],
+    0x02485: [0x0028, 0x0031, 0x0038, 0x0029],
+    0x02486: [0x0028, 0x0031, 0x0039, 0x0029],
+    0x02487: [0x0028, 0x0032, 0x0030, 0x0029],
+    0x02488: [0x0031, 0x002E],
+    0x02489: [0x0032, 0x002E],
+    0x0248A: [0x0033, 0x002E],
+    0x0248B: [0x0034, 0x002E],
+    0x0248C: [0x0035, 0x002E],
+    0x0248D: [0x0036, 0x002E],
+    0x0248E: [0x0037, 0x002E],
+    0x0248F: [0x0038, 0x002E],
+    0x02490: [0x0039, 0x002E],
+    0x02491: [0x0031, 0x0030, 0x002E],
+    0x02492: [0x0031, 0x0031, 0x002E],
+    0x02493: [0x0031, 0x0032, 0x002E],
+    0x02494: [0x0031, 0x0033, 0x002E],
+    0x02495: [0x0031, 0x0034, 0x002E],
+    0x02496: [0x0031, 0x0035, 0x002E],
+    0x02497: [0x0031, 0x0036, 0x002E],
+    0x02498: [0x0031, 0x0037, 0x002E],
+    0x02499: [0x0031, 0x0038, 0x002E],
+    0x0249A: [0x0031, 0x0039, 0x002E],
+    0x0249B: [0x0032, 0x0030, 0x002E],
+    0x0249C: [0x0028, 0x0061, 0x0029],
+    0x0249D: [0x0028, 0x0062, 0x0029],
+    0x0249E: [0x0028, 0x0063, 0x0029],
+    0x0249F: [0x0028, 0x0064, 0x0029],
+    0x024A0: [0x0028, 0x0065, 0x0029],
+    0x024A1: [0x0028, 0x0066, 0x0029],
+    0x024A2: [0x0028, 0x0067, 0x0029],
+    0x024A3: [0x0028, 0x0068, 0x0029],
+    0x024A4: [0x0028, 0x0069, 0x0029],
+    0x024A5: [0x0028, 0x006A, 0x0029],
+    0x024A6: [0x0028, 0x006B, 0x0029],
+    0x024A7: [0x0028, 0x006C, 0x0029],
+    0x024A8: [0x0028, 0x006D, 0x0029],
+    0x024A9: [0x0028, 0x006E, 0x0029],
+    0x024AA: [0x0028, 0x006F, 0x0029],
+    0x024AB: [0x0028, 0x0070, 0x0029],
+    0x024AC: [0x0028, 0x0071, 0x0029],
+    0x024AD: [0x0028, 0x0072, 0x0029],
+    0x024AE: [0x0028, 0x0073, 0x0029],
+    0x024AF: [0x0028, 0x0074, 0x0029],
+    0x024B0: [0x0028, 0x0075, 0x0029],
+    0x024B1: [0x0028, 0x0076, 0x0029],
+    0x024B2: [0x0028, 0x0077, 0x0029],
+    0x024B3: [0x0028, 0x0078, 0x0029],
+    0x024B4: [0x0028, 0x0079, 0x0029],
+    0x024B5: [0x0028, 0x007A, 0x0029],
+    0x024B6: [0x0061],
+    0x024B7: [0x0062],
+    0x024B8: [0x0063],
+    0x024B9: [0x0064],
+    0x024BA: [0x0065],
+    0x024BB: [0x0066],
+    0x024BC: [0x0067],
+    0x024BD: [0x0068],
+    0x024BE: [0x0069],
+    0x024BF: [0x006A],
+    0x024C0: [0x006B],
+    0x024C1: [0x006C],
+    0x024C2: [0x006D],
+    0x024C3: [0x006E],
+    0x024C4: [0x006F],
+    0x024C5: [0x0070],
+    0x024C6: [0x0071],
+    0x024C7: [0x0072],
+    0x024C8: [0x0073],
+    0x024C9: [0x0074],
+    0x024CA: [0x0075],
+    0x024CB: [0x0076],
+    0x024CC: [0x0077],
+    0x024CD: [0x0078],
+    0x024CE: [0x0079],
+    0x024CF: [0x007A],
+    0x024D0: [0x0061],
+    0x024D1: [0x0062],
+    0x024D2: [0x0063],
+    0x024D3: [0x0064],
+    0x024D4: [0x0065],
+    0x024D5: [0x0066],
+    0x024D6: [0x0067],
+    0x024D7: [0x0068],
+    0x024D8: [0x0069],
+    0x024D9: [0x006A],
+    0x024DA: [0x006B],
+    0x024DB: [0x006C],
+    0x024DC: [0x006D],
+    0x024DD: [0x006E],
+    0x024DE: [0x006F],
+    0x024DF: [0x0070],
+    0x024E0: [0x0071],
+    0x024E1: [0x0072],
+    0x024E2: [0x0073],
+    0x024E3: [0x0074],
+    0x024E4: [0x0075],
+    0x024E5: [0x0076],
+    0x024E6: [0x0077],
+    0x024E7: [0x0078],
+    0x024E8: [0x0079],
+    0x024E9: [0x007A],
+    0x024EA: [0x0030],
+    0x02A0C: [0x222B, 0x222B, 0x222B, 0x222B],
+    0x02A74: [0x003A, 0x003A, 0x003D],
+    0x02A75: [0x003D, 0x003D],
+    0x02A76: [0x003D, 0x003D, 0x003D],
+    0x02ADC: [0x2ADD, 0x0338],
+    0x02C00: [0x2C30],
+    0x02C01: [0x2C31],
+    0x02C02: [0x2C32],
+    0x02C03: [0x2C33],
+    0x02C04: [0x2C34],
+    0x02C05: [0x2C35],
+    0x02C06: [0x2C36],
+    0x02C07: [0x2C37],
+    0x02C08: [0x2C38],
+    0x02C09: [0x2C39],
+    0x02C0A: [0x2C3A],
+    0x02C0B: [0x2C3B],
+    0x02C0C: [0x2C3C],
+    0x02C0D: [0x2C3D],
+    0x02C0E: [0x2C3E],
+    0x02C0F: [0x2C3F],
+    0x02C10: [0x2C40],
+    0x02C11: [0x2C41],
+    0x02C12: [0x2C42],
+    0x02C13: [0x2C43],
+    0x02C14: [0x2C44],
+    0x02C15: [0x2C45],
+    0x02C16: [0x2C46],
+    0x02C17: [0x2C47],
+    0x02C18: [0x2C48],
+    0x02C19: [0x2C49],
+    0x02C1A: [0x2C4A],
+    0x02C1B: [0x2C4B],
+    0x02C1C: [0x2C4C],
+    0x02C1D: [0x2C4D],
+    0x02C1E: [0x2C4E],
+    0x02C1F: [0x2C4F],
+    0x02C20: [0x2C50],
+    0x02C21: [0x2C51],
+    0x02C22: [0x2C52],
+    0x02C23: [0x2C53],
+    0x02C24: [0x2C54],
+    0x02C25: [0x2C55],
+    0x02C26: [0x2C56],
+    0x02C27: [0x2C57],
+    0x02C28: [0x2C58],
+    0x02C29: [0x2C59],
+    0x02C2A: [0x2C5A],
+    0x02C2B: [0x2C5B],
+    0x02C2C: [0x2C5C],
+    0x02C2D: [0x2C5D],
+    0x02C2E: [0x2C5E],
+    0x02C2F: [0x2C5F],
+    0x02C60: [0x2C61],
+    0x02C62: [0x026B],
+    0x02C63: [0x1D7D],
+    0x02C64: [0x027D],
+    0x02C67: [0x2C68],
+    0x02C69: [0x2C6A],
+    0x02C6B: [0x2C6C],
+    0x02C6D: [0x0251],
+    0x02C6E: [0x0271],
+    0x02C6F: [0x0250],
+    0x02C70: [0x0252],
+    0x02C72: [0x2C73],
+    0x02C75: [0x2C76],
+    0x02C7C: [0x006A],
+    0x02C7D: [0x0076],
+    0x02C7E: [0x023F],
+    0x02C7F: [0x0240],
+    0x02C80: [0x2C81],
+    0x02C82: [0x2C83],
+    0x02C84: [0x2C85],
+    0x02C86: [0x2C87],
+    0x02C88: [0x2C89],
+    0x02C8A: [0x2C8B],
+    0x02C8C: [0x2C8D],
+    0x02C8E: [0x2C8F],
+    0x02C90: [0x2C91],
+    0x02C92: [0x2C93],
+    0x02C94: [0x2C95],
+    0x02C96: [0x2C97],
+    0x02C98: [0x2C99],
+    0x02C9A: [0x2C9B],
+    0x02C9C: [0x2C9D],
+    0x02C9E: [0x2C9F],
+    0x02CA0: [0x2CA1],
+    0x02CA2: [0x2CA3],
+    0x02CA4: [0x2CA5],
+    0x02CA6: [0x2CA7],
+    0x02CA8: [0x2CA9],
+    0x02CAA: [0x2CAB],
+    0x02CAC: [0x2CAD],
+    0x02CAE: [0x2CAF],
+    0x02CB0: [0x2CB1],
+    0x02CB2: [0x2CB3],
+    0x02CB4: [0x2CB5],
+    0x02CB6: [0x2CB7],
+    0x02CB8: [0x2CB9],
+    0x02CBA: [0x2CBB],
+    0x02CBC: [0x2CBD],
+    0x02CBE: [0x2CBF],
+    0x02CC0: [0x2CC1],
+    0x02CC2: [0x2CC3],
+    0x02CC4: [0x2CC5],
+    0x02CC6: [0x2CC7],
+    0x02CC8: [0x2CC9],
+    0x02CCA: [0x2CCB],
+    0x02CCC: [0x2CCD],
+    0x02CCE: [0x2CCF],
+    0x02CD0: [0x2CD1],
+    0x02CD2: [0x2CD3],
+    0x02CD4: [0x2CD5],
+    0x02CD6: [0x2CD7],
+    0x02CD8: [0x2CD9],
+    0x02CDA: [0x2CDB],
+    0x02CDC: [0x2CDD],
+    0x02CDE: [0x2CDF],
+    0x02CE0: [0x2CE1],
+    0x02CE2: [0x2CE3],
+    0x02CEB: [0x2CEC],
+    0x02CED: [0x2CEE],
+    0x02CF2: [0x2CF3],
+    0x02D6F: [0x2D61],
+    0x02E9F: [0x6BCD],
+    0x02EF3: [0x9F9F],
+    0x02F00: [0x4E00],
+    0x02F01: [0x4E28],
+    0x02F02: [0x4E36],
+    0x02F03: [0x4E3F],
+    0x02F04: [0x4E59],
+    0x02F05: [0x4E85],
+    0x02F06: [0x4E8C],
+    0x02F07: [0x4EA0],
+    0x02F08: [0x4EBA],
+    0x02F09: [0x513F],
+    0x02F0A: [0x5165],
+    0x02F0B: [0x516B],
+    0x02F0C: [0x5182],
+    0x02F0D: [0x5196],
+    0x02F0E: [0x51AB],
+    0x02F0F: [0x51E0],
+    0x02F10: [0x51F5],
+    0x02F11: [0x5200],
+    0x02F12: [0x529B],
+    0x02F13: [0x52F9],
+    0x02F14: [0x5315],
+    0x02F15: [0x531A],
+    0x02F16: [0x5338],
+    0x02F17: [0x5341],
+    0x02F18: [0x535C],
+    0x02F19: [0x5369],
+    0x02F1A: [0x5382],
+    0x02F1B: [0x53B6],
+    0x02F1C: [0x53C8],
+    0x02F1D: [0x53E3],
+    0x02F1E: [0x56D7],
+    0x02F1F: [0x571F],
+    0x02F20: [0x58EB],
+    0x02F21: [0x5902],
+    0x02F22: [0x590A],
+    0x02F23: [0x5915],
+    0x02F24: [0x5927],
+    0x02F25: [0x5973],
+    0x02F26: [0x5B50],
+    0x02F27: [0x5B80],
+    0x02F28: [0x5BF8],
+    0x02F29: [0x5C0F],
+    0x02F2A: [0x5C22],
+    0x02F2B: [0x5C38],
+    0x02F2C: [0x5C6E],
+    0x02F2D: [0x5C71],
+    0x02F2E: [0x5DDB],
+    0x02F2F: [0x5DE5],
+    0x02F30: [0x5DF1],
+    0x02F31: [0x5DFE],
+    0x02F32: [0x5E72],
+    0x02F33: [0x5E7A],
+    0x02F34: [0x5E7F],
+    0x02F35: [0x5EF4],
+    0x02F36: [0x5EFE],
+    0x02F37: [0x5F0B],
+    0x02F38: [0x5F13],
+    0x02F39: [0x5F50],
+    0x02F3A: [0x5F61],
+    0x02F3B: [0x5F73],
+    0x02F3C: [0x5FC3],
+    0x02F3D: [0x6208],
+    0x02F3E: [0x6236],
+    0x02F3F: [0x624B],
+    0x02F40: [0x652F],
+    0x02F41: [0x6534],
+    0x02F42: [0x6587],
+    0x02F43: [0x6597],
+    0x02F44: [0x65A4],
+    0x02F45: [0x65B9],
+    0x02F46: [0x65E0],
+    0x02F47: [0x65E5],
+    0x02F48: [0x66F0],
+    0x02F49: [0x6708],
+    0x02F4A: [0x6728],
+    0x02F4B: [0x6B20],
+    0x02F4C: [0x6B62],
+    0x02F4D: [0x6B79],
+    0x02F4E: [0x6BB3],
+    0x02F4F: [0x6BCB],
+    0x02F50: [0x6BD4],
+    0x02F51: [0x6BDB],
+    0x02F52: [0x6C0F],
+    0x02F53: [0x6C14],
+    0x02F54: [0x6C34],
+    0x02F55: [0x706B],
+    0x02F56: [0x722A],
+    0x02F57: [0x7236],
+    0x02F58: [0x723B],
+    0x02F59: [0x723F],
+    0x02F5A: [0x7247],
+    0x02F5B: [0x7259],
+    0x02F5C: [0x725B],
+    0x02F5D: [0x72AC],
+    0x02F5E: [0x7384],
+    0x02F5F: [0x7389],
+    0x02F60: [0x74DC],
+    0x02F61: [0x74E6],
+    0x02F62: [0x7518],
+    0x02F63: [0x751F],
+    0x02F64: [0x7528],
+    0x02F65: [0x7530],
+    0x02F66: [0x758B],
+    0x02F67: [0x7592],
+    0x02F68: [0x7676],
+    0x02F69: [0x767D],
+    0x02F6A: [0x76AE],
+    0x02F6B: [0x76BF],
+    0x02F6C: [0x76EE],
+    0x02F6D: [0x77DB],
+    0x02F6E: [0x77E2],
+    0x02F6F: [0x77F3],
+    0x02F70: [0x793A],
+    0x02F71: [0x79B8],
+    0x02F72: [0x79BE],
+    0x02F73: [0x7A74],
+    0x02F74: [0x7ACB],
+    0x02F75: [0x7AF9],
+    0x02F76: [0x7C73],
+    0x02F77: [0x7CF8],
+    0x02F78: [0x7F36],
+    0x02F79: [0x7F51],
+    0x02F7A: [0x7F8A],
+    0x02F7B: [0x7FBD],
+    0x02F7C: [0x8001],
+    0x02F7D: [0x800C],
+    0x02F7E: [0x8012],
+    0x02F7F: [0x8033],
+    0x02F80: [0x807F],
+    0x02F81: [0x8089],
+    0x02F82: [0x81E3],
+    0x02F83: [0x81EA],
+    0x02F84: [0x81F3],
+    0x02F85: [0x81FC],
+    0x02F86: [0x820C],
+    0x02F87: [0x821B],
+    0x02F88: [0x821F],
+    0x02F89: [0x826E],
+    0x02F8A: [0x8272],
+    0x02F8B: [0x8278],
+    0x02F8C: [0x864D],
+    0x02F8D: [0x866B],
+    0x02F8E: [0x8840],
+    0x02F8F: [0x884C],
+    0x02F90: [0x8863],
+    0x02F91: [0x897E],
+    0x02F92: [0x898B],
+    0x02F93: [0x89D2],
+    0x02F94: [0x8A00],
+    0x02F95: [0x8C37],
+    0x02F96: [0x8C46],
+    0x02F97: [0x8C55],
+    0x02F98: [0x8C78],
+    0x02F99: [0x8C9D],
+    0x02F9A: [0x8D64],
+    0x02F9B: [0x8D70],
+    0x02F9C: [0x8DB3],
+    0x02F9D: [0x8EAB],
+    0x02F9E: [0x8ECA],
+    0x02F9F: [0x8F9B],
+    0x02FA0: [0x8FB0],
+    0x02FA1: [0x8FB5],
+    0x02FA2: [0x9091],
+    0x02FA3: [0x9149],
+    0x02FA4: [0x91C6],
+    0x02FA5: [0x91CC],
+    0x02FA6: [0x91D1],
+    0x02FA7: [0x9577],
+    0x02FA8: [0x9580],
+    0x02FA9: [0x961C],
+    0x02FAA: [0x96B6],
+    0x02FAB: [0x96B9],
+    0x02FAC: [0x96E8],
+    0x02FAD: [0x9751],
+    0x02FAE: [0x975E],
+    0x02FAF: [0x9762],
+    0x02FB0: [0x9769],
+    0x02FB1: [0x97CB],
+    0x02FB2: [0x97ED],
+    0x02FB3: [0x97F3],
+    0x02FB4: [0x9801],
+    0x02FB5: [0x98A8],
+    0x02FB6: [0x98DB],
+    0x02FB7: [0x98DF],
+    0x02FB8: [0x9996],
+    0x02FB9: [0x9999],
+    0x02FBA: [0x99AC],
+    0x02FBB: [0x9AA8],
+    0x02FBC: [0x9AD8],
+    0x02FBD: [0x9ADF],
+    0x02FBE: [0x9B25],
+    0x02FBF: [0x9B2F],
+    0x02FC0: [0x9B32],
+    0x02FC1: [0x9B3C],
+    0x02FC2: [0x9B5A],
+    0x02FC3: [0x9CE5],
+    0x02FC4: [0x9E75],
+    0x02FC5: [0x9E7F],
+    0x02FC6: [0x9EA5],
+    0x02FC7: [0x9EBB],
+    0x02FC8: [0x9EC3],
+    0x02FC9: [0x9ECD],
+    0x02FCA: [0x9ED1],
+    0x02FCB: [0x9EF9],
+    0x02FCC: [0x9EFD],
+    0x02FCD: [0x9F0E],
+    0x02FCE: [0x9F13],
+    0x02FCF: [0x9F20],
+    0x02FD0: [0x9F3B],
+    0x02FD1: [0x9F4A],
+    0x02FD2: [0x9F52],
+    0x02FD3: [0x9F8D],
+    0x02FD4: [0x9F9C],
+    0x02FD5: [0x9FA0],
+    0x03000: [0x0020],
+    0x03036: [0x3012],
+    0x03038: [0x5341],
+    0x03039: [0x5344],
+    0x0303A: [0x5345],
+    0x0309B: [0x0020, 0x3099],
+    0x0309C: [0x0020, 0x309A],
+    0x0309F: [0x3088, 0x308A],
+    0x030FF: [0x30B3, 0x30C8],
+    0x03131: [0x1100],
+    0x03132: [0x1101],
+    0x03133: [0x11AA],
+    0x03134: [0x1102],
+    0x03135: [0x11AC],
+    0x03136: [0x11AD],
+    0x03137: [0x1103],
+    0x03138: [0x1104],
+    0x03139: [0x1105],
+    0x0313A: [0x11B0],
+    0x0313B: [0x11B1],
+    0x0313C: [0x11B2],
+    0x0313D: [0x11B3],
+    0x0313E: [0x11B4],
+    0x0313F: [0x11B5],
+    0x03140: [0x111A],
+    0x03141: [0x1106],
+    0x03142: [0x1107],
+    0x03143: [0x1108],
+    0x03144: [0x1121],
+    0x03145: [0x1109],
+    0x03146: [0x110A],
+    0x03147: [0x110B],
+    0x03148: [0x110C],
+    0x03149: [0x110D],
+    0x0314A: [0x110E],
+    0x0314B: [0x110F],
+    0x0314C: [0x1110],
+    0x0314D: [0x1111],
+    0x0314E: [0x1112],
+    0x0314F: [0x1161],
+    0x03150: [0x1162],
+    0x03151: [0x1163],
+    0x03152: [0x1164],
+    0x03153: [0x1165],
+    0x03154: [0x1166],
+    0x03155: [0x1167],
+    0x03156: [0x1168],
+    0x03157: [0x1169],
+    0x03158: [0x116A],
+    0x03159: [0x116B],
+    0x0315A: [0x116C],
+    0x0315B: [0x116D],
+    0x0315C: [0x116E],
+    0x0315D: [0x116F],
+    0x0315E: [0x1170],
+    0x0315F: [0x1171],
+    0x03160: [0x1172],
+    0x03161: [0x1173],
+    0x03162: [0x1174],
+    0x03163: [0x1175],
+    0x03164: [],
+    0x03165: [0x1114],
+    0x03166: [0x1115],
+    0x03167: [0x11C7],
+    0x03168: [0x11C8],
+    0x03169: [0x11CC],
+    0x0316A: [0x11CE],
+    0x0316B: [0x11D3],
+    0x0316C: [0x11D7],
+    0x0316D: [0x11D9],
+    0x0316E: [0x111C],
+    0x0316F: [0x11DD],
+    0x03170: [0x11DF],
+    0x03171: [0x111D],
+    0x03172: [0x111E],
+    0x03173: [0x1120],
+    0x03174: [0x1122],
+    0x03175: [0x1123],
+    0x03176: [0x1127],
+    0x03177: [0x1129],
+    0x03178: [0x112B],
+    0x03179: [0x112C],
+    0x0317A: [0x112D],
+    0x0317B: [0x112E],
+    0x0317C: [0x112F],
+    0x0317D: [0x1132],
+    0x0317E: [0x1136],
+    0x0317F: [0x1140],
+    0x03180: [0x1147],
+    0x03181: [0x114C],
+    0x03182: [0x11F1],
+    0x03183: [0x11F2],
+    0x03184: [0x1157],
+    0x03185: [0x1158],
+    0x03186: [0x1159],
+    0x03187: [0x1184],
+    0x03188: [0x1185],
+    0x03189: [0x1188],
+    0x0318A: [0x1191],
+    0x0318B: [0x1192],
+    0x0318C: [0x1194],
+    0x0318D: [0x119E],
+    0x0318E: [0x11A1],
+    0x03192: [0x4E00],
+    0x03193: [0x4E8C],
+    0x03194: [0x4E09],
+    0x03195: [0x56DB],
+    0x03196: [0x4E0A],
+    0x03197: [0x4E2D],
+    0x03198: [0x4E0B],
+    0x03199: [0x7532],
+    0x0319A: [0x4E59],
+    0x0319B: [0x4E19],
+    0x0319C: [0x4E01],
+    0x0319D: [0x5929],
+    0x0319E: [0x5730],
+    0x0319F: [0x4EBA],
+    0x03200: [0x0028, 0x1100, 0x0029],
+    0x03201: [0x0028, 0x1102, 0x0029],
+    0x03202: [0x0028, 0x1103, 0x0029],
+    0x03203: [0x0028, 0x1105, 0x0029],
+    0x03204: [0x0028, 0x1106, 0x0029],
+    0x03205: [0x0028, 0x1107, 0x0029],
+    0x03206: [0x0028, 0x1109, 0x0029],
+    0x03207: [0x0028, 0x110B, 0x0029],
+    0x03208: [0x0028, 0x110C, 0x0029],
+    0x03209: [0x0028, 0x110E, 0x0029],
+    0x0320A: [0x0028, 0x110F, 0x0029],
+    0x0320B: [0x0028, 0x1110, 0x0029],
+    0x0320C: [0x0028, 0x1111, 0x0029],
+    0x0320D: [0x0028, 0x1112, 0x0029],
+    0x0320E: [0x0028, 0xAC00, 0x0029],
+    0x0320F: [0x0028, 0xB098, 0x0029],
+    0x03210: [0x0028, 0xB2E4, 0x0029],
+    0x03211: [0x0028, 0xB77C, 0x0029],
+    0x03212: [0x0028, 0xB9C8, 0x0029],
+    0x03213: [0x0028, 0xBC14, 0x0029],
+    0x03214: [0x0028, 0xC0AC, 0x0029],
+    0x03215: [0x0028, 0xC544, 0x0029],
+    0x03216: [0x0028, 0xC790, 0x0029],
+    0x03217: [0x0028, 0xCC28, 0x0029],
+    0x03218: [0x0028, 0xCE74, 0x0029],
+    0x03219: [0x0028, 0xD0C0, 0x0029],
+    0x0321A: [0x0028, 0xD30C, 0x0029],
+    0x0321B: [0x0028, 0xD558, 0x0029],
+    0x0321C: [0x0028, 0xC8FC, 0x0029],
+    0x0321D: [0x0028, 0xC624, 0xC804, 0x0029],
+    0x0321E: [0x0028, 0xC624, 0xD6C4, 0x0029],
+    0x03220: [0x0028, 0x4E00, 0x0029],
+    0x03221: [0x0028, 0x4E8C, 0x0029],
+    0x03222: [0x0028, 0x4E09, 0x0029],
+    0x03223: [0x0028, 0x56DB, 0x0029],
+    0x03224: [0x0028, 0x4E94, 0x0029],
+    0x03225: [0x0028, 0x516D, 0x0029],
+    0x03226: [0x0028, 0x4E03, 0x0029],
+    0x03227: [0x0028, 0x516B, 0x0029],
+    0x03228: [0x0028, 0x4E5D, 0x0029],
+    0x03229: [0x0028, 0x5341, 0x0029],
+    0x0322A: [0x0028, 0x6708, 0x0029],
+    0x0322B: [0x0028, 0x706B, 0x0029],
+    0x0322C: [0x0028, 0x6C34, 0x0029],
+    0x0322D: [0x0028, 0x6728, 0x0029],
+    0x0322E: [0x0028, 0x91D1, 0x0029],
+    0x0322F: [0x0028, 0x571F, 0x0029],
+    0x03230: [0x0028, 0x65E5, 0x0029],
+    0x03231: [0x0028, 0x682A, 0x0029],
+    0x03232: [0x0028, 0x6709, 0x0029],
+    0x03233: [0x0028, 0x793E, 0x0029],
+    0x03234: [0x0028, 0x540D, 0x0029],
+    0x03235: [0x0028, 0x7279, 0x0029],
+    0x03236: [0x0028, 0x8CA1, 0x0029],
+    0x03237: [0x0028, 0x795D, 0x0029],
+    0x03238: [0x0028, 0x52B4, 0x0029],
+    0x03239: [0x0028, 0x4EE3, 0x0029],
+    0x0323A: [0x0028, 0x547C, 0x0029],
+    0x0323B: [0x0028, 0x5B66, 0x0029],
+    0x0323C: [0x0028, 0x76E3, 0x0029],
+    0x0323D: [0x0028, 0x4F01, 0x0029],
+    0x0323E: [0x0028, 0x8CC7, 0x0029],
+    0x0323F: [0x0028, 0x5354, 0x0029],
+    0x03240: [0x0028, 0x796D, 0x0029],
+    0x03241: [0x0028, 0x4F11, 0x0029],
+    0x03242: [0x0028, 0x81EA, 0x0029],
+    0x03243: [0x0028, 0x81F3, 0x0029],
+    0x03244: [0x554F],
+    0x03245: [0x5E7C],
+    0x03246: [0x6587],
+    0x03247: [0x7B8F],
+    0x03250: [0x0070, 0x0074, 0x0065],
+    0x03251: [0x0032, 0x0031],
+    0x03252: [0x0032, 0x0032],
+    0x03253: [0x0032, 0x0033],
+    0x03254: [0x0032, 0x0034],
+    0x03255: [0x0032, 0x0035],
+    0x03256: [0x0032, 0x0036],
+    0x03257: [0x0032, 0x0037],
+    0x03258: [0x0032, 0x0038],
+    0x03259: [0x0032, 0x0039],
+    0x0325A: [0x0033, 0x0030],
+    0x0325B: [0x0033, 0x0031],
+    0x0325C: [0x0033, 0x0032],
+    0x0325D: [0x0033, 0x0033],
+    0x0325E: [0x0033, 0x0034],
+    0x0325F: [0x0033, 0x0035],
+    0x03260: [0x1100],
+    0x03261: [0x1102],
+    0x03262: [0x1103],
+    0x03263: [0x1105],
+    0x03264: [0x1106],
+    0x03265: [0x1107],
+    0x03266: [0x1109],
+    0x03267: [0x110B],
+    0x03268: [0x110C],
+    0x03269: [0x110E],
+    0x0326A: [0x110F],
+    0x0326B: [0x1110],
+    0x0326C: [0x1111],
+    0x0326D: [0x1112],
+    0x0326E: [0xAC00],
+    0x0326F: [0xB098],
+    0x03270: [0xB2E4],
+    0x03271: [0xB77C],
+    0x03272: [0xB9C8],
+    0x03273: [0xBC14],
+    0x03274: [0xC0AC],
+    0x03275: [0xC544],
+    0x03276: [0xC790],
+    0x03277: [0xCC28],
+    0x03278: [0xCE74],
+    0x03279: [0xD0C0],
+    0x0327A: [0xD30C],
+    0x0327B: [0xD558],
+    0x0327C: [0xCC38, 0xACE0],
+    0x0327D: [0xC8FC, 0xC758],
+    0x0327E: [0xC6B0],
+    0x03280: [0x4E00],
+    0x03281: [0x4E8C],
+    0x03282: [0x4E09],
+    0x03283: [0x56DB],
+    0x03284: [0x4E94],
+    0x03285: [0x516D],
+    0x03286: [0x4E03],
+    0x03287: [0x516B],
+    0x03288: [0x4E5D],
+    0x03289: [0x5341],
+    0x0328A: [0x6708],
+    0x0328B: [0x706B],
+    0x0328C: [0x6C34],
+    0x0328D: [0x6728],
+    0x0328E: [0x91D1],
+    0x0328F: [0x571F],
+    0x03290: [0x65E5],
+    0x03291: [0x682A],
+    0x03292: [0x6709],
+    0x03293: [0x793E],
+    0x03294: [0x540D],
+    0x03295: [0x7279],
+    0x03296: [0x8CA1],
+    0x03297: [0x795D],
+    0x03298: [0x52B4],
+    0x03299: [0x79D8],
+    0x0329A: [0x7537],
+    0x0329B: [0x5973],
+    0x0329C: [0x9069],
+    0x0329D: [0x512A],
+    0x0329E: [0x5370],
+    0x0329F: [0x6CE8],
+    0x032A0: [0x9805],
+    0x032A1: [0x4F11],
+    0x032A2: [0x5199],
+    0x032A3: [0x6B63],
+    0x032A4: [0x4E0A],
+    0x032A5: [0x4E2D],
+    0x032A6: [0x4E0B],
+    0x032A7: [0x5DE6],
+    0x032A8: [0x53F3],
+    0x032A9: [0x533B],
+    0x032AA: [0x5B97],
+    0x032AB: [0x5B66],
+    0x032AC: [0x76E3],
+    0x032AD: [0x4F01],
+    0x032AE: [0x8CC7],
+    0x032AF: [0x5354],
+    0x032B0: [0x591C],
+    0x032B1: [0x0033, 0x0036],
+    0x032B2: [0x0033, 0x0037],
+    0x032B3: [0x0033, 0x0038],
+    0x032B4: [0x0033, 0x0039],
+    0x032B5: [0x0034, 0x0030],
+    0x032B6: [0x0034, 0x0031],
+    0x032B7: [0x0034, 0x0032],
+    0x032B8: [0x0034, 0x0033],
+    0x032B9: [0x0034, 0x0034],
+    0x032BA: [0x0034, 0x0035],
+    0x032BB: [0x0034, 0x0036],
+    0x032BC: [0x0034, 0x0037],
+    0x032BD: [0x0034, 0x0038],
+    0x032BE: [0x0034, 0x0039],
+    0x032BF: [0x0035, 0x0030],
+    0x032C0: [0x0031, 0x6708],
+    0x032C1: [0x0032, 0x6708],
+    0x032C2: [0x0033, 0x6708],
+    0x032C3: [0x0034, 0x6708],
+    0x032C4: [0x0035, 0x6708],
+    0x032C5: [0x0036, 0x6708],
+    0x032C6: [0x0037, 0x6708],
+    0x032C7: [0x0038, 0x6708],
+    0x032C8: [0x0039, 0x6708],
+    0x032C9: [0x0031, 0x0030, 0x6708],
+    0x032CA: [0x0031, 0x0031, 0x6708],
+    0x032CB: [0x0031, 0x0032, 0x6708],
+    0x032CC: [0x0068, 0x0067],
+    0x032CD: [0x0065, 0x0072, 0x0067],
+    0x032CE: [0x0065, 0x0076],
+    0x032CF: [0x006C, 0x0074, 0x0064],
+    0x032D0: [0x30A2],
+    0x032D1: [0x30A4],
+    0x032D2: [0x30A6],
+    0x032D3: [0x30A8],
+    0x032D4: [0x30AA],
+    0x032D5: [0x30AB],
+    0x032D6: [0x30AD],
+    0x032D7: [0x30AF],
+    0x032D8: [0x30B1],
+    0x032D9: [0x30B3],
+    0x032DA: [0x30B5],
+    0x032DB: [0x30B7],
+    0x032DC: [0x30B9],
+    0x032DD: [0x30BB],
+    0x032DE: [0x30BD],
+    0x032DF: [0x30BF],
+    0x032E0: [0x30C1],
+    0x032E1: [0x30C4],
+    0x032E2: [0x30C6],
+    0x032E3: [0x30C8],
+    0x032E4: [0x30CA],
+    0x032E5: [0x30CB],
+    0x032E6: [0x30CC],
+    0x032E7: [0x30CD],
+    0x032E8: [0x30CE],
+    0x032E9: [0x30CF],
+    0x032EA: [0x30D2],
+    0x032EB: [0x30D5],
+    0x032EC: [0x30D8],
+    0x032ED: [0x30DB],
+    0x032EE: [0x30DE],
+    0x032EF: [0x30DF],
+    0x032F0: [0x30E0],
+    0x032F1: [0x30E1],
+    0x032F2: [0x30E2],
+    0x032F3: [0x30E4],
+    0x032F4: [0x30E6],
+    0x032F5: [0x30E8],
+    0x032F6: [0x30E9],
+    0x032F7: [0x30EA],
+    0x032F8: [0x30EB],
+    0x032F9: [0x30EC],
+    0x032FA: [0x30ED],
+    0x032FB: [0x30EF],
+    0x032FC: [0x30F0],
+    0x032FD: [0x30F1],
+    0x032FE: [0x30F2],
+    0x032FF: [0x4EE4, 0x548C],
+    0x03300: [0x30A2, 0x30D1, 0x30FC, 0x30C8],
+    0x03301: [0x30A2, 0x30EB, 0x30D5, 0x30A1],
+    0x03302: [0x30A2, 0x30F3, 0x30DA, 0x30A2],
+    0x03303: [0x30A2, 0x30FC, 0x30EB],
+    0x03304: [0x30A4, 0x30CB, 0x30F3, 0x30B0],
+    0x03305: [0x30A4, 0x30F3, 0x30C1],
+    0x03306: [0x30A6, 0x30A9, 0x30F3],
+    0x03307: [0x30A8, 0x30B9, 0x30AF, 0x30FC, 0x30C9],
+    0x03308: [0x30A8, 0x30FC, 0x30AB, 0x30FC],
+    0x03309: [0x30AA, 0x30F3, 0x30B9],
+    0x0330A: [0x30AA, 0x30FC, 0x30E0],
+    0x0330B: [0x30AB, 0x30A4, 0x30EA],
+    0x0330C: [0x30AB, 0x30E9, 0x30C3, 0x30C8],
+    0x0330D: [0x30AB, 0x30ED, 0x30EA, 0x30FC],
+    0x0330E: [0x30AC, 0x30ED, 0x30F3],
+    0x0330F: [0x30AC, 0x30F3, 0x30DE],
+    0x03310: [0x30AE, 0x30AC],
+    0x03311: [0x30AE, 0x30CB, 0x30FC],
+    0x03312: [0x30AD, 0x30E5, 0x30EA, 0x30FC],
+    0x03313: [0x30AE, 0x30EB, 0x30C0, 0x30FC],
+    0x03314: [0x30AD, 0x30ED],
+    0x03315: [0x30AD, 0x30ED, 0x30B0, 0x30E9, 0x30E0],
+    0x03316: [0x30AD, 0x30ED, 0x30E1, 0x30FC, 0x30C8, 0x30EB],
+    0x03317: [0x30AD, 0x30ED, 0x30EF, 0x30C3, 0x30C8],
+    0x03318: [0x30B0, 0x30E9, 0x30E0],
+    0x03319: [0x30B0, 0x30E9, 0x30E0, 0x30C8, 0x30F3],
+    0x0331A: [0x30AF, 0x30EB, 0x30BC, 0x30A4, 0x30ED],
+    0x0331B: [0x30AF, 0x30ED, 0x30FC, 0x30CD],
+    0x0331C: [0x30B1, 0x30FC, 0x30B9],
+    0x0331D: [0x30B3, 0x30EB, 0x30CA],
+    0x0331E: [0x30B3, 0x30FC, 0x30DD],
+    0x0331F: [0x30B5, 0x30A4, 0x30AF, 0x30EB],
+    0x03320: [0x30B5, 0x30F3, 0x30C1, 0x30FC, 0x30E0],
+    0x03321: [0x30B7, 0x30EA, 0x30F3, 0x30B0],
+    0x03322: [0x30BB, 0x30F3, 0x30C1],
+    0x03323: [0x30BB, 0x30F3, 0x30C8],
+    0x03324: [0x30C0, 0x30FC, 0x30B9],
+    0x03325: [0x30C7, 0x30B7],
+    0x03326: [0x30C9, 0x30EB],
+    0x03327: [0x30C8, 0x30F3],
+    0x03328: [0x30CA, 0x30CE],
+    0x03329: [0x30CE, 0x30C3, 0x30C8],
+    0x0332A: [0x30CF, 0x30A4, 0x30C4],
+    0x0332B: [0x30D1, 0x30FC, 0x30BB, 0x30F3, 0x30C8],
+    0x0332C: [0x30D1, 0x30FC, 0x30C4],
+    0x0332D: [0x30D0, 0x30FC, 0x30EC, 0x30EB],
+    0x0332E: [0x30D4, 0x30A2, 0x30B9, 0x30C8, 0x30EB],
+    0x0332F: [0x30D4, 0x30AF, 0x30EB],
+    0x03330: [0x30D4, 0x30B3],
+    0x03331: [0x30D3, 0x30EB],
+    0x03332: [0x30D5, 0x30A1, 0x30E9, 0x30C3, 0x30C9],
+    0x03333: [0x30D5, 0x30A3, 0x30FC, 0x30C8],
+    0x03334: [0x30D6, 0x30C3, 0x30B7, 0x30A7, 0x30EB],
+    0x03335: [0x30D5, 0x30E9, 0x30F3],
+    0x03336: [0x30D8, 0x30AF, 0x30BF, 0x30FC, 0x30EB],
+    0x03337: [0x30DA, 0x30BD],
+    0x03338: [0x30DA, 0x30CB, 0x30D2],
+    0x03339: [0x30D8, 0x30EB, 0x30C4],
+    0x0333A: [0x30DA, 0x30F3, 0x30B9],
+    0x0333B: [0x30DA, 0x30FC, 0x30B8],
+    0x0333C: [0x30D9, 0x30FC, 0x30BF],
+    0x0333D: [0x30DD, 0x30A4, 0x30F3, 0x30C8],
+    0x0333E: [0x30DC, 0x30EB, 0x30C8],
+    0x0333F: [0x30DB, 0x30F3],
+    0x03340: [0x30DD, 0x30F3, 0x30C9],
+    0x03341: [0x30DB, 0x30FC, 0x30EB],
+    0x03342: [0x30DB, 0x30FC, 0x30F3],
+    0x03343: [0x30DE, 0x30A4, 0x30AF, 0x30ED],
+    0x03344: [0x30DE, 0x30A4, 0x30EB],
+    0x03345: [0x30DE, 0x30C3, 0x30CF],
+    0x03346: [0x30DE, 0x30EB, 0x30AF],
+    0x03347: [0x30DE, 0x30F3, 0x30B7, 0x30E7, 0x30F3],
+    0x03348: [0x30DF, 0x30AF, 0x30ED, 0x30F3],
+    0x03349: [0x30DF, 0x30EA],
+    0x0334A: [0x30DF, 0x30EA, 0x30D0, 0x30FC, 0x30EB],
+    0x0334B: [0x30E1, 0x30AC],
+    0x0334C: [0x30E1, 0x30AC, 0x30C8, 0x30F3],
+    0x0334D: [0x30E1, 0x30FC, 0x30C8, 0x30EB],
+    0x0334E: [0x30E4, 0x30FC, 0x30C9],
+    0x0334F: [0x30E4, 0x30FC, 0x30EB],
+    0x03350: [0x30E6, 0x30A2, 0x30F3],
+    0x03351: [0x30EA, 0x30C3, 0x30C8, 0x30EB],
+    0x03352: [0x30EA, 0x30E9],
+    0x03353: [0x30EB, 0x30D4, 0x30FC],
+    0x03354: [0x30EB, 0x30FC, 0x30D6, 0x30EB],
+    0x03355: [0x30EC, 0x30E0],
+    0x03356: [0x30EC, 0x30F3, 0x30C8, 0x30B2, 0x30F3],
+    0x03357: [0x30EF, 0x30C3, 0x30C8],
+    0x03358: [0x0030, 0x70B9],
+    0x03359: [0x0031, 0x70B9],
+    0x0335A: [0x0032, 0x70B9],
+    0x0335B: [0x0033, 0x70B9],
+    0x0335C: [0x0034, 0x70B9],
+    0x0335D: [0x0035, 0x70B9],
+    0x0335E: [0x0036, 0x70B9],
+    0x0335F: [0x0037, 0x70B9],
+    0x03360: [0x0038, 0x70B9],
+    0x03361: [0x0039, 0x70B9],
+    0x03362: [0x0031, 0x0030, 0x70B9],
+    0x03363: [0x0031, 0x0031, 0x70B9],
+    0x03364: [0x0031, 0x0032, 0x70B9],
+    0x03365: [0x0031, 0x0033, 0x70B9],
+    0x03366: [0x0031, 0x0034, 0x70B9],
+    0x03367: [0x0031, 0x0035, 0x70B9],
+    0x03368: [0x0031, 0x0036, 0x70B9],
+    0x03369: [0x0031, 0x0037, 0x70B9],
+    0x0336A: [0x0031, 0x0038, 0x70B9],
+    0x0336B: [0x0031, 0x0039, 0x70B9],
+    0x0336C: [0x0032, 0x0030, 0x70B9],
+    0x0336D: [0x0032, 0x0031, 0x70B9],
+    0x0336E: [0x0032, 0x0032, 0x70B9],
+    0x0336F: [0x0032, 0x0033, 0x70B9],
+    0x03370: [0x0032, 0x0034, 0x70B9],
+    0x03371: [0x0068, 0x0070, 0x0061],
+    0x03372: [0x0064, 0x0061],
+    0x03373: [0x0061, 0x0075],
+    0x03374: [0x0062, 0x0061, 0x0072],
+    0x03375: [0x006F, 0x0076],
+    0x03376: [0x0070, 0x0063],
+    0x03377: [0x0064, 0x006D],
+    0x03378: [0x0064, 0x006D, 0x0032],
+    0x03379: [0x0064, 0x006D, 0x0033],
+    0x0337A: [0x0069, 0x0075],
+    0x0337B: [0x5E73, 0x6210],
+    0x0337C: [0x662D, 0x548C],
+    0x0337D: [0x5927, 0x6B63],
+    0x0337E: [0x660E, 0x6CBB],
+    0x0337F: [0x682A, 0x5F0F, 0x4F1A, 0x793E],
+    0x03380: [0x0070, 0x0061],
+    0x03381: [0x006E, 0x0061],
+    0x03382: [0x03BC, 0x0061],
+    0x03383: [0x006D, 0x0061],
+    0x03384: [0x006B, 0x0061],
+    0x03385: [0x006B, 0x0062],
+    0x03386: [0x006D, 0x0062],
+    0x03387: [0x0067, 0x0062],
+    0x03388: [0x0063, 0x0061, 0x006C],
+    0x03389: [0x006B, 0x0063, 0x0061, 0x006C],
+    0x0338A: [0x0070, 0x0066],
+    0x0338B: [0x006E, 0x0066],
+    0x0338C: [0x03BC, 0x0066],
+    0x0338D: [0x03BC, 0x0067],
+    0x0338E: [0x006D, 0x0067],
+    0x0338F: [0x006B, 0x0067],
+    0x03390: [0x0068, 0x007A],
+    0x03391: [0x006B, 0x0068, 0x007A],
+    0x03392: [0x006D, 0x0068, 0x007A],
+    0x03393: [0x0067, 0x0068, 0x007A],
+    0x03394: [0x0074, 0x0068, 0x007A],
+    0x03395: [0x03BC, 0x006C],
+    0x03396: [0x006D, 0x006C],
+    0x03397: [0x0064, 0x006C],
+    0x03398: [0x006B, 0x006C],
+    0x03399: [0x0066, 0x006D],
+    0x0339A: [0x006E, 0x006D],
+    0x0339B: [0x03BC, 0x006D],
+    0x0339C: [0x006D, 0x006D],
+    0x0339D: [0x0063, 0x006D],
+    0x0339E: [0x006B, 0x006D],
+    0x0339F: [0x006D, 0x006D, 0x0032],
+    0x033A0: [0x0063, 0x006D, 0x0032],
+    0x033A1: [0x006D, 0x0032],
+    0x033A2: [0x006B, 0x006D, 0x0032],
+    0x033A3: [0x006D, 0x006D, 0x0033],
+    0x033A4: [0x0063, 0x006D, 0x0033],
+    0x033A5: [0x006D, 0x0033],
+    0x033A6: [0x006B, 0x006D, 0x0033],
+    0x033A7: [0x006D, 0x2215, 0x0073],
+    0x033A8: [0x006D, 0x2215, 0x0073, 0x0032],
+    0x033A9: [0x0070, 0x0061],
+    0x033AA: [0x006B, 0x0070, 0x0061],
+    0x033AB: [0x006D, 0x0070, 0x0061],
+    0x033AC: [0x0067, 0x0070, 0x0061],
+    0x033AD: [0x0072, 0x0061, 0x0064],
+    0x033AE: [0x0072, 0x0061, 0x0064, 0x2215, 0x0073],
+    0x033AF: [0x0072, 0x0061, 0x0064, 0x2215, 0x0073, 0x0032],
+    0x033B0: [0x0070, 0x0073],
+    0x033B1: [0x006E, 0x0073],
+    0x033B2: [0x03BC, 0x0073],
+    0x033B3: [0x006D, 0x0073],
+    0x033B4: [0x0070, 0x0076],
+    0x033B5: [0x006E, 0x0076],
+    0x033B6: [0x03BC, 0x0076],
+    0x033B7: [0x006D, 0x0076],
+    0x033B8: [0x006B, 0x0076],
+    0x033B9: [0x006D, 0x0076],
+    0x033BA: [0x0070, 0x0077],
+    0x033BB: [0x006E, 0x0077],
+    0x033BC: [0x03BC, 0x0077],
+    0x033BD: [0x006D, 0x0077],
+    0x033BE: [0x006B, 0x0077],
+    0x033BF: [0x006D, 0x0077],
+    0x033C0: [0x006B, 0x03C9],
+    0x033C1: [0x006D, 0x03C9],
+    0x033C2: [0x0061, 0x002E, 0x006D, 0x002E],
+    0x033C3: [0x0062, 0x0071],
+    0x033C4: [0x0063, 0x0063],
+    0x033C5: [0x0063, 0x0064],
+    0x033C6: [0x0063, 0x2215, 0x006B, 0x0067],
+    0x033C7: [0x0063, 0x006F, 0x002E],
+    0x033C8: [0x0064, 0x0062],
+    0x033C9: [0x0067, 0x0079],
+    0x033CA: [0x0068, 0x0061],
+    0x033CB: [0x0068, 0x0070],
+    0x033CC: [0x0069, 0x006E],
+    0x033CD: [0x006B, 0x006B],
+    0x033CE: [0x006B, 0x006D],
+    0x033CF: [0x006B, 0x0074],
+    0x033D0: [0x006C, 0x006D],
+    0x033D1: [0x006C, 0x006E],
+    0x033D2: [0x006C, 0x006F, 0x0067],
+    0x033D3: [0x006C, 0x0078],
+    0x033D4: [0x006D, 0x0062],
+    0x033D5: [0x006D, 0x0069, 0x006C],
+    0x033D6: [0x006D, 0x006F, 0x006C],
+    0x033D7: [0x0070, 0x0068],
+    0x033D8: [0x0070, 0x002E, 0x006D, 0x002E],
+    0x033D9: [0x0070, 0x0070, 0x006D],
+    0x033DA: [0x0070, 0x0072],
+    0x033DB: [0x0073, 0x0072],
+    0x033DC: [0x0073, 0x0076],
+    0x033DD: [0x0077, 0x0062],
+    0x033DE: [0x0076, 0x2215, 0x006D],
+    0x033DF: [0x0061, 0x2215, 0x006D],
+    0x033E0: [0x0031, 0x65E5],
+    0x033E1: [0x0032, 0x65E5],
+    0x033E2: [0x0033, 0x65E5],
+    0x033E3: [0x0034, 0x65E5],
+    0x033E4: [0x0035, 0x65E5],
+    0x033E5: [0x0036, 0x65E5],
+    0x033E6: [0x0037, 0x65E5],
+    0x033E7: [0x0038, 0x65E5],
+    0x033E8: [0x0039, 0x65E5],
+    0x033E9: [0x0031, 0x0030, 0x65E5],
+    0x033EA: [0x0031, 0x0031, 0x65E5],
+    0x033EB: [0x0031, 0x0032, 0x65E5],
+    0x033EC: [0x0031, 0x0033, 0x65E5],
+    0x033ED: [0x0031, 0x0034, 0x65E5],
+    0x033EE: [0x0031, 0x0035, 0x65E5],
+    0x033EF: [0x0031, 0x0036, 0x65E5],
+    0x033F0: [0x0031, 0x0037, 0x65E5],
+    0x033F1: [0x0031, 0x0038, 0x65E5],
+    0x033F2: [0x0031, 0x0039, 0x65E5],
+    0x033F3: [0x0032, 0x0030, 0x65E5],
+    0x033F4: [0x0032, 0x0031, 0x65E5],
+    0x033F5: [0x0032, 0x0032, 0x65E5],
+    0x033F6: [0x0032, 0x0033, 0x65E5],
+    0x033F7: [0x0032, 0x0034, 0x65E5],
+    0x033F8: [0x0032, 0x0035, 0x65E5],
+    0x033F9: [0x0032, 0x0036, 0x65E5],
+    0x033FA: [0x0032, 0x0037, 0x65E5],
+    0x033FB: [0x0032, 0x0038, 0x65E5],
+    0x033FC: [0x0032, 0x0039, 0x65E5],
+    0x033FD: [0x0033, 0x0030, 0x65E5],
+    0x033FE: [0x0033, 0x0031, 0x65E5],
+    0x033FF: [0x0067, 0x0061, 0x006C],
+    0x0A640: [0xA641],
+    0x0A642: [0xA643],
+    0x0A644: [0xA645],
+    0x0A646: [0xA647],
+    0x0A648: [0xA649],
+    0x0A64A: [0xA64B],
+    0x0A64C: [0xA64D],
+    0x0A64E: [0xA64F],
+    0x0A650: [0xA651],
+    0x0A652: [0xA653],
+    0x0A654: [0xA655],
+    0x0A656: [0xA657],
+    0x0A658: [0xA659],
+    0x0A65A: [0xA65B],
+    0x0A65C: [0xA65D],
+    0x0A65E: [0xA65F],
+    0x0A660: [0xA661],
+    0x0A662: [0xA663],
+    0x0A664: [0xA665],
+    0x0A666: [0xA667],
+    0x0A668: [0xA669],
+    0x0A66A: [0xA66B],
+    0x0A66C: [0xA66D],
+    0x0A680: [0xA681],
+    0x0A682: [0xA683],
+    0x0A684: [0xA685],
+    0x0A686: [0xA687],
+    0x0A688: [0xA689],
+    0x0A68A: [0xA68B],
+    0x0A68C: [0xA68D],
+    0x0A68E: [0xA68F],
+    0x0A690: [0xA691],
+    0x0A692: [0xA693],
+    0x0A694: [0xA695],
+    0x0A696: [0xA697],
+    0x0A698: [0xA699],
+    0x0A69A: [0xA69B],
+    0x0A69C: [0x044A],
+    0x0A69D: [0x044C],
+    0x0A722: [0xA723],
+    0x0A724: [0xA725],
+    0x0A726: [0xA727],
+    0x0A728: [0xA729],
+    0x0A72A: [0xA72B],
+    0x0A72C: [0xA72D],
+    0x0A72E: [0xA72F],
+    0x0A732: [0xA733],
+    0x0A734: [0xA735],
+    0x0A736: [0xA737],
+    0x0A738: [0xA739],
+    0x0A73A: [0xA73B],
+    0x0A73C: [0xA73D],
+    0x0A73E: [0xA73F],
+    0x0A740: [0xA741],
+    0x0A742: [0xA743],
+    0x0A744: [0xA745],
+    0x0A746: [0xA747],
+    0x0A748: [0xA749],
+    0x0A74A: [0xA74B],
+    0x0A74C: [0xA74D],
+    0x0A74E: [0xA74F],
+    0x0A750: [0xA751],
+    0x0A752: [0xA753],
+    0x0A754: [0xA755],
+    0x0A756: [0xA757],
+    0x0A758: [0xA759],
+    0x0A75A: [0xA75B],
+    0x0A75C: [0xA75D],
+    0x0A75E: [0xA75F],
+    0x0A760: [0xA761],
+    0x0A762: [0xA763],
+    0x0A764: [0xA765],
+    0x0A766: [0xA767],
+    0x0A768: [0xA769],
+    0x0A76A: [0xA76B],
+    0x0A76C: [0xA76D],
+    0x0A76E: [0xA76F],
+    0x0A770: [0xA76F],
+    0x0A779: [0xA77A],
+    0x0A77B: [0xA77C],
+    0x0A77D: [0x1D79],
+    0x0A77E: [0xA77F],
+    0x0A780: [0xA781],
+    0x0A782: [0xA783],
+    0x0A784: [0xA785],
+    0x0A786: [0xA787],
+    0x0A78B: [0xA78C],
+    0x0A78D: [0x0265],
+    0x0A790: [0xA791],
+    0x0A792: [0xA793],
+    0x0A796: [0xA797],
+    0x0A798: [0xA799],
+    0x0A79A: [0xA79B],
+    0x0A79C: [0xA79D],
+    0x0A79E: [0xA79F],
+    0x0A7A0: [0xA7A1],
+    0x0A7A2: [0xA7A3],
+    0x0A7A4: [0xA7A5],
+    0x0A7A6: [0xA7A7],
+    0x0A7A8: [0xA7A9],
+    0x0A7AA: [0x0266],
+    0x0A7AB: [0x025C],
+    0x0A7AC: [0x0261],
+    0x0A7AD: [0x026C],
+    0x0A7AE: [0x026A],
+    0x0A7B0: [0x029E],
+    0x0A7B1: [0x0287],
+    0x0A7B2: [0x029D],
+    0x0A7B3: [0xAB53],
+    0x0A7B4: [0xA7B5],
+    0x0A7B6: [0xA7B7],
+    0x0A7B8: [0xA7B9],
+    0x0A7BA: [0xA7BB],
+    0x0A7BC: [0xA7BD],
+    0x0A7BE: [0xA7BF],
+    0x0A7C0: [0xA7C1],
+    0x0A7C2: [0xA7C3],
+    0x0A7C4: [0xA794],
+    0x0A7C5: [0x0282],
+    0x0A7C6: [0x1D8E],
+    0x0A7C7: [0xA7C8],
+    0x0A7C9: [0xA7CA],
+    0x0A7CB: [0x0264],
+    0x0A7CC: [0xA7CD],
+    0x0A7D0: [0xA7D1],
+    0x0A7D6: [0xA7D7],
+    0x0A7D8: [0xA7D9],
+    0x0A7DA: [0xA7DB],
+    0x0A7DC: [0x019B],
+    0x0A7F2: [0x0063],
+    0x0A7F3: [0x0066],
+    0x0A7F4: [0x0071],
+    0x0A7F5: [0xA7F6],
+    0x0A7F8: [0x0127],
+    0x0A7F9: [0x0153],
+    0x0AB5C: [0xA727],
+    0x0AB5D: [0xAB37],
+    0x0AB5E: [0x026B],
+    0x0AB5F: [0xAB52],
+    0x0AB69: [0x028D],
+    0x0AB70: [0x13A0],
+    0x0AB71: [0x13A1],
+    0x0AB72: [0x13A2],
+    0x0AB73: [0x13A3],
+    0x0AB74: [0x13A4],
+    0x0AB75: [0x13A5],
+    0x0AB76: [0x13A6],
+    0x0AB77: [0x13A7],
+    0x0AB78: [0x13A8],
+    0x0AB79: [0x13A9],
+    0x0AB7A: [0x13AA],
+    0x0AB7B: [0x13AB],
+    0x0AB7C: [0x13AC],
+    0x0AB7D: [0x13AD],
+    0x0AB7E: [0x13AE],
+    0x0AB7F: [0x13AF],
+    0x0AB80: [0x13B0],
+    0x0AB81: [0x13B1],
+    0x0AB82: [0x13B2],
+    0x0AB83: [0x13B3],
+    0x0AB84: [0x13B4],
+    0x0AB85: [0x13B5],
+    0x0AB86: [0x13B6],
+    0x0AB87: [0x13B7],
+    0x0AB88: [0x13B8],
+    0x0AB89: [0x13B9],
+    0x0AB8A: [0x13BA],
+    0x0AB8B: [0x13BB],
+    0x0AB8C: [0x13BC],
+    0x0AB8D: [0x13BD],
+    0x0AB8E: [0x13BE],
+    0x0AB8F: [0x13BF],
+    0x0AB90: [0x13C0],
+    0x0AB91: [0x13C1],
+    0x0AB92: [0x13C2],
+    0x0AB93: [0x13C3],
+    0x0AB94: [0x13C4],
+    0x0AB95: [0x13C5],
+    0x0AB96: [0x13C6],
+    0x0AB97: [0x13C7],
+    0x0AB98: [0x13C8],
+    0x0AB99: [0x13C9],
+    0x0AB9A: [0x13CA],
+    0x0AB9B: [0x13CB],
+    0x0AB9C: [0x13CC],
+    0x0AB9D: [0x13CD],
+    0x0AB9E: [0x13CE],
+    0x0AB9F: [0x13CF],
+    0x0ABA0: [0x13D0],
+    0x0ABA1: [0x13D1],
+    0x0ABA2: [0x13D2],
+    0x0ABA3: [0x13D3],
+    0x0ABA4: [0x13D4],
+    0x0ABA5: [0x13D5],
+    0x0ABA6: [0x13D6],
+    0x0ABA7: [0x13D7],
+    0x0ABA8: [0x13D8],
+    0x0ABA9: [0x13D9],
+    0x0ABAA: [0x13DA],
+    0x0ABAB: [0x13DB],
+    0x0ABAC: [0x13DC],
+    0x0ABAD: [0x13DD],
+    0x0ABAE: [0x13DE],
+    0x0ABAF: [0x13DF],
+    0x0ABB0: [0x13E0],
+    0x0ABB1: [0x13E1],
+    0x0ABB2: [0x13E2],
+    0x0ABB3: [0x13E3],
+    0x0ABB4: [0x13E4],
+    0x0ABB5: [0x13E5],
+    0x0ABB6: [0x13E6],
+    0x0ABB7: [0x13E7],
+    0x0ABB8: [0x13E8],
+    0x0ABB9: [0x13E9],
+    0x0ABBA: [0x13EA],
+    0x0ABBB: [0x13EB],
+    0x0ABBC: [0x13EC],
+    0x0ABBD: [0x13ED],
+    0x0ABBE: [0x13EE],
+    0x0ABBF: [0x13EF],
+    0x0F900: [0x8C48],
+    0x0F901: [0x66F4],
+    0x0F902: [0x8ECA],
+    0x0F903: [0x8CC8],
+    0x0F904: [0x6ED1],
+    0x0F905: [0x4E32],
+    0x0F906: [0x53E5],
+    0x0F907: [0x9F9C],
+    0x0F908: [0x9F9C],
+    0x0F909: [0x5951],
+    0x0F90A: [0x91D1],
+    0x0F90B: [0x5587],
+    0x0F90C: [0x5948],
+    0x0F90D: [0x61F6],
+    0x0F90E: [0x7669],
+    0x0F90F: [0x7F85],
+    0x0F910: [0x863F],
+    0x0F911: [0x87BA],
+    0x0F912: [0x88F8],
+    0x0F913: [0x908F],
+    0x0F914: [0x6A02],
+    0x0F915: [0x6D1B],
+    0x0F916: [0x70D9],
+    0x0F917: [0x73DE],
+    0x0F918: [0x843D],
+    0x0F919: [0x916A],
+    0x0F91A: [0x99F1],
+    0x0F91B: [0x4E82],
+    0x0F91C: [0x5375],
+    0x0F91D: [0x6B04],
+    0x0F91E: [0x721B],
+    0x0F91F: [0x862D],
+    0x0F920: [0x9E1E],
+    0x0F921: [0x5D50],
+    0x0F922: [0x6FEB],
+    0x0F923: [0x85CD],
+    0x0F924: [0x8964],
+    0x0F925: [0x62C9],
+    0x0F926: [0x81D8],
+    0x0F927: [0x881F],
+    0x0F928: [0x5ECA],
+    0x0F929: [0x6717],
+    0x0F92A: [0x6D6A],
+    0x0F92B: [0x72FC],
+    0x0F92C: [0x90CE],
+    0x0F92D: [0x4F86],
+    0x0F92E: [0x51B7],
+    0x0F92F: [0x52DE],
+    0x0F930: [0x64C4],
+    0x0F931: [0x6AD3],
+    0x0F932: [0x7210],
+    0x0F933: [0x76E7],
+    0x0F934: [0x8001],
+    0x0F935: [0x8606],
+    0x0F936: [0x865C],
+    0x0F937: [0x8DEF],
+    0x0F938: [0x9732],
+    0x0F939: [0x9B6F],
+    0x0F93A: [0x9DFA],
+    0x0F93B: [0x788C],
+    0x0F93C: [0x797F],
+    0x0F93D: [0x7DA0],
+    0x0F93E: [0x83C9],
+    0x0F93F: [0x9304],
+    0x0F940: [0x9E7F],
+    0x0F941: [0x8AD6],
+    0x0F942: [0x58DF],
+    0x0F943: [0x5F04],
+    0x0F944: [0x7C60],
+    0x0F945: [0x807E],
+    0x0F946: [0x7262],
+    0x0F947: [0x78CA],
+    0x0F948: [0x8CC2],
+    0x0F949: [0x96F7],
+    0x0F94A: [0x58D8],
+    0x0F94B: [0x5C62],
+    0x0F94C: [0x6A13],
+    0x0F94D: [0x6DDA],
+    0x0F94E: [0x6F0F],
+    0x0F94F: [0x7D2F],
+    0x0F950: [0x7E37],
+    0x0F951: [0x964B],
+    0x0F952: [0x52D2],
+    0x0F953: [0x808B],
+    0x0F954: [0x51DC],
+    0x0F955: [0x51CC],
+    0x0F956: [0x7A1C],
+    0x0F957: [0x7DBE],
+    0x0F958: [0x83F1],
+    0x0F959: [0x9675],
+    0x0F95A: [0x8B80],
+    0x0F95B: [0x62CF],
+    0x0F95C: [0x6A02],
+    0x0F95D: [0x8AFE],
+    0x0F95E: [0x4E39],
+    0x0F95F: [0x5BE7],
+    0x0F960: [0x6012],
+    0x0F961: [0x7387],
+    0x0F962: [0x7570],
+    0x0F963: [0x5317],
+    0x0F964: [0x78FB],
+    0x0F965: [0x4FBF],
+    0x0F966: [0x5FA9],
+    0x0F967: [0x4E0D],
+    0x0F968: [0x6CCC],
+    0x0F969: [0x6578],
+    0x0F96A: [0x7D22],
+    0x0F96B: [0x53C3],
+    0x0F96C: [0x585E],
+    0x0F96D: [0x7701],
+    0x0F96E: [0x8449],
+    0x0F96F: [0x8AAA],
+    0x0F970: [0x6BBA],
+    0x0F971: [0x8FB0],
+    0x0F972: [0x6C88],
+    0x0F973: [0x62FE],
+    0x0F974: [0x82E5],
+    0x0F975: [0x63A0],
+    0x0F976: [0x7565],
+    0x0F977: [0x4EAE],
+    0x0F978: [0x5169],
+    0x0F979: [0x51C9],
+    0x0F97A: [0x6881],
+    0x0F97B: [0x7CE7],
+    0x0F97C: [0x826F],
+    0x0F97D: [0x8AD2],
+    0x0F97E: [0x91CF],
+    0x0F97F: [0x52F5],
+    0x0F980: [0x5442],
+    0x0F981: [0x5973],
+    0x0F982: [0x5EEC],
+    0x0F983: [0x65C5],
+    0x0F984: [0x6FFE],
+    0x0F985: [0x792A],
+    0x0F986: [0x95AD],
+    0x0F987: [0x9A6A],
+    0x0F988: [0x9E97],
+    0x0F989: [0x9ECE],
+    0x0F98A: [0x529B],
+    0x0F98B: [0x66C6],
+    0x0F98C: [0x6B77],
+    0x0F98D: [0x8F62],
+    0x0F98E: [0x5E74],
+    0x0F98F: [0x6190],
+    0x0F990: [0x6200],
+    0x0F991: [0x649A],
+    0x0F992: [0x6F23],
+    0x0F993: [0x7149],
+    0x0F994: [0x7489],
+    0x0F995: [0x79CA],
+    0x0F996: [0x7DF4],
+    0x0F997: [0x806F],
+    0x0F998: [0x8F26],
+    0x0F999: [0x84EE],
+    0x0F99A: [0x9023],
+    0x0F99B: [0x934A],
+    0x0F99C: [0x5217],
+    0x0F99D: [0x52A3],
+    0x0F99E: [0x54BD],
+    0x0F99F: [0x70C8],
+    0x0F9A0: [0x88C2],
+    0x0F9A1: [0x8AAA],
+    0x0F9A2: [0x5EC9],
+    0x0F9A3: [0x5FF5],
+    0x0F9A4: [0x637B],
+    0x0F9A5: [0x6BAE],
+    0x0F9A6: [0x7C3E],
+    0x0F9A7: [0x7375],
+    0x0F9A8: [0x4EE4],
+    0x0F9A9: [0x56F9],
+    0x0F9AA: [0x5BE7],
+    0x0F9AB: [0x5DBA],
+    0x0F9AC: [0x601C],
+    0x0F9AD: [0x73B2],
+    0x0F9AE: [0x7469],
+    0x0F9AF: [0x7F9A],
+    0x0F9B0: [0x8046],
+    0x0F9B1: [0x9234],
+    0x0F9B2: [0x96F6],
+    0x0F9B3: [0x9748],
+    0x0F9B4: [0x9818],
+    0x0F9B5: [0x4F8B],
+    0x0F9B6: [0x79AE],
+    0x0F9B7: [0x91B4],
+    0x0F9B8: [0x96B8],
+    0x0F9B9: [0x60E1],
+    0x0F9BA: [0x4E86],
+    0x0F9BB: [0x50DA],
+    0x0F9BC: [0x5BEE],
+    0x0F9BD: [0x5C3F],
+    0x0F9BE: [0x6599],
+    0x0F9BF: [0x6A02],
+    0x0F9C0: [0x71CE],
+    0x0F9C1: [0x7642],
+    0x0F9C2: [0x84FC],
+    0x0F9C3: [0x907C],
+    0x0F9C4: [0x9F8D],
+    0x0F9C5: [0x6688],
+    0x0F9C6: [0x962E],
+    0x0F9C7: [0x5289],
+    0x0F9C8: [0x677B],
+    0x0F9C9: [0x67F3],
+    0x0F9CA: [0x6D41],
+    0x0F9CB: [0x6E9C],
+    0x0F9CC: [0x7409],
+    0x0F9CD: [0x7559],
+    0x0F9CE: [0x786B],
+    0x0F9CF: [0x7D10],
+    0x0F9D0: [0x985E],
+    0x0F9D1: [0x516D],
+    0x0F9D2: [0x622E],
+    0x0F9D3: [0x9678],
+    0x0F9D4: [0x502B],
+    0x0F9D5: [0x5D19],
+    0x0F9D6: [0x6DEA],
+    0x0F9D7: [0x8F2A],
+    0x0F9D8: [0x5F8B],
+    0x0F9D9: [0x6144],
+    0x0F9DA: [0x6817],
+    0x0F9DB: [0x7387],
+    0x0F9DC: [0x9686],
+    0x0F9DD: [0x5229],
+    0x0F9DE: [0x540F],
+    0x0F9DF: [0x5C65],
+    0x0F9E0: [0x6613],
+    0x0F9E1: [0x674E],
+    0x0F9E2: [0x68A8],
+    0x0F9E3: [0x6CE5],
+    0x0F9E4: [0x7406],
+    0x0F9E5: [0x75E2],
+    0x0F9E6: [0x7F79],
+    0x0F9E7: [0x88CF],
+    0x0F9E8: [0x88E1],
+    0x0F9E9: [0x91CC],
+    0x0F9EA: [0x96E2],
+    0x0F9EB: [0x533F],
+    0x0F9EC: [0x6EBA],
+    0x0F9ED: [0x541D],
+    0x0F9EE: [0x71D0],
+    0x0F9EF: [0x7498],
+    0x0F9F0: [0x85FA],
+    0x0F9F1: [0x96A3],
+    0x0F9F2: [0x9C57],
+    0x0F9F3: [0x9E9F],
+    0x0F9F4: [0x6797],
+    0x0F9F5: [0x6DCB],
+    0x0F9F6: [0x81E8],
+    0x0F9F7: [0x7ACB],
+    0x0F9F8: [0x7B20],
+    0x0F9F9: [0x7C92],
+    0x0F9FA: [0x72C0],
+    0x0F9FB: [0x7099],
+    0x0F9FC: [0x8B58],
+    0x0F9FD: [0x4EC0],
+    0x0F9FE: [0x8336],
+    0x0F9FF: [0x523A],
+    0x0FA00: [0x5207],
+    0x0FA01: [0x5EA6],
+    0x0FA02: [0x62D3],
+    0x0FA03: [0x7CD6],
+    0x0FA04: [0x5B85],
+    0x0FA05: [0x6D1E],
+    0x0FA06: [0x66B4],
+    0x0FA07: [0x8F3B],
+    0x0FA08: [0x884C],
+    0x0FA09: [0x964D],
+    0x0FA0A: [0x898B],
+    0x0FA0B: [0x5ED3],
+    0x0FA0C: [0x5140],
+    0x0FA0D: [0x55C0],
+    0x0FA10: [0x585A],
+    0x0FA12: [0x6674],
+    0x0FA15: [0x51DE],
+    0x0FA16: [0x732A],
+    0x0FA17: [0x76CA],
+    0x0FA18: [0x793C],
+    0x0FA19: [0x795E],
+    0x0FA1A: [0x7965],
+    0x0FA1B: [0x798F],
+    0x0FA1C: [0x9756],
+    0x0FA1D: [0x7CBE],
+    0x0FA1E: [0x7FBD],
+    0x0FA20: [0x8612],
+    0x0FA22: [0x8AF8],
+    0x0FA25: [0x9038],
+    0x0FA26: [0x90FD],
+    0x0FA2A: [0x98EF],
+    0x0FA2B: [0x98FC],
+    0x0FA2C: [0x9928],
+    0x0FA2D: [0x9DB4],
+    0x0FA2E: [0x90DE],
+    0x0FA2F: [0x96B7],
+    0x0FA30: [0x4FAE],
+    0x0FA31: [0x50E7],
+    0x0FA32: [0x514D],
+    0x0FA33: [0x52C9],
+    0x0FA34: [0x52E4],
+    0x0FA35: [0x5351],
+    0x0FA36: [0x559D],
+    0x0FA37: [0x5606],
+    0x0FA38: [0x5668],
+    0x0FA39: [0x5840],
+    0x0FA3A: [0x58A8],
+    0x0FA3B: [0x5C64],
+    0x0FA3C: [0x5C6E],
+    0x0FA3D: [0x6094],
+    0x0FA3E: [0x6168],
+    0x0FA3F: [0x618E],
+    0x0FA40: [0x61F2],
+    0x0FA41: [0x654F],
+    0x0FA42: [0x65E2],
+    0x0FA43: [0x6691],
+    0x0FA44: [0x6885],
+    0x0FA45: [0x6D77],
+    0x0FA46: [0x6E1A],
+    0x0FA47: [0x6F22],
+    0x0FA48: [0x716E],
+    0x0FA49: [0x722B],
+    0x0FA4A: [0x7422],
+    0x0FA4B: [0x7891],
+    0x0FA4C: [0x793E],
+    0x0FA4D: [0x7949],
+    0x0FA4E: [0x7948],
+    0x0FA4F: [0x7950],
+    0x0FA50: [0x7956],
+    0x0FA51: [0x795D],
+    0x0FA52: [0x798D],
+    0x0FA53: [0x798E],
+    0x0FA54: [0x7A40],
+    0x0FA55: [0x7A81],
+    0x0FA56: [0x7BC0],
+    0x0FA57: [0x7DF4],
+    0x0FA58: [0x7E09],
+    0x0FA59: [0x7E41],
+    0x0FA5A: [0x7F72],
+    0x0FA5B: [0x8005],
+    0x0FA5C: [0x81ED],
+    0x0FA5D: [0x8279],
+    0x0FA5E: [0x8279],
+    0x0FA5F: [0x8457],
+    0x0FA60: [0x8910],
+    0x0FA61: [0x8996],
+    0x0FA62: [0x8B01],
+    0x0FA63: [0x8B39],
+    0x0FA64: [0x8CD3],
+    0x0FA65: [0x8D08],
+    0x0FA66: [0x8FB6],
+    0x0FA67: [0x9038],
+    0x0FA68: [0x96E3],
+    0x0FA69: [0x97FF],
+    0x0FA6A: [0x983B],
+    0x0FA6B: [0x6075],
+    0x0FA6C: [0x242EE],
+    0x0FA6D: [0x8218],
+    0x0FA70: [0x4E26],
+    0x0FA71: [0x51B5],
+    0x0FA72: [0x5168],
+    0x0FA73: [0x4F80],
+    0x0FA74: [0x5145],
+    0x0FA75: [0x5180],
+    0x0FA76: [0x52C7],
+    0x0FA77: [0x52FA],
+    0x0FA78: [0x559D],
+    0x0FA79: [0x5555],
+    0x0FA7A: [0x5599],
+    0x0FA7B: [0x55E2],
+    0x0FA7C: [0x585A],
+    0x0FA7D: [0x58B3],
+    0x0FA7E: [0x5944],
+    0x0FA7F: [0x5954],
+    0x0FA80: [0x5A62],
+    0x0FA81: [0x5B28],
+    0x0FA82: [0x5ED2],
+    0x0FA83: [0x5ED9],
+    0x0FA84: [0x5F69],
+    0x0FA85: [0x5FAD],
+    0x0FA86: [0x60D8],
+    0x0FA87: [0x614E],
+    0x0FA88: [0x6108],
+    0x0FA89: [0x618E],
+    0x0FA8A: [0x6160],
+    0x0FA8B: [0x61F2],
+    0x0FA8C: [0x6234],
+    0x0FA8D: [0x63C4],
+    0x0FA8E: [0x641C],
+    0x0FA8F: [0x6452],
+    0x0FA90: [0x6556],
+    0x0FA91: [0x6674],
+    0x0FA92: [0x6717],
+    0x0FA93: [0x671B],
+    0x0FA94: [0x6756],
+    0x0FA95: [0x6B79],
+    0x0FA96: [0x6BBA],
+    0x0FA97: [0x6D41],
+    0x0FA98: [0x6EDB],
+    0x0FA99: [0x6ECB],
+    0x0FA9A: [0x6F22],
+    0x0FA9B: [0x701E],
+    0x0FA9C: [0x716E],
+    0x0FA9D: [0x77A7],
+    0x0FA9E: [0x7235],
+    0x0FA9F: [0x72AF],
+    0x0FAA0: [0x732A],
+    0x0FAA1: [0x7471],
+    0x0FAA2: [0x7506],
+    0x0FAA3: [0x753B],
+    0x0FAA4: [0x761D],
+    0x0FAA5: [0x761F],
+    0x0FAA6: [0x76CA],
+    0x0FAA7: [0x76DB],
+    0x0FAA8: [0x76F4],
+    0x0FAA9: [0x774A],
+    0x0FAAA: [0x7740],
+    0x0FAAB: [0x78CC],
+    0x0FAAC: [0x7AB1],
+    0x0FAAD: [0x7BC0],
+    0x0FAAE: [0x7C7B],
+    0x0FAAF: [0x7D5B],
+    0x0FAB0: [0x7DF4],
+    0x0FAB1: [0x7F3E],
+    0x0FAB2: [0x8005],
+    0x0FAB3: [0x8352],
+    0x0FAB4: [0x83EF],
+    0x0FAB5: [0x8779],
+    0x0FAB6: [0x8941],
+    0x0FAB7: [0x8986],
+    0x0FAB8: [0x8996],
+    0x0FAB9: [0x8ABF],
+    0x0FABA: [0x8AF8],
+    0x0FABB: [0x8ACB],
+    0x0FABC: [0x8B01],
+    0x0FABD: [0x8AFE],
+    0x0FABE: [0x8AED],
+    0x0FABF: [0x8B39],
+    0x0FAC0: [0x8B8A],
+    0x0FAC1: [0x8D08],
+    0x0FAC2: [0x8F38],
+    0x0FAC3: [0x9072],
+    0x0FAC4: [0x9199],
+    0x0FAC5: [0x9276],
+    0x0FAC6: [0x967C],
+    0x0FAC7: [0x96E3],
+    0x0FAC8: [0x9756],
+    0x0FAC9: [0x97DB],
+    0x0FACA: [0x97FF],
+    0x0FACB: [0x980B],
+    0x0FACC: [0x983B],
+    0x0FACD: [0x9B12],
+    0x0FACE: [0x9F9C],
+    0x0FACF: [0x2284A],
+    0x0FAD0: [0x22844],
+    0x0FAD1: [0x233D5],
+    0x0FAD2: [0x3B9D],
+    0x0FAD3: [0x4018],
+    0x0FAD4: [0x4039],
+    0x0FAD5: [0x25249],
+    0x0FAD6: [0x25CD0],
+    0x0FAD7: [0x27ED3],
+    0x0FAD8: [0x9F43],
+    0x0FAD9: [0x9F8E],
+    0x0FB00: [0x0066, 0x0066],
+    0x0FB01: [0x0066, 0x0069],
+    0x0FB02: [0x0066, 0x006C],
+    0x0FB03: [0x0066, 0x0066, 0x0069],
+    0x0FB04: [0x0066, 0x0066, 0x006C],
+    0x0FB05: [0x0073, 0x0074],
+    0x0FB06: [0x0073, 0x0074],
+    0x0FB13: [0x0574, 0x0576],
+    0x0FB14: [0x0574, 0x0565],
+    0x0FB15: [0x0574, 0x056B],
+    0x0FB16: [0x057E, 0x0576],
+    0x0FB17: [0x0574, 0x056D],
+    0x0FB1D: [0x05D9, 0x05B4],
+    0x0FB1F: [0x05F2, 0x05B7],
+    0x0FB20: [0x05E2],
+    0x0FB21: [0x05D0],
+    0x0FB22: [0x05D3],
+    0x0FB23: [0x05D4],
+    0x0FB24: [0x05DB],
+    0x0FB25: [0x05DC],
+    0x0FB26: [0x05DD],
+    0x0FB27: [0x05E8],
+    0x0FB28: [0x05EA],
+    0x0FB29: [0x002B],
+    0x0FB2A: [0x05E9, 0x05C1],
+    0x0FB2B: [0x05E9, 0x05C2],
+    0x0FB2C: [0x05E9, 0x05BC, 0x05C1],
+    0x0FB2D: [0x05E9, 0x05BC, 0x05C2],
+    0x0FB2E: [0x05D0, 0x05B7],
+    0x0FB2F: [0x05D0, 0x05B8],
+    0x0FB30: [0x05D0, 0x05BC],
+    0x0FB31: [0x05D1, 0x05BC],
+    0x0FB32: [0x05D2, 0x05BC],
+    0x0FB33: [0x05D3, 0x05BC],
+    0x0FB34: [0x05D4, 0x05BC],
+    0x0FB35: [0x05D5, 0x05BC],
+    0x0FB36: [0x05D6, 0x05BC],
+    0x0FB38: [0x05D8, 0x05BC],
+    0x0FB39: [0x05D9, 0x05BC],
+    0x0FB3A: [0x05DA, 0x05BC],
+    0x0FB3B: [0x05DB, 0x05BC],
+    0x0FB3C: [0x05DC, 0x05BC],
+    0x0FB3E: [0x05DE, 0x05BC],
+    0x0FB40: [0x05E0, 0x05BC],
+    0x0FB41: [0x05E1, 0x05BC],
+    0x0FB43: [0x05E3, 0x05BC],
+    0x0FB44: [0x05E4, 0x05BC],
+    0x0FB46: [0x05E6, 0x05BC],
+    0x0FB47: [0x05E7, 0x05BC],
+    0x0FB48: [0x05E8, 0x05BC],
+    0x0FB49: [0x05E9, 0x05BC],
+    0x0FB4A: [0x05EA, 0x05BC],
+    0x0FB4B: [0x05D5, 0x05B9],
+    0x0FB4C: [0x05D1, 0x05BF],
+    0x0FB4D: [0x05DB, 0x05BF],
+    0x0FB4E: [0x05E4, 0x05BF],
+    0x0FB4F: [0x05D0, 0x05DC],
+    0x0FB50: [0x0671],
+    0x0FB51: [0x0671],
+    0x0FB52: [0x067B],
+    0x0FB53: [0x067B],
+    0x0FB54: [0x067B],
+    0x0FB55: [0x067B],
+    0x0FB56: [0x067E],
+    0x0FB57: [0x067E],
+    0x0FB58: [0x067E],
+    0x0FB59: [0x067E],
+    0x0FB5A: [0x0680],
+    0x0FB5B: [0x0680],
+    0x0FB5C: [0x0680],
+    0x0FB5D: [0x0680],
+    0x0FB5E: [0x067A],
+    0x0FB5F: [0x067A],
+    0x0FB60: [0x067A],
+    0x0FB61: [0x067A],
+    0x0FB62: [0x067F],
+    0x0FB63: [0x067F],
+    0x0FB64: [0x067F],
+    0x0FB65: [0x067F],
+    0x0FB66: [0x0679],
+    0x0FB67: [0x0679],
+    0x0FB68: [0x0679],
+    0x0FB69: [0x0679],
+    0x0FB6A: [0x06A4],
+    0x0FB6B: [0x06A4],
+    0x0FB6C: [0x06A4],
+    0x0FB6D: [0x06A4],
+    0x0FB6E: [0x06A6],
+    0x0FB6F: [0x06A6],
+    0x0FB70: [0x06A6],
+    0x0FB71: [0x06A6],
+    0x0FB72: [0x0684],
+    0x0FB73: [0x0684],
+    0x0FB74: [0x0684],
+    0x0FB75: [0x0684],
+    0x0FB76: [0x0683],
+    0x0FB77: [0x0683],
+    0x0FB78: [0x0683],
+    0x0FB79: [0x0683],
+    0x0FB7A: [0x0686],
+    0x0FB7B: [0x0686],
+    0x0FB7C: [0x0686],
+    0x0FB7D: [0x0686],
+    0x0FB7E: [0x0687],
+    0x0FB7F: [0x0687],
+    0x0FB80: [0x0687],
+    0x0FB81: [0x0687],
+    0x0FB82: [0x068D],
+    0x0FB83: [0x068D],
+    0x0FB84: [0x068C],
+    0x0FB85: [0x068C],
+    0x0FB86: [0x068E],
+    0x0FB87: [0x068E],
+    0x0FB88: [0x0688],
+    0x0FB89: [0x0688],
+    0x0FB8A: [0x0698],
+    0x0FB8B: [0x0698],
+    0x0FB8C: [0x0691],
+    0x0FB8D: [0x0691],
+    0x0FB8E: [0x06A9],
+    0x0FB8F: [0x06A9],
+    0x0FB90: [0x06A9],
+    0x0FB91: [0x06A9],
+    0x0FB92: [0x06AF],
+    0x0FB93: [0x06AF],
+    0x0FB94: [0x06AF],
+    0x0FB95: [0x06AF],
+    0x0FB96: [0x06B3],
+    0x0FB97: [0x06B3],
+    0x0FB98: [0x06B3],
+    0x0FB99: [0x06B3],
+    0x0FB9A: [0x06B1],
+    0x0FB9B: [0x06B1],
+    0x0FB9C: [0x06B1],
+    0x0FB9D: [0x06B1],
+    0x0FB9E: [0x06BA],
+    0x0FB9F: [0x06BA],
+    0x0FBA0: [0x06BB],
+    0x0FBA1: [0x06BB],
+    0x0FBA2: [0x06BB],
+    0x0FBA3: [0x06BB],
+    0x0FBA4: [0x06C0],
+    0x0FBA5: [0x06C0],
+    0x0FBA6: [0x06C1],
+    0x0FBA7: [0x06C1],
+    0x0FBA8: [0x06C1],
+    0x0FBA9: [0x06C1],
+    0x0FBAA: [0x06BE],
+    0x0FBAB: [0x06BE],
+    0x0FBAC: [0x06BE],
+    0x0FBAD: [0x06BE],
+    0x0FBAE: [0x06D2],
+    0x0FBAF: [0x06D2],
+    0x0FBB0: [0x06D3],
+    0x0FBB1: [0x06D3],
+    0x0FBD3: [0x06AD],
+    0x0FBD4: [0x06AD],
+    0x0FBD5: [0x06AD],
+    0x0FBD6: [0x06AD],
+    0x0FBD7: [0x06C7],
+    0x0FBD8: [0x06C7],
+    0x0FBD9: [0x06C6],
+    0x0FBDA: [0x06C6],
+    0x0FBDB: [0x06C8],
+    0x0FBDC: [0x06C8],
+    0x0FBDD: [0x06C7, 0x0674],
+    0x0FBDE: [0x06CB],
+    0x0FBDF: [0x06CB],
+    0x0FBE0: [0x06C5],
+    0x0FBE1: [0x06C5],
+    0x0FBE2: [0x06C9],
+    0x0FBE3: [0x06C9],
+    0x0FBE4: [0x06D0],
+    0x0FBE5: [0x06D0],
+    0x0FBE6: [0x06D0],
+    0x0FBE7: [0x06D0],
+    0x0FBE8: [0x0649],
+    0x0FBE9: [0x0649],
+    0x0FBEA: [0x0626, 0x0627],
+    0x0FBEB: [0x0626, 0x0627],
+    0x0FBEC: [0x0626, 0x06D5],
+    0x0FBED: [0x0626, 0x06D5],
+    0x0FBEE: [0x0626, 0x0648],
+    0x0FBEF: [0x0626, 0x0648],
+    0x0FBF0: [0x0626, 0x06C7],
+    0x0FBF1: [0x0626, 0x06C7],
+    0x0FBF2: [0x0626, 0x06C6],
+    0x0FBF3: [0x0626, 0x06C6],
+    0x0FBF4: [0x0626, 0x06C8],
+    0x0FBF5: [0x0626, 0x06C8],
+    0x0FBF6: [0x0626, 0x06D0],
+    0x0FBF7: [0x0626, 0x06D0],
+    0x0FBF8: [0x0626, 0x06D0],
+    0x0FBF9: [0x0626, 0x0649],
+    0x0FBFA: [0x0626, 0x0649],
+    0x0FBFB: [0x0626, 0x0649],
+    0x0FBFC: [0x06CC],
+    0x0FBFD: [0x06CC],
+    0x0FBFE: [0x06CC],
+    0x0FBFF: [0x06CC],
+    0x0FC00: [0x0626, 0x062C],
+    0x0FC01: [0x0626, 0x062D],
+    0x0FC02: [0x0626, 0x0645],
+    0x0FC03: [0x0626, 0x0649],
+    0x0FC04: [0x0626, 0x064A],
+    0x0FC05: [0x0628, 0x062C],
+    0x0FC06: [0x0628, 0x062D],
+    0x0FC07: [0x0628, 0x062E],
+    0x0FC08: [0x0628, 0x0645],
+    0x0FC09: [0x0628, 0x0649],
+    0x0FC0A: [0x0628, 0x064A],
+    0x0FC0B: [0x062A, 0x062C],
+    0x0FC0C: [0x062A, 0x062D],
+    0x0FC0D: [0x062A, 0x062E],
+    0x0FC0E: [0x062A, 0x0645],
+    0x0FC0F: [0x062A, 0x0649],
+    0x0FC10: [0x062A, 0x064A],
+    0x0FC11: [0x062B, 0x062C],
+    0x0FC12: [0x062B, 0x0645],
+    0x0FC13: [0x062B, 0x0649],
+    0x0FC14: [0x062B, 0x064A],
+    0x0FC15: [0x062C, 0x062D],
+    0x0FC16: [0x062C, 0x0645],
+    0x0FC17: [0x062D, 0x062C],
+    0x0FC18: [0x062D, 0x0645],
+    0x0FC19: [0x062E, 0x062C],
+    0x0FC1A: [0x062E, 0x062D],
+    0x0FC1B: [0x062E, 0x0645],
+    0x0FC1C: [0x0633, 0x062C],
+    0x0FC1D: [0x0633, 0x062D],
+    0x0FC1E: [0x0633, 0x062E],
+    0x0FC1F: [0x0633, 0x0645],
+    0x0FC20: [0x0635, 0x062D],
+    0x0FC21: [0x0635, 0x0645],
+    0x0FC22: [0x0636, 0x062C],
+    0x0FC23: [0x0636, 0x062D],
+    0x0FC24: [0x0636, 0x062E],
+    0x0FC25: [0x0636, 0x0645],
+    0x0FC26: [0x0637, 0x062D],
+    0x0FC27: [0x0637, 0x0645],
+    0x0FC28: [0x0638, 0x0645],
+    0x0FC29: [0x0639, 0x062C],
+    0x0FC2A: [0x0639, 0x0645],
+    0x0FC2B: [0x063A, 0x062C],
+    0x0FC2C: [0x063A, 0x0645],
+    0x0FC2D: [0x0641, 0x062C],
+    0x0FC2E: [0x0641, 0x062D],
+    0x0FC2F: [0x0641, 0x062E],
+    0x0FC30: [0x0641, 0x0645],
+    0x0FC31: [0x0641, 0x0649],
+    0x0FC32: [0x0641, 0x064A],
+    0x0FC33: [0x0642, 0x062D],
+    0x0FC34: [0x0642, 0x0645],
+    0x0FC35: [0x0642, 0x0649],
+    0x0FC36: [0x0642, 0x064A],
+    0x0FC37: [0x0643, 0x0627],
+    0x0FC38: [0x0643, 0x062C],
+    0x0FC39: [0x0643, 0x062D],
+    0x0FC3A: [0x0643, 0x062E],
+    0x0FC3B: [0x0643, 0x0644],
+    0x0FC3C: [0x0643, 0x0645],
+    0x0FC3D: [0x0643, 0x0649],
+    0x0FC3E: [0x0643, 0x064A],
+    0x0FC3F: [0x0644, 0x062C],
+    0x0FC40: [0x0644, 0x062D],
+    0x0FC41: [0x0644, 0x062E],
+    0x0FC42: [0x0644, 0x0645],
+    0x0FC43: [0x0644, 0x0649],
+    0x0FC44: [0x0644, 0x064A],
+    0x0FC45: [0x0645, 0x062C],
+    0x0FC46: [0x0645, 0x062D],
+    0x0FC47: [0x0645, 0x062E],
+    0x0FC48: [0x0645, 0x0645],
+    0x0FC49: [0x0645, 0x0649],
+    0x0FC4A: [0x0645, 0x064A],
+    0x0FC4B: [0x0646, 0x062C],
+    0x0FC4C: [0x0646, 0x062D],
+    0x0FC4D: [0x0646, 0x062E],
+    0x0FC4E: [0x0646, 0x0645],
+    0x0FC4F: [0x0646, 0x0649],
+    0x0FC50: [0x0646, 0x064A],
+    0x0FC51: [0x0647, 0x062C],
+    0x0FC52: [0x0647, 0x0645],
+    0x0FC53: [0x0647, 0x0649],
+    0x0FC54: [0x0647, 0x064A],
+    0x0FC55: [0x064A, 0x062C],
+    0x0FC56: [0x064A, 0x062D],
+    0x0FC57: [0x064A, 0x062E],
+    0x0FC58: [0x064A, 0x0645],
+    0x0FC59: [0x064A, 0x0649],
+    0x0FC5A: [0x064A, 0x064A],
+    0x0FC5B: [0x0630, 0x0670],
+    0x0FC5C: [0x0631, 0x0670],
+    0x0FC5D: [0x0649, 0x0670],
+    0x0FC5E: [0x0020, 0x064C, 0x0651],
+    0x0FC5F: [0x0020, 0x064D, 0x0651],
+    0x0FC60: [0x0020, 0x064E, 0x0651],
+    0x0FC61: [0x0020, 0x064F, 0x0651],
+    0x0FC62: [0x0020, 0x0650, 0x0651],
+    0x0FC63: [0x0020, 0x0651, 0x0670],
+    0x0FC64: [0x0626, 0x0631],
+    0x0FC65: [0x0626, 0x0632],
+    0x0FC66: [0x0626, 0x0645],
+    0x0FC67: [0x0626, 0x0646],
+    0x0FC68: [0x0626, 0x0649],
+    0x0FC69: [0x0626, 0x064A],
+    0x0FC6A: [0x0628, 0x0631],
+    0x0FC6B: [0x0628, 0x0632],
+    0x0FC6C: [0x0628, 0x0645],
+    0x0FC6D: [0x0628, 0x0646],
+    0x0FC6E: [0x0628, 0x0649],
+    0x0FC6F: [0x0628, 0x064A],
+    0x0FC70: [0x062A, 0x0631],
+    0x0FC71: [0x062A, 0x0632],
+    0x0FC72: [0x062A, 0x0645],
+    0x0FC73: [0x062A, 0x0646],
+    0x0FC74: [0x062A, 0x0649],
+    0x0FC75: [0x062A, 0x064A],
+    0x0FC76: [0x062B, 0x0631],
+    0x0FC77: [0x062B, 0x0632],
+    0x0FC78: [0x062B, 0x0645],
+    0x0FC79: [0x062B, 0x0646],
+    0x0FC7A: [0x062B, 0x0649],
+    0x0FC7B: [0x062B, 0x064A],
+    0x0FC7C: [0x0641, 0x0649],
+    0x0FC7D: [0x0641, 0x064A],
+    0x0FC7E: [0x0642, 0x0649],
+    0x0FC7F: [0x0642, 0x064A],
+    0x0FC80: [0x0643, 0x0627],
+    0x0FC81: [0x0643, 0x0644],
+    0x0FC82: [0x0643, 0x0645],
+    0x0FC83: [0x0643, 0x0649],
+    0x0FC84: [0x0643, 0x064A],
+    0x0FC85: [0x0644, 0x0645],
+    0x0FC86: [0x0644, 0x0649],
+    0x0FC87: [0x0644, 0x064A],
+    0x0FC88: [0x0645, 0x0627],
+    0x0FC89: [0x0645, 0x0645],
+    0x0FC8A: [0x0646, 0x0631],
+    0x0FC8B: [0x0646, 0x0632],
+    0x0FC8C: [0x0646, 0x0645],
+    0x0FC8D: [0x0646, 0x0646],
+    0x0FC8E: [0x0646, 0x0649],
+    0x0FC8F: [0x0646, 0x064A],
+    0x0FC90: [0x0649, 0x0670],
+    0x0FC91: [0x064A, 0x0631],
+    0x0FC92: [0x064A, 0x0632],
+    0x0FC93: [0x064A, 0x0645],
+    0x0FC94: [0x064A, 0x0646],
+    0x0FC95: [0x064A, 0x0649],
+    0x0FC96: [0x064A, 0x064A],
+    0x0FC97: [0x0626, 0x062C],
+    0x0FC98: [0x0626, 0x062D],
+    0x0FC99: [0x0626, 0x062E],
+    0x0FC9A: [0x0626, 0x0645],
+    0x0FC9B: [0x0626, 0x0647],
+    0x0FC9C: [0x0628, 0x062C],
+    0x0FC9D: [0x0628, 0x062D],
+    0x0FC9E: [0x0628, 0x062E],
+    0x0FC9F: [0x0628, 0x0645],
+    0x0FCA0: [0x0628, 0x0647],
+    0x0FCA1: [0x062A, 0x062C],
+    0x0FCA2: [0x062A, 0x062D],
+    0x0FCA3: [0x062A, 0x062E],
+    0x0FCA4: [0x062A, 0x0645],
+    0x0FCA5: [0x062A, 0x0647],
+    0x0FCA6: [0x062B, 0x0645],
+    0x0FCA7: [0x062C, 0x062D],
+    0x0FCA8: [0x062C, 0x0645],
+    0x0FCA9: [0x062D, 0x062C],
+    0x0FCAA: [0x062D, 0x0645],
+    0x0FCAB: [0x062E, 0x062C],
+    0x0FCAC: [0x062E, 0x0645],
+    0x0FCAD: [0x0633, 0x062C],
+    0x0FCAE: [0x0633, 0x062D],
+    0x0FCAF: [0x0633, 0x062E],
+    0x0FCB0: [0x0633, 0x0645],
+    0x0FCB1: [0x0635, 0x062D],
+    0x0FCB2: [0x0635, 0x062E],
+    0x0FCB3: [0x0635, 0x0645],
+    0x0FCB4: [0x0636, 0x062C],
+    0x0FCB5: [0x0636, 0x062D],
+    0x0FCB6: [0x0636, 0x062E],
+    0x0FCB7: [0x0636, 0x0645],
+    0x0FCB8: [0x0637, 0x062D],
+    0x0FCB9: [0x0638, 0x0645],
+    0x0FCBA: [0x0639, 0x062C],
+    0x0FCBB: [0x0639, 0x0645],
+    0x0FCBC: [0x063A, 0x062C],
+    0x0FCBD: [0x063A, 0x0645],
+    0x0FCBE: [0x0641, 0x062C],
+    0x0FCBF: [0x0641, 0x062D],
+    0x0FCC0: [0x0641, 0x062E],
+    0x0FCC1: [0x0641, 0x0645],
+    0x0FCC2: [0x0642, 0x062D],
+    0x0FCC3: [0x0642, 0x0645],
+    0x0FCC4: [0x0643, 0x062C],
+    0x0FCC5: [0x0643, 0x062D],
+    0x0FCC6: [0x0643, 0x062E],
+    0x0FCC7: [0x0643, 0x0644],
+    0x0FCC8: [0x0643, 0x0645],
+    0x0FCC9: [0x0644, 0x062C],
+    0x0FCCA: [0x0644, 0x062D],
+    0x0FCCB: [0x0644, 0x062E],
+    0x0FCCC: [0x0644, 0x0645],
+    0x0FCCD: [0x0644, 0x0647],
+    0x0FCCE: [0x0645, 0x062C],
+    0x0FCCF: [0x0645, 0x062D],
+    0x0FCD0: [0x0645, 0x062E],
+    0x0FCD1: [0x0645, 0x0645],
+    0x0FCD2: [0x0646, 0x062C],
+    0x0FCD3: [0x0646, 0x062D],
+    0x0FCD4: [0x0646, 0x062E],
+    0x0FCD5: [0x0646, 0x0645],
+    0x0FCD6: [0x0646, 0x0647],
+    0x0FCD7: [0x0647, 0x062C],
+    0x0FCD8: [0x0647, 0x0645],
+    0x0FCD9: [0x0647, 0x0670],
+    0x0FCDA: [0x064A, 0x062C],
+    0x0FCDB: [0x064A, 0x062D],
+    0x0FCDC: [0x064A, 0x062E],
+    0x0FCDD: [0x064A, 0x0645],
+    0x0FCDE: [0x064A, 0x0647],
+    0x0FCDF: [0x0626, 0x0645],
+    0x0FCE0: [0x0626, 0x0647],
+    0x0FCE1: [0x0628, 0x0645],
+    0x0FCE2: [0x0628, 0x0647],
+    0x0FCE3: [0x062A, 0x0645],
+    0x0FCE4: [0x062A, 0x0647],
+    0x0FCE5: [0x062B, 0x0645],
+    0x0FCE6: [0x062B, 0x0647],
+    0x0FCE7: [0x0633, 0x0645],
+    0x0FCE8: [0x0633, 0x0647],
+    0x0FCE9: [0x0634, 0x0645],
+    0x0FCEA: [0x0634, 0x0647],
+    0x0FCEB: [0x0643, 0x0644],
+    0x0FCEC: [0x0643, 0x0645],
+    0x0FCED: [0x0644, 0x0645],
+    0x0FCEE: [0x0646, 0x0645],
+    0x0FCEF: [0x0646, 0x0647],
+    0x0FCF0: [0x064A, 0x0645],
+    0x0FCF1: [0x064A, 0x0647],
+    0x0FCF2: [0x0640, 0x064E, 0x0651],
+    0x0FCF3: [0x0640, 0x064F, 0x0651],
+    0x0FCF4: [0x0640, 0x0650, 0x0651],
+    0x0FCF5: [0x0637, 0x0649],
+    0x0FCF6: [0x0637, 0x064A],
+    0x0FCF7: [0x0639, 0x0649],
+    0x0FCF8: [0x0639, 0x064A],
+    0x0FCF9: [0x063A, 0x0649],
+    0x0FCFA: [0x063A, 0x064A],
+    0x0FCFB: [0x0633, 0x0649],
+    0x0FCFC: [0x0633, 0x064A],
+    0x0FCFD: [0x0634, 0x0649],
+    0x0FCFE: [0x0634, 0x064A],
+    0x0FCFF: [0x062D, 0x0649],
+    0x0FD00: [0x062D, 0x064A],
+    0x0FD01: [0x062C, 0x0649],
+    0x0FD02: [0x062C, 0x064A],
+    0x0FD03: [0x062E, 0x0649],
+    0x0FD04: [0x062E, 0x064A],
+    0x0FD05: [0x0635, 0x0649],
+    0x0FD06: [0x0635, 0x064A],
+    0x0FD07: [0x0636, 0x0649],
+    0x0FD08: [0x0636, 0x064A],
+    0x0FD09: [0x0634, 0x062C],
+    0x0FD0A: [0x0634, 0x062D],
+    0x0FD0B: [0x0634, 0x062E],
+    0x0FD0C: [0x0634, 0x0645],
+    0x0FD0D: [0x0634, 0x0631],
+    0x0FD0E: [0x0633, 0x0631],
+    0x0FD0F: [0x0635, 0x0631],
+    0x0FD10: [0x0636, 0x0631],
+    0x0FD11: [0x0637, 0x0649],
+    0x0FD12: [0x0637, 0x064A],
+    0x0FD13: [0x0639, 0x0649],
+    0x0FD14: [0x0639, 0x064A],
+    0x0FD15: [0x063A, 0x0649],
+    0x0FD16: [0x063A, 0x064A],
+    0x0FD17: [0x0633, 0x0649],
+    0x0FD18: [0x0633, 0x064A],
+    0x0FD19: [0x0634, 0x0649],
+    0x0FD1A: [0x0634, 0x064A],
+    0x0FD1B: [0x062D, 0x0649],
+    0x0FD1C: [0x062D, 0x064A],
+    0x0FD1D: [0x062C, 0x0649],
+    0x0FD1E: [0x062C, 0x064A],
+    0x0FD1F: [0x062E, 0x0649],
+    0x0FD20: [0x062E, 0x064A],
+    0x0FD21: [0x0635, 0x0649],
+    0x0FD22: [0x0635, 0x064A],
+    0x0FD23: [0x0636, 0x0649],
+    0x0FD24: [0x0636, 0x064A],
+    0x0FD25: [0x0634, 0x062C],
+    0x0FD26: [0x0634, 0x062D],
+    0x0FD27: [0x0634, 0x062E],
+    0x0FD28: [0x0634, 0x0645],
+    0x0FD29: [0x0634, 0x0631],
+    0x0FD2A: [0x0633, 0x0631],
+    0x0FD2B: [0x0635, 0x0631],
+    0x0FD2C: [0x0636, 0x0631],
+    0x0FD2D: [0x0634, 0x062C],
+    0x0FD2E: [0x0634, 0x062D],
+    0x0FD2F: [0x0634, 0x062E],
+    0x0FD30: [0x0634, 0x0645],
+    0x0FD31: [0x0633, 0x0647],
+    0x0FD32: [0x0634, 0x0647],
+    0x0FD33: [0x0637, 0x0645],
+    0x0FD34: [0x0633, 0x062C],
+    0x0FD35: [0x0633, 0x062D],
+    0x0FD36: [0x0633, 0x062E],
+    0x0FD37: [0x0634, 0x062C],
+    0x0FD38: [0x0634, 0x062D],
+    0x0FD39: [0x0634, 0x062E],
+    0x0FD3A: [0x0637, 0x0645],
+    0x0FD3B: [0x0638, 0x0645],
+    0x0FD3C: [0x0627, 0x064B],
+    0x0FD3D: [0x0627, 0x064B],
+    0x0FD50: [0x062A, 0x062C, 0x0645],
+    0x0FD51: [0x062A, 0x062D, 0x062C],
+    0x0FD52: [0x062A, 0x062D, 0x062C],
+    0x0FD53: [0x062A, 0x062D, 0x0645],
+    0x0FD54: [0x062A, 0x062E, 0x0645],
+    0x0FD55: [0x062A, 0x0645, 0x062C],
+    0x0FD56: [0x062A, 0x0645, 0x062D],
+    0x0FD57: [0x062A, 0x0645, 0x062E],
+    0x0FD58: [0x062C, 0x0645, 0x062D],
+    0x0FD59: [0x062C, 0x0645, 0x062D],
+    0x0FD5A: [0x062D, 0x0645, 0x064A],
+    0x0FD5B: [0x062D, 0x0645, 0x0649],
+    0x0FD5C: [0x0633, 0x062D, 0x062C],
+    0x0FD5D: [0x0633, 0x062C, 0x062D],
+    0x0FD5E: [0x0633, 0x062C, 0x0649],
+    0x0FD5F: [0x0633, 0x0645, 0x062D],
+    0x0FD60: [0x0633, 0x0645, 0x062D],
+    0x0FD61: [0x0633, 0x0645, 0x062C],
+    0x0FD62: [0x0633, 0x0645, 0x0645],
+    0x0FD63: [0x0633, 0x0645, 0x0645],
+    0x0FD64: [0x0635, 0x062D, 0x062D],
+    0x0FD65: [0x0635, 0x062D, 0x062D],
+    0x0FD66: [0x0635, 0x0645, 0x0645],
+    0x0FD67: [0x0634, 0x062D, 0x0645],
+    0x0FD68: [0x0634, 0x062D, 0x0645],
+    0x0FD69: [0x0634, 0x062C, 0x064A],
+    0x0FD6A: [0x0634, 0x0645, 0x062E],
+    0x0FD6B: [0x0634, 0x0645, 0x062E],
+    0x0FD6C: [0x0634, 0x0645, 0x0645],
+    0x0FD6D: [0x0634, 0x0645, 0x0645],
+    0x0FD6E: [0x0636, 0x062D, 0x0649],
+    0x0FD6F: [0x0636, 0x062E, 0x0645],
+    0x0FD70: [0x0636, 0x062E, 0x0645],
+    0x0FD71: [0x0637, 0x0645, 0x062D],
+    0x0FD72: [0x0637, 0x0645, 0x062D],
+    0x0FD73: [0x0637, 0x0645, 0x0645],
+    0x0FD74: [0x0637, 0x0645, 0x064A],
+    0x0FD75: [0x0639, 0x062C, 0x0645],
+    0x0FD76: [0x0639, 0x0645, 0x0645],
+    0x0FD77: [0x0639, 0x0645, 0x0645],
+    0x0FD78: [0x0639, 0x0645, 0x0649],
+    0x0FD79: [0x063A, 0x0645, 0x0645],
+    0x0FD7A: [0x063A, 0x0645, 0x064A],
+    0x0FD7B: [0x063A, 0x0645, 0x0649],
+    0x0FD7C: [0x0641, 0x062E, 0x0645],
+    0x0FD7D: [0x0641, 0x062E, 0x0645],
+    0x0FD7E: [0x0642, 0x0645, 0x062D],
+    0x0FD7F: [0x0642, 0x0645, 0x0645],
+    0x0FD80: [0x0644, 0x062D, 0x0645],
+    0x0FD81: [0x0644, 0x062D, 0x064A],
+    0x0FD82: [0x0644, 0x062D, 0x0649],
+    0x0FD83: [0x0644, 0x062C, 0x062C],
+    0x0FD84: [0x0644, 0x062C, 0x062C],
+    0x0FD85: [0x0644, 0x062E, 0x0645],
+    0x0FD86: [0x0644, 0x062E, 0x0645],
+    0x0FD87: [0x0644, 0x0645, 0x062D],
+    0x0FD88: [0x0644, 0x0645, 0x062D],
+    0x0FD89: [0x0645, 0x062D, 0x062C],
+    0x0FD8A: [0x0645, 0x062D, 0x0645],
+    0x0FD8B: [0x0645, 0x062D, 0x064A],
+    0x0FD8C: [0x0645, 0x062C, 0x062D],
+    0x0FD8D: [0x0645, 0x062C, 0x0645],
+    0x0FD8E: [0x0645, 0x062E, 0x062C],
+    0x0FD8F: [0x0645, 0x062E, 0x0645],
+    0x0FD92: [0x0645, 0x062C, 0x062E],
+    0x0FD93: [0x0647, 0x0645, 0x062C],
+    0x0FD94: [0x0647, 0x0645, 0x0645],
+    0x0FD95: [0x0646, 0x062D, 0x0645],
+    0x0FD96: [0x0646, 0x062D, 0x0649],
+    0x0FD97: [0x0646, 0x062C, 0x0645],
+    0x0FD98: [0x0646, 0x062C, 0x0645],
+    0x0FD99: [0x0646, 0x062C, 0x0649],
+    0x0FD9A: [0x0646, 0x0645, 0x064A],
+    0x0FD9B: [0x0646, 0x0645, 0x0649],
+    0x0FD9C: [0x064A, 0x0645, 0x0645],
+    0x0FD9D: [0x064A, 0x0645, 0x0645],
+    0x0FD9E: [0x0628, 0x062E, 0x064A],
+    0x0FD9F: [0x062A, 0x062C, 0x064A],
+    0x0FDA0: [0x062A, 0x062C, 0x0649],
+    0x0FDA1: [0x062A, 0x062E, 0x064A],
+    0x0FDA2: [0x062A, 0x062E, 0x0649],
+    0x0FDA3: [0x062A, 0x0645, 0x064A],
+    0x0FDA4: [0x062A, 0x0645, 0x0649],
+    0x0FDA5: [0x062C, 0x0645, 0x064A],
+    0x0FDA6: [0x062C, 0x062D, 0x0649],
+    0x0FDA7: [0x062C, 0x0645, 0x0649],
+    0x0FDA8: [0x0633, 0x062E, 0x0649],
+    0x0FDA9: [0x0635, 0x062D, 0x064A],
+    0x0FDAA: [0x0634, 0x062D, 0x064A],
+    0x0FDAB: [0x0636, 0x062D, 0x064A],
+    0x0FDAC: [0x0644, 0x062C, 0x064A],
+    0x0FDAD: [0x0644, 0x0645, 0x064A],
+    0x0FDAE: [0x064A, 0x062D, 0x064A],
+    0x0FDAF: [0x064A, 0x062C, 0x064A],
+    0x0FDB0: [0x064A, 0x0645, 0x064A],
+    0x0FDB1: [0x0645, 0x0645, 0x064A],
+    0x0FDB2: [0x0642, 0x0645, 0x064A],
+    0x0FDB3: [0x0646, 0x062D, 0x064A],
+    0x0FDB4: [0x0642, 0x0645, 0x062D],
+    0x0FDB5: [0x0644, 0x062D, 0x0645],
+    0x0FDB6: [0x0639, 0x0645, 0x064A],
+    0x0FDB7: [0x0643, 0x0645, 0x064A],
+    0x0FDB8: [0x0646, 0x062C, 0x062D],
+    0x0FDB9: [0x0645, 0x062E, 0x064A],
+    0x0FDBA: [0x0644, 0x062C, 0x0645],
+    0x0FDBB: [0x0643, 0x0645, 0x0645],
+    0x0FDBC: [0x0644, 0x062C, 0x0645],
+    0x0FDBD: [0x0646, 0x062C, 0x062D],
+    0x0FDBE: [0x062C, 0x062D, 0x064A],
+    0x0FDBF: [0x062D, 0x062C, 0x064A],
+    0x0FDC0: [0x0645, 0x062C, 0x064A],
+    0x0FDC1: [0x0641, 0x0645, 0x064A],
+    0x0FDC2: [0x0628, 0x062D, 0x064A],
+    0x0FDC3: [0x0643, 0x0645, 0x0645],
+    0x0FDC4: [0x0639, 0x062C, 0x0645],
+    0x0FDC5: [0x0635, 0x0645, 0x0645],
+    0x0FDC6: [0x0633, 0x062E, 0x064A],
+    0x0FDC7: [0x0646, 0x062C, 0x064A],
+    0x0FDF0: [0x0635, 0x0644, 0x06D2],
+    0x0FDF1: [0x0642, 0x0644, 0x06D2],
+    0x0FDF2: [0x0627, 0x0644, 0x0644, 0x0647],
+    0x0FDF3: [0x0627, 0x0643, 0x0628, 0x0631],
+    0x0FDF4: [0x0645, 0x062D, 0x0645, 0x062F],
+    0x0FDF5: [0x0635, 0x0644, 0x0639, 0x0645],
+    0x0FDF6: [0x0631, 0x0633, 0x0648, 0x0644],
+    0x0FDF7: [0x0639, 0x0644, 0x064A, 0x0647],
+    0x0FDF8: [0x0648, 0x0633, 0x0644, 0x0645],
+    0x0FDF9: [0x0635, 0x0644, 0x0649],
+    0x0FDFA: [0x0635, 0x0644, 0x0649, 0x0020, 0x0627, 0x0644, 0x0644, 0x0647, 0x0020, 0x0639, 0x0644, 0x064A, 0x0647, 0x0020, 0x0648, 0x0633, 0x0644, 0x0645],
+    0x0FDFB: [0x062C, 0x0644, 0x0020, 0x062C, 0x0644, 0x0627, 0x0644, 0x0647],
+    0x0FDFC: [0x0631, 0x06CC, 0x0627, 0x0644],
+    **dict.fromkeys(range(0x0FE00, 0x0FE0F + 1), []),
+    0x0FE10: [0x002C],
+    0x0FE11: [0x3001],
+    0x0FE12: [0x3002],
+    0x0FE13: [0x003A],
+    0x0FE14: [0x003B],
+    0x0FE15: [0x0021],
+    0x0FE16: [0x003F],
+    0x0FE17: [0x3016],
+    0x0FE18: [0x3017],
+    0x0FE19: [0x002E, 0x002E, 0x002E],
+    0x0FE30: [0x002E, 0x002E],
+    0x0FE31: [0x2014],
+    0x0FE32: [0x2013],
+    0x0FE33: [0x005F],
+    0x0FE34: [0x005F],
+    0x0FE35: [0x0028],
+    0x0FE36: [0x0029],
+    0x0FE37: [0x007B],
+    0x0FE38: [0x007D],
+    0x0FE39: [0x3014],
+    0x0FE3A: [0x3015],
+    0x0FE3B: [0x3010],
+    0x0FE3C: [0x3011],
+    0x0FE3D: [0x300A],
+    0x0FE3E: [0x300B],
+    0x0FE3F: [0x3008],
+    0x0FE40: [0x3009],
+    0x0FE41: [0x300C],
+    0x0FE42: [0x300D],
+    0x0FE43: [0x300E],
+    0x0FE44: [0x300F],
+    0x0FE47: [0x005B],
+    0x0FE48: [0x005D],
+    0x0FE49: [0x0020, 0x0305],
+    0x0FE4A: [0x0020, 0x0305],
+    0x0FE4B: [0x0020, 0x0305],
+    0x0FE4C: [0x0020, 0x0305],
+    0x0FE4D: [0x005F],
+    0x0FE4E: [0x005F],
+    0x0FE4F: [0x005F],
+    0x0FE50: [0x002C],
+    0x0FE51: [0x3001],
+    0x0FE52: [0x002E],
+    0x0FE54: [0x003B],
+    0x0FE55: [0x003A],
+    0x0FE56: [0x003F],
+    0x0FE57: [0x0021],
+    0x0FE58: [0x2014],
+    0x0FE59: [0x0028],
+    0x0FE5A: [0x0029],
+    0x0FE5B: [0x007B],
+    0x0FE5C: [0x007D],
+    0x0FE5D: [0x3014],
+    0x0FE5E: [0x3015],
+    0x0FE5F: [0x0023],
+    0x0FE60: [0x0026],
+    0x0FE61: [0x002A],
+    0x0FE62: [0x002B],
+    0x0FE63: [0x002D],
+    0x0FE64: [0x003C],
+    0x0FE65: [0x003E],
+    0x0FE66: [0x003D],
+    0x0FE68: [0x005C],
+    0x0FE69: [0x0024],
+    0x0FE6A: [0x0025],
+    0x0FE6B: [0x0040],
+    0x0FE70: [0x0020, 0x064B],
+    0x0FE71: [0x0640, 0x064B],
+    0x0FE72: [0x0020, 0x064C],
+    0x0FE74: [0x0020, 0x064D],
+    0x0FE76: [0x0020, 0x064E],
+    0x0FE77: [0x0640, 0x064E],
+    0x0FE78: [0x0020, 0x064F],
+    0x0FE79: [0x0640, 0x064F],
+    0x0FE7A: [0x0020, 0x0650],
+    0x0FE7B: [0x0640, 0x0650],
+    0x0FE7C: [0x0020, 0x0651],
+    0x0FE7D: [0x0640, 0x0651],
+    0x0FE7E: [0x0020, 0x0652],
+    0x0FE7F: [0x0640, 0x0652],
+    0x0FE80: [0x0621],
+    0x0FE81: [0x0622],
+    0x0FE82: [0x0622],
+    0x0FE83: [0x0623],
+    0x0FE84: [0x0623],
+    0x0FE85: [0x0624],
+    0x0FE86: [0x0624],
+    0x0FE87: [0x0625],
+    0x0FE88: [0x0625],
+    0x0FE89: [0x0626],
+    0x0FE8A: [0x0626],
+    0x0FE8B: [0x0626],
+    0x0FE8C: [0x0626],
+    0x0FE8D: [0x0627],
+    0x0FE8E: [0x0627],
+    0x0FE8F: [0x0628],
+    0x0FE90: [0x0628],
+    0x0FE91: [0x0628],
+    0x0FE92: [0x0628],
+    0x0FE93: [0x0629],
+    0x0FE94: [0x0629],
+    0x0FE95: [0x062A],
+    0x0FE96: [0x062A],
+    0x0FE97: [0x062A],
+    0x0FE98: [0x062A],
+    0x0FE99: [0x062B],
+    0x0FE9A: [0x062B],
+    0x0FE9B: [0x062B],
+    0x0FE9C: [0x062B],
+    0x0FE9D: [0x062C],
+    0x0FE9E: [0x062C],
+    0x0FE9F: [0x062C],
+    0x0FEA0: [0x062C],
+    0x0FEA1: [0x062D],
+    0x0FEA2: [0x062D],
+    0x0FEA3: [0x062D],
+    0x0FEA4: [0x062D],
+    0x0FEA5: [0x062E],
+    0x0FEA6: [0x062E],
+    0x0FEA7: [0x062E],
+    0x0FEA8: [0x062E],
+    0x0FEA9: [0x062F],
+    0x0FEAA: [0x062F],
+    0x0FEAB: [0x0630],
+    0x0FEAC: [0x0630],
+    0x0FEAD: [0x0631],
+    0x0FEAE: [0x0631],
+    0x0FEAF: [0x0632],
+    0x0FEB0: [0x0632],
+    0x0FEB1: [0x0633],
+    0x0FEB2: [0x0633],
+    0x0FEB3: [0x0633],
+    0x0FEB4: [0x0633],
+    0x0FEB5: [0x0634],
+    0x0FEB6: [0x0634],
+    0x0FEB7: [0x0634],
+    0x0FEB8: [0x0634],
+    0x0FEB9: [0x0635],
+    0x0FEBA: [0x0635],
+    0x0FEBB: [0x0635],
+    0x0FEBC: [0x0635],
+    0x0FEBD: [0x0636],
+    0x0FEBE: [0x0636],
+    0x0FEBF: [0x0636],
+    0x0FEC0: [0x0636],
+    0x0FEC1: [0x0637],
+    0x0FEC2: [0x0637],
+    0x0FEC3: [0x0637],
+    0x0FEC4: [0x0637],
+    0x0FEC5: [0x0638],
+    0x0FEC6: [0x0638],
+    0x0FEC7: [0x0638],
+    0x0FEC8: [0x0638],
+    0x0FEC9: [0x0639],
+    0x0FECA: [0x0639],
+    0x0FECB: [0x0639],
+    0x0FECC: [0x0639],
+    0x0FECD: [0x063A],
+    0x0FECE: [0x063A],
+    0x0FECF: [0x063A],
+    0x0FED0: [0x063A],
+    0x0FED1: [0x0641],
+    0x0FED2: [0x0641],
+    0x0FED3: [0x0641],
+    0x0FED4: [0x0641],
+    0x0FED5: [0x0642],
+    0x0FED6: [0x0642],
+    0x0FED7: [0x0642],
+    0x0FED8: [0x0642],
+    0x0FED9: [0x0643],
+    0x0FEDA: [0x0643],
+    0x0FEDB: [0x0643],
+    0x0FEDC: [0x0643],
+    0x0FEDD: [0x0644],
+    0x0FEDE: [0x0644],
+    0x0FEDF: [0x0644],
+    0x0FEE0: [0x0644],
+    0x0FEE1: [0x0645],
+    0x0FEE2: [0x0645],
+    0x0FEE3: [0x0645],
+    0x0FEE4: [0x0645],
+    0x0FEE5: [0x0646],
+    0x0FEE6: [0x0646],
+    0x0FEE7: [0x0646],
+    0x0FEE8: [0x0646],
+    0x0FEE9: [0x0647],
+    0x0FEEA: [0x0647],
+    0x0FEEB: [0x0647],
+    0x0FEEC: [0x0647],
+    0x0FEED: [0x0648],
+    0x0FEEE: [0x0648],
+    0x0FEEF: [0x0649],
+    0x0FEF0: [0x0649],
+    0x0FEF1: [0x064A],
+    0x0FEF2: [0x064A],
+    0x0FEF3: [0x064A],
+    0x0FEF4: [0x064A],
+    0x0FEF5: [0x0644, 0x0622],
+    0x0FEF6: [0x0644, 0x0622],
+    0x0FEF7: [0x0644, 0x0623],
+    0x0FEF8: [0x0644, 0x0623],
+    0x0FEF9: [0x0644, 0x0625],
+    0x0FEFA: [0x0644, 0x0625],
+    0x0FEFB: [0x0644, 0x0627],
+    0x0FEFC: [0x0644, 0x0627],
+    0x0FEFF: [],
+    0x0FF01: [0x0021],
+    0x0FF02: [0x0022],
+    0x0FF03: [0x0023],
+    0x0FF04: [0x0024],
+    0x0FF05: [0x0025],
+    0x0FF06: [0x0026],
+    0x0FF07: [0x0027],
+    0x0FF08: [0x0028],
+    0x0FF09: [0x0029],
+    0x0FF0A: [0x002A],
+    0x0FF0B: [0x002B],
+    0x0FF0C: [0x002C],
+    0x0FF0D: [0x002D],
+    0x0FF0E: [0x002E],
+    0x0FF0F: [0x002F],
+    0x0FF10: [0x0030],
+    0x0FF11: [0x0031],
+    0x0FF12: [0x0032],
+    0x0FF13: [0x0033],
+    0x0FF14: [0x0034],
+    0x0FF15: [0x0035],
+    0x0FF16: [0x0036],
+    0x0FF17: [0x0037],
+    0x0FF18: [0x0038],
+    0x0FF19: [0x0039],
+    0x0FF1A: [0x003A],
+    0x0FF1B: [0x003B],
+    0x0FF1C: [0x003C],
+    0x0FF1D: [0x003D],
+    0x0FF1E: [0x003E],
+    0x0FF1F: [0x003F],
+    0x0FF20: [0x0040],
+    0x0FF21: [0x0061],
+    0x0FF22: [0x0062],
+    0x0FF23: [0x0063],
+    0x0FF24: [0x0064],
+    0x0FF25: [0x0065],
+    0x0FF26: [0x0066],
+    0x0FF27: [0x0067],
+    0x0FF28: [0x0068],
+    0x0FF29: [0x0069],
+    0x0FF2A: [0x006A],
+    0x0FF2B: [0x006B],
+    0x0FF2C: [0x006C],
+    0x0FF2D: [0x006D],
+    0x0FF2E: [0x006E],
+    0x0FF2F: [0x006F],
+    0x0FF30: [0x0070],
+    0x0FF31: [0x0071],
+    0x0FF32: [0x0072],
+    0x0FF33: [0x0073],
+    0x0FF34: [0x0074],
+    0x0FF35: [0x0075],
+    0x0FF36: [0x0076],
+    0x0FF37: [0x0077],
+    0x0FF38: [0x0078],
+    0x0FF39: [0x0079],
+    0x0FF3A: [0x007A],
+    0x0FF3B: [0x005B],
+    0x0FF3C: [0x005C],
+    0x0FF3D: [0x005D],
+    0x0FF3E: [0x005E],
+    0x0FF3F: [0x005F],
+    0x0FF40: [0x0060],
+    0x0FF41: [0x0061],
+    0x0FF42: [0x0062],
+    0x0FF43: [0x0063],
+    0x0FF44: [0x0064],
+    0x0FF45: [0x0065],
+    0x0FF46: [0x0066],
+    0x0FF47: [0x0067],
+    0x0FF48: [0x0068],
+    0x0FF49: [0x0069],
+    0x0FF4A: [0x006A],
+    0x0FF4B: [0x006B],
+    0x0FF4C: [0x006C],
+    0x0FF4D: [0x006D],
+    0x0FF4E: [0x006E],
+    0x0FF4F: [0x006F],
+    0x0FF50: [0x0070],
+    0x0FF51: [0x0071],
+    0x0FF52: [0x0072],
+    0x0FF53: [0x0073],
+    0x0FF54: [0x0074],
+    0x0FF55: [0x0075],
+    0x0FF56: [0x0076],
+    0x0FF57: [0x0077],
+    0x0FF58: [0x0078],
+    0x0FF59: [0x0079],
+    0x0FF5A: [0x007A],
+    0x0FF5B: [0x007B],
+    0x0FF5C: [0x007C],
+    0x0FF5D: [0x007D],
+    0x0FF5E: [0x007E],
+    0x0FF5F: [0x2985],
+    0x0FF60: [0x2986],
+    0x0FF61: [0x3002],
+    0x0FF62: [0x300C],
+    0x0FF63: [0x300D],
+    0x0FF64: [0x3001],
+    0x0FF65: [0x30FB],
+    0x0FF66: [0x30F2],
+    0x0FF67: [0x30A1],
+    0x0FF68: [0x30A3],
+    0x0FF69: [0x30A5],
+    0x0FF6A: [0x30A7],
+    0x0FF6B: [0x30A9],
+    0x0FF6C: [0x30E3],
+    0x0FF6D: [0x30E5],
+    0x0FF6E: [0x30E7],
+    0x0FF6F: [0x30C3],
+    0x0FF70: [0x30FC],
+    0x0FF71: [0x30A2],
+    0x0FF72: [0x30A4],
+    0x0FF73: [0x30A6],
+    0x0FF74: [0x30A8],
+    0x0FF75: [0x30AA],
+    0x0FF76: [0x30AB],
+    0x0FF77: [0x30AD],
+    0x0FF78: [0x30AF],
+    0x0FF79: [0x30B1],
+    0x0FF7A: [0x30B3],
+    0x0FF7B: [0x30B5],
+    0x0FF7C: [0x30B7],
+    0x0FF7D: [0x30B9],
+    0x0FF7E: [0x30BB],
+    0x0FF7F: [0x30BD],
+    0x0FF80: [0x30BF],
+    0x0FF81: [0x30C1],
+    0x0FF82: [0x30C4],
+    0x0FF83: [0x30C6],
+    0x0FF84: [0x30C8],
+    0x0FF85: [0x30CA],
+    0x0FF86: [0x30CB],
+    0x0FF87: [0x30CC],
+    0x0FF88: [0x30CD],
+    0x0FF89: [0x30CE],
+    0x0FF8A: [0x30CF],
+    0x0FF8B: [0x30D2],
+    0x0FF8C: [0x30D5],
+    0x0FF8D: [0x30D8],
+    0x0FF8E: [0x30DB],
+    0x0FF8F: [0x30DE],
+    0x0FF90: [0x30DF],
+    0x0FF91: [0x30E0],
+    0x0FF92: [0x30E1],
+    0x0FF93: [0x30E2],
+    0x0FF94: [0x30E4],
+    0x0FF95: [0x30E6],
+    0x0FF96: [0x30E8],
+    0x0FF97: [0x30E9],
+    0x0FF98: [0x30EA],
+    0x0FF99: [0x30EB],
+    0x0FF9A: [0x30EC],
+    0x0FF9B: [0x30ED],
+    0x0FF9C: [0x30EF],
+    0x0FF9D: [0x30F3],
+    0x0FF9E: [0x3099],
+    0x0FF9F: [0x309A],
+    0x0FFA0: [],
+    0x0FFA1: [0x1100],
+    0x0FFA2: [0x1101],
+    0x0FFA3: [0x11AA],
+    0x0FFA4: [0x1102],
+    0x0FFA5: [0x11AC],
+    0x0FFA6: [0x11AD],
+    0x0FFA7: [0x1103],
+    0x0FFA8: [0x1104],
+    0x0FFA9: [0x1105],
+    0x0FFAA: [0x11B0],
+    0x0FFAB: [0x11B1],
+    0x0FFAC: [0x11B2],
+    0x0FFAD: [0x11B3],
+    0x0FFAE: [0x11B4],
+    0x0FFAF: [0x11B5],
+    0x0FFB0: [0x111A],
+    0x0FFB1: [0x1106],
+    0x0FFB2: [0x1107],
+    0x0FFB3: [0x1108],
+    0x0FFB4: [0x1121],
+    0x0FFB5: [0x1109],
+    0x0FFB6: [0x110A],
+    0x0FFB7: [0x110B],
+    0x0FFB8: [0x110C],
+    0x0FFB9: [0x110D],
+    0x0FFBA: [0x110E],
+    0x0FFBB: [0x110F],
+    0x0FFBC: [0x1110],
+    0x0FFBD: [0x1111],
+    0x0FFBE: [0x1112],
+    0x0FFC2: [0x1161],
+    0x0FFC3: [0x1162],
+    0x0FFC4: [0x1163],
+    0x0FFC5: [0x1164],
+    0x0FFC6: [0x1165],
+    0x0FFC7: [0x1166],
+    0x0FFCA: [0x1167],
+    0x0FFCB: [0x1168],
+    0x0FFCC: [0x1169],
+    0x0FFCD: [0x116A],
+    0x0FFCE: [0x116B],
+    0x0FFCF: [0x116C],
+    0x0FFD2: [0x116D],
+    0x0FFD3: [0x116E],
+    0x0FFD4: [0x116F],
+    0x0FFD5: [0x1170],
+    0x0FFD6: [0x1171],
+    0x0FFD7: [0x1172],
+    0x0FFDA: [0x1173],
+    0x0FFDB: [0x1174],
+    0x0FFDC: [0x1175],
+    0x0FFE0: [0x00A2],
+    0x0FFE1: [0x00A3],
+    0x0FFE2: [0x00AC],
+    0x0FFE3: [0x0020, 0x0304],
+    0x0FFE4: [0x00A6],
+    0x0FFE5: [0x00A5],
+    0x0FFE6: [0x20A9],
+    0x0FFE8: [0x2502],
+    0x0FFE9: [0x2190],
+    0x0FFEA: [0x2191],
+    0x0FFEB: [0x2192],
+    0x0FFEC: [0x2193],
+    0x0FFED: [0x25A0],
+    0x0FFEE: [0x25CB],
+    **dict.fromkeys(range(0x0FFF0, 0x0FFF8 + 1), []),
+    0x10400: [0x10428],
+    0x10401: [0x10429],
+    0x10402: [0x1042A],
+    0x10403: [0x1042B],
+    0x10404: [0x1042C],
+    0x10405: [0x1042D],
+    0x10406: [0x1042E],
+    0x10407: [0x1042F],
+    0x10408: [0x10430],
+    0x10409: [0x10431],
+    0x1040A: [0x10432],
+    0x1040B: [0x10433],
+    0x1040C: [0x10434],
+    0x1040D: [0x10435],
+    0x1040E: [0x10436],
+    0x1040F: [0x10437],
+    0x10410: [0x10438],
+    0x10411: [0x10439],
+    0x10412: [0x1043A],
+    0x10413: [0x1043B],
+    0x10414: [0x1043C],
+    0x10415: [0x1043D],
+    0x10416: [0x1043E],
+    0x10417: [0x1043F],
+    0x10418: [0x10440],
+    0x10419: [0x10441],
+    0x1041A: [0x10442],
+    0x1041B: [0x10443],
+    0x1041C: [0x10444],
+    0x1041D: [0x10445],
+    0x1041E: [0x10446],
+    0x1041F: [0x10447],
+    0x10420: [0x10448],
+    0x10421: [0x10449],
+    0x10422: [0x1044A],
+    0x10423: [0x1044B],
+    0x10424: [0x1044C],
+    0x10425: [0x1044D],
+    0x10426: [0x1044E],
+    0x10427: [0x1044F],
+    0x104B0: [0x104D8],
+    0x104B1: [0x104D9],
+    0x104B2: [0x104DA],
+    0x104B3: [0x104DB],
+    0x104B4: [0x104DC],
+    0x104B5: [0x104DD],
+    0x104B6: [0x104DE],
+    0x104B7: [0x104DF],
+    0x104B8: [0x104E0],
+    0x104B9: [0x104E1],
+    0x104BA: [0x104E2],
+    0x104BB: [0x104E3],
+    0x104BC: [0x104E4],
+    0x104BD: [0x104E5],
+    0x104BE: [0x104E6],
+    0x104BF: [0x104E7],
+    0x104C0: [0x104E8],
+    0x104C1: [0x104E9],
+    0x104C2: [0x104EA],
+    0x104C3: [0x104EB],
+    0x104C4: [0x104EC],
+    0x104C5: [0x104ED],
+    0x104C6: [0x104EE],
+    0x104C7: [0x104EF],
+    0x104C8: [0x104F0],
+    0x104C9: [0x104F1],
+    0x104CA: [0x104F2],
+    0x104CB: [0x104F3],
+    0x104CC: [0x104F4],
+    0x104CD: [0x104F5],
+    0x104CE: [0x104F6],
+    0x104CF: [0x104F7],
+    0x104D0: [0x104F8],
+    0x104D1: [0x104F9],
+    0x104D2: [0x104FA],
+    0x104D3: [0x104FB],
+    0x10570: [0x10597],
+    0x10571: [0x10598],
+    0x10572: [0x10599],
+    0x10573: [0x1059A],
+    0x10574: [0x1059B],
+    0x10575: [0x1059C],
+    0x10576: [0x1059D],
+    0x10577: [0x1059E],
+    0x10578: [0x1059F],
+    0x10579: [0x105A0],
+    0x1057A: [0x105A1],
+    0x1057C: [0x105A3],
+    0x1057D: [0x105A4],
+    0x1057E: [0x105A5],
+    0x1057F: [0x105A6],
+    0x10580: [0x105A7],
+    0x10581: [0x105A8],
+    0x10582: [0x105A9],
+    0x10583: [0x105AA],
+    0x10584: [0x105AB],
+    0x10585: [0x105AC],
+    0x10586: [0x105AD],
+    0x10587: [0x105AE],
+    0x10588: [0x105AF],
+    0x10589: [0x105B0],
+    0x1058A: [0x105B1],
+    0x1058C: [0x105B3],
+    0x1058D: [0x105B4],
+    0x1058E: [0x105B5],
+    0x1058F: [0x105B6],
+    0x10590: [0x105B7],
+    0x10591: [0x105B8],
+    0x10592: [0x105B9],
+    0x10594: [0x105BB],
+    0x10595: [0x105BC],
+    0x10781: [0x02D0],
+    0x10782: [0x02D1],
+    0x10783: [0x00E6],
+    0x10784: [0x0299],
+    0x10785: [0x0253],
+    0x10787: [0x02A3],
+    0x10788: [0xAB66],
+    0x10789: [0x02A5],
+    0x1078A: [0x02A4],
+    0x1078B: [0x0256],
+    0x1078C: [0x0257],
+    0x1078D: [0x1D91],
+    0x1078E: [0x0258],
+    0x1078F: [0x025E],
+    0x10790: [0x02A9],
+    0x10791: [0x0264],
+    0x10792: [0x0262],
+    0x10793: [0x0260],
+    0x10794: [0x029B],
+    0x10795: [0x0127],
+    0x10796: [0x029C],
+    0x10797: [0x0267],
+    0x10798: [0x0284],
+    0x10799: [0x02AA],
+    0x1079A: [0x02AB],
+    0x1079B: [0x026C],
+    0x1079C: [0x1DF04],
+    0x1079D: [0xA78E],
+    0x1079E: [0x026E],
+    0x1079F: [0x1DF05],
+    0x107A0: [0x028E],
+    0x107A1: [0x1DF06],
+    0x107A2: [0x00F8],
+    0x107A3: [0x0276],
+    0x107A4: [0x0277],
+    0x107A5: [0x0071],
+    0x107A6: [0x027A],
+    0x107A7: [0x1DF08],
+    0x107A8: [0x027D],
+    0x107A9: [0x027E],
+    0x107AA: [0x0280],
+    0x107AB: [0x02A8],
+    0x107AC: [0x02A6],
+    0x107AD: [0xAB67],
+    0x107AE: [0x02A7],
+    0x107AF: [0x0288],
+    0x107B0: [0x2C71],
+    0x107B2: [0x028F],
+    0x107B3: [0x02A1],
+    0x107B4: [0x02A2],
+    0x107B5: [0x0298],
+    0x107B6: [0x01C0],
+    0x107B7: [0x01C1],
+    0x107B8: [0x01C2],
+    0x107B9: [0x1DF0A],
+    0x107BA: [0x1DF1E],
+    0x10C80: [0x10CC0],
+    0x10C81: [0x10CC1],
+    0x10C82: [0x10CC2],
+    0x10C83: [0x10CC3],
+    0x10C84: [0x10CC4],
+    0x10C85: [0x10CC5],
+    0x10C86: [0x10CC6],
+    0x10C87: [0x10CC7],
+    0x10C88: [0x10CC8],
+    0x10C89: [0x10CC9],
+    0x10C8A: [0x10CCA],
+    0x10C8B: [0x10CCB],
+    0x10C8C: [0x10CCC],
+    0x10C8D: [0x10CCD],
+    0x10C8E: [0x10CCE],
+    0x10C8F: [0x10CCF],
+    0x10C90: [0x10CD0],
+    0x10C91: [0x10CD1],
+    0x10C92: [0x10CD2],
+    0x10C93: [0x10CD3],
+    0x10C94: [0x10CD4],
+    0x10C95: [0x10CD5],
+    0x10C96: [0x10CD6],
+    0x10C97: [0x10CD7],
+    0x10C98: [0x10CD8],
+    0x10C99: [0x10CD9],
+    0x10C9A: [0x10CDA],
+    0x10C9B: [0x10CDB],
+    0x10C9C: [0x10CDC],
+    0x10C9D: [0x10CDD],
+    0x10C9E: [0x10CDE],
+    0x10C9F: [0x10CDF],
+    0x10CA0: [0x10CE0],
+    0x10CA1: [0x10CE1],
+    0x10CA2: [0x10CE2],
+    0x10CA3: [0x10CE3],
+    0x10CA4: [0x10CE4],
+    0x10CA5: [0x10CE5],
+    0x10CA6: [0x10CE6],
+    0x10CA7: [0x10CE7],
+    0x10CA8: [0x10CE8],
+    0x10CA9: [0x10CE9],
+    0x10CAA: [0x10CEA],
+    0x10CAB: [0x10CEB],
+    0x10CAC: [0x10CEC],
+    0x10CAD: [0x10CED],
+    0x10CAE: [0x10CEE],
+    0x10CAF: [0x10CEF],
+    0x10CB0: [0x10CF0],
+    0x10CB1: [0x10CF1],
+    0x10CB2: [0x10CF2],
+    0x10D50: [0x10D70],
+    0x10D51: [0x10D71],
+    0x10D52: [0x10D72],
+    0x10D53: [0x10D73],
+    0x10D54: [0x10D74],
+    0x10D55: [0x10D75],
+    0x10D56: [0x10D76],
+    0x10D57: [0x10D77],
+    0x10D58: [0x10D78],
+    0x10D59: [0x10D79],
+    0x10D5A: [0x10D7A],
+    0x10D5B: [0x10D7B],
+    0x10D5C: [0x10D7C],
+    0x10D5D: [0x10D7D],
+    0x10D5E: [0x10D7E],
+    0x10D5F: [0x10D7F],
+    0x10D60: [0x10D80],
+    0x10D61: [0x10D81],
+    0x10D62: [0x10D82],
+    0x10D63: [0x10D83],
+    0x10D64: [0x10D84],
+    0x10D65: [0x10D85],
+    0x118A0: [0x118C0],
+    0x118A1: [0x118C1],
+    0x118A2: [0x118C2],
+    0x118A3: [0x118C3],
+    0x118A4: [0x118C4],
+    0x118A5: [0x118C5],
+    0x118A6: [0x118C6],
+    0x118A7: [0x118C7],
+    0x118A8: [0x118C8],
+    0x118A9: [0x118C9],
+    0x118AA: [0x118CA],
+    0x118AB: [0x118CB],
+    0x118AC: [0x118CC],
+    0x118AD: [0x118CD],
+    0x118AE: [0x118CE],
+    0x118AF: [0x118CF],
+    0x118B0: [0x118D0],
+    0x118B1: [0x118D1],
+    0x118B2: [0x118D2],
+    0x118B3: [0x118D3],
+    0x118B4: [0x118D4],
+    0x118B5: [0x118D5],
+    0x118B6: [0x118D6],
+    0x118B7: [0x118D7],
+    0x118B8: [0x118D8],
+    0x118B9: [0x118D9],
+    0x118BA: [0x118DA],
+    0x118BB: [0x118DB],
+    0x118BC: [0x118DC],
+    0x118BD: [0x118DD],
+    0x118BE: [0x118DE],
+    0x118BF: [0x118DF],
+    0x16E40: [0x16E60],
+    0x16E41: [0x16E61],
+    0x16E42: [0x16E62],
+    0x16E43: [0x16E63],
+    0x16E44: [0x16E64],
+    0x16E45: [0x16E65],
+    0x16E46: [0x16E66],
+    0x16E47: [0x16E67],
+    0x16E48: [0x16E68],
+    0x16E49: [0x16E69],
+    0x16E4A: [0x16E6A],
+    0x16E4B: [0x16E6B],
+    0x16E4C: [0x16E6C],
+    0x16E4D: [0x16E6D],
+    0x16E4E: [0x16E6E],
+    0x16E4F: [0x16E6F],
+    0x16E50: [0x16E70],
+    0x16E51: [0x16E71],
+    0x16E52: [0x16E72],
+    0x16E53: [0x16E73],
+    0x16E54: [0x16E74],
+    0x16E55: [0x16E75],
+    0x16E56: [0x16E76],
+    0x16E57: [0x16E77],
+    0x16E58: [0x16E78],
+    0x16E59: [0x16E79],
+    0x16E5A: [0x16E7A],
+    0x16E5B: [0x16E7B],
+    0x16E5C: [0x16E7C],
+    0x16E5D: [0x16E7D],
+    0x16E5E: [0x16E7E],
+    0x16E5F: [0x16E7F],
+    **dict.fromkeys(range(0x1BCA0, 0x1BCA3 + 1), []),
+    0x1CCD6: [0x0061],
+    0x1CCD7: [0x0062],
+    0x1CCD8: [0x0063],
+    0x1CCD9: [0x0064],
+    0x1CCDA: [0x0065],
+    0x1CCDB: [0x0066],
+    0x1CCDC: [0x0067],
+    0x1CCDD: [0x0068],
+    0x1CCDE: [0x0069],
+    0x1CCDF: [0x006A],
+    0x1CCE0: [0x006B],
+    0x1CCE1: [0x006C],
+    0x1CCE2: [0x006D],
+    0x1CCE3: [0x006E],
+    0x1CCE4: [0x006F],
+    0x1CCE5: [0x0070],
+    0x1CCE6: [0x0071],
+    0x1CCE7: [0x0072],
+    0x1CCE8: [0x0073],
+    0x1CCE9: [0x0074],
+    0x1CCEA: [0x0075],
+    0x1CCEB: [0x0076],
+    0x1CCEC: [0x0077],
+    0x1CCED: [0x0078],
+    0x1CCEE: [0x0079],
+    0x1CCEF: [0x007A],
+    0x1CCF0: [0x0030],
+    0x1CCF1: [0x0031],
+    0x1CCF2: [0x0032],
+    0x1CCF3: [0x0033],
+    0x1CCF4: [0x0034],
+    0x1CCF5: [0x0035],
+    0x1CCF6: [0x0036],
+    0x1CCF7: [0x0037],
+    0x1CCF8: [0x0038],
+    0x1CCF9: [0x0039],
+    0x1D15E: [0x1D157, 0x1D165],
+    0x1D15F: [0x1D158, 0x1D165],
+    0x1D160: [0x1D158, 0x1D165, 0x1D16E],
+    0x1D161: [0x1D158, 0x1D165, 0x1D16F],
+    0x1D162: [0x1D158, 0x1D165, 0x1D170],
+    0x1D163: [0x1D158, 0x1D165, 0x1D171],
+    0x1D164: [0x1D158, 0x1D165, 0x1D172],
+    **dict.fromkeys(range(0x1D173, 0x1D17A + 1), []),
+    0x1D1BB: [0x1D1B9, 0x1D165],
+    0x1D1BC: [0x1D1BA, 0x1D165],
+    0x1D1BD: [0x1D1B9, 0x1D165, 0x1D16E],
+    0x1D1BE: [0x1D1BA, 0x1D165, 0x1D16E],
+    0x1D1BF: [0x1D1B9, 0x1D165, 0x1D16F],
+    0x1D1C0: [0x1D1BA, 0x1D165, 0x1D16F],
+    0x1D400: [0x0061],
+    0x1D401: [0x0062],
+    0x1D402: [0x0063],
+    0x1D403: [0x0064],
+    0x1D404: [0x0065],
+    0x1D405: [0x0066],
+    0x1D406: [0x0067],
+    0x1D407: [0x0068],
+    0x1D408: [0x0069],
+    0x1D409: [0x006A],
+    0x1D40A: [0x006B],
+    0x1D40B: [0x006C],
+    0x1D40C: [0x006D],
+    0x1D40D: [0x006E],
+    0x1D40E: [0x006F],
+    0x1D40F: [0x0070],
+    0x1D410: [0x0071],
+    0x1D411: [0x0072],
+    0x1D412: [0x0073],
+    0x1D413: [0x0074],
+    0x1D414: [0x0075],
+    0x1D415: [0x0076],
+    0x1D416: [0x0077],
+    0x1D417: [0x0078],
+    0x1D418: [0x0079],
+    0x1D419: [0x007A],
+    0x1D41A: [0x0061],
+    0x1D41B: [0x0062],
+    0x1D41C: [0x0063],
+    0x1D41D: [0x0064],
+    0x1D41E: [0x0065],
+    0x1D41F: [0x0066],
+    0x1D420: [0x0067],
+    0x1D421: [0x0068],
+    0x1D422: [0x0069],
+    0x1D423: [0x006A],
+    0x1D424: [0x006B],
+    0x1D425: [0x006C],
+    0x1D426: [0x006D],
+    0x1D427: [0x006E],
+    0x1D428: [0x006F],
+    0x1D429: [0x0070],
+    0x1D42A: [0x0071],
+    0x1D42B: [0x0072],
+    0x1D42C: [0x0073],
+    0x1D42D: [0x0074],
+    0x1D42E: [0x0075],
+    0x1D42F: [0x0076],
+    0x1D430: [0x0077],
+    0x1D431: [0x0078],
+    0x1D432: [0x0079],
+    0x1D433: [0x007A],
+    0x1D434: [0x0061],
+    0x1D435: [0x0062],
+    0x1D436: [0x0063],
+    0x1D437: [0x0064],
+    0x1D438: [0x0065],
+    0x1D439: [0x0066],
+    0x1D43A: [0x0067],
+    0x1D43B: [0x0068],
+    0x1D43C: [0x0069],
+    0x1D43D: [0x006A],
+    0x1D43E: [0x006B],
+    0x1D43F: [0x006C],
+    0x1D440: [0x006D],
+    0x1D441: [0x006E],
+    0x1D442: [0x006F],
+    0x1D443: [0x0070],
+    0x1D444: [0x0071],
+    0x1D445: [0x0072],
+    0x1D446: [0x0073],
+    0x1D447: [0x0074],
+    0x1D448: [0x0075],
+    0x1D449: [0x0076],
+    0x1D44A: [0x0077],
+    0x1D44B: [0x0078],
+    0x1D44C: [0x0079],
+    0x1D44D: [0x007A],
+    0x1D44E: [0x0061],
+    0x1D44F: [0x0062],
+    0x1D450: [0x0063],
+    0x1D451: [0x0064],
+    0x1D452: [0x0065],
+    0x1D453: [0x0066],
+    0x1D454: [0x0067],
+    0x1D456: [0x0069],
+    0x1D457: [0x006A],
+    0x1D458: [0x006B],
+    0x1D459: [0x006C],
+    0x1D45A: [0x006D],
+    0x1D45B: [0x006E],
+    0x1D45C: [0x006F],
+    0x1D45D: [0x0070],
+    0x1D45E: [0x0071],
+    0x1D45F: [0x0072],
+    0x1D460: [0x0073],
+    0x1D461: [0x0074],
+    0x1D462: [0x0075],
+    0x1D463: [0x0076],
+    0x1D464: [0x0077],
+    0x1D465: [0x0078],
+    0x1D466: [0x0079],
+    0x1D467: [0x007A],
+    0x1D468: [0x0061],
+    0x1D469: [0x0062],
+    0x1D46A: [0x0063],
+    0x1D46B: [0x0064],
+    0x1D46C: [0x0065],
+    0x1D46D: [0x0066],
+    0x1D46E: [0x0067],
+    0x1D46F: [0x0068],
+    0x1D470: [0x0069],
+    0x1D471: [0x006A],
+    0x1D472: [0x006B],
+    0x1D473: [0x006C],
+    0x1D474: [0x006D],
+    0x1D475: [0x006E],
+    0x1D476: [0x006F],
+    0x1D477: [0x0070],
+    0x1D478: [0x0071],
+    0x1D479: [0x0072],
+    0x1D47A: [0x0073],
+    0x1D47B: [0x0074],
+    0x1D47C: [0x0075],
+    0x1D47D: [0x0076],
+    0x1D47E: [0x0077],
+    0x1D47F: [0x0078],
+    0x1D480: [0x0079],
+    0x1D481: [0x007A],
+    0x1D482: [0x0061],
+    0x1D483: [0x0062],
+    0x1D484: [0x0063],
+    0x1D485: [0x0064],
+    0x1D486: [0x0065],
+    0x1D487: [0x0066],
+    0x1D488: [0x0067],
+    0x1D489: [0x0068],
+    0x1D48A: [0x0069],
+    0x1D48B: [0x006A],
+    0x1D48C: [0x006B],
+    0x1D48D: [0x006C],
+    0x1D48E: [0x006D],
+    0x1D48F: [0x006E],
+    0x1D490: [0x006F],
+    0x1D491: [0x0070],
+    0x1D492: [0x0071],
+    0x1D493: [0x0072],
+    0x1D494: [0x0073],
+    0x1D495: [0x0074],
+    0x1D496: [0x0075],
+    0x1D497: [0x0076],
+    0x1D498: [0x0077],
+    0x1D499: [0x0078],
+    0x1D49A: [0x0079],
+    0x1D49B: [0x007A],
+    0x1D49C: [0x0061],
+    0x1D49E: [0x0063],
+    0x1D49F: [0x0064],
+    0x1D4A2: [0x0067],
+    0x1D4A5: [0x006A],
+    0x1D4A6: [0x006B],
+    0x1D4A9: [0x006E],
+    0x1D4AA: [0x006F],
+    0x1D4AB: [0x0070],
+    0x1D4AC: [0x0071],
+    0x1D4AE: [0x0073],
+    0x1D4AF: [0x0074],
+    0x1D4B0: [0x0075],
+    0x1D4B1: [0x0076],
+    0x1D4B2: [0x0077],
+    0x1D4B3: [0x0078],
+    0x1D4B4: [0x0079],
+    0x1D4B5: [0x007A],
+    0x1D4B6: [0x0061],
+    0x1D4B7: [0x0062],
+    0x1D4B8: [0x0063],
+    0x1D4B9: [0x0064],
+    0x1D4BB: [0x0066],
+    0x1D4BD: [0x0068],
+    0x1D4BE: [0x0069],
+    0x1D4BF: [0x006A],
+    0x1D4C0: [0x006B],
+    0x1D4C1: [0x006C],
+    0x1D4C2: [0x006D],
+    0x1D4C3: [0x006E],
+    0x1D4C5: [0x0070],
+    0x1D4C6: [0x0071],
+    0x1D4C7: [0x0072],
+    0x1D4C8: [0x0073],
+    0x1D4C9: [0x0074],
+    0x1D4CA: [0x0075],
+    0x1D4CB: [0x0076],
+    0x1D4CC: [0x0077],
+    0x1D4CD: [0x0078],
+    0x1D4CE: [0x0079],
+    0x1D4CF: [0x007A],
+    0x1D4D0: [0x0061],
+    0x1D4D1: [0x0062],
+    0x1D4D2: [0x0063],
+    0x1D4D3: [0x0064],
+    0x1D4D4: [0x0065],
+    0x1D4D5: [0x0066],
+    0x1D4D6: [0x0067],
+    0x1D4D7: [0x0068],
+    0x1D4D8: [0x0069],
+    0x1D4D9: [0x006A],
+    0x1D4DA: [0x006B],
+    0x1D4DB: [0x006C],
+    0x1D4DC: [0x006D],
+    0x1D4DD: [0x006E],
+    0x1D4DE: [0x006F],
+    0x1D4DF: [0x0070],
+    0x1D4E0: [0x0071],
+    0x1D4E1: [0x0072],
+    0x1D4E2: [0x0073],
+    0x1D4E3: [0x0074],
+    0x1D4E4: [0x0075],
+    0x1D4E5: [0x0076],
+    0x1D4E6: [0x0077],
+    0x1D4E7: [0x0078],
+    0x1D4E8: [0x0079],
+    0x1D4E9: [0x007A],
+    0x1D4EA: [0x0061],
+    0x1D4EB: [0x0062],
+    0x1D4EC: [0x0063],
+    0x1D4ED: [0x0064],
+    0x1D4EE: [0x0065],
+    0x1D4EF: [0x0066],
+    0x1D4F0: [0x0067],
+    0x1D4F1: [0x0068],
+    0x1D4F2: [0x0069],
+    0x1D4F3: [0x006A],
+    0x1D4F4: [0x006B],
+    0x1D4F5: [0x006C],
+    0x1D4F6: [0x006D],
+    0x1D4F7: [0x006E],
+    0x1D4F8: [0x006F],
+    0x1D4F9: [0x0070],
+    0x1D4FA: [0x0071],
+    0x1D4FB: [0x0072],
+    0x1D4FC: [0x0073],
+    0x1D4FD: [0x0074],
+    0x1D4FE: [0x0075],
+    0x1D4FF: [0x0076],
+    0x1D500: [0x0077],
+    0x1D501: [0x0078],
+    0x1D502: [0x0079],
+    0x1D503: [0x007A],
+    0x1D504: [0x0061],
+    0x1D505: [0x0062],
+    0x1D507: [0x0064],
+    0x1D508: [0x0065],
+    0x1D509: [0x0066],
+    0x1D50A: [0x0067],
+    0x1D50D: [0x006A],
+    0x1D50E: [0x006B],
+    0x1D50F: [0x006C],
+    0x1D510: [0x006D],
+    0x1D511: [0x006E],
+    0x1D512: [0x006F],
+    0x1D513: [0x0070],
+    0x1D514: [0x0071],
+    0x1D516: [0x0073],
+    0x1D517: [0x0074],
+    0x1D518: [0x0075],
+    0x1D519: [0x0076],
+    0x1D51A: [0x0077],
+    0x1D51B: [0x0078],
+    0x1D51C: [0x0079],
+    0x1D51E: [0x0061],
+    0x1D51F: [0x0062],
+    0x1D520: [0x0063],
+    0x1D521: [0x0064],
+    0x1D522: [0x0065],
+    0x1D523: [0x0066],
+    0x1D524: [0x0067],
+    0x1D525: [0x0068],
+    0x1D526: [0x0069],
+    0x1D527: [0x006A],
+    0x1D528: [0x006B],
+    0x1D529: [0x006C],
+    0x1D52A: [0x006D],
+    0x1D52B: [0x006E],
+    0x1D52C: [0x006F],
+    0x1D52D: [0x0070],
+    0x1D52E: [0x0071],
+    0x1D52F: [0x0072],
+    0x1D530: [0x0073],
+    0x1D531: [0x0074],
+    0x1D532: [0x0075],
+    0x1D533: [0x0076],
+    0x1D534: [0x0077],
+    0x1D535: [0x0078],
+    0x1D536: [0x0079],
+    0x1D537: [0x007A],
+    0x1D538: [0x0061],
+    0x1D539: [0x0062],
+    0x1D53B: [0x0064],
+    0x1D53C: [0x0065],
+    0x1D53D: [0x0066],
+    0x1D53E: [0x0067],
+    0x1D540: [0x0069],
+    0x1D541: [0x006A],
+    0x1D542: [0x006B],
+    0x1D543: [0x006C],
+    0x1D544: [0x006D],
+    0x1D546: [0x006F],
+    0x1D54A: [0x0073],
+    0x1D54B: [0x0074],
+    0x1D54C: [0x0075],
+    0x1D54D: [0x0076],
+    0x1D54E: [0x0077],
+    0x1D54F: [0x0078],
+    0x1D550: [0x0079],
+    0x1D552: [0x0061],
+    0x1D553: [0x0062],
+    0x1D554: [0x0063],
+    0x1D555: [0x0064],
+    0x1D556: [0x0065],
+    0x1D557: [0x0066],
+    0x1D558: [0x0067],
+    0x1D559: [0x0068],
+    0x1D55A: [0x0069],
+    0x1D55B: [0x006A],
+    0x1D55C: [0x006B],
+    0x1D55D: [0x006C],
+    0x1D55E: [0x006D],
+    0x1D55F: [0x006E],
+    0x1D560: [0x006F],
+    0x1D561: [0x0070],
+    0x1D562: [0x0071],
+    0x1D563: [0x0072],
+    0x1D564: [0x0073],
+    0x1D565: [0x0074],
+    0x1D566: [0x0075],
+    0x1D567: [0x0076],
+    0x1D568: [0x0077],
+    0x1D569: [0x0078],
+    0x1D56A: [0x0079],
+    0x1D56B: [0x007A],
+    0x1D56C: [0x0061],
+    0x1D56D: [0x0062],
+    0x1D56E: [0x0063],
+    0x1D56F: [0x0064],
+    0x1D570: [0x0065],
+    0x1D571: [0x0066],
+    0x1D572: [0x0067],
+    0x1D573: [0x0068],
+    0x1D574: [0x0069],
+    0x1D575: [0x006A],
+    0x1D576: [0x006B],
+    0x1D577: [0x006C],
+    0x1D578: [0x006D],
+    0x1D579: [0x006E],
+    0x1D57A: [0x006F],
+    0x1D57B: [0x0070],
+    0x1D57C: [0x0071],
+    0x1D57D: [0x0072],
+    0x1D57E: [0x0073],
+    0x1D57F: [0x0074],
+    0x1D580: [0x0075],
+    0x1D581: [0x0076],
+    0x1D582: [0x0077],
+    0x1D583: [0x0078],
+    0x1D584: [0x0079],
+    0x1D585: [0x007A],
+    0x1D586: [0x0061],
+    0x1D587: [0x0062],
+    0x1D588: [0x0063],
+    0x1D589: [0x0064],
+    0x1D58A: [0x0065],
+    0x1D58B: [0x0066],
+    0x1D58C: [0x0067],
+    0x1D58D: [0x0068],
+    0x1D58E: [0x0069],
+    0x1D58F: [0x006A],
+    0x1D590: [0x006B],
+    0x1D591: [0x006C],
+    0x1D592: [0x006D],
+    0x1D593: [0x006E],
+    0x1D594: [0x006F],
+    0x1D595: [0x0070],
+    0x1D596: [0x0071],
+    0x1D597: [0x0072],
+    0x1D598: [0x0073],
+    0x1D599: [0x0074],
+    0x1D59A: [0x0075],
+    0x1D59B: [0x0076],
+    0x1D59C: [0x0077],
+    0x1D59D: [0x0078],
+    0x1D59E: [0x0079],
+    0x1D59F: [0x007A],
+    0x1D5A0: [0x0061],
+    0x1D5A1: [0x0062],
+    0x1D5A2: [0x0063],
+    0x1D5A3: [0x0064],
+    0x1D5A4: [0x0065],
+    0x1D5A5: [0x0066],
+    0x1D5A6: [0x0067],
+    0x1D5A7: [0x0068],
+    0x1D5A8: [0x0069],
+    0x1D5A9: [0x006A],
+    0x1D5AA: [0x006B],
+    0x1D5AB: [0x006C],
+    0x1D5AC: [0x006D],
+    0x1D5AD: [0x006E],
+    0x1D5AE: [0x006F],
+    0x1D5AF: [0x0070],
+    0x1D5B0: [0x0071],
+    0x1D5B1: [0x0072],
+    0x1D5B2: [0x0073],
+    0x1D5B3: [0x0074],
+    0x1D5B4: [0x0075],
+    0x1D5B5: [0x0076],
+    0x1D5B6: [0x0077],
+    0x1D5B7: [0x0078],
+    0x1D5B8: [0x0079],
+    0x1D5B9: [0x007A],
+    0x1D5BA: [0x0061],
+    0x1D5BB: [0x0062],
+    0x1D5BC: [0x0063],
+    0x1D5BD: [0x0064],
+    0x1D5BE: [0x0065],
+    0x1D5BF: [0x0066],
+    0x1D5C0: [0x0067],
+    0x1D5C1: [0x0068],
+    0x1D5C2: [0x0069],
+    0x1D5C3: [0x006A],
+    0x1D5C4: [0x006B],
+    0x1D5C5: [0x006C],
+    0x1D5C6: [0x006D],
+    0x1D5C7: [0x006E],
+    0x1D5C8: [0x006F],
+    0x1D5C9: [0x0070],
+    0x1D5CA: [0x0071],
+    0x1D5CB: [0x0072],
+    0x1D5CC: [0x0073],
+    0x1D5CD: [0x0074],
+    0x1D5CE: [0x0075],
+    0x1D5CF: [0x0076],
+    0x1D5D0: [0x0077],
+    0x1D5D1: [0x0078],
+    0x1D5D2: [0x0079],
+    0x1D5D3: [0x007A],
+    0x1D5D4: [0x0061],
+    0x1D5D5: [0x0062],
+    0x1D5D6: [0x0063],
+    0x1D5D7: [0x0064],
+    0x1D5D8: [0x0065],
+    0x1D5D9: [0x0066],
+    0x1D5DA: [0x0067],
+    0x1D5DB: [0x0068],
+    0x1D5DC: [0x0069],
+    0x1D5DD: [0x006A],
+    0x1D5DE: [0x006B],
+    0x1D5DF: [0x006C],
+    0x1D5E0: [0x006D],
+    0x1D5E1: [0x006E],
+    0x1D5E2: [0x006F],
+    0x1D5E3: [0x0070],
+    0x1D5E4: [0x0071],
+    0x1D5E5: [0x0072],
+    0x1D5E6: [0x0073],
+    0x1D5E7: [0x0074],
+    0x1D5E8: [0x0075],
+    0x1D5E9: [0x0076],
+    0x1D5EA: [0x0077],
+    0x1D5EB: [0x0078],
+    0x1D5EC: [0x0079],
+    0x1D5ED: [0x007A],
+    0x1D5EE: [0x0061],
+    0x1D5EF: [0x0062],
+    0x1D5F0: [0x0063],
+    0x1D5F1: [0x0064],
+    0x1D5F2: [0x0065],
+    0x1D5F3: [0x0066],
+    0x1D5F4: [0x0067],
+    0x1D5F5: [0x0068],
+    0x1D5F6: [0x0069],
+    0x1D5F7: [0x006A],
+    0x1D5F8: [0x006B],
+    0x1D5F9: [0x006C],
+    0x1D5FA: [0x006D],
+    0x1D5FB: [0x006E],
+    0x1D5FC: [0x006F],
+    0x1D5FD: [0x0070],
+    0x1D5FE: [0x0071],
+    0x1D5FF: [0x0072],
+    0x1D600: [0x0073],
+    0x1D601: [0x0074],
+    0x1D602: [0x0075],
+    0x1D603: [0x0076],
+    0x1D604: [0x0077],
+    0x1D605: [0x0078],
+    0x1D606: [0x0079],
+    0x1D607: [0x007A],
+    0x1D608: [0x0061],
+    0x1D609: [0x0062],
+    0x1D60A: [0x0063],
+    0x1D60B: [0x0064],
+    0x1D60C: [0x0065],
+    0x1D60D: [0x0066],
+    0x1D60E: [0x0067],
+    0x1D60F: [0x0068],
+    0x1D610: [0x0069],
+    0x1D611: [0x006A],
+    0x1D612: [0x006B],
+    0x1D613: [0x006C],
+    0x1D614: [0x006D],
+    0x1D615: [0x006E],
+    0x1D616: [0x006F],
+    0x1D617: [0x0070],
+    0x1D618: [0x0071],
+    0x1D619: [0x0072],
+    0x1D61A: [0x0073],
+    0x1D61B: [0x0074],
+    0x1D61C: [0x0075],
+    0x1D61D: [0x0076],
+    0x1D61E: [0x0077],
+    0x1D61F: [0x0078],
+    0x1D620: [0x0079],
+    0x1D621: [0x007A],
+    0x1D622: [0x0061],
+    0x1D623: [0x0062],
+    0x1D624: [0x0063],
+    0x1D625: [0x0064],
+    0x1D626: [0x0065],
+    0x1D627: [0x0066],
+    0x1D628: [0x0067],
+    0x1D629: [0x0068],
+    0x1D62A: [0x0069],
+    0x1D62B: [0x006A],
+    0x1D62C: [0x006B],
+    0x1D62D: [0x006C],
+    0x1D62E: [0x006D],
+    0x1D62F: [0x006E],
+    0x1D630: [0x006F],
+    0x1D631: [0x0070],
+    0x1D632: [0x0071],
+    0x1D633: [0x0072],
+    0x1D634: [0x0073],
+    0x1D635: [0x0074],
+    0x1D636: [0x0075],
+    0x1D637: [0x0076],
+    0x1D638: [0x0077],
+    0x1D639: [0x0078],
+    0x1D63A: [0x0079],
+    0x1D63B: [0x007A],
+    0x1D63C: [0x0061],
+    0x1D63D: [0x0062],
+    0x1D63E: [0x0063],
+    0x1D63F: [0x0064],
+    0x1D640: [0x0065],
+    0x1D641: [0x0066],
+    0x1D642: [0x0067],
+    0x1D643: [0x0068],
+    0x1D644: [0x0069],
+    0x1D645: [0x006A],
+    0x1D646: [0x006B],
+    0x1D647: [0x006C],
+    0x1D648: [0x006D],
+    0x1D649: [0x006E],
+    0x1D64A: [0x006F],
+    0x1D64B: [0x0070],
+    0x1D64C: [0x0071],
+    0x1D64D: [0x0072],
+    0x1D64E: [0x0073],
+    0x1D64F: [0x0074],
+    0x1D650: [0x0075],
+    0x1D651: [0x0076],
+    0x1D652: [0x0077],
+    0x1D653: [0x0078],
+    0x1D654: [0x0079],
+    0x1D655: [0x007A],
+    0x1D656: [0x0061],
+    0x1D657: [0x0062],
+    0x1D658: [0x0063],
+    0x1D659: [0x0064],
+    0x1D65A: [0x0065],
+    0x1D65B: [0x0066],
+    0x1D65C: [0x0067],
+    0x1D65D: [0x0068],
+    0x1D65E: [0x0069],
+    0x1D65F: [0x006A],
+    0x1D660: [0x006B],
+    0x1D661: [0x006C],
+    0x1D662: [0x006D],
+    0x1D663: [0x006E],
+    0x1D664: [0x006F],
+    0x1D665: [0x0070],
+    0x1D666: [0x0071],
+    0x1D667: [0x0072],
+    0x1D668: [0x0073],
+    0x1D669: [0x0074],
+    0x1D66A: [0x0075],
+    0x1D66B: [0x0076],
+    0x1D66C: [0x0077],
+    0x1D66D: [0x0078],
+    0x1D66E: [0x0079],
+    0x1D66F: [0x007A],
+    0x1D670: [0x0061],
+    0x1D671: [0x0062],
+    0x1D672: [0x0063],
+    0x1D673: [0x0064],
+    0x1D674: [0x0065],
+    0x1D675: [0x0066],
+    0x1D676: [0x0067],
+    0x1D677: [0x0068],
+    0x1D678: [0x0069],
+    0x1D679: [0x006A],
+    0x1D67A: [0x006B],
+    0x1D67B: [0x006C],
+    0x1D67C: [0x006D],
+    0x1D67D: [0x006E],
+    0x1D67E: [0x006F],
+    0x1D67F: [0x0070],
+    0x1D680: [0x0071],
+    0x1D681: [0x0072],
+    0x1D682: [0x0073],
+    0x1D683: [0x0074],
+    0x1D684: [0x0075],
+    0x1D685: [0x0076],
+    0x1D686: [0x0077],
+    0x1D687: [0x0078],
+    0x1D688: [0x0079],
+    0x1D689: [0x007A],
+    0x1D68A: [0x0061],
+    0x1D68B: [0x0062],
+    0x1D68C: [0x0063],
+    0x1D68D: [0x0064],
+    0x1D68E: [0x0065],
+    0x1D68F: [0x0066],
+    0x1D690: [0x0067],
+    0x1D691: [0x0068],
+    0x1D692: [0x0069],
+    0x1D693: [0x006A],
+    0x1D694: [0x006B],
+    0x1D695: [0x006C],
+    0x1D696: [0x006D],
+    0x1D697: [0x006E],
+    0x1D698: [0x006F],
+    0x1D699: [0x0070],
+    0x1D69A: [0x0071],
+    0x1D69B: [0x0072],
+    0x1D69C: [0x0073],
+    0x1D69D: [0x0074],
+    0x1D69E: [0x0075],
+    0x1D69F: [0x0076],
+    0x1D6A0: [0x0077],
+    0x1D6A1: [0x0078],
+    0x1D6A2: [0x0079],
+    0x1D6A3: [0x007A],
+    0x1D6A4: [0x0131],
+    0x1D6A5: [0x0237],
+    0x1D6A8: [0x03B1],
+    0x1D6A9: [0x03B2],
+    0x1D6AA: [0x03B3],
+    0x1D6AB: [0x03B4],
+    0x1D6AC: [0x03B5],
+    0x1D6AD: [0x03B6],
+    0x1D6AE: [0x03B7],
+    0x1D6AF: [0x03B8],
+    0x1D6B0: [0x03B9],
+    0x1D6B1: [0x03BA],
+    0x1D6B2: [0x03BB],
+    0x1D6B3: [0x03BC],
+    0x1D6B4: [0x03BD],
+    0x1D6B5: [0x03BE],
+    0x1D6B6: [0x03BF],
+    0x1D6B7: [0x03C0],
+    0x1D6B8: [0x03C1],
+    0x1D6B9: [0x03B8],
+    0x1D6BA: [0x03C3],
+    0x1D6BB: [0x03C4],
+    0x1D6BC: [0x03C5],
+    0x1D6BD: [0x03C6],
+    0x1D6BE: [0x03C7],
+    0x1D6BF: [0x03C8],
+    0x1D6C0: [0x03C9],
+    0x1D6C1: [0x2207],
+    0x1D6C2: [0x03B1],
+    0x1D6C3: [0x03B2],
+    0x1D6C4: [0x03B3],
+    0x1D6C5: [0x03B4],
+    0x1D6C6: [0x03B5],
+    0x1D6C7: [0x03B6],
+    0x1D6C8: [0x03B7],
+    0x1D6C9: [0x03B8],
+    0x1D6CA: [0x03B9],
+    0x1D6CB: [0x03BA],
+    0x1D6CC: [0x03BB],
+    0x1D6CD: [0x03BC],
+    0x1D6CE: [0x03BD],
+    0x1D6CF: [0x03BE],
+    0x1D6D0: [0x03BF],
+    0x1D6D1: [0x03C0],
+    0x1D6D2: [0x03C1],
+    0x1D6D3: [0x03C3],
+    0x1D6D4: [0x03C3],
+    0x1D6D5: [0x03C4],
+    0x1D6D6: [0x03C5],
+    0x1D6D7: [0x03C6],
+    0x1D6D8: [0x03C7],
+    0x1D6D9: [0x03C8],
+    0x1D6DA: [0x03C9],
+    0x1D6DB: [0x2202],
+    0x1D6DC: [0x03B5],
+    0x1D6DD: [0x03B8],
+    0x1D6DE: [0x03BA],
+    0x1D6DF: [0x03C6],
+    0x1D6E0: [0x03C1],
+    0x1D6E1: [0x03C0],
+    0x1D6E2: [0x03B1],
+    0x1D6E3: [0x03B2],
+    0x1D6E4: [0x03B3],
+    0x1D6E5: [0x03B4],
+    0x1D6E6: [0x03B5],
+    0x1D6E7: [0x03B6],
+    0x1D6E8: [0x03B7],
+    0x1D6E9: [0x03B8],
+    0x1D6EA: [0x03B9],
+    0x1D6EB: [0x03BA],
+    0x1D6EC: [0x03BB],
+    0x1D6ED: [0x03BC],
+    0x1D6EE: [0x03BD],
+    0x1D6EF: [0x03BE],
+    0x1D6F0: [0x03BF],
+    0x1D6F1: [0x03C0],
+    0x1D6F2: [0x03C1],
+    0x1D6F3: [0x03B8],
+    0x1D6F4: [0x03C3],
+    0x1D6F5: [0x03C4],
+    0x1D6F6: [0x03C5],
+    0x1D6F7: [0x03C6],
+    0x1D6F8: [0x03C7],
+    0x1D6F9: [0x03C8],
+    0x1D6FA: [0x03C9],
+    0x1D6FB: [0x2207],
+    0x1D6FC: [0x03B1],
+    0x1D6FD: [0x03B2],
+    0x1D6FE: [0x03B3],
+    0x1D6FF: [0x03B4],
+    0x1D700: [0x03B5],
+    0x1D701: [0x03B6],
+    0x1D702: [0x03B7],
+    0x1D703: [0x03B8],
+    0x1D704: [0x03B9],
+    0x1D705: [0x03BA],
+    0x1D706: [0x03BB],
+    0x1D707: [0x03BC],
+    0x1D708: [0x03BD],
+    0x1D709: [0x03BE],
+    0x1D70A: [0x03BF],
+    0x1D70B: [0x03C0],
+    0x1D70C: [0x03C1],
+    0x1D70D: [0x03C3],
+    0x1D70E: [0x03C3],
+    0x1D70F: [0x03C4],
+    0x1D710: [0x03C5],
+    0x1D711: [0x03C6],
+    0x1D712: [0x03C7],
+    0x1D713: [0x03C8],
+    0x1D714: [0x03C9],
+    0x1D715: [0x2202],
+    0x1D716: [0x03B5],
+    0x1D717: [0x03B8],
+    0x1D718: [0x03BA],
+    0x1D719: [0x03C6],
+    0x1D71A: [0x03C1],
+    0x1D71B: [0x03C0],
+    0x1D71C: [0x03B1],
+    0x1D71D: [0x03B2],
+    0x1D71E: [0x03B3],
+    0x1D71F: [0x03B4],
+    0x1D720: [0x03B5],
+    0x1D721: [0x03B6],
+    0x1D722: [0x03B7],
+    0x1D723: [0x03B8],
+    0x1D724: [0x03B9],
+    0x1D725: [0x03BA],
+    0x1D726: [0x03BB],
+    0x1D727: [0x03BC],
+    0x1D728: [0x03BD],
+    0x1D729: [0x03BE],
+    0x1D72A: [0x03BF],
+    0x1D72B: [0x03C0],
+    0x1D72C: [0x03C1],
+    0x1D72D: [0x03B8],
+    0x1D72E: [0x03C3],
+    0x1D72F: [0x03C4],
+    0x1D730: [0x03C5],
+    0x1D731: [0x03C6],
+    0x1D732: [0x03C7],
+    0x1D733: [0x03C8],
+    0x1D734: [0x03C9],
+    0x1D735: [0x2207],
+    0x1D736: [0x03B1],
+    0x1D737: [0x03B2],
+    0x1D738: [0x03B3],
+    0x1D739: [0x03B4],
+    0x1D73A: [0x03B5],
+    0x1D73B: [0x03B6],
+    0x1D73C: [0x03B7],
+    0x1D73D: [0x03B8],
+    0x1D73E: [0x03B9],
+    0x1D73F: [0x03BA],
+    0x1D740: [0x03BB],
+    0x1D741: [0x03BC],
+    0x1D742: [0x03BD],
+    0x1D743: [0x03BE],
+    0x1D744: [0x03BF],
+    0x1D745: [0x03C0],
+    0x1D746: [0x03C1],
+    0x1D747: [0x03C3],
+    0x1D748: [0x03C3],
+    0x1D749: [0x03C4],
+    0x1D74A: [0x03C5],
+    0x1D74B: [0x03C6],
+    0x1D74C: [0x03C7],
+    0x1D74D: [0x03C8],
+    0x1D74E: [0x03C9],
+    0x1D74F: [0x2202],
+    0x1D750: [0x03B5],
+    0x1D751: [0x03B8],
+    0x1D752: [0x03BA],
+    0x1D753: [0x03C6],
+    0x1D754: [0x03C1],
+    0x1D755: [0x03C0],
+    0x1D756: [0x03B1],
+    0x1D757: [0x03B2],
+    0x1D758: [0x03B3],
+    0x1D759: [0x03B4],
+    0x1D75A: [0x03B5],
+    0x1D75B: [0x03B6],
+    0x1D75C: [0x03B7],
+    0x1D75D: [0x03B8],
+    0x1D75E: [0x03B9],
+    0x1D75F: [0x03BA],
+    0x1D760: [0x03BB],
+    0x1D761: [0x03BC],
+    0x1D762: [0x03BD],
+    0x1D763: [0x03BE],
+    0x1D764: [0x03BF],
+    0x1D765: [0x03C0],
+    0x1D766: [0x03C1],
+    0x1D767: [0x03B8],
+    0x1D768: [0x03C3],
+    0x1D769: [0x03C4],
+    0x1D76A: [0x03C5],
+    0x1D76B: [0x03C6],
+    0x1D76C: [0x03C7],
+    0x1D76D: [0x03C8],
+    0x1D76E: [0x03C9],
+    0x1D76F: [0x2207],
+    0x1D770: [0x03B1],
+    0x1D771: [0x03B2],
+    0x1D772: [0x03B3],
+    0x1D773: [0x03B4],
+    0x1D774: [0x03B5],
+    0x1D775: [0x03B6],
+    0x1D776: [0x03B7],
+    0x1D777: [0x03B8],
+    0x1D778: [0x03B9],
+    0x1D779: [0x03BA],
+    0x1D77A: [0x03BB],
+    0x1D77B: [0x03BC],
+    0x1D77C: [0x03BD],
+    0x1D77D: [0x03BE],
+    0x1D77E: [0x03BF],
+    0x1D77F: [0x03C0],
+    0x1D780: [0x03C1],
+    0x1D781: [0x03C3],
+    0x1D782: [0x03C3],
+    0x1D783: [0x03C4],
+    0x1D784: [0x03C5],
+    0x1D785: [0x03C6],
+    0x1D786: [0x03C7],
+    0x1D787: [0x03C8],
+    0x1D788: [0x03C9],
+    0x1D789: [0x2202],
+    0x1D78A: [0x03B5],
+    0x1D78B: [0x03B8],
+    0x1D78C: [0x03BA],
+    0x1D78D: [0x03C6],
+    0x1D78E: [0x03C1],
+    0x1D78F: [0x03C0],
+    0x1D790: [0x03B1],
+    0x1D791: [0x03B2],
+    0x1D792: [0x03B3],
+    0x1D793: [0x03B4],
+    0x1D794: [0x03B5],
+    0x1D795: [0x03B6],
+    0x1D796: [0x03B7],
+    0x1D797: [0x03B8],
+    0x1D798: [0x03B9],
+    0x1D799: [0x03BA],
+    0x1D79A: [0x03BB],
+    0x1D79B: [0x03BC],
+    0x1D79C: [0x03BD],
+    0x1D79D: [0x03BE],
+    0x1D79E: [0x03BF],
+    0x1D79F: [0x03C0],
+    0x1D7A0: [0x03C1],
+    0x1D7A1: [0x03B8],
+    0x1D7A2: [0x03C3],
+    0x1D7A3: [0x03C4],
+    0x1D7A4: [0x03C5],
+    0x1D7A5: [0x03C6],
+    0x1D7A6: [0x03C7],
+    0x1D7A7: [0x03C8],
+    0x1D7A8: [0x03C9],
+    0x1D7A9: [0x2207],
+    0x1D7AA: [0x03B1],
+    0x1D7AB: [0x03B2],
+    0x1D7AC: [0x03B3],
+    0x1D7AD: [0x03B4],
+    0x1D7AE: [0x03B5],
+    0x1D7AF: [0x03B6],
+    0x1D7B0: [0x03B7],
+    0x1D7B1: [0x03B8],
+    0x1D7B2: [0x03B9],
+    0x1D7B3: [0x03BA],
+    0x1D7B4: [0x03BB],
+    0x1D7B5: [0x03BC],
+    0x1D7B6: [0x03BD],
+    0x1D7B7: [0x03BE],
+    0x1D7B8: [0x03BF],
+    0x1D7B9: [0x03C0],
+    0x1D7BA: [0x03C1],
+    0x1D7BB: [0x03C3],
+    0x1D7BC: [0x03C3],
+    0x1D7BD: [0x03C4],
+    0x1D7BE: [0x03C5],
+    0x1D7BF: [0x03C6],
+    0x1D7C0: [0x03C7],
+    0x1D7C1: [0x03C8],
+    0x1D7C2: [0x03C9],
+    0x1D7C3: [0x2202],
+    0x1D7C4: [0x03B5],
+    0x1D7C5: [0x03B8],
+    0x1D7C6: [0x03BA],
+    0x1D7C7: [0x03C6],
+    0x1D7C8: [0x03C1],
+    0x1D7C9: [0x03C0],
+    0x1D7CA: [0x03DD],
+    0x1D7CB: [0x03DD],
+    0x1D7CE: [0x0030],
+    0x1D7CF: [0x0031],
+    0x1D7D0: [0x0032],
+    0x1D7D1: [0x0033],
+    0x1D7D2: [0x0034],
+    0x1D7D3: [0x0035],
+    0x1D7D4: [0x0036],
+    0x1D7D5: [0x0037],
+    0x1D7D6: [0x0038],
+    0x1D7D7: [0x0039],
+    0x1D7D8: [0x0030],
+    0x1D7D9: [0x0031],
+    0x1D7DA: [0x0032],
+    0x1D7DB: [0x0033],
+    0x1D7DC: [0x0034],
+    0x1D7DD: [0x0035],
+    0x1D7DE: [0x0036],
+    0x1D7DF: [0x0037],
+    0x1D7E0: [0x0038],
+    0x1D7E1: [0x0039],
+    0x1D7E2: [0x0030],
+    0x1D7E3: [0x0031],
+    0x1D7E4: [0x0032],
+    0x1D7E5: [0x0033],
+    0x1D7E6: [0x0034],
+    0x1D7E7: [0x0035],
+    0x1D7E8: [0x0036],
+    0x1D7E9: [0x0037],
+    0x1D7EA: [0x0038],
+    0x1D7EB: [0x0039],
+    0x1D7EC: [0x0030],
+    0x1D7ED: [0x0031],
+    0x1D7EE: [0x0032],
+    0x1D7EF: [0x0033],
+    0x1D7F0: [0x0034],
+    0x1D7F1: [0x0035],
+    0x1D7F2: [0x0036],
+    0x1D7F3: [0x0037],
+    0x1D7F4: [0x0038],
+    0x1D7F5: [0x0039],
+    0x1D7F6: [0x0030],
+    0x1D7F7: [0x0031],
+    0x1D7F8: [0x0032],
+    0x1D7F9: [0x0033],
+    0x1D7FA: [0x0034],
+    0x1D7FB: [0x0035],
+    0x1D7FC: [0x0036],
+    0x1D7FD: [0x0037],
+    0x1D7FE: [0x0038],
+    0x1D7FF: [0x0039],
+    0x1E030: [0x0430],
+    0x1E031: [0x0431],
+    0x1E032: [0x0432],
+    0x1E033: [0x0433],
+    0x1E034: [0x0434],
+    0x1E035: [0x0435],
+    0x1E036: [0x0436],
+    0x1E037: [0x0437],
+    0x1E038: [0x0438],
+    0x1E039: [0x043A],
+    0x1E03A: [0x043B],
+    0x1E03B: [0x043C],
+    0x1E03C: [0x043E],
+    0x1E03D: [0x043F],
+    0x1E03E: [0x0440],
+    0x1E03F: [0x0441],
+    0x1E040: [0x0442],
+    0x1E041: [0x0443],
+    0x1E042: [0x0444],
+    0x1E043: [0x0445],
+    0x1E044: [0x0446],
+    0x1E045: [0x0447],
+    0x1E046: [0x0448],
+    0x1E047: [0x044B],
+    0x1E048: [0x044D],
+    0x1E049: [0x044E],
+    0x1E04A: [0xA689],
+    0x1E04B: [0x04D9],
+    0x1E04C: [0x0456],
+    0x1E04D: [0x0458],
+    0x1E04E: [0x04E9],
+    0x1E04F: [0x04AF],
+    0x1E050: [0x04CF],
+    0x1E051: [0x0430],
+    0x1E052: [0x0431],
+    0x1E053: [0x0432],
+    0x1E054: [0x0433],
+    0x1E055: [0x0434],
+    0x1E056: [0x0435],
+    0x1E057: [0x0436],
+    0x1E058: [0x0437],
+    0x1E059: [0x0438],
+    0x1E05A: [0x043A],
+    0x1E05B: [0x043B],
+    0x1E05C: [0x043E],
+    0x1E05D: [0x043F],
+    0x1E05E: [0x0441],
+    0x1E05F: [0x0443],
+    0x1E060: [0x0444],
+    0x1E061: [0x0445],
+    0x1E062: [0x0446],
+    0x1E063: [0x0447],
+    0x1E064: [0x0448],
+    0x1E065: [0x044A],
+    0x1E066: [0x044B],
+    0x1E067: [0x0491],
+    0x1E068: [0x0456],
+    0x1E069: [0x0455],
+    0x1E06A: [0x045F],
+    0x1E06B: [0x04AB],
+    0x1E06C: [0xA651],
+    0x1E06D: [0x04B1],
+    0x1E900: [0x1E922],
+    0x1E901: [0x1E923],
+    0x1E902: [0x1E924],
+    0x1E903: [0x1E925],
+    0x1E904: [0x1E926],
+    0x1E905: [0x1E927],
+    0x1E906: [0x1E928],
+    0x1E907: [0x1E929],
+    0x1E908: [0x1E92A],
+    0x1E909: [0x1E92B],
+    0x1E90A: [0x1E92C],
+    0x1E90B: [0x1E92D],
+    0x1E90C: [0x1E92E],
+    0x1E90D: [0x1E92F],
+    0x1E90E: [0x1E930],
+    0x1E90F: [0x1E931],
+    0x1E910: [0x1E932],
+    0x1E911: [0x1E933],
+    0x1E912: [0x1E934],
+    0x1E913: [0x1E935],
+    0x1E914: [0x1E936],
+    0x1E915: [0x1E937],
+    0x1E916: [0x1E938],
+    0x1E917: [0x1E939],
+    0x1E918: [0x1E93A],
+    0x1E919: [0x1E93B],
+    0x1E91A: [0x1E93C],
+    0x1E91B: [0x1E93D],
+    0x1E91C: [0x1E93E],
+    0x1E91D: [0x1E93F],
+    0x1E91E: [0x1E940],
+    0x1E91F: [0x1E941],
+    0x1E920: [0x1E942],
+    0x1E921: [0x1E943],
+    0x1EE00: [0x0627],
+    0x1EE01: [0x0628],
+    0x1EE02: [0x062C],
+    0x1EE03: [0x062F],
+    0x1EE05: [0x0648],
+    0x1EE06: [0x0632],
+    0x1EE07: [0x062D],
+    0x1EE08: [0x0637],
+    0x1EE09: [0x064A],
+    0x1EE0A: [0x0643],
+    0x1EE0B: [0x0644],
+    0x1EE0C: [0x0645],
+    0x1EE0D: [0x0646],
+    0x1EE0E: [0x0633],
+    0x1EE0F: [0x0639],
+    0x1EE10: [0x0641],
+    0x1EE11: [0x0635],
+    0x1EE12: [0x0642],
+    0x1EE13: [0x0631],
+    0x1EE14: [0x0634],
+    0x1EE15: [0x062A],
+    0x1EE16: [0x062B],
+    0x1EE17: [0x062E],
+    0x1EE18: [0x0630],
+    0x1EE19: [0x0636],
+    0x1EE1A: [0x0638],
+    0x1EE1B: [0x063A],
+    0x1EE1C: [0x066E],
+    0x1EE1D: [0x06BA],
+    0x1EE1E: [0x06A1],
+    0x1EE1F: [0x066F],
+    0x1EE21: [0x0628],
+    0x1EE22: [0x062C],
+    0x1EE24: [0x0647],
+    0x1EE27: [0x062D],
+    0x1EE29: [0x064A],
+    0x1EE2A: [0x0643],
+    0x1EE2B: [0x0644],
+    0x1EE2C: [0x0645],
+    0x1EE2D: [0x0646],
+    0x1EE2E: [0x0633],
+    0x1EE2F: [0x0639],
+    0x1EE30: [0x0641],
+    0x1EE31: [0x0635],
+    0x1EE32: [0x0642],
+    0x1EE34: [0x0634],
+    0x1EE35: [0x062A],
+    0x1EE36: [0x062B],
+    0x1EE37: [0x062E],
+    0x1EE39: [0x0636],
+    0x1EE3B: [0x063A],
+    0x1EE42: [0x062C],
+    0x1EE47: [0x062D],
+    0x1EE49: [0x064A],
+    0x1EE4B: [0x0644],
+    0x1EE4D: [0x0646],
+    0x1EE4E: [0x0633],
+    0x1EE4F: [0x0639],
+    0x1EE51: [0x0635],
+    0x1EE52: [0x0642],
+    0x1EE54: [0x0634],
+    0x1EE57: [0x062E],
+    0x1EE59: [0x0636],
+    0x1EE5B: [0x063A],
+    0x1EE5D: [0x06BA],
+    0x1EE5F: [0x066F],
+    0x1EE61: [0x0628],
+    0x1EE62: [0x062C],
+    0x1EE64: [0x0647],
+    0x1EE67: [0x062D],
+    0x1EE68: [0x0637],
+    0x1EE69: [0x064A],
+    0x1EE6A: [0x0643],
+    0x1EE6C: [0x0645],
+    0x1EE6D: [0x0646],
+    0x1EE6E: [0x0633],
+    0x1EE6F: [0x0639],
+    0x1EE70: [0x0641],
+    0x1EE71: [0x0635],
+    0x1EE72: [0x0642],
+    0x1EE74: [0x0634],
+    0x1EE75: [0x062A],
+    0x1EE76: [0x062B],
+    0x1EE77: [0x062E],
+    0x1EE79: [0x0636],
+    0x1EE7A: [0x0638],
+    0x1EE7B: [0x063A],
+    0x1EE7C: [0x066E],
+    0x1EE7E: [0x06A1],
+    0x1EE80: [0x0627],
+    0x1EE81: [0x0628],
+    0x1EE82: [0x062C],
+    0x1EE83: [0x062F],
+    0x1EE84: [0x0647],
+    0x1EE85: [0x0648],
+    0x1EE86: [0x0632],
+    0x1EE87: [0x062D],
+    0x1EE88: [0x0637],
+    0x1EE89: [0x064A],
+    0x1EE8B: [0x0644],
+    0x1EE8C: [0x0645],
+    0x1EE8D: [0x0646],
+    0x1EE8E: [0x0633],
+    0x1EE8F: [0x0639],
+    0x1EE90: [0x0641],
+    0x1EE91: [0x0635],
+    0x1EE92: [0x0642],
+    0x1EE93: [0x0631],
+    0x1EE94: [0x0634],
+    0x1EE95: [0x062A],
+    0x1EE96: [0x062B],
+    0x1EE97: [0x062E],
+    0x1EE98: [0x0630],
+    0x1EE99: [0x0636],
+    0x1EE9A: [0x0638],
+    0x1EE9B: [0x063A],
+    0x1EEA1: [0x0628],
+    0x1EEA2: [0x062C],
+    0x1EEA3: [0x062F],
+    0x1EEA5: [0x0648],
+    0x1EEA6: [0x0632],
+    0x1EEA7: [0x062D],
+    0x1EEA8: [0x0637],
+    0x1EEA9: [0x064A],
+    0x1EEAB: [0x0644],
+    0x1EEAC: [0x0645],
+    0x1EEAD: [0x0646],
+    0x1EEAE: [0x0633],
+    0x1EEAF: [0x0639],
+    0x1EEB0: [0x0641],
+    0x1EEB1: [0x0635],
+    0x1EEB2: [0x0642],
+    0x1EEB3: [0x0631],
+    0x1EEB4: [0x0634],
+    0x1EEB5: [0x062A],
+    0x1EEB6: [0x062B],
+    0x1EEB7: [0x062E],
+    0x1EEB8: [0x0630],
+    0x1EEB9: [0x0636],
+    0x1EEBA: [0x0638],
+    0x1EEBB: [0x063A],
+    0x1F100: [0x0030, 0x002E],
+    0x1F101: [0x0030, 0x002C],
+    0x1F102: [0x0031, 0x002C],
+    0x1F103: [0x0032, 0x002C],
+    0x1F104: [0x0033, 0x002C],
+    0x1F105: [0x0034, 0x002C],
+    0x1F106: [0x0035, 0x002C],
+    0x1F107: [0x0036, 0x002C],
+    0x1F108: [0x0037, 0x002C],
+    0x1F109: [0x0038, 0x002C],
+    0x1F10A: [0x0039, 0x002C],
+    0x1F110: [0x0028, 0x0061, 0x0029],
+    0x1F111: [0x0028, 0x0062, 0x0029],
+    0x1F112: [0x0028, 0x0063, 0x0029],
+    0x1F113: [0x0028, 0x0064, 0x0029],
+    0x1F114: [0x0028, 0x0065, 0x0029],
+    0x1F115: [0x0028, 0x0066, 0x0029],
+    0x1F116: [0x0028, 0x0067, 0x0029],
+    0x1F117: [0x0028, 0x0068, 0x0029],
+    0x1F118: [0x0028, 0x0069, 0x0029],
+    0x1F119: [0x0028, 0x006A, 0x0029],
+    0x1F11A: [0x0028, 0x006B, 0x0029],
+    0x1F11B: [0x0028, 0x006C, 0x0029],
+    0x1F11C: [0x0028, 0x006D, 0x0029],
+    0x1F11D: [0x0028, 0x006E, 0x0029],
+    0x1F11E: [0x0028, 0x006F, 0x0029],
+    0x1F11F: [0x0028, 0x0070, 0x0029],
+    0x1F120: [0x0028, 0x0071, 0x0029],
+    0x1F121: [0x0028, 0x0072, 0x0029],
+    0x1F122: [0x0028, 0x0073, 0x0029],
+    0x1F123: [0x0028, 0x0074, 0x0029],
+    0x1F124: [0x0028, 0x0075, 0x0029],
+    0x1F125: [0x0028, 0x0076, 0x0029],
+    0x1F126: [0x0028, 0x0077, 0x0029],
+    0x1F127: [0x0028, 0x0078, 0x0029],
+    0x1F128: [0x0028, 0x0079, 0x0029],
+    0x1F129: [0x0028, 0x007A, 0x0029],
+    0x1F12A: [0x3014, 0x0073, 0x3015],
+    0x1F12B: [0x0063],
+    0x1F12C: [0x0072],
+    0x1F12D: [0x0063, 0x0064],
+    0x1F12E: [0x0077, 0x007A],
+    0x1F130: [0x0061],
+    0x1F131: [0x0062],
+    0x1F132: [0x0063],
+    0x1F133: [0x0064],
+    0x1F134: [0x0065],
+    0x1F135: [0x0066],
+    0x1F136: [0x0067],
+    0x1F137: [0x0068],
+    0x1F138: [0x0069],
+    0x1F139: [0x006A],
+    0x1F13A: [0x006B],
+    0x1F13B: [0x006C],
+    0x1F13C: [0x006D],
+    0x1F13D: [0x006E],
+    0x1F13E: [0x006F],
+    0x1F13F: [0x0070],
+    0x1F140: [0x0071],
+    0x1F141: [0x0072],
+    0x1F142: [0x0073],
+    0x1F143: [0x0074],
+    0x1F144: [0x0075],
+    0x1F145: [0x0076],
+    0x1F146: [0x0077],
+    0x1F147: [0x0078],
+    0x1F148: [0x0079],
+    0x1F149: [0x007A],
+    0x1F14A: [0x0068, 0x0076],
+    0x1F14B: [0x006D, 0x0076],
+    0x1F14C: [0x0073, 0x0064],
+    0x1F14D: [0x0073, 0x0073],
+    0x1F14E: [0x0070, 0x0070, 0x0076],
+    0x1F14F: [0x0077, 0x0063],
+    0x1F16A: [0x006D, 0x0063],
+    0x1F16B: [0x006D, 0x0064],
+    0x1F16C: [0x006D, 0x0072],
+    0x1F190: [0x0064, 0x006A],
+    0x1F200: [0x307B, 0x304B],
+    0x1F201: [0x30B3, 0x30B3],
+    0x1F202: [0x30B5],
+    0x1F210: [0x624B],
+    0x1F211: [0x5B57],
+    0x1F212: [0x53CC],
+    0x1F213: [0x30C7],
+    0x1F214: [0x4E8C],
+    0x1F215: [0x591A],
+    0x1F216: [0x89E3],
+    0x1F217: [0x5929],
+    0x1F218: [0x4EA4],
+    0x1F219: [0x6620],
+    0x1F21A: [0x7121],
+    0x1F21B: [0x6599],
+    0x1F21C: [0x524D],
+    0x1F21D: [0x5F8C],
+    0x1F21E: [0x518D],
+    0x1F21F: [0x65B0],
+    0x1F220: [0x521D],
+    0x1F221: [0x7D42],
+    0x1F222: [0x751F],
+    0x1F223: [0x8CA9],
+    0x1F224: [0x58F0],
+    0x1F225: [0x5439],
+    0x1F226: [0x6F14],
+    0x1F227: [0x6295],
+    0x1F228: [0x6355],
+    0x1F229: [0x4E00],
+    0x1F22A: [0x4E09],
+    0x1F22B: [0x904A],
+    0x1F22C: [0x5DE6],
+    0x1F22D: [0x4E2D],
+    0x1F22E: [0x53F3],
+    0x1F22F: [0x6307],
+    0x1F230: [0x8D70],
+    0x1F231: [0x6253],
+    0x1F232: [0x7981],
+    0x1F233: [0x7A7A],
+    0x1F234: [0x5408],
+    0x1F235: [0x6E80],
+    0x1F236: [0x6709],
+    0x1F237: [0x6708],
+    0x1F238: [0x7533],
+    0x1F239: [0x5272],
+    0x1F23A: [0x55B6],
+    0x1F23B: [0x914D],
+    0x1F240: [0x3014, 0x672C, 0x3015],
+    0x1F241: [0x3014, 0x4E09, 0x3015],
+    0x1F242: [0x3014, 0x4E8C, 0x3015],
+    0x1F243: [0x3014, 0x5B89, 0x3015],
+    0x1F244: [0x3014, 0x70B9, 0x3015],
+    0x1F245: [0x3014, 0x6253, 0x3015],
+    0x1F246: [0x3014, 0x76D7, 0x3015],
+    0x1F247: [0x3014, 0x52DD, 0x3015],
+    0x1F248: [0x3014, 0x6557, 0x3015],
+    0x1F250: [0x5F97],
+    0x1F251: [0x53EF],
+    0x1FBF0: [0x0030],
+    0x1FBF1: [0x0031],
+    0x1FBF2: [0x0032],
+    0x1FBF3: [0x0033],
+    0x1FBF4: [0x0034],
+    0x1FBF5: [0x0035],
+    0x1FBF6: [0x0036],
+    0x1FBF7: [0x0037],
+    0x1FBF8: [0x0038],
+    0x1FBF9: [0x0039],
+    0x2F800: [0x4E3D],
+    0x2F801: [0x4E38],
+    0x2F802: [0x4E41],
+    0x2F803: [0x20122],
+    0x2F804: [0x4F60],
+    0x2F805: [0x4FAE],
+    0x2F806: [0x4FBB],
+    0x2F807: [0x5002],
+    0x2F808: [0x507A],
+    0x2F809: [0x5099],
+    0x2F80A: [0x50E7],
+    0x2F80B: [0x50CF],
+    0x2F80C: [0x349E],
+    0x2F80D: [0x2063A],
+    0x2F80E: [0x514D],
+    0x2F80F: [0x5154],
+    0x2F810: [0x5164],
+    0x2F811: [0x5177],
+    0x2F812: [0x2051C],
+    0x2F813: [0x34B9],
+    0x2F814: [0x5167],
+    0x2F815: [0x518D],
+    0x2F816: [0x2054B],
+    0x2F817: [0x5197],
+    0x2F818: [0x51A4],
+    0x2F819: [0x4ECC],
+    0x2F81A: [0x51AC],
+    0x2F81B: [0x51B5],
+    0x2F81C: [0x291DF],
+    0x2F81D: [0x51F5],
+    0x2F81E: [0x5203],
+    0x2F81F: [0x34DF],
+    0x2F820: [0x523B],
+    0x2F821: [0x5246],
+    0x2F822: [0x5272],
+    0x2F823: [0x5277],
+    0x2F824: [0x3515],
+    0x2F825: [0x52C7],
+    0x2F826: [0x52C9],
+    0x2F827: [0x52E4],
+    0x2F828: [0x52FA],
+    0x2F829: [0x5305],
+    0x2F82A: [0x5306],
+    0x2F82B: [0x5317],
+    0x2F82C: [0x5349],
+    0x2F82D: [0x5351],
+    0x2F82E: [0x535A],
+    0x2F82F: [0x5373],
+    0x2F830: [0x537D],
+    0x2F831: [0x537F],
+    0x2F832: [0x537F],
+    0x2F833: [0x537F],
+    0x2F834: [0x20A2C],
+    0x2F835: [0x7070],
+    0x2F836: [0x53CA],
+    0x2F837: [0x53DF],
+    0x2F838: [0x20B63],
+    0x2F839: [0x53EB],
+    0x2F83A: [0x53F1],
+    0x2F83B: [0x5406],
+    0x2F83C: [0x549E],
+    0x2F83D: [0x5438],
+    0x2F83E: [0x5448],
+    0x2F83F: [0x5468],
+    0x2F840: [0x54A2],
+    0x2F841: [0x54F6],
+    0x2F842: [0x5510],
+    0x2F843: [0x5553],
+    0x2F844: [0x5563],
+    0x2F845: [0x5584],
+    0x2F846: [0x5584],
+    0x2F847: [0x5599],
+    0x2F848: [0x55AB],
+    0x2F849: [0x55B3],
+    0x2F84A: [0x55C2],
+    0x2F84B: [0x5716],
+    0x2F84C: [0x5606],
+    0x2F84D: [0x5717],
+    0x2F84E: [0x5651],
+    0x2F84F: [0x5674],
+    0x2F850: [0x5207],
+    0x2F851: [0x58EE],
+    0x2F852: [0x57CE],
+    0x2F853: [0x57F4],
+    0x2F854: [0x580D],
+    0x2F855: [0x578B],
+    0x2F856: [0x5832],
+    0x2F857: [0x5831],
+    0x2F858: [0x58AC],
+    0x2F859: [0x214E4],
+    0x2F85A: [0x58F2],
+    0x2F85B: [0x58F7],
+    0x2F85C: [0x5906],
+    0x2F85D: [0x591A],
+    0x2F85E: [0x5922],
+    0x2F85F: [0x5962],
+    0x2F860: [0x216A8],
+    0x2F861: [0x216EA],
+    0x2F862: [0x59EC],
+    0x2F863: [0x5A1B],
+    0x2F864: [0x5A27],
+    0x2F865: [0x59D8],
+    0x2F866: [0x5A66],
+    0x2F867: [0x36EE],
+    0x2F868: [0x36FC],
+    0x2F869: [0x5B08],
+    0x2F86A: [0x5B3E],
+    0x2F86B: [0x5B3E],
+    0x2F86C: [0x219C8],
+    0x2F86D: [0x5BC3],
+    0x2F86E: [0x5BD8],
+    0x2F86F: [0x5BE7],
+    0x2F870: [0x5BF3],
+    0x2F871: [0x21B18],
+    0x2F872: [0x5BFF],
+    0x2F873: [0x5C06],
+    0x2F874: [0x5F53],
+    0x2F875: [0x5C22],
+    0x2F876: [0x3781],
+    0x2F877: [0x5C60],
+    0x2F878: [0x5C6E],
+    0x2F879: [0x5CC0],
+    0x2F87A: [0x5C8D],
+    0x2F87B: [0x21DE4],
+    0x2F87C: [0x5D43],
+    0x2F87D: [0x21DE6],
+    0x2F87E: [0x5D6E],
+    0x2F87F: [0x5D6B],
+    0x2F880: [0x5D7C],
+    0x2F881: [0x5DE1],
+    0x2F882: [0x5DE2],
+    0x2F883: [0x382F],
+    0x2F884: [0x5DFD],
+    0x2F885: [0x5E28],
+    0x2F886: [0x5E3D],
+    0x2F887: [0x5E69],
+    0x2F888: [0x3862],
+    0x2F889: [0x22183],
+    0x2F88A: [0x387C],
+    0x2F88B: [0x5EB0],
+    0x2F88C: [0x5EB3],
+    0x2F88D: [0x5EB6],
+    0x2F88E: [0x5ECA],
+    0x2F88F: [0x2A392],
+    0x2F890: [0x5EFE],
+    0x2F891: [0x22331],
+    0x2F892: [0x22331],
+    0x2F893: [0x8201],
+    0x2F894: [0x5F22],
+    0x2F895: [0x5F22],
+    0x2F896: [0x38C7],
+    0x2F897: [0x232B8],
+    0x2F898: [0x261DA],
+    0x2F899: [0x5F62],
+    0x2F89A: [0x5F6B],
+    0x2F89B: [0x38E3],
+    0x2F89C: [0x5F9A],
+    0x2F89D: [0x5FCD],
+    0x2F89E: [0x5FD7],
+    0x2F89F: [0x5FF9],
+    0x2F8A0: [0x6081],
+    0x2F8A1: [0x393A],
+    0x2F8A2: [0x391C],
+    0x2F8A3: [0x6094],
+    0x2F8A4: [0x226D4],
+    0x2F8A5: [0x60C7],
+    0x2F8A6: [0x6148],
+    0x2F8A7: [0x614C],
+    0x2F8A8: [0x614E],
+    0x2F8A9: [0x614C],
+    0x2F8AA: [0x617A],
+    0x2F8AB: [0x618E],
+    0x2F8AC: [0x61B2],
+    0x2F8AD: [0x61A4],
+    0x2F8AE: [0x61AF],
+    0x2F8AF: [0x61DE],
+    0x2F8B0: [0x61F2],
+    0x2F8B1: [0x61F6],
+    0x2F8B2: [0x6210],
+    0x2F8B3: [0x621B],
+    0x2F8B4: [0x625D],
+    0x2F8B5: [0x62B1],
+    0x2F8B6: [0x62D4],
+    0x2F8B7: [0x6350],
+    0x2F8B8: [0x22B0C],
+    0x2F8B9: [0x633D],
+    0x2F8BA: [0x62FC],
+    0x2F8BB: [0x6368],
+    0x2F8BC: [0x6383],
+    0x2F8BD: [0x63E4],
+    0x2F8BE: [0x22BF1],
+    0x2F8BF: [0x6422],
+    0x2F8C0: [0x63C5],
+    0x2F8C1: [0x63A9],
+    0x2F8C2: [0x3A2E],
+    0x2F8C3: [0x6469],
+    0x2F8C4: [0x647E],
+    0x2F8C5: [0x649D],
+    0x2F8C6: [0x6477],
+    0x2F8C7: [0x3A6C],
+    0x2F8C8: [0x654F],
+    0x2F8C9: [0x656C],
+    0x2F8CA: [0x2300A],
+    0x2F8CB: [0x65E3],
+    0x2F8CC: [0x66F8],
+    0x2F8CD: [0x6649],
+    0x2F8CE: [0x3B19],
+    0x2F8CF: [0x6691],
+    0x2F8D0: [0x3B08],
+    0x2F8D1: [0x3AE4],
+    0x2F8D2: [0x5192],
+    0x2F8D3: [0x5195],
+    0x2F8D4: [0x6700],
+    0x2F8D5: [0x669C],
+    0x2F8D6: [0x80AD],
+    0x2F8D7: [0x43D9],
+    0x2F8D8: [0x6717],
+    0x2F8D9: [0x671B],
+    0x2F8DA: [0x6721],
+    0x2F8DB: [0x675E],
+    0x2F8DC: [0x6753],
+    0x2F8DD: [0x233C3],
+    0x2F8DE: [0x3B49],
+    0x2F8DF: [0x67FA],
+    0x2F8E0: [0x6785],
+    0x2F8E1: [0x6852],
+    0x2F8E2: [0x6885],
+    0x2F8E3: [0x2346D],
+    0x2F8E4: [0x688E],
+    0x2F8E5: [0x681F],
+    0x2F8E6: [0x6914],
+    0x2F8E7: [0x3B9D],
+    0x2F8E8: [0x6942],
+    0x2F8E9: [0x69A3],
+    0x2F8EA: [0x69EA],
+    0x2F8EB: [0x6AA8],
+    0x2F8EC: [0x236A3],
+    0x2F8ED: [0x6ADB],
+    0x2F8EE: [0x3C18],
+    0x2F8EF: [0x6B21],
+    0x2F8F0: [0x238A7],
+    0x2F8F1: [0x6B54],
+    0x2F8F2: [0x3C4E],
+    0x2F8F3: [0x6B72],
+    0x2F8F4: [0x6B9F],
+    0x2F8F5: [0x6BBA],
+    0x2F8F6: [0x6BBB],
+    0x2F8F7: [0x23A8D],
+    0x2F8F8: [0x21D0B],
+    0x2F8F9: [0x23AFA],
+    0x2F8FA: [0x6C4E],
+    0x2F8FB: [0x23CBC],
+    0x2F8FC: [0x6CBF],
+    0x2F8FD: [0x6CCD],
+    0x2F8FE: [0x6C67],
+    0x2F8FF: [0x6D16],
+    0x2F900: [0x6D3E],
+    0x2F901: [0x6D77],
+    0x2F902: [0x6D41],
+    0x2F903: [0x6D69],
+    0x2F904: [0x6D78],
+    0x2F905: [0x6D85],
+    0x2F906: [0x23D1E],
+    0x2F907: [0x6D34],
+    0x2F908: [0x6E2F],
+    0x2F909: [0x6E6E],
+    0x2F90A: [0x3D33],
+    0x2F90B: [0x6ECB],
+    0x2F90C: [0x6EC7],
+    0x2F90D: [0x23ED1],
+    0x2F90E: [0x6DF9],
+    0x2F90F: [0x6F6E],
+    0x2F910: [0x23F5E],
+    0x2F911: [0x23F8E],
+    0x2F912: [0x6FC6],
+    0x2F913: [0x7039],
+    0x2F914: [0x701E],
+    0x2F915: [0x701B],
+    0x2F916: [0x3D96],
+    0x2F917: [0x704A],
+    0x2F918: [0x707D],
+    0x2F919: [0x7077],
+    0x2F91A: [0x70AD],
+    0x2F91B: [0x20525],
+    0x2F91C: [0x7145],
+    0x2F91D: [0x24263],
+    0x2F91E: [0x719C],
+    0x2F91F: [0x243AB],
+    0x2F920: [0x7228],
+    0x2F921: [0x7235],
+    0x2F922: [0x7250],
+    0x2F923: [0x24608],
+    0x2F924: [0x7280],
+    0x2F925: [0x7295],
+    0x2F926: [0x24735],
+    0x2F927: [0x24814],
+    0x2F928: [0x737A],
+    0x2F929: [0x738B],
+    0x2F92A: [0x3EAC],
+    0x2F92B: [0x73A5],
+    0x2F92C: [0x3EB8],
+    0x2F92D: [0x3EB8],
+    0x2F92E: [0x7447],
+    0x2F92F: [0x745C],
+    0x2F930: [0x7471],
+    0x2F931: [0x7485],
+    0x2F932: [0x74CA],
+    0x2F933: [0x3F1B],
+    0x2F934: [0x7524],
+    0x2F935: [0x24C36],
+    0x2F936: [0x753E],
+    0x2F937: [0x24C92],
+    0x2F938: [0x7570],
+    0x2F939: [0x2219F],
+    0x2F93A: [0x7610],
+    0x2F93B: [0x24FA1],
+    0x2F93C: [0x24FB8],
+    0x2F93D: [0x25044],
+    0x2F93E: [0x3FFC],
+    0x2F93F: [0x4008],
+    0x2F940: [0x76F4],
+    0x2F941: [0x250F3],
+    0x2F942: [0x250F2],
+    0x2F943: [0x25119],
+    0x2F944: [0x25133],
+    0x2F945: [0x771E],
+    0x2F946: [0x771F],
+    0x2F947: [0x771F],
+    0x2F948: [0x774A],
+    0x2F949: [0x4039],
+    0x2F94A: [0x778B],
+    0x2F94B: [0x4046],
+    0x2F94C: [0x4096],
+    0x2F94D: [0x2541D],
+    0x2F94E: [0x784E],
+    0x2F94F: [0x788C],
+    0x2F950: [0x78CC],
+    0x2F951: [0x40E3],
+    0x2F952: [0x25626],
+    0x2F953: [0x7956],
+    0x2F954: [0x2569A],
+    0x2F955: [0x256C5],
+    0x2F956: [0x798F],
+    0x2F957: [0x79EB],
+    0x2F958: [0x412F],
+    0x2F959: [0x7A40],
+    0x2F95A: [0x7A4A],
+    0x2F95B: [0x7A4F],
+    0x2F95C: [0x2597C],
+    0x2F95D: [0x25AA7],
+    0x2F95E: [0x25AA7],
+    0x2F95F: [0x7AEE],
+    0x2F960: [0x4202],
+    0x2F961: [0x25BAB],
+    0x2F962: [0x7BC6],
+    0x2F963: [0x7BC9],
+    0x2F964: [0x4227],
+    0x2F965: [0x25C80],
+    0x2F966: [0x7CD2],
+    0x2F967: [0x42A0],
+    0x2F968: [0x7CE8],
+    0x2F969: [0x7CE3],
+    0x2F96A: [0x7D00],
+    0x2F96B: [0x25F86],
+    0x2F96C: [0x7D63],
+    0x2F96D: [0x4301],
+    0x2F96E: [0x7DC7],
+    0x2F96F: [0x7E02],
+    0x2F970: [0x7E45],
+    0x2F971: [0x4334],
+    0x2F972: [0x26228],
+    0x2F973: [0x26247],
+    0x2F974: [0x4359],
+    0x2F975: [0x262D9],
+    0x2F976: [0x7F7A],
+    0x2F977: [0x2633E],
+    0x2F978: [0x7F95],
+    0x2F979: [0x7FFA],
+    0x2F97A: [0x8005],
+    0x2F97B: [0x264DA],
+    0x2F97C: [0x26523],
+    0x2F97D: [0x8060],
+    0x2F97E: [0x265A8],
+    0x2F97F: [0x8070],
+    0x2F980: [0x2335F],
+    0x2F981: [0x43D5],
+    0x2F982: [0x80B2],
+    0x2F983: [0x8103],
+    0x2F984: [0x440B],
+    0x2F985: [0x813E],
+    0x2F986: [0x5AB5],
+    0x2F987: [0x267A7],
+    0x2F988: [0x267B5],
+    0x2F989: [0x23393],
+    0x2F98A: [0x2339C],
+    0x2F98B: [0x8201],
+    0x2F98C: [0x8204],
+    0x2F98D: [0x8F9E],
+    0x2F98E: [0x446B],
+    0x2F98F: [0x8291],
+    0x2F990: [0x828B],
+    0x2F991: [0x829D],
+    0x2F992: [0x52B3],
+    0x2F993: [0x82B1],
+    0x2F994: [0x82B3],
+    0x2F995: [0x82BD],
+    0x2F996: [0x82E6],
+    0x2F997: [0x26B3C],
+    0x2F998: [0x82E5],
+    0x2F999: [0x831D],
+    0x2F99A: [0x8363],
+    0x2F99B: [0x83AD],
+    0x2F99C: [0x8323],
+    0x2F99D: [0x83BD],
+    0x2F99E: [0x83E7],
+    0x2F99F: [0x8457],
+    0x2F9A0: [0x8353],
+    0x2F9A1: [0x83CA],
+    0x2F9A2: [0x83CC],
+    0x2F9A3: [0x83DC],
+    0x2F9A4: [0x26C36],
+    0x2F9A5: [0x26D6B],
+    0x2F9A6: [0x26CD5],
+    0x2F9A7: [0x452B],
+    0x2F9A8: [0x84F1],
+    0x2F9A9: [0x84F3],
+    0x2F9AA: [0x8516],
+    0x2F9AB: [0x273CA],
+    0x2F9AC: [0x8564],
+    0x2F9AD: [0x26F2C],
+    0x2F9AE: [0x455D],
+    0x2F9AF: [0x4561],
+    0x2F9B0: [0x26FB1],
+    0x2F9B1: [0x270D2],
+    0x2F9B2: [0x456B],
+    0x2F9B3: [0x8650],
+    0x2F9B4: [0x865C],
+    0x2F9B5: [0x8667],
+    0x2F9B6: [0x8669],
+    0x2F9B7: [0x86A9],
+    0x2F9B8: [0x8688],
+    0x2F9B9: [0x870E],
+    0x2F9BA: [0x86E2],
+    0x2F9BB: [0x8779],
+    0x2F9BC: [0x8728],
+    0x2F9BD: [0x876B],
+    0x2F9BE: [0x8786],
+    0x2F9BF: [0x45D7],
+    0x2F9C0: [0x87E1],
+    0x2F9C1: [0x8801],
+    0x2F9C2: [0x45F9],
+    0x2F9C3: [0x8860],
+    0x2F9C4: [0x8863],
+    0x2F9C5: [0x27667],
+    0x2F9C6: [0x88D7],
+    0x2F9C7: [0x88DE],
+    0x2F9C8: [0x4635],
+    0x2F9C9: [0x88FA],
+    0x2F9CA: [0x34BB],
+    0x2F9CB: [0x278AE],
+    0x2F9CC: [0x27966],
+    0x2F9CD: [0x46BE],
+    0x2F9CE: [0x46C7],
+    0x2F9CF: [0x8AA0],
+    0x2F9D0: [0x8AED],
+    0x2F9D1: [0x8B8A],
+    0x2F9D2: [0x8C55],
+    0x2F9D3: [0x27CA8],
+    0x2F9D4: [0x8CAB],
+    0x2F9D5: [0x8CC1],
+    0x2F9D6: [0x8D1B],
+    0x2F9D7: [0x8D77],
+    0x2F9D8: [0x27F2F],
+    0x2F9D9: [0x20804],
+    0x2F9DA: [0x8DCB],
+    0x2F9DB: [0x8DBC],
+    0x2F9DC: [0x8DF0],
+    0x2F9DD: [0x208DE],
+    0x2F9DE: [0x8ED4],
+    0x2F9DF: [0x8F38],
+    0x2F9E0: [0x285D2],
+    0x2F9E1: [0x285ED],
+    0x2F9E2: [0x9094],
+    0x2F9E3: [0x90F1],
+    0x2F9E4: [0x9111],
+    0x2F9E5: [0x2872E],
+    0x2F9E6: [0x911B],
+    0x2F9E7: [0x9238],
+    0x2F9E8: [0x92D7],
+    0x2F9E9: [0x92D8],
+    0x2F9EA: [0x927C],
+    0x2F9EB: [0x93F9],
+    0x2F9EC: [0x9415],
+    0x2F9ED: [0x28BFA],
+    0x2F9EE: [0x958B],
+    0x2F9EF: [0x4995],
+    0x2F9F0: [0x95B7],
+    0x2F9F1: [0x28D77],
+    0x2F9F2: [0x49E6],
+    0x2F9F3: [0x96C3],
+    0x2F9F4: [0x5DB2],
+    0x2F9F5: [0x9723],
+    0x2F9F6: [0x29145],
+    0x2F9F7: [0x2921A],
+    0x2F9F8: [0x4A6E],
+    0x2F9F9: [0x4A76],
+    0x2F9FA: [0x97E0],
+    0x2F9FB: [0x2940A],
+    0x2F9FC: [0x4AB2],
+    0x2F9FD: [0x29496],
+    0x2F9FE: [0x980B],
+    0x2F9FF: [0x980B],
+    0x2FA00: [0x9829],
+    0x2FA01: [0x295B6],
+    0x2FA02: [0x98E2],
+    0x2FA03: [0x4B33],
+    0x2FA04: [0x9929],
+    0x2FA05: [0x99A7],
+    0x2FA06: [0x99C2],
+    0x2FA07: [0x99FE],
+    0x2FA08: [0x4BCE],
+    0x2FA09: [0x29B30],
+    0x2FA0A: [0x9B12],
+    0x2FA0B: [0x9C40],
+    0x2FA0C: [0x9CFD],
+    0x2FA0D: [0x4CCE],
+    0x2FA0E: [0x4CED],
+    0x2FA0F: [0x9D67],
+    0x2FA10: [0x2A0CE],
+    0x2FA11: [0x4CF8],
+    0x2FA12: [0x2A105],
+    0x2FA13: [0x2A20E],
+    0x2FA14: [0x2A291],
+    0x2FA15: [0x9EBB],
+    0x2FA16: [0x4D56],
+    0x2FA17: [0x9EF9],
+    0x2FA18: [0x9EFE],
+    0x2FA19: [0x9F05],
+    0x2FA1A: [0x9F0F],
+    0x2FA1B: [0x9F16],
+    0x2FA1C: [0x9F3B],
+    0x2FA1D: [0x2A600],
+    **dict.fromkeys(range(0xE0000, 0xE0FFF + 1), []),
+}
+
+# Changes_When_NFKC_Casefolded=Yes, together with NFC_Quick_Check=No
+# or NFC_Quick_Check=Maybe
+# Characters that cannot ever occur, or may or may not occur, in the
+# NFKC_Casefold form
+_NFKC_CF_QC_NO_OR_MAYBE = set(_NFKC_CF_BY_CHARACTER) | _NFC__QC_NO_OR_MAYBE
+
+# Dictionary mapping characters to their full case foldings
+# (Case_Folding status C and F)
+_CASEFOLD_BY_CHARACTER = {
+    0x00041: [0x0061],
+    0x00042: [0x0062],
+    0x00043: [0x0063],
+    0x00044: [0x0064],
+    0x00045: [0x0065],
+    0x00046: [0x0066],
+    0x00047: [0x0067],
+    0x00048: [0x0068],
+    0x00049: [0x0069],
+    0x0004A: [0x006A],
+    0x0004B: [0x006B],
+    0x0004C: [0x006C],
+    0x0004D: [0x006D],
+    0x0004E: [0x006E],
+    0x0004F: [0x006F],
+    0x00050: [0x0070],
+    0x00051: [0x0071],
+    0x00052: [0x0072],
+    0x00053: [0x0073],
+    0x00054: [0x0074],
+    0x00055: [0x0075],
+    0x00056: [0x0076],
+    0x00057: [0x0077],
+    0x00058: [0x0078],
+    0x00059: [0x0079],
+    0x0005A: [0x007A],
+    0x000B5: [0x03BC],
+    0x000C0: [0x00E0],
+    0x000C1: [0x00E1],
+    0x000C2: [0x00E2],
+    0x000C3: [0x00E3],
+    0x000C4: [0x00E4],
+    0x000C5: [0x00E5],
+    0x000C6: [0x00E6],
+    0x000C7: [0x00E7],
+    0x000C8: [0x00E8],
+    0x000C9: [0x00E9],
+    0x000CA: [0x00EA],
+    0x000CB: [0x00EB],
+    0x000CC: [0x00EC],
+    0x000CD: [0x00ED],
+    0x000CE: [0x00EE],
+    0x000CF: [0x00EF],
+    0x000D0: [0x00F0],
+    0x000D1: [0x00F1],
+    0x000D2: [0x00F2],
+    0x000D3: [0x00F3],
+    0x000D4: [0x00F4],
+    0x000D5: [0x00F5],
+    0x000D6: [0x00F6],
+    0x000D8: [0x00F8],
+    0x000D9: [0x00F9],
+    0x000DA: [0x00FA],
+    0x000DB: [0x00FB],
+    0x000DC: [0x00FC],
+    0x000DD: [0x00FD],
+    0x000DE: [0x00FE],
+    0x000DF: [0x0073, 0x0073],
+    0x00100: [0x0101],
+    0x00102: [0x0103],
+    0x00104: [0x0105],
+    0x00106: [0x0107],
+    0x00108: [0x0109],
+    0x0010A: [0x010B],
+    0x0010C: [0x010D],
+    0x0010E: [0x010F],
+    0x00110: [0x0111],
+    0x00112: [0x0113],
+    0x00114: [0x0115],
+    0x00116: [0x0117],
+    0x00118: [0x0119],
+    0x0011A: [0x011B],
+    0x0011C: [0x011D],
+    0x0011E: [0x011F],
+    0x00120: [0x0121],
+    0x00122: [0x0123],
+    0x00124: [0x0125],
+    0x00126: [0x0127],
+    0x00128: [0x0129],
+    0x0012A: [0x012B],
+    0x0012C: [0x012D],
+    0x0012E: [0x012F],
+    0x00130: [0x0069, 0x0307],
+    0x00132: [0x0133],
+    0x00134: [0x0135],
+    0x00136: [0x0137],
+    0x00139: [0x013A],
+    0x0013B: [0x013C],
+    0x0013D: [0x013E],
+    0x0013F: [0x0140],
+    0x00141: [0x0142],
+    0x00143: [0x0144],
+    0x00145: [0x0146],
+    0x00147: [0x0148],
+    0x00149: [0x02BC, 0x006E],
+    0x0014A: [0x014B],
+    0x0014C: [0x014D],
+    0x0014E: [0x014F],
+    0x00150: [0x0151],
+    0x00152: [0x0153],
+    0x00154: [0x0155],
+    0x00156: [0x0157],
+    0x00158: [0x0159],
+    0x0015A: [0x015B],
+    0x0015C: [0x015D],
+    0x0015E: [0x015F],
+    0x00160: [0x0161],
+    0x00162: [0x0163],
+    0x00164: [0x0165],
+    0x00166: [0x0167],
+    0x00168: [0x0169],
+    0x0016A: [0x016B],
+    0x0016C: [0x016D],
+    0x0016E: [0x016F],
+    0x00170: [0x0171],
+    0x00172: [0x0173],
+    0x00174: [0x0175],
+    0x00176: [0x0177],
+    0x00178: [0x00FF],
+    0x00179: [0x017A],
+    0x0017B: [0x017C],
+    0x0017D: [0x017E],
+    0x0017F: [0x0073],
+    0x00181: [0x0253],
+    0x00182: [0x0183],
+    0x00184: [0x0185],
+    0x00186: [0x0254],
+    0x00187: [0x0188],
+    0x00189: [0x0256],
+    0x0018A: [0x0257],
+    0x0018B: [0x018C],
+    0x0018E: [0x01DD],
+    0x0018F: [0x0259],
+    0x00190: [0x025B],
+    0x00191: [0x0192],
+    0x00193: [0x0260],
+    0x00194: [0x0263],
+    0x00196: [0x0269],
+    0x00197: [0x0268],
+    0x00198: [0x0199],
+    0x0019C: [0x026F],
+    0x0019D: [0x0272],
+    0x0019F: [0x0275],
+    0x001A0: [0x01A1],
+    0x001A2: [0x01A3],
+    0x001A4: [0x01A5],
+    0x001A6: [0x0280],
+    0x001A7: [0x01A8],
+    0x001A9: [0x0283],
+    0x001AC: [0x01AD],
+    0x001AE: [0x0288],
+    0x001AF: [0x01B0],
+    0x001B1: [0x028A],
+    0x001B2: [0x028B],
+    0x001B3: [0x01B4],
+    0x001B5: [0x01B6],
+    0x001B7: [0x0292],
+    0x001B8: [0x01B9],
+    0x001BC: [0x01BD],
+    0x001C4: [0x01C6],
+    0x001C5: [0x01C6],
+    0x001C7: [0x01C9],
+    0x001C8: [0x01C9],
+    0x001CA: [0x01CC],
+    0x001CB: [0x01CC],
+    0x001CD: [0x01CE],
+    0x001CF: [0x01D0],
+    0x001D1: [0x01D2],
+    0x001D3: [0x01D4],
+    0x001D5: [0x01D6],
+    0x001D7: [0x01D8],
+    0x001D9: [0x01DA],
+    0x001DB: [0x01DC],
+    0x001DE: [0x01DF],
+    0x001E0: [0x01E1],
+    0x001E2: [0x01E3],
+    0x001E4: [0x01E5],
+    0x001E6: [0x01E7],
+    0x001E8: [0x01E9],
+    0x001EA: [0x01EB],
+    0x001EC: [0x01ED],
+    0x001EE: [0x01EF],
+    0x001F0: [0x006A, 0x030C],
+    0x001F1: [0x01F3],
+    0x001F2: [0x01F3],
+    0x001F4: [0x01F5],
+    0x001F6: [0x0195],
+    0x001F7: [0x01BF],
+    0x001F8: [0x01F9],
+    0x001FA: [0x01FB],
+    0x001FC: [0x01FD],
+    0x001FE: [0x01FF],
+    0x00200: [0x0201],
+    0x00202: [0x0203],
+    0x00204: [0x0205],
+    0x00206: [0x0207],
+    0x00208: [0x0209],
+    0x0020A: [0x020B],
+    0x0020C: [0x020D],
+    0x0020E: [0x020F],
+    0x00210: [0x0211],
+    0x00212: [0x0213],
+    0x00214: [0x0215],
+    0x00216: [0x0217],
+    0x00218: [0x0219],
+    0x0021A: [0x021B],
+    0x0021C: [0x021D],
+    0x0021E: [0x021F],
+    0x00220: [0x019E],
+    0x00222: [0x0223],
+    0x00224: [0x0225],
+    0x00226: [0x0227],
+    0x00228: [0x0229],
+    0x0022A: [0x022B],
+    0x0022C: [0x022D],
+    0x0022E: [0x022F],
+    0x00230: [0x0231],
+    0x00232: [0x0233],
+    0x0023A: [0x2C65],
+    0x0023B: [0x023C],
+    0x0023D: [0x019A],
+    0x0023E: [0x2C66],
+    0x00241: [0x0242],
+    0x00243: [0x0180],
+    0x00244: [0x0289],
+    0x00245: [0x028C],
+    0x00246: [0x0247],
+    0x00248: [0x0249],
+    0x0024A: [0x024B],
+    0x0024C: [0x024D],
+    0x0024E: [0x024F],
+    0x00345: [0x03B9],
+    0x00370: [0x0371],
+    0x00372: [0x0373],
+    0x00376: [0x0377],
+    0x0037F: [0x03F3],
+    0x00386: [0x03AC],
+    0x00388: [0x03AD],
+    0x00389: [0x03AE],
+    0x0038A: [0x03AF],
+    0x0038C: [0x03CC],
+    0x0038E: [0x03CD],
+    0x0038F: [0x03CE],
+    0x00390: [0x03B9, 0x0308, 0x0301],
+    0x00391: [0x03B1],
+    0x00392: [0x03B2],
+    0x00393: [0x03B3],
+    0x00394: [0x03B4],
+    0x00395: [0x03B5],
+    0x00396: [0x03B6],
+    0x00397: [0x03B7],
+    0x00398: [0x03B8],
+    0x00399: [0x03B9],
+    0x0039A: [0x03BA],
+    0x0039B: [0x03BB],
+    0x0039C: [0x03BC],
+    0x0039D: [0x03BD],
+    0x0039E: [0x03BE],
+    0x0039F: [0x03BF],
+    0x003A0: [0x03C0],
+    0x003A1: [0x03C1],
+    0x003A3: [0x03C3],
+    0x003A4: [0x03C4],
+    0x003A5: [0x03C5],
+    0x003A6: [0x03C6],
+    0x003A7: [0x03C7],
+    0x003A8: [0x03C8],
+    0x003A9: [0x03C9],
+    0x003AA: [0x03CA],
+    0x003AB: [0x03CB],
+    0x003B0: [0x03C5, 0x0308, 0x0301],
+    0x003C2: [0x03C3],
+    0x003CF: [0x03D7],
+    0x003D0: [0x03B2],
+    0x003D1: [0x03B8],
+    0x003D5: [0x03C6],
+    0x003D6: [0x03C0],
+    0x003D8: [0x03D9],
+    0x003DA: [0x03DB],
+    0x003DC: [0x03DD],
+    0x003DE: [0x03DF],
+    0x003E0: [0x03E1],
+    0x003E2: [0x03E3],
+    0x003E4: [0x03E5],
+    0x003E6: [0x03E7],
+    0x003E8: [0x03E9],
+    0x003EA: [0x03EB],
+    0x003EC: [0x03ED],
+    0x003EE: [0x03EF],
+    0x003F0: [0x03BA],
+    0x003F1: [0x03C1],
+    0x003F4: [0x03B8],
+    0x003F5: [0x03B5],
+    0x003F7: [0x03F8],
+    0x003F9: [0x03F2],
+    0x003FA: [0x03FB],
+    0x003FD: [0x037B],
+    0x003FE: [0x037C],
+    0x003FF: [0x037D],
+    0x00400: [0x0450],
+    0x00401: [0x0451],
+    0x00402: [0x0452],
+    0x00403: [0x0453],
+    0x00404: [0x0454],
+    0x00405: [0x0455],
+    0x00406: [0x0456],
+    0x00407: [0x0457],
+    0x00408: [0x0458],
+    0x00409: [0x0459],
+    0x0040A: [0x045A],
+    0x0040B: [0x045B],
+    0x0040C: [0x045C],
+    0x0040D: [0x045D],
+    0x0040E: [0x045E],
+    0x0040F: [0x045F],
+    0x00410: [0x0430],
+    0x00411: [0x0431],
+    0x00412: [0x0432],
+    0x00413: [0x0433],
+    0x00414: [0x0434],
+    0x00415: [0x0435],
+    0x00416: [0x0436],
+    0x00417: [0x0437],
+    0x00418: [0x0438],
+    0x00419: [0x0439],
+    0x0041A: [0x043A],
+    0x0041B: [0x043B],
+    0x0041C: [0x043C],
+    0x0041D: [0x043D],
+    0x0041E: [0x043E],
+    0x0041F: [0x043F],
+    0x00420: [0x0440],
+    0x00421: [0x0441],
+    0x00422: [0x0442],
+    0x00423: [0x0443],
+    0x00424: [0x0444],
+    0x00425: [0x0445],
+    0x00426: [0x0446],
+    0x00427: [0x0447],
+    0x00428: [0x0448],
+    0x00429: [0x0449],
+    0x0042A: [0x044A],
+    0x0042B: [0x044B],
+    0x0042C: [0x044C],
+    0x0042D: [0x044D],
+    0x0042E: [0x044E],
+    0x0042F: [0x044F],
+    0x00460: [0x0461],
+    0x00462: [0x0463],
+    0x00464: [0x0465],
+    0x00466: [0x0467],
+    0x00468: [0x0469],
+    0x0046A: [0x046B],
+    0x0046C: [0x046D],
+    0x0046E: [0x046F],
+    0x00470: [0x0471],
+    0x00472: [0x0473],
+    0x00474: [0x0475],
+    0x00476: [0x0477],
+    0x00478: [0x0479],
+    0x0047A: [0x047B],
+    0x0047C: [0x047D],
+    0x0047E: [0x047F],
+    0x00480: [0x0481],
+    0x0048A: [0x048B],
+    0x0048C: [0x048D],
+    0x0048E: [0x048F],
+    0x00490: [0x0491],
+    0x00492: [0x0493],
+    0x00494: [0x0495],
+    0x00496: [0x0497],
+    0x00498: [0x0499],
+    0x0049A: [0x049B],
+    0x0049C: [0x049D],
+    0x0049E: [0x049F],
+    0x004A0: [0x04A1],
+    0x004A2: [0x04A3],
+    0x004A4: [0x04A5],
+    0x004A6: [0x04A7],
+    0x004A8: [0x04A9],
+    0x004AA: [0x04AB],
+    0x004AC: [0x04AD],
+    0x004AE: [0x04AF],
+    0x004B0: [0x04B1],
+    0x004B2: [0x04B3],
+    0x004B4: [0x04B5],
+    0x004B6: [0x04B7],
+    0x004B8: [0x04B9],
+    0x004BA: [0x04BB],
+    0x004BC: [0x04BD],
+    0x004BE: [0x04BF],
+    0x004C0: [0x04CF],
+    0x004C1: [0x04C2],
+    0x004C3: [0x04C4],
+    0x004C5: [0x04C6],
+    0x004C7: [0x04C8],
+    0x004C9: [0x04CA],
+    0x004CB: [0x04CC],
+    0x004CD: [0x04CE],
+    0x004D0: [0x04D1],
+    0x004D2: [0x04D3],
+    0x004D4: [0x04D5],
+    0x004D6: [0x04D7],
+    0x004D8: [0x04D9],
+    0x004DA: [0x04DB],
+    0x004DC: [0x04DD],
+    0x004DE: [0x04DF],
+    0x004E0: [0x04E1],
+    0x004E2: [0x04E3],
+    0x004E4: [0x04E5],
+    0x004E6: [0x04E7],
+    0x004E8: [0x04E9],
+    0x004EA: [0x04EB],
+    0x004EC: [0x04ED],
+    0x004EE: [0x04EF],
+    0x004F0: [0x04F1],
+    0x004F2: [0x04F3],
+    0x004F4: [0x04F5],
+    0x004F6: [0x04F7],
+    0x004F8: [0x04F9],
+    0x004FA: [0x04FB],
+    0x004FC: [0x04FD],
+    0x004FE: [0x04FF],
+    0x00500: [0x0501],
+    0x00502: [0x0503],
+    0x00504: [0x0505],
+    0x00506: [0x0507],
+    0x00508: [0x0509],
+    0x0050A: [0x050B],
+    0x0050C: [0x050D],
+    0x0050E: [0x050F],
+    0x00510: [0x0511],
+    0x00512: [0x0513],
+    0x00514: [0x0515],
+    0x00516: [0x0517],
+    0x00518: [0x0519],
+    0x0051A: [0x051B],
+    0x0051C: [0x051D],
+    0x0051E: [0x051F],
+    0x00520: [0x0521],
+    0x00522: [0x0523],
+    0x00524: [0x0525],
+    0x00526: [0x0527],
+    0x00528: [0x0529],
+    0x0052A: [0x052B],
+    0x0052C: [0x052D],
+    0x0052E: [0x052F],
+    0x00531: [0x0561],
+    0x00532: [0x0562],
+    0x00533: [0x0563],
+    0x00534: [0x0564],
+    0x00535: [0x0565],
+    0x00536: [0x0566],
+    0x00537: [0x0567],
+    0x00538: [0x0568],
+    0x00539: [0x0569],
+    0x0053A: [0x056A],
+    0x0053B: [0x056B],
+    0x0053C: [0x056C],
+    0x0053D: [0x056D],
+    0x0053E: [0x056E],
+    0x0053F: [0x056F],
+    0x00540: [0x0570],
+    0x00541: [0x0571],
+    0x00542: [0x0572],
+    0x00543: [0x0573],
+    0x00544: [0x0574],
+    0x00545: [0x0575],
+    0x00546: [0x0576],
+    0x00547: [0x0577],
+    0x00548: [0x0578],
+    0x00549: [0x0579],
+    0x0054A: [0x057A],
+    0x0054B: [0x057B],
+    0x0054C: [0x057C],
+    0x0054D: [0x057D],
+    0x0054E: [0x057E],
+    0x0054F: [0x057F],
+    0x00550: [0x0580],
+    0x00551: [0x0581],
+    0x00552: [0x0582],
+    0x00553: [0x0583],
+    0x00554: [0x0584],
+    0x00555: [0x0585],
+    0x00556: [0x0586],
+    0x00587: [0x0565, 0x0582],
+    0x010A0: [0x2D00],
+    0x010A1: [0x2D01],
+    0x010A2: [0x2D02],
+    0x010A3: [0x2D03],
+    0x010A4: [0x2D04],
+    0x010A5: [0x2D05],
+    0x010A6: [0x2D06],
+    0x010A7: [0x2D07],
+    0x010A8: [0x2D08],
+    0x010A9: [0x2D09],
+    0x010AA: [0x2D0A],
+    0x010AB: [0x2D0B],
+    0x010AC: [0x2D0C],
+    0x010AD: [0x2D0D],
+    0x010AE: [0x2D0E],
+    0x010AF: [0x2D0F],
+    0x010B0: [0x2D10],
+    0x010B1: [0x2D11],
+    0x010B2: [0x2D12],
+    0x010B3: [0x2D13],
+    0x010B4: [0x2D14],
+    0x010B5: [0x2D15],
+    0x010B6: [0x2D16],
+    0x010B7: [0x2D17],
+    0x010B8: [0x2D18],
+    0x010B9: [0x2D19],
+    0x010BA: [0x2D1A],
+    0x010BB: [0x2D1B],
+    0x010BC: [0x2D1C],
+    0x010BD: [0x2D1D],
+    0x010BE: [0x2D1E],
+    0x010BF: [0x2D1F],
+    0x010C0: [0x2D20],
+    0x010C1: [0x2D21],
+    0x010C2: [0x2D22],
+    0x010C3: [0x2D23],
+    0x010C4: [0x2D24],
+    0x010C5: [0x2D25],
+    0x010C7: [0x2D27],
+    0x010CD: [0x2D2D],
+    0x013F8: [0x13F0],
+    0x013F9: [0x13F1],
+    0x013FA: [0x13F2],
+    0x013FB: [0x13F3],
+    0x013FC: [0x13F4],
+    0x013FD: [0x13F5],
+    0x01C80: [0x0432],
+    0x01C81: [0x0434],
+    0x01C82: [0x043E],
+    0x01C83: [0x0441],
+    0x01C84: [0x0442],
+    0x01C85: [0x0442],
+    0x01C86: [0x044A],
+    0x01C87: [0x0463],
+    0x01C88: [0xA64B],
+    0x01C89: [0x1C8A],
+    0x01C90: [0x10D0],
+    0x01C91: [0x10D1],
+    0x01C92: [0x10D2],
+    0x01C93: [0x10D3],
+    0x01C94: [0x10D4],
+    0x01C95: [0x10D5],
+    0x01C96: [0x10D6],
+    0x01C97: [0x10D7],
+    0x01C98: [0x10D8],
+    0x01C99: [0x10D9],
+    0x01C9A: [0x10DA],
+    0x01C9B: [0x10DB],
+    0x01C9C: [0x10DC],
+    0x01C9D: [0x10DD],
+    0x01C9E: [0x10DE],
+    0x01C9F: [0x10DF],
+    0x01CA0: [0x10E0],
+    0x01CA1: [0x10E1],
+    0x01CA2: [0x10E2],
+    0x01CA3: [0x10E3],
+    0x01CA4: [0x10E4],
+    0x01CA5: [0x10E5],
+    0x01CA6: [0x10E6],
+    0x01CA7: [0x10E7],
+    0x01CA8: [0x10E8],
+    0x01CA9: [0x10E9],
+    0x01CAA: [0x10EA],
+    0x01CAB: [0x10EB],
+    0x01CAC: [0x10EC],
+    0x01CAD: [0x10ED],
+    0x01CAE: [0x10EE],
+    0x01CAF: [0x10EF],
+    0x01CB0: [0x10F0],
+    0x01CB1: [0x10F1],
+    0x01CB2: [0x10F2],
+    0x01CB3: [0x10F3],
+    0x01CB4: [0x10F4],
+    0x01CB5: [0x10F5],
+    0x01CB6: [0x10F6],
+    0x01CB7: [0x10F7],
+    0x01CB8: [0x10F8],
+    0x01CB9: [0x10F9],
+    0x01CBA: [0x10FA],
+    0x01CBD: [0x10FD],
+    0x01CBE: [0x10FE],
+    0x01CBF: [0x10FF],
+    0x01E00: [0x1E01],
+    0x01E02: [0x1E03],
+    0x01E04: [0x1E05],
+    0x01E06: [0x1E07],
+    0x01E08: [0x1E09],
+    0x01E0A: [0x1E0B],
+    0x01E0C: [0x1E0D],
+    0x01E0E: [0x1E0F],
+    0x01E10: [0x1E11],
+    0x01E12: [0x1E13],
+    0x01E14: [0x1E15],
+    0x01E16: [0x1E17],
+    0x01E18: [0x1E19],
+    0x01E1A: [0x1E1B],
+    0x01E1C: [0x1E1D],
+    0x01E1E: [0x1E1F],
+    0x01E20: [0x1E21],
+    0x01E22: [0x1E23],
+    0x01E24: [0x1E25],
+    0x01E26: [0x1E27],
+    0x01E28: [0x1E29],
+    0x01E2A: [0x1E2B],
+    0x01E2C: [0x1E2D],
+    0x01E2E: [0x1E2F],
+    0x01E30: [0x1E31],
+    0x01E32: [0x1E33],
+    0x01E34: [0x1E35],
+    0x01E36: [0x1E37],
+    0x01E38: [0x1E39],
+    0x01E3A: [0x1E3B],
+    0x01E3C: [0x1E3D],
+    0x01E3E: [0x1E3F],
+    0x01E40: [0x1E41],
+    0x01E42: [0x1E43],
+    0x01E44: [0x1E45],
+    0x01E46: [0x1E47],
+    0x01E48: [0x1E49],
+    0x01E4A: [0x1E4B],
+    0x01E4C: [0x1E4D],
+    0x01E4E: [0x1E4F],
+    0x01E50: [0x1E51],
+    0x01E52: [0x1E53],
+    0x01E54: [0x1E55],
+    0x01E56: [0x1E57],
+    0x01E58: [0x1E59],
+    0x01E5A: [0x1E5B],
+    0x01E5C: [0x1E5D],
+    0x01E5E: [0x1E5F],
+    0x01E60: [0x1E61],
+    0x01E62: [0x1E63],
+    0x01E64: [0x1E65],
+    0x01E66: [0x1E67],
+    0x01E68: [0x1E69],
+    0x01E6A: [0x1E6B],
+    0x01E6C: [0x1E6D],
+    0x01E6E: [0x1E6F],
+    0x01E70: [0x1E71],
+    0x01E72: [0x1E73],
+    0x01E74: [0x1E75],
+    0x01E76: [0x1E77],
+    0x01E78: [0x1E79],
+    0x01E7A: [0x1E7B],
+    0x01E7C: [0x1E7D],
+    0x01E7E: [0x1E7F],
+    0x01E80: [0x1E81],
+    0x01E82: [0x1E83],
+    0x01E84: [0x1E85],
+    0x01E86: [0x1E87],
+    0x01E88: [0x1E89],
+    0x01E8A: [0x1E8B],
+    0x01E8C: [0x1E8D],
+    0x01E8E: [0x1E8F],
+    0x01E90: [0x1E91],
+    0x01E92: [0x1E93],
+    0x01E94: [0x1E95],
+    0x01E96: [0x0068, 0x0331],
+    0x01E97: [0x0074, 0x0308],
+    0x01E98: [0x0077, 0x030A],
+    0x01E99: [0x0079, 0x030A],
+    0x01E9A: [0x0061, 0x02BE],
+    0x01E9B: [0x1E61],
+    0x01E9E: [0x0073, 0x0073],
+    0x01EA0: [0x1EA1],
+    0x01EA2: [0x1EA3],
+    0x01EA4: [0x1EA5],
+    0x01EA6: [0x1EA7],
+    0x01EA8: [0x1EA9],
+    0x01EAA: [0x1EAB],
+    0x01EAC: [0x1EAD],
+    0x01EAE: [0x1EAF],
+    0x01EB0: [0x1EB1],
+    0x01EB2: [0x1EB3],
+    0x01EB4: [0x1EB5],
+    0x01EB6: [0x1EB7],
+    0x01EB8: [0x1EB9],
+    0x01EBA: [0x1EBB],
+    0x01EBC: [0x1EBD],
+    0x01EBE: [0x1EBF],
+    0x01EC0: [0x1EC1],
+    0x01EC2: [0x1EC3],
+    0x01EC4: [0x1EC5],
+    0x01EC6: [0x1EC7],
+    0x01EC8: [0x1EC9],
+    0x01ECA: [0x1ECB],
+    0x01ECC: [0x1ECD],
+    0x01ECE: [0x1ECF],
+    0x01ED0: [0x1ED1],
+    0x01ED2: [0x1ED3],
+    0x01ED4: [0x1ED5],
+    0x01ED6: [0x1ED7],
+    0x01ED8: [0x1ED9],
+    0x01EDA: [0x1EDB],
+    0x01EDC: [0x1EDD],
+    0x01EDE: [0x1EDF],
+    0x01EE0: [0x1EE1],
+    0x01EE2: [0x1EE3],
+    0x01EE4: [0x1EE5],
+    0x01EE6: [0x1EE7],
+    0x01EE8: [0x1EE9],
+    0x01EEA: [0x1EEB],
+    0x01EEC: [0x1EED],
+    0x01EEE: [0x1EEF],
+    0x01EF0: [0x1EF1],
+    0x01EF2: [0x1EF3],
+    0x01EF4: [0x1EF5],
+    0x01EF6: [0x1EF7],
+    0x01EF8: [0x1EF9],
+    0x01EFA: [0x1EFB],
+    0x01EFC: [0x1EFD],
+    0x01EFE: [0x1EFF],
+    0x01F08: [0x1F00],
+    0x01F09: [0x1F01],
+    0x01F0A: [0x1F02],
+    0x01F0B: [0x1F03],
+    0x01F0C: [0x1F04],
+    0x01F0D: [0x1F05],
+    0x01F0E: [0x1F06],
+    0x01F0F: [0x1F07],
+    0x01F18: [0x1F10],
+    0x01F19: [0x1F11],
+    0x01F1A: [0x1F12],
+    0x01F1B: [0x1F13],
+    0x01F1C: [0x1F14],
+    0x01F1D: [0x1F15],
+    0x01F28: [0x1F20],
+    0x01F29: [0x1F21],
+    0x01F2A: [0x1F22],
+    0x01F2B: [0x1F23],
+    0x01F2C: [0x1F24],
+    0x01F2D: [0x1F25],
+    0x01F2E: [0x1F26],
+    0x01F2F: [0x1F27],
+    0x01F38: [0x1F30],
+    0x01F39: [0x1F31],
+    0x01F3A: [0x1F32],
+    0x01F3B: [0x1F33],
+    0x01F3C: [0x1F34],
+    0x01F3D: [0x1F35],
+    0x01F3E: [0x1F36],
+    0x01F3F: [0x1F37],
+    0x01F48: [0x1F40],
+    0x01F49: [0x1F41],
+    0x01F4A: [0x1F42],
+    0x01F4B: [0x1F43],
+    0x01F4C: [0x1F44],
+    0x01F4D: [0x1F45],
+    0x01F50: [0x03C5, 0x0313],
+    0x01F52: [0x03C5, 0x0313, 0x0300],
+    0x01F54: [0x03C5, 0x0313, 0x0301],
+    0x01F56: [0x03C5, 0x0313, 0x0342],
+    0x01F59: [0x1F51],
+    0x01F5B: [0x1F53],
+    0x01F5D: [0x1F55],
+    0x01F5F: [0x1F57],
+    0x01F68: [0x1F60],
+    0x01F69: [0x1F61],
+    0x01F6A: [0x1F62],
+    0x01F6B: [0x1F63],
+    0x01F6C: [0x1F64],
+    0x01F6D: [0x1F65],
+    0x01F6E: [0x1F66],
+    0x01F6F: [0x1F67],
+    0x01F80: [0x1F00, 0x03B9],
+    0x01F81: [0x1F01, 0x03B9],
+    0x01F82: [0x1F02, 0x03B9],
+    0x01F83: [0x1F03, 0x03B9],
+    0x01F84: [0x1F04, 0x03B9],
+    0x01F85: [0x1F05, 0x03B9],
+    0x01F86: [0x1F06, 0x03B9],
+    0x01F87: [0x1F07, 0x03B9],
+    0x01F88: [0x1F00, 0x03B9],
+    0x01F89: [0x1F01, 0x03B9],
+    0x01F8A: [0x1F02, 0x03B9],
+    0x01F8B: [0x1F03, 0x03B9],
+    0x01F8C: [0x1F04, 0x03B9],
+    0x01F8D: [0x1F05, 0x03B9],
+    0x01F8E: [0x1F06, 0x03B9],
+    0x01F8F: [0x1F07, 0x03B9],
+    0x01F90: [0x1F20, 0x03B9],
+    0x01F91: [0x1F21, 0x03B9],
+    0x01F92: [0x1F22, 0x03B9],
+    0x01F93: [0x1F23, 0x03B9],
+    0x01F94: [0x1F24, 0x03B9],
+    0x01F95: [0x1F25, 0x03B9],
+    0x01F96: [0x1F26, 0x03B9],
+    0x01F97: [0x1F27, 0x03B9],
+    0x01F98: [0x1F20, 0x03B9],
+    0x01F99: [0x1F21, 0x03B9],
+    0x01F9A: [0x1F22, 0x03B9],
+    0x01F9B: [0x1F23, 0x03B9],
+    0x01F9C: [0x1F24, 0x03B9],
+    0x01F9D: [0x1F25, 0x03B9],
+    0x01F9E: [0x1F26, 0x03B9],
+    0x01F9F: [0x1F27, 0x03B9],
+    0x01FA0: [0x1F60, 0x03B9],
+    0x01FA1: [0x1F61, 0x03B9],
+    0x01FA2: [0x1F62, 0x03B9],
+    0x01FA3: [0x1F63, 0x03B9],
+    0x01FA4: [0x1F64, 0x03B9],
+    0x01FA5: [0x1F65, 0x03B9],
+    0x01FA6: [0x1F66, 0x03B9],
+    0x01FA7: [0x1F67, 0x03B9],
+    0x01FA8: [0x1F60, 0x03B9],
+    0x01FA9: [0x1F61, 0x03B9],
+    0x01FAA: [0x1F62, 0x03B9],
+    0x01FAB: [0x1F63, 0x03B9],
+    0x01FAC: [0x1F64, 0x03B9],
+    0x01FAD: [0x1F65, 0x03B9],
+    0x01FAE: [0x1F66, 0x03B9],
+    0x01FAF: [0x1F67, 0x03B9],
+    0x01FB2: [0x1F70, 0x03B9],
+    0x01FB3: [0x03B1, 0x03B9],
+    0x01FB4: [0x03AC, 0x03B9],
+    0x01FB6: [0x03B1, 0x0342],
+    0x01FB7: [0x03B1, 0x0342, 0x03B9],
+    0x01FB8: [0x1FB0],
+    0x01FB9: [0x1FB1],
+    0x01FBA: [0x1F70],
+    0x01FBB: [0x1F71],
+    0x01FBC: [0x03B1, 0x03B9],
+    0x01FBE: [0x03B9],
+    0x01FC2: [0x1F74, 0x03B9],
+    0x01FC3: [0x03B7, 0x03B9],
+    0x01FC4: [0x03AE, 0x03B9],
+    0x01FC6: [0x03B7, 0x0342],
+    0x01FC7: [0x03B7, 0x0342, 0x03B9],
+    0x01FC8: [0x1F72],
+    0x01FC9: [0x1F73],
+    0x01FCA: [0x1F74],
+    0x01FCB: [0x1F75],
+    0x01FCC: [0x03B7, 0x03B9],
+    0x01FD2: [0x03B9, 0x0308, 0x0300],
+    0x01FD3: [0x03B9, 0x0308, 0x0301],
+    0x01FD6: [0x03B9, 0x0342],
+    0x01FD7: [0x03B9, 0x0308, 0x0342],
+    0x01FD8: [0x1FD0],
+    0x01FD9: [0x1FD1],
+    0x01FDA: [0x1F76],
+    0x01FDB: [0x1F77],
+    0x01FE2: [0x03C5, 0x0308, 0x0300],
+    0x01FE3: [0x03C5, 0x0308, 0x0301],
+    0x01FE4: [0x03C1, 0x0313],
+    0x01FE6: [0x03C5, 0x0342],
+    0x01FE7: [0x03C5, 0x0308, 0x0342],
+    0x01FE8: [0x1FE0],
+    0x01FE9: [0x1FE1],
+    0x01FEA: [0x1F7A],
+    0x01FEB: [0x1F7B],
+    0x01FEC: [0x1FE5],
+    0x01FF2: [0x1F7C, 0x03B9],
+    0x01FF3: [0x03C9, 0x03B9],
+    0x01FF4: [0x03CE, 0x03B9],
+    0x01FF6: [0x03C9, 0x0342],
+    0x01FF7: [0x03C9, 0x0342, 0x03B9],
+    0x01FF8: [0x1F78],
+    0x01FF9: [0x1F79],
+    0x01FFA: [0x1F7C],
+    0x01FFB: [0x1F7D],
+    0x01FFC: [0x03C9, 0x03B9],
+    0x02126: [0x03C9],
+    0x0212A: [0x006B],
+    0x0212B: [0x00E5],
+    0x02132: [0x214E],
+    0x02160: [0x2170],
+    0x02161: [0x2171],
+    0x02162: [0x2172],
+    0x02163: [0x2173],
+    0x02164: [0x2174],
+    0x02165: [0x2175],
+    0x02166: [0x2176],
+    0x02167: [0x2177],
+    0x02168: [0x2178],
+    0x02169: [0x2179],
+    0x0216A: [0x217A],
+    0x0216B: [0x217B],
+    0x0216C: [0x217C],
+    0x0216D: [0x217D],
+    0x0216E: [0x217E],
+    0x0216F: [0x217F],
+    0x02183: [0x2184],
+    0x024B6: [0x24D0],
+    0x024B7: [0x24D1],
+    0x024B8: [0x24D2],
+    0x024B9: [0x24D3],
+    0x024BA: [0x24D4],
+    0x024BB: [0x24D5],
+    0x024BC: [0x24D6],
+    0x024BD: [0x24D7],
+    0x024BE: [0x24D8],
+    0x024BF: [0x24D9],
+    0x024C0: [0x24DA],
+    0x024C1: [0x24DB],
+    0x024C2: [0x24DC],
+    0x024C3: [0x24DD],
+    0x024C4: [0x24DE],
+    0x024C5: [0x24DF],
+    0x024C6: [0x24E0],
+    0x024C7: [0x24E1],
+    0x024C8: [0x24E2],
+    0x024C9: [0x24E3],
+    0x024CA: [0x24E4],
+    0x024CB: [0x24E5],
+    0x024CC: [0x24E6],
+    0x024CD: [0x24E7],
+    0x024CE: [0x24E8],
+    0x024CF: [0x24E9],
+    0x02C00: [0x2C30],
+    0x02C01: [0x2C31],
+    0x02C02: [0x2C32],
+    0x02C03: [0x2C33],
+    0x02C04: [0x2C34],
+    0x02C05: [0x2C35],
+    0x02C06: [0x2C36],
+    0x02C07: [0x2C37],
+    0x02C08: [0x2C38],
+    0x02C09: [0x2C39],
+    0x02C0A: [0x2C3A],
+    0x02C0B: [0x2C3B],
+    0x02C0C: [0x2C3C],
+    0x02C0D: [0x2C3D],
+    0x02C0E: [0x2C3E],
+    0x02C0F: [0x2C3F],
+    0x02C10: [0x2C40],
+    0x02C11: [0x2C41],
+    0x02C12: [0x2C42],
+    0x02C13: [0x2C43],
+    0x02C14: [0x2C44],
+    0x02C15: [0x2C45],
+    0x02C16: [0x2C46],
+    0x02C17: [0x2C47],
+    0x02C18: [0x2C48],
+    0x02C19: [0x2C49],
+    0x02C1A: [0x2C4A],
+    0x02C1B: [0x2C4B],
+    0x02C1C: [0x2C4C],
+    0x02C1D: [0x2C4D],
+    0x02C1E: [0x2C4E],
+    0x02C1F: [0x2C4F],
+    0x02C20: [0x2C50],
+    0x02C21: [0x2C51],
+    0x02C22: [0x2C52],
+    0x02C23: [0x2C53],
+    0x02C24: [0x2C54],
+    0x02C25: [0x2C55],
+    0x02C26: [0x2C56],
+    0x02C27: [0x2C57],
+    0x02C28: [0x2C58],
+    0x02C29: [0x2C59],
+    0x02C2A: [0x2C5A],
+    0x02C2B: [0x2C5B],
+    0x02C2C: [0x2C5C],
+    0x02C2D: [0x2C5D],
+    0x02C2E: [0x2C5E],
+    0x02C2F: [0x2C5F],
+    0x02C60: [0x2C61],
+    0x02C62: [0x026B],
+    0x02C63: [0x1D7D],
+    0x02C64: [0x027D],
+    0x02C67: [0x2C68],
+    0x02C69: [0x2C6A],
+    0x02C6B: [0x2C6C],
+    0x02C6D: [0x0251],
+    0x02C6E: [0x0271],
+    0x02C6F: [0x0250],
+    0x02C70: [0x0252],
+    0x02C72: [0x2C73],
+    0x02C75: [0x2C76],
+    0x02C7E: [0x023F],
+    0x02C7F: [0x0240],
+    0x02C80: [0x2C81],
+    0x02C82: [0x2C83],
+    0x02C84: [0x2C85],
+    0x02C86: [0x2C87],
+    0x02C88: [0x2C89],
+    0x02C8A: [0x2C8B],
+    0x02C8C: [0x2C8D],
+    0x02C8E: [0x2C8F],
+    0x02C90: [0x2C91],
+    0x02C92: [0x2C93],
+    0x02C94: [0x2C95],
+    0x02C96: [0x2C97],
+    0x02C98: [0x2C99],
+    0x02C9A: [0x2C9B],
+    0x02C9C: [0x2C9D],
+    0x02C9E: [0x2C9F],
+    0x02CA0: [0x2CA1],
+    0x02CA2: [0x2CA3],
+    0x02CA4: [0x2CA5],
+    0x02CA6: [0x2CA7],
+    0x02CA8: [0x2CA9],
+    0x02CAA: [0x2CAB],
+    0x02CAC: [0x2CAD],
+    0x02CAE: [0x2CAF],
+    0x02CB0: [0x2CB1],
+    0x02CB2: [0x2CB3],
+    0x02CB4: [0x2CB5],
+    0x02CB6: [0x2CB7],
+    0x02CB8: [0x2CB9],
+    0x02CBA: [0x2CBB],
+    0x02CBC: [0x2CBD],
+    0x02CBE: [0x2CBF],
+    0x02CC0: [0x2CC1],
+    0x02CC2: [0x2CC3],
+    0x02CC4: [0x2CC5],
+    0x02CC6: [0x2CC7],
+    0x02CC8: [0x2CC9],
+    0x02CCA: [0x2CCB],
+    0x02CCC: [0x2CCD],
+    0x02CCE: [0x2CCF],
+    0x02CD0: [0x2CD1],
+    0x02CD2: [0x2CD3],
+    0x02CD4: [0x2CD5],
+    0x02CD6: [0x2CD7],
+    0x02CD8: [0x2CD9],
+    0x02CDA: [0x2CDB],
+    0x02CDC: [0x2CDD],
+    0x02CDE: [0x2CDF],
+    0x02CE0: [0x2CE1],
+    0x02CE2: [0x2CE3],
+    0x02CEB: [0x2CEC],
+    0x02CED: [0x2CEE],
+    0x02CF2: [0x2CF3],
+    0x0A640: [0xA641],
+    0x0A642: [0xA643],
+    0x0A644: [0xA645],
+    0x0A646: [0xA647],
+    0x0A648: [0xA649],
+    0x0A64A: [0xA64B],
+    0x0A64C: [0xA64D],
+    0x0A64E: [0xA64F],
+    0x0A650: [0xA651],
+    0x0A652: [0xA653],
+    0x0A654: [0xA655],
+    0x0A656: [0xA657],
+    0x0A658: [0xA659],
+    0x0A65A: [0xA65B],
+    0x0A65C: [0xA65D],
+    0x0A65E: [0xA65F],
+    0x0A660: [0xA661],
+    0x0A662: [0xA663],
+    0x0A664: [0xA665],
+    0x0A666: [0xA667],
+    0x0A668: [0xA669],
+    0x0A66A: [0xA66B],
+    0x0A66C: [0xA66D],
+    0x0A680: [0xA681],
+    0x0A682: [0xA683],
+    0x0A684: [0xA685],
+    0x0A686: [0xA687],
+    0x0A688: [0xA689],
+    0x0A68A: [0xA68B],
+    0x0A68C: [0xA68D],
+    0x0A68E: [0xA68F],
+    0x0A690: [0xA691],
+    0x0A692: [0xA693],
+    0x0A694: [0xA695],
+    0x0A696: [0xA697],
+    0x0A698: [0xA699],
+    0x0A69A: [0xA69B],
+    0x0A722: [0xA723],
+    0x0A724: [0xA725],
+    0x0A726: [0xA727],
+    0x0A728: [0xA729],
+    0x0A72A: [0xA72B],
+    0x0A72C: [0xA72D],
+    0x0A72E: [0xA72F],
+    0x0A732: [0xA733],
+    0x0A734: [0xA735],
+    0x0A736: [0xA737],
+    0x0A738: [0xA739],
+    0x0A73A: [0xA73B],
+    0x0A73C: [0xA73D],
+    0x0A73E: [0xA73F],
+    0x0A740: [0xA741],
+    0x0A742: [0xA743],
+    0x0A744: [0xA745],
+    0x0A746: [0xA747],
+    0x0A748: [0xA749],
+    0x0A74A: [0xA74B],
+    0x0A74C: [0xA74D],
+    0x0A74E: [0xA74F],
+    0x0A750: [0xA751],
+    0x0A752: [0xA753],
+    0x0A754: [0xA755],
+    0x0A756: [0xA757],
+    0x0A758: [0xA759],
+    0x0A75A: [0xA75B],
+    0x0A75C: [0xA75D],
+    0x0A75E: [0xA75F],
+    0x0A760: [0xA761],
+    0x0A762: [0xA763],
+    0x0A764: [0xA765],
+    0x0A766: [0xA767],
+    0x0A768: [0xA769],
+    0x0A76A: [0xA76B],
+    0x0A76C: [0xA76D],
+    0x0A76E: [0xA76F],
+    0x0A779: [0xA77A],
+    0x0A77B: [0xA77C],
+    0x0A77D: [0x1D79],
+    0x0A77E: [0xA77F],
+    0x0A780: [0xA781],
+    0x0A782: [0xA783],
+    0x0A784: [0xA785],
+    0x0A786: [0xA787],
+    0x0A78B: [0xA78C],
+    0x0A78D: [0x0265],
+    0x0A790: [0xA791],
+    0x0A792: [0xA793],
+    0x0A796: [0xA797],
+    0x0A798: [0xA799],
+    0x0A79A: [0xA79B],
+    0x0A79C: [0xA79D],
+    0x0A79E: [0xA79F],
+    0x0A7A0: [0xA7A1],
+    0x0A7A2: [0xA7A3],
+    0x0A7A4: [0xA7A5],
+    0x0A7A6: [0xA7A7],
+    0x0A7A8: [0xA7A9],
+    0x0A7AA: [0x0266],
+    0x0A7AB: [0x025C],
+    0x0A7AC: [0x0261],
+    0x0A7AD: [0x026C],
+    0x0A7AE: [0x026A],
+    0x0A7B0: [0x029E],
+    0x0A7B1: [0x0287],
+    0x0A7B2: [0x029D],
+    0x0A7B3: [0xAB53],
+    0x0A7B4: [0xA7B5],
+    0x0A7B6: [0xA7B7],
+    0x0A7B8: [0xA7B9],
+    0x0A7BA: [0xA7BB],
+    0x0A7BC: [0xA7BD],
+    0x0A7BE: [0xA7BF],
+    0x0A7C0: [0xA7C1],
+    0x0A7C2: [0xA7C3],
+    0x0A7C4: [0xA794],
+    0x0A7C5: [0x0282],
+    0x0A7C6: [0x1D8E],
+    0x0A7C7: [0xA7C8],
+    0x0A7C9: [0xA7CA],
+    0x0A7CB: [0x0264],
+    0x0A7CC: [0xA7CD],
+    0x0A7D0: [0xA7D1],
+    0x0A7D6: [0xA7D7],
+    0x0A7D8: [0xA7D9],
+    0x0A7DA: [0xA7DB],
+    0x0A7DC: [0x019B],
+    0x0A7F5: [0xA7F6],
+    0x0AB70: [0x13A0],
+    0x0AB71: [0x13A1],
+    0x0AB72: [0x13A2],
+    0x0AB73: [0x13A3],
+    0x0AB74: [0x13A4],
+    0x0AB75: [0x13A5],
+    0x0AB76: [0x13A6],
+    0x0AB77: [0x13A7],
+    0x0AB78: [0x13A8],
+    0x0AB79: [0x13A9],
+    0x0AB7A: [0x13AA],
+    0x0AB7B: [0x13AB],
+    0x0AB7C: [0x13AC],
+    0x0AB7D: [0x13AD],
+    0x0AB7E: [0x13AE],
+    0x0AB7F: [0x13AF],
+    0x0AB80: [0x13B0],
+    0x0AB81: [0x13B1],
+    0x0AB82: [0x13B2],
+    0x0AB83: [0x13B3],
+    0x0AB84: [0x13B4],
+    0x0AB85: [0x13B5],
+    0x0AB86: [0x13B6],
+    0x0AB87: [0x13B7],
+    0x0AB88: [0x13B8],
+    0x0AB89: [0x13B9],
+    0x0AB8A: [0x13BA],
+    0x0AB8B: [0x13BB],
+    0x0AB8C: [0x13BC],
+    0x0AB8D: [0x13BD],
+    0x0AB8E: [0x13BE],
+    0x0AB8F: [0x13BF],
+    0x0AB90: [0x13C0],
+    0x0AB91: [0x13C1],
+    0x0AB92: [0x13C2],
+    0x0AB93: [0x13C3],
+    0x0AB94: [0x13C4],
+    0x0AB95: [0x13C5],
+    0x0AB96: [0x13C6],
+    0x0AB97: [0x13C7],
+    0x0AB98: [0x13C8],
+    0x0AB99: [0x13C9],
+    0x0AB9A: [0x13CA],
+    0x0AB9B: [0x13CB],
+    0x0AB9C: [0x13CC],
+    0x0AB9D: [0x13CD],
+    0x0AB9E: [0x13CE],
+    0x0AB9F: [0x13CF],
+    0x0ABA0: [0x13D0],
+    0x0ABA1: [0x13D1],
+    0x0ABA2: [0x13D2],
+    0x0ABA3: [0x13D3],
+    0x0ABA4: [0x13D4],
+    0x0ABA5: [0x13D5],
+    0x0ABA6: [0x13D6],
+    0x0ABA7: [0x13D7],
+    0x0ABA8: [0x13D8],
+    0x0ABA9: [0x13D9],
+    0x0ABAA: [0x13DA],
+    0x0ABAB: [0x13DB],
+    0x0ABAC: [0x13DC],
+    0x0ABAD: [0x13DD],
+    0x0ABAE: [0x13DE],
+    0x0ABAF: [0x13DF],
+    0x0ABB0: [0x13E0],
+    0x0ABB1: [0x13E1],
+    0x0ABB2: [0x13E2],
+    0x0ABB3: [0x13E3],
+    0x0ABB4: [0x13E4],
+    0x0ABB5: [0x13E5],
+    0x0ABB6: [0x13E6],
+    0x0ABB7: [0x13E7],
+    0x0ABB8: [0x13E8],
+    0x0ABB9: [0x13E9],
+    0x0ABBA: [0x13EA],
+    0x0ABBB: [0x13EB],
+    0x0ABBC: [0x13EC],
+    0x0ABBD: [0x13ED],
+    0x0ABBE: [0x13EE],
+    0x0ABBF: [0x13EF],
+    0x0FB00: [0x0066, 0x0066],
+    0x0FB01: [0x0066, 0x0069],
+    0x0FB02: [0x0066, 0x006C],
+    0x0FB03: [0x0066, 0x0066, 0x0069],
+    0x0FB04: [0x0066, 0x0066, 0x006C],
+    0x0FB05: [0x0073, 0x0074],
+    0x0FB06: [0x0073, 0x0074],
+    0x0FB13: [0x0574, 0x0576],
+    0x0FB14: [0x0574, 0x0565],
+    0x0FB15: [0x0574, 0x056B],
+    0x0FB16: [0x057E, 0x0576],
+    0x0FB17: [0x0574, 0x056D],
+    0x0FF21: [0xFF41],
+    0x0FF22: [0xFF42],
+    0x0FF23: [0xFF43],
+    0x0FF24: [0xFF44],
+    0x0FF25: [0xFF45],
+    0x0FF26: [0xFF46],
+    0x0FF27: [0xFF47],
+    0x0FF28: [0xFF48],
+    0x0FF29: [0xFF49],
+    0x0FF2A: [0xFF4A],
+    0x0FF2B: [0xFF4B],
+    0x0FF2C: [0xFF4C],
+    0x0FF2D: [0xFF4D],
+    0x0FF2E: [0xFF4E],
+    0x0FF2F: [0xFF4F],
+    0x0FF30: [0xFF50],
+    0x0FF31: [0xFF51],
+    0x0FF32: [0xFF52],
+    0x0FF33: [0xFF53],
+    0x0FF34: [0xFF54],
+    0x0FF35: [0xFF55],
+    0x0FF36: [0xFF56],
+    0x0FF37: [0xFF57],
+    0x0FF38: [0xFF58],
+    0x0FF39: [0xFF59],
+    0x0FF3A: [0xFF5A],
+    0x10400: [0x10428],
+    0x10401: [0x10429],
+    0x10402: [0x1042A],
+    0x10403: [0x1042B],
+    0x10404: [0x1042C],
+    0x10405: [0x1042D],
+    0x10406: [0x1042E],
+    0x10407: [0x1042F],
+    0x10408: [0x10430],
+    0x10409: [0x10431],
+    0x1040A: [0x10432],
+    0x1040B: [0x10433],
+    0x1040C: [0x10434],
+    0x1040D: [0x10435],
+    0x1040E: [0x10436],
+    0x1040F: [0x10437],
+    0x10410: [0x10438],
+    0x10411: [0x10439],
+    0x10412: [0x1043A],
+    0x10413: [0x1043B],
+    0x10414: [0x1043C],
+    0x10415: [0x1043D],
+    0x10416: [0x1043E],
+    0x10417: [0x1043F],
+    0x10418: [0x10440],
+    0x10419: [0x10441],
+    0x1041A: [0x10442],
+    0x1041B: [0x10443],
+    0x1041C: [0x10444],
+    0x1041D: [0x10445],
+    0x1041E: [0x10446],
+    0x1041F: [0x10447],
+    0x10420: [0x10448],
+    0x10421: [0x10449],
+    0x10422: [0x1044A],
+    0x10423: [0x1044B],
+    0x10424: [0x1044C],
+    0x10425: [0x1044D],
+    0x10426: [0x1044E],
+    0x10427: [0x1044F],
+    0x104B0: [0x104D8],
+    0x104B1: [0x104D9],
+    0x104B2: [0x104DA],
+    0x104B3: [0x104DB],
+    0x104B4: [0x104DC],
+    0x104B5: [0x104DD],
+    0x104B6: [0x104DE],
+    0x104B7: [0x104DF],
+    0x104B8: [0x104E0],
+    0x104B9: [0x104E1],
+    0x104BA: [0x104E2],
+    0x104BB: [0x104E3],
+    0x104BC: [0x104E4],
+    0x104BD: [0x104E5],
+    0x104BE: [0x104E6],
+    0x104BF: [0x104E7],
+    0x104C0: [0x104E8],
+    0x104C1: [0x104E9],
+    0x104C2: [0x104EA],
+    0x104C3: [0x104EB],
+    0x104C4: [0x104EC],
+    0x104C5: [0x104ED],
+    0x104C6: [0x104EE],
+    0x104C7: [0x104EF],
+    0x104C8: [0x104F0],
+    0x104C9: [0x104F1],
+    0x104CA: [0x104F2],
+    0x104CB: [0x104F3],
+    0x104CC: [0x104F4],
+    0x104CD: [0x104F5],
+    0x104CE: [0x104F6],
+    0x104CF: [0x104F7],
+    0x104D0: [0x104F8],
+    0x104D1: [0x104F9],
+    0x104D2: [0x104FA],
+    0x104D3: [0x104FB],
+    0x10570: [0x10597],
+    0x10571: [0x10598],
+    0x10572: [0x10599],
+    0x10573: [0x1059A],
+    0x10574: [0x1059B],
+    0x10575: [0x1059C],
+    0x10576: [0x1059D],
+    0x10577: [0x1059E],
+    0x10578: [0x1059F],
+    0x10579: [0x105A0],
+    0x1057A: [0x105A1],
+    0x1057C: [0x105A3],
+    0x1057D: [0x105A4],
+    0x1057E: [0x105A5],
+    0x1057F: [0x105A6],
+    0x10580: [0x105A7],
+    0x10581: [0x105A8],
+    0x10582: [0x105A9],
+    0x10583: [0x105AA],
+    0x10584: [0x105AB],
+    0x10585: [0x105AC],
+    0x10586: [0x105AD],
+    0x10587: [0x105AE],
+    0x10588: [0x105AF],
+    0x10589: [0x105B0],
+    0x1058A: [0x105B1],
+    0x1058C: [0x105B3],
+    0x1058D: [0x105B4],
+    0x1058E: [0x105B5],
+    0x1058F: [0x105B6],
+    0x10590: [0x105B7],
+    0x10591: [0x105B8],
+    0x10592: [0x105B9],
+    0x10594: [0x105BB],
+    0x10595: [0x105BC],
+    0x10C80: [0x10CC0],
+    0x10C81: [0x10CC1],
+    0x10C82: [0x10CC2],
+    0x10C83: [0x10CC3],
+    0x10C84: [0x10CC4],
+    0x10C85: [0x10CC5],
+    0x10C86: [0x10CC6],
+    0x10C87: [0x10CC7],
+    0x10C88: [0x10CC8],
+    0x10C89: [0x10CC9],
+    0x10C8A: [0x10CCA],
+    0x10C8B: [0x10CCB],
+    0x10C8C: [0x10CCC],
+    0x10C8D: [0x10CCD],
+    0x10C8E: [0x10CCE],
+    0x10C8F: [0x10CCF],
+    0x10C90: [0x10CD0],
+    0x10C91: [0x10CD1],
+    0x10C92: [0x10CD2],
+    0x10C93: [0x10CD3],
+    0x10C94: [0x10CD4],
+    0x10C95: [0x10CD5],
+    0x10C96: [0x10CD6],
+    0x10C97: [0x10CD7],
+    0x10C98: [0x10CD8],
+    0x10C99: [0x10CD9],
+    0x10C9A: [0x10CDA],
+    0x10C9B: [0x10CDB],
+    0x10C9C: [0x10CDC],
+    0x10C9D: [0x10CDD],
+    0x10C9E: [0x10CDE],
+    0x10C9F: [0x10CDF],
+    0x10CA0: [0x10CE0],
+    0x10CA1: [0x10CE1],
+    0x10CA2: [0x10CE2],
+    0x10CA3: [0x10CE3],
+    0x10CA4: [0x10CE4],
+    0x10CA5: [0x10CE5],
+    0x10CA6: [0x10CE6],
+    0x10CA7: [0x10CE7],
+    0x10CA8: [0x10CE8],
+    0x10CA9: [0x10CE9],
+    0x10CAA: [0x10CEA],
+    0x10CAB: [0x10CEB],
+    0x10CAC: [0x10CEC],
+    0x10CAD: [0x10CED],
+    0x10CAE: [0x10CEE],
+    0x10CAF: [0x10CEF],
+    0x10CB0: [0x10CF0],
+    0x10CB1: [0x10CF1],
+    0x10CB2: [0x10CF2],
+    0x10D50: [0x10D70],
+    0x10D51: [0x10D71],
+    0x10D52: [0x10D72],
+    0x10D53: [0x10D73],
+    0x10D54: [0x10D74],
+    0x10D55: [0x10D75],
+    0x10D56: [0x10D76],
+    0x10D57: [0x10D77],
+    0x10D58: [0x10D78],
+    0x10D59: [0x10D79],
+    0x10D5A: [0x10D7A],
+    0x10D5B: [0x10D7B],
+    0x10D5C: [0x10D7C],
+    0x10D5D: [0x10D7D],
+    0x10D5E: [0x10D7E],
+    0x10D5F: [0x10D7F],
+    0x10D60: [0x10D80],
+    0x10D61: [0x10D81],
+    0x10D62: [0x10D82],
+    0x10D63: [0x10D83],
+    0x10D64: [0x10D84],
+    0x10D65: [0x10D85],
+    0x118A0: [0x118C0],
+    0x118A1: [0x118C1],
+    0x118A2: [0x118C2],
+    0x118A3: [0x118C3],
+    0x118A4: [0x118C4],
+    0x118A5: [0x118C5],
+    0x118A6: [0x118C6],
+    0x118A7: [0x118C7],
+    0x118A8: [0x118C8],
+    0x118A9: [0x118C9],
+    0x118AA: [0x118CA],
+    0x118AB: [0x118CB],
+    0x118AC: [0x118CC],
+    0x118AD: [0x118CD],
+    0x118AE: [0x118CE],
+    0x118AF: [0x118CF],
+    0x118B0: [0x118D0],
+    0x118B1: [0x118D1],
+    0x118B2: [0x118D2],
+    0x118B3: [0x118D3],
+    0x118B4: [0x118D4],
+    0x118B5: [0x118D5],
+    0x118B6: [0x118D6],
+    0x118B7: [0x118D7],
+    0x118B8: [0x118D8],
+    0x118B9: [0x118D9],
+    0x118BA: [0x118DA],
+    0x118BB: [0x118DB],
+    0x118BC: [0x118DC],
+    0x118BD: [0x118DD],
+    0x118BE: [0x118DE],
+    0x118BF: [0x118DF],
+    0x16E40: [0x16E60],
+    0x16E41: [0x16E61],
+    0x16E42: [0x16E62],
+    0x16E43: [0x16E63],
+    0x16E44: [0x16E64],
+    0x16E45: [0x16E65],
+    0x16E46: [0x16E66],
+    0x16E47: [0x16E67],
+    0x16E48: [0x16E68],
+    0x16E49: [0x16E69],
+    0x16E4A: [0x16E6A],
+    0x16E4B: [0x16E6B],
+    0x16E4C: [0x16E6C],
+    0x16E4D: [0x16E6D],
+    0x16E4E: [0x16E6E],
+    0x16E4F: [0x16E6F],
+    0x16E50: [0x16E70],
+    0x16E51: [0x16E71],
+    0x16E52: [0x16E72],
+    0x16E53: [0x16E73],
+    0x16E54: [0x16E74],
+    0x16E55: [0x16E75],
+    0x16E56: [0x16E76],
+    0x16E57: [0x16E77],
+    0x16E58: [0x16E78],
+    0x16E59: [0x16E79],
+    0x16E5A: [0x16E7A],
+    0x16E5B: [0x16E7B],
+    0x16E5C: [0x16E7C],
+    0x16E5D: [0x16E7D],
+    0x16E5E: [0x16E7E],
+    0x16E5F: [0x16E7F],
+    0x1E900: [0x1E922],
+    0x1E901: [0x1E923],
+    0x1E902: [0x1E924],
+    0x1E903: [0x1E925],
+    0x1E904: [0x1E926],
+    0x1E905: [0x1E927],
+    0x1E906: [0x1E928],
+    0x1E907: [0x1E929],
+    0x1E908: [0x1E92A],
+    0x1E909: [0x1E92B],
+    0x1E90A: [0x1E92C],
+    0x1E90B: [0x1E92D],
+    0x1E90C: [0x1E92E],
+    0x1E90D: [0x1E92F],
+    0x1E90E: [0x1E930],
+    0x1E90F: [0x1E931],
+    0x1E910: [0x1E932],
+    0x1E911: [0x1E933],
+    0x1E912: [0x1E934],
+    0x1E913: [0x1E935],
+    0x1E914: [0x1E936],
+    0x1E915: [0x1E937],
+    0x1E916: [0x1E938],
+    0x1E917: [0x1E939],
+    0x1E918: [0x1E93A],
+    0x1E919: [0x1E93B],
+    0x1E91A: [0x1E93C],
+    0x1E91B: [0x1E93D],
+    0x1E91C: [0x1E93E],
+    0x1E91D: [0x1E93F],
+    0x1E91E: [0x1E940],
+    0x1E91F: [0x1E941],
+    0x1E920: [0x1E942],
+    0x1E921: [0x1E943],
+}
+
 del _NFC__QC_NO, _NFC__QC_MAYBE, _NFKC_QC_NO, _NFKC_QC_MAYBE
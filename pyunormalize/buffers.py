@@ -0,0 +1,490 @@
+"""Normalization of Unicode text held in binary buffers."""
+
+import mmap
+import os
+import re
+import shutil
+import tempfile
+from array import array
+from bisect import bisect_right
+
+from pyunormalize.bulk import _screen
+from pyunormalize.normalization import (
+    _QUICK_CHECK_BY_FORM,
+    _iter_segments,
+    _last_boundary,
+    _normalization_forms,
+    _normalize_codepoints,
+)
+
+__all__ = [
+    "normalize_codepoints",
+    "normalize_column",
+    "normalize_file",
+    "normalize_utf8",
+]
+
+# Type code of arrays of unsigned 32-bit integers
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+# Size of the blocks of a file decoded, normalized, or copied at once
+_FILE_BLOCK_SIZE = 1 << 20
+
+# Dictionary mapping normalization forms to compiled regular expressions
+# matching any byte which does not encode an ASCII character passing the
+# quick check, computed on first use
+_UTF8_SCREEN_BY_FORM = {}
+
+# Minimum length of the runs of ASCII characters passing the quick check
+# which are copied as they are between regions normalized at once
+_UTF8_STABLE_RUN = 32
+
+# Dictionary mapping normalization forms to compiled regular expressions
+# matching runs of bytes encoding ASCII characters passing the quick check,
+# computed on first use
+_UTF8_STABLE_BY_FORM = {}
+
+
+def normalize_utf8(form, data):
+    """Transform the UTF-8 encoded Unicode text `data` into the normalization
+    form `form`, and return it encoded in UTF-8.
+
+    The bytes are screened directly, without decoding: long runs of ASCII
+    characters which are left unchanged by normalization are skipped in
+    bulk. Only the regions between them which may need normalization are
+    decoded and normalized, and the changed regions are spliced between
+    slices of the original buffer. If the text is already normalized, the
+    original buffer is returned as it is, without any copy.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        data (bytes-like): The UTF-8 encoded Unicode text, such as a bytes,
+            bytearray, or memoryview object.
+
+    Returns:
+        bytes-like: The normalized text encoded in UTF-8, which is `data`
+            itself if the text is already normalized.
+
+    Raises:
+        UnicodeDecodeError: If `data` is not valid UTF-8.
+
+    Examples:
+
+        >>> normalize_utf8("NFC", b"cafe\\xcc\\x81")
+        b'caf\\xc3\\xa9'
+
+        >>> data = b"caf\\xc3\\xa9"
+        >>> normalize_utf8("NFC", data) is data
+        True
+
+    """
+    screen = _utf8_screen(form)
+    match = screen.search(data)
+
+    if match is None:
+        return data
+
+    search_stable = _utf8_stable(form).search
+    search_text = _screen(form).search
+    func = _normalization_forms[form]
+
+    pieces = []
+    copied = 0  # offset up to which the text has been copied
+
+    while match:
+        # Every ASCII character has a normalization boundary before it, so
+        # the text can be split before the ASCII character preceding the
+        # first byte which may need normalization, and before the next long
+        # enough run of ASCII characters passing the quick check.
+        start = max(match.start() - 1, copied)
+        stable = search_stable(data, match.end())
+        end = len(data) if stable is None else stable.start()
+
+        text = str(data[start:end], "utf-8")
+
+        if search_text(text) is not None:
+            normalized = func(text)
+
+            if normalized != text:
+                pieces.append(data[copied:start])
+                pieces.append(normalized.encode("utf-8"))
+                copied = end
+
+        match = screen.search(data, end)
+
+    if not pieces:
+        return data
+
+    pieces.append(data[copied:])
+
+    return b"".join(pieces)
+
+
+def normalize_codepoints(form, buf, out=None):
+    """Transform the Unicode text held in `buf` as a sequence of code points
+    into the normalization form `form`. The code points are processed as
+    integers, without conversion to and from a Unicode string.
+
+    `buf` may be any object supporting the buffer protocol, holding unsigned
+    32-bit integers, such as an `array("I")` or a memoryview. A buffer of
+    bytes is read as native-endian 32-bit integers. Only the segments failing
+    the quick check are normalized; the others are copied in bulk.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        buf (buffer): The code points of the Unicode text.
+
+        out (buffer, optional): A writable buffer of unsigned 32-bit
+            integers receiving the normalized code points.
+
+    Returns:
+        array or int: A new array of the normalized code points, or the
+            number of code points written into `out`, if given.
+
+    Raises:
+        ValueError: If `out` is too small for the normalized code points.
+
+    Examples:
+
+        >>> from array import array
+        >>> buf = array("I", [0x0041, 0x030A, 0x0323])
+        >>> [f"{x:04X}" for x in normalize_codepoints("NFC", buf)]
+        ['1EA0', '030A']
+
+        >>> out = array("I", bytes(4 * 8))
+        >>> normalize_codepoints("NFKD", array("I", [0xFB01]), out)
+        2
+        >>> [chr(x) for x in out[:2]]
+        ['f', 'i']
+
+    """
+    codepoints = _as_uint32(buf)
+    result = array(_UINT32)
+
+    for start, end, needs_work in _iter_segments(codepoints, form):
+        segment = codepoints[start:end]
+
+        if needs_work:
+            result.extend(_normalize_codepoints(segment, form))
+        else:
+            result.frombytes(segment.cast("B"))
+
+    if out is None:
+        return result
+
+    out = _as_uint32(out)
+    n = len(result)
+
+    if n > len(out):
+        raise ValueError(
+            f"output buffer too small: {len(out)} < {n} code points"
+        )
+
+    out[:n] = result
+
+    return n
+
+
+def normalize_column(form, offsets, data):
+    """Transform a column of UTF-8 encoded Unicode strings, stored as in
+    Apache Arrow, into the normalization form `form`. The string at row `i`
+    is `data[offsets[i]:offsets[i + 1]]`.
+
+    The whole data buffer is screened at once for bytes which may need
+    normalization, and only the rows containing such bytes are normalized.
+    If no row changes, the input buffers are returned as they are. Otherwise,
+    runs of unchanged rows are copied as slices into a new data buffer, and
+    new offsets are computed, starting at zero.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        offsets (buffer): The offsets of the rows, a buffer of signed 32-bit
+            or 64-bit integers, such as an `array("i")` or `array("q")`.
+
+        data (bytes-like): The UTF-8 encoded strings.
+
+    Returns:
+        tuple: The offsets and data buffers of the normalized column, which
+            are `offsets` and `data` themselves if no row changes.
+
+    Raises:
+        UnicodeDecodeError: If a row is not valid UTF-8.
+
+    Examples:
+
+        >>> from array import array
+        >>> offsets = array("i", [0, 3, 9, 9])
+        >>> data = "teacafe\u0301".encode()
+        >>> new_offsets, new_data = normalize_column("NFC", offsets, data)
+        >>> new_offsets, new_data.decode()
+        (array('i', [0, 3, 8, 8]), 'teacafé')
+
+        >>> normalize_column("NFC", new_offsets, new_data)[1] is new_data
+        True
+
+    """
+    view = memoryview(offsets)
+    typecode = view.format.lstrip("@=<>!")
+    buf = memoryview(data)
+    search = _utf8_screen(form).search
+
+    first = view[0] if len(view) else 0
+    last = view[-1] if len(view) else 0
+
+    changes = []  # (row, normalized bytes) of each changed row
+    match = search(data, first, last)
+
+    while match:
+        row = bisect_right(view, match.start()) - 1
+        start, end = view[row], view[row + 1]
+
+        chunk = buf[start:end]
+        normalized = normalize_utf8(form, chunk)
+        if normalized is not chunk:
+            changes.append((row, normalized))
+
+        match = search(data, end, last)
+
+    if not changes:
+        return offsets, data
+
+    pieces = []
+    new_offsets = array(typecode)
+    row = 0    # first row not copied yet
+    shift = -first
+
+    for changed, normalized in changes:
+        # Copy the unchanged rows before the changed one
+        start = view[row]
+        pieces.append(buf[start : view[changed]])
+        _extend_shifted(new_offsets, view[row:changed], shift)
+
+        new_offsets.append(view[changed] + shift)
+        pieces.append(normalized)
+        shift += len(normalized) - (view[changed + 1] - view[changed])
+        row = changed + 1
+
+    pieces.append(buf[view[row] : last])
+    _extend_shifted(new_offsets, view[row:], shift)
+
+    return new_offsets, b"".join(pieces)
+
+
+def normalize_file(form, src_path, dst_path):
+    """Transform the UTF-8 encoded text file `src_path` into the normalization
+    form `form`, and write the result to `dst_path`, in UTF-8. Memory use does
+    not depend on the size of the file.
+
+    The source file is memory-mapped, and its bytes are screened directly for
+    regions which may need normalization. Each such region is decoded and
+    normalized in blocks split at normalization boundaries, and the text in
+    between is copied as it is, in large blocks. If the text is already
+    normalized, nothing is written, and an existing file at `dst_path` is
+    removed, so that it never holds text left from an earlier call.
+
+    The result is written to a temporary file in the directory of
+    `dst_path`, which then replaces `dst_path`, so that `dst_path` is never
+    left partly written, for instance if the source is not valid UTF-8.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        src_path (path-like): The path of the file to normalize.
+
+        dst_path (path-like): The path of the file receiving the normalized
+            text, which must not be the same file as `src_path`.
+
+    Returns:
+        bool: True if the text was changed and written to `dst_path`, False
+            if it is already normalized. In that case, `dst_path` does not
+            exist after the call, and `src_path` should be used instead.
+
+    Raises:
+        UnicodeDecodeError: If the file is not valid UTF-8.
+
+        ValueError: If `src_path` and `dst_path` are the same file.
+
+    """
+    if os.path.exists(dst_path) and os.path.samefile(src_path, dst_path):
+        raise ValueError(f"cannot normalize a file in place: {dst_path!r}")
+
+    search = _utf8_screen(form).search
+    func = _normalization_forms[form]
+
+    with open(src_path, "rb") as src:
+        size = os.fstat(src.fileno()).st_size
+
+        if not size:
+            _remove_stale(dst_path)
+            return False
+
+        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            dst = tmp_path = None
+            pos = 0      # offset up to which the text has been processed
+            copied = 0   # offset up to which the text has been written
+
+            try:
+                match = search(mm)
+
+                while match:
+                    # Every ASCII character has a normalization boundary
+                    # before it
+                    start = max(match.start() - 1, pos)
+                    end, text = _decode_block(mm, start, size, form)
+
+                    normalized = func(text)
+
+                    if normalized != text:
+                        if dst is None:
+                            dst, tmp_path = _open_temporary(dst_path)
+                        _copy_blocks(mm, copied, start, dst)
+                        dst.write(normalized.encode("utf-8"))
+                        copied = end
+
+                    pos = end
+                    match = search(mm, pos)
+
+                if dst is None:
+                    _remove_stale(dst_path)
+                    return False
+
+                _copy_blocks(mm, copied, size, dst)
+                dst.close()
+
+                shutil.copymode(src_path, tmp_path)
+                os.replace(tmp_path, dst_path)
+                tmp_path = None
+            finally:
+                if dst is not None:
+                    dst.close()
+                if tmp_path is not None:
+                    os.remove(tmp_path)
+
+    return True
+
+
+def _open_temporary(path):
+    # Create a temporary file in the directory of the given path, and return
+    # it opened for writing in binary mode, along with its path.
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp"
+    )
+
+    return os.fdopen(fd, "wb"), tmp_path
+
+
+def _remove_stale(path):
+    # Remove the file at the given path, if it exists, as it would hold
+    # text which does not derive from the current source file.
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _decode_block(mm, start, size, form):
+    # Decode a block of UTF-8 text starting at the given offset, which must
+    # be at a normalization boundary, and ending at a normalization boundary
+    # or at the end of the file. Return the end offset and the decoded text.
+
+    block_size = _FILE_BLOCK_SIZE
+
+    while True:
+        end = min(start + block_size, size)
+
+        # Do not split a UTF-8 sequence
+        while end < size and 0x80 <= mm[end] < 0xC0:
+            end += 1
+
+        text = str(mm[start:end], "utf-8")
+
+        if end == size:
+            return end, text
+
+        i = _last_boundary(text, form)
+
+        if i:
+            end -= len(text[i:].encode("utf-8"))
+            return end, text[:i]
+
+        # No normalization boundary in the block
+        block_size *= 2
+
+
+def _copy_blocks(mm, start, end, dst):
+    # Copy the given range of the memory-mapped file to the output file,
+    # in large blocks.
+
+    for i in range(start, end, _FILE_BLOCK_SIZE):
+        dst.write(mm[i : min(i + _FILE_BLOCK_SIZE, end)])
+
+
+def _extend_shifted(result, offsets, shift):
+    # Append the offsets, shifted by the given amount, to the array.
+
+    if shift:
+        result.extend([x + shift for x in offsets])
+    else:
+        result.frombytes(offsets.cast("B"))
+
+
+def _as_uint32(buf):
+    # Return a memoryview of the buffer as unsigned 32-bit integers.
+
+    view = memoryview(buf)
+
+    if view.format != _UINT32:
+        view = view.cast("B").cast(_UINT32)
+
+    return view
+
+
+def _utf8_screen(form):
+    # Return a compiled regular expression matching any byte from 0x80 to
+    # 0xFF, or encoding an ASCII character which fails the quick check for
+    # the normalization form `form`.
+
+    try:
+        return _UTF8_SCREEN_BY_FORM[form]
+    except KeyError:
+        pass
+
+    qc = _QUICK_CHECK_BY_FORM[form]
+    pattern = b"".join(
+        re.escape(bytes([b])) for b in range(0x80) if b in qc
+    )
+    _UTF8_SCREEN_BY_FORM[form] = screen = re.compile(
+        b"[" + pattern + b"\\x80-\\xff]"
+    )
+
+    return screen
+
+
+def _utf8_stable(form):
+    # Return a compiled regular expression matching runs of bytes encoding
+    # ASCII characters which pass the quick check for the normalization form
+    # `form`, none of which is matched by the screen from _utf8_screen().
+
+    try:
+        return _UTF8_STABLE_BY_FORM[form]
+    except KeyError:
+        pass
+
+    qc = _QUICK_CHECK_BY_FORM[form]
+    pattern = b"".join(
+        re.escape(bytes([b])) for b in range(0x80) if b not in qc
+    )
+    _UTF8_STABLE_BY_FORM[form] = stable = re.compile(
+        b"[" + pattern + b"]{%d}" % _UTF8_STABLE_RUN
+    )
+
+    return stable
@@ -0,0 +1,315 @@
+"""Normalization of many Unicode strings at once."""
+
+import re
+from itertools import islice
+
+from pyunormalize.normalization import (
+    _NON_ZERO_CCC_TABLE,
+    _QUICK_CHECK_BY_FORM,
+    _QUICK_CHECK_CCC_BY_FORM,
+    _normalization_forms,
+    NFKC,
+)
+
+__all__ = [
+    "dedupe",
+    "group_equivalent",
+    "normalize_identifiers",
+    "normalize_many",
+    "quick_check_many",
+]
+
+# Number of strings screened together in a single regular expression search
+_BATCH_SIZE = 1024
+
+# Separator used to join strings for screening, unchanged by any
+# normalization form
+_SEPARATOR = "\n"
+
+# Dictionary mapping normalization forms to compiled regular expressions
+# matching any character that may need normalization, computed on first use
+_SCREEN_BY_FORM = {}
+
+
+def normalize_many(form, strings, *, unique=False):
+    """Return a list of the Unicode strings in the iterable `strings`, each
+    transformed into the Unicode normalization form `form`. This is the same
+    as `[normalize(form, s) for s in strings]`, but much faster for large
+    numbers of short strings.
+
+    The normalization function is looked up once, and strings are screened
+    by batches: a whole batch is scanned at once for characters which may
+    need normalization, and only the strings containing such characters are
+    normalized. The others are returned directly.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        strings (iterable): The Unicode strings to normalize.
+
+        unique (bool): Whether to normalize each distinct string needing
+            normalization only once, which pays off when strings repeat.
+
+    Returns:
+        list: The normalized Unicode strings, in the same order.
+
+    Examples:
+
+        >>> normalize_many("NFKC", ["ﬁle", "plain", "x²", "ﬁle"], unique=True)
+        ['file', 'plain', 'x2', 'file']
+
+    """
+    func = _normalization_forms[form]
+    cache = {} if unique else None
+    result = []
+
+    for batch, flagged in _screen_batches(strings, form):
+        base = len(result)
+        result.extend(batch)
+
+        for i in flagged:
+            s = batch[i]
+
+            if cache is None:
+                result[base + i] = func(s)
+            else:
+                try:
+                    result[base + i] = cache[s]
+                except KeyError:
+                    cache[s] = result[base + i] = func(s)
+
+    return result
+
+
+def quick_check_many(form, strings):
+    """Return a mask telling which of the Unicode strings in the iterable
+    `strings` are known to be in the normalization form `form`, according
+    to the quick check. The mask holds one byte per string, set to 1 if the
+    quick check answers "Yes", and to 0 if it answers "No" or "Maybe".
+
+    Strings are screened by batches: a whole batch is scanned at once for
+    characters which may need normalization, and only the strings containing
+    such characters are checked one by one.
+
+    Args:
+        form (str): The normalization form to check, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        strings (iterable): The Unicode strings to check.
+
+    Returns:
+        bytearray: The quick check mask, in the same order as `strings`.
+
+    Examples:
+
+        >>> quick_check_many("NFC", ["caf\u00E9", "cafe\u0301", "tea"])
+        bytearray(b'\\x01\\x00\\x01')
+
+    """
+    qc = _QUICK_CHECK_BY_FORM[form]
+    lead_ccc, trail_ccc = _QUICK_CHECK_CCC_BY_FORM.get(
+        form, (_NON_ZERO_CCC_TABLE, _NON_ZERO_CCC_TABLE)
+    )
+    mask = bytearray()
+
+    for batch, flagged in _screen_batches(strings, form):
+        base = len(mask)
+        mask.extend(b"\x01" * len(batch))
+
+        for i in flagged:
+            prev_ccc = 0
+
+            for u in map(ord, batch[i]):
+                if u in qc or u in lead_ccc and lead_ccc[u] < prev_ccc:
+                    mask[base + i] = 0
+                    break
+
+                prev_ccc = trail_ccc.get(u, 0)
+
+    return mask
+
+
+def group_equivalent(strings, form):
+    """Group the Unicode strings in the iterable `strings` by equivalence
+    under the normalization form `form`, and return a dictionary mapping
+    each normal form to the list of input strings having it, in input order.
+
+    Strings are screened for characters which may need normalization, and
+    only the strings containing such characters are normalized. The others
+    are their own normal form.
+
+    Args:
+        strings (iterable): The Unicode strings to group.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+    Returns:
+        dict: The lists of equivalent strings, keyed by their normal form.
+
+    Examples:
+
+        >>> groups = group_equivalent(["ﬁle", "file", "x²", "x2"], "NFKC")
+        >>> groups
+        {'file': ['ﬁle', 'file'], 'x2': ['x²', 'x2']}
+
+    """
+    search = _screen(form).search
+    func = _normalization_forms[form]
+    groups = {}
+
+    for s in strings:
+        key = s if search(s) is None else func(s)
+
+        try:
+            groups[key].append(s)
+        except KeyError:
+            groups[key] = [s]
+
+    return groups
+
+
+def dedupe(strings, form):
+    """Return an iterator over the Unicode strings in the iterable `strings`,
+    skipping every string equivalent under the normalization form `form`
+    to a string seen before. The first string of each equivalence class is
+    yielded as it is, not normalized.
+
+    Strings are processed as a stream, keeping only the normal form of each
+    distinct string seen so far. Strings are screened for characters which
+    may need normalization, and only the strings containing such characters
+    are normalized.
+
+    Args:
+        strings (iterable): The Unicode strings to deduplicate.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+    Yields:
+        str: The first string of each equivalence class, in input order.
+
+    Examples:
+
+        >>> [*dedupe(["caf\u00E9", "tea", "cafe\u0301", "tea"], "NFC")]
+        ['café', 'tea']
+
+    """
+    search = _screen(form).search
+    func = _normalization_forms[form]
+    seen = set()
+
+    for s in strings:
+        key = s if search(s) is None else func(s)
+
+        if key not in seen:
+            seen.add(key)
+            yield s
+
+
+def normalize_identifiers(identifiers):
+    """Return an iterator over the identifiers in the iterable `identifiers`,
+    each transformed into the Unicode "normalization form KC", as Python
+    does for identifiers (PEP 3131). This is suitable for the NAME tokens
+    produced by the `tokenize` module.
+
+    Identifiers repeat heavily in source code, so each distinct non-ASCII
+    identifier is normalized only once, and its normal form is memoized for
+    the rest of the iteration. ASCII identifiers are always in NFKC and are
+    returned directly, without any lookup.
+
+    Args:
+        identifiers (iterable): The identifiers to normalize.
+
+    Yields:
+        str: The NFKC normalized identifiers, in the same order.
+
+    Examples:
+
+        >>> [*normalize_identifiers(["ﬁle", "file", "ℌ", "x²", "ﬁle"])]
+        ['file', 'file', 'H', 'x2', 'file']
+
+    """
+    cache = {}
+
+    for name in identifiers:
+        # All ASCII characters are unchanged by NFKC
+        if not name or max(name) < "\x80":
+            yield name
+            continue
+
+        try:
+            yield cache[name]
+        except KeyError:
+            cache[name] = result = NFKC(name)
+            yield result
+
+
+def _screen_batches(strings, form):
+    # Split the iterable of Unicode strings into batches, and yield each
+    # batch as a list, along with the indexes of the strings in it which
+    # contain characters that may need normalization. Each batch is joined
+    # and scanned by a single regular expression search.
+
+    search = _screen(form).search
+    strings = iter(strings)
+
+    while True:
+        batch = list(islice(strings, _BATCH_SIZE))
+        if not batch:
+            break
+
+        joined = _SEPARATOR.join(batch)
+        flagged = []
+        match = search(joined)
+        i = start = 0  # index and offset of the current string
+
+        while match:
+            pos = match.start()
+
+            while start + len(batch[i]) < pos:
+                start += len(batch[i]) + 1
+                i += 1
+
+            flagged.append(i)
+
+            start += len(batch[i]) + 1
+            i += 1
+            match = search(joined, start)
+
+        yield batch, flagged
+
+
+def _screen(form):
+    # Return a compiled regular expression matching any character which
+    # fails the quick check for the normalization form `form`, or which has
+    # a non-zero canonical combining class. Strings without such characters
+    # are known to be normalized. Supplementary characters are all matched,
+    # as the regular expression engine only tests large character sets
+    # quickly within the Basic Multilingual Plane.
+
+    try:
+        return _SCREEN_BY_FORM[form]
+    except KeyError:
+        pass
+
+    chars = sorted(_QUICK_CHECK_BY_FORM[form] | set(_NON_ZERO_CCC_TABLE))
+    ranges = []
+
+    for cp in chars:
+        if cp > 0xFFFF:
+            break
+        if ranges and ranges[-1][1] == cp - 1:
+            ranges[-1][1] = cp
+        else:
+            ranges.append([cp, cp])
+
+    ranges.append([0x10000, 0x10FFFF])
+
+    pattern = "".join(
+        f"\\U{first:08X}-\\U{last:08X}" for first, last in ranges
+    )
+    _SCREEN_BY_FORM[form] = screen = re.compile(f"[{pattern}]")
+
+    return screen
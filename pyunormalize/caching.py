@@ -0,0 +1,212 @@
+"""Memoization of Unicode normalization."""
+
+import threading
+from collections import OrderedDict, namedtuple
+
+from pyunormalize.bulk import _screen
+from pyunormalize.normalization import _normalization_forms
+
+__all__ = [
+    "InterningNormalizer",
+    "cached",
+]
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "currsize", "chars"]
+)
+
+
+def cached(form, maxsize=4096, max_len=256, max_chars=1 << 20):
+    """Return a function transforming Unicode strings into the normalization
+    form `form`, like `normalize(form, unistr)`, but memoizing its results in
+    a least recently used (LRU) cache. This pays off when the same strings
+    are normalized over and over.
+
+    Strings already known to be normalized after a fast scan are returned
+    directly and never enter the cache, nor do strings longer than `max_len`.
+    The cache holds at most `maxsize` entries and `max_chars` characters,
+    counting both the input strings and their normal forms. The least
+    recently used entries are evicted first.
+
+    The function is thread-safe: the cache is locked while it is looked up
+    and updated, but not while strings are normalized.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        maxsize (int): The maximum number of cached entries.
+
+        max_len (int): The maximum length of cached strings.
+
+        max_chars (int): The maximum total number of cached characters.
+
+    Returns:
+        CachedNormalizer: The normalization function, with methods
+            `cache_info()` and `cache_clear()`.
+
+    Examples:
+
+        >>> nfkc = cached("NFKC", maxsize=2)
+        >>> [nfkc(s) for s in ["ﬁ", "ﬁ", "x²", "plain", "ℌ"]]
+        ['fi', 'fi', 'x2', 'plain', 'H']
+        >>> nfkc.cache_info()
+        CacheInfo(hits=1, misses=3, evictions=1, currsize=2, chars=6)
+
+    """
+    return CachedNormalizer(form, maxsize, max_len, max_chars)
+
+
+class CachedNormalizer:
+    """Normalization function with a bounded LRU cache, as returned
+    by `cached()`."""
+
+    def __init__(self, form, maxsize, max_len, max_chars):
+        self.form = form
+        self.maxsize = maxsize
+        self.max_len = max_len
+        self.max_chars = max_chars
+
+        self._func = _normalization_forms[form]
+        self._search = _screen(form).search
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._chars = 0
+
+    def __call__(self, unistr):
+        if self._search(unistr) is None:
+            return unistr
+
+        cache = self._cache
+
+        with self._lock:
+            try:
+                result = cache[unistr]
+            except KeyError:
+                self._misses += 1
+            else:
+                cache.move_to_end(unistr)
+                self._hits += 1
+                return result
+
+        result = self._func(unistr)
+
+        size = len(unistr) + len(result)
+        if len(unistr) > self.max_len or size > self.max_chars:
+            return result
+
+        with self._lock:
+            # Another thread may have cached the string in the meantime
+            if unistr in cache:
+                return result
+
+            while cache and (len(cache) >= self.maxsize
+                             or self._chars + size > self.max_chars):
+                key, val = cache.popitem(last=False)
+                self._chars -= len(key) + len(val)
+                self._evictions += 1
+
+            if self.maxsize > 0:
+                cache[unistr] = result
+                self._chars += size
+
+        return result
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.form!r})"
+
+    def cache_info(self):
+        """Return a named tuple with the number of cache hits, misses and
+        evictions, and the current number of entries and characters in the
+        cache."""
+
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._cache),
+                self._chars,
+            )
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+
+        with self._lock:
+            self._cache.clear()
+            self._hits = self._misses = self._evictions = self._chars = 0
+
+
+class InterningNormalizer:
+    """Normalization function returning a single shared object for each
+    distinct normalized string.
+
+    Equal results of `normalize(form, unistr)` are stored as separate
+    objects. This function looks each result up in an interning table
+    and returns the object already stored there, so that equal results
+    share memory and compare by identity first. The table holds at most
+    `maxsize` strings, and the least recently returned ones are dropped
+    first, so frequent strings stay shared. Python strings cannot be weakly
+    referenced, so the table keeps its strings alive until they are dropped.
+
+    The function is thread-safe: the table is locked while it is looked up
+    and updated, but not while strings are normalized.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        maxsize (int): The maximum number of strings in the interning table.
+
+    Examples:
+
+        >>> nfc = InterningNormalizer("NFC")
+        >>> a = nfc("cafe\u0301")
+        >>> b = nfc("caf\u00E9")
+        >>> a == b, a is b
+        (True, True)
+        >>> len(nfc)
+        1
+
+    """
+
+    def __init__(self, form, maxsize=1 << 16):
+        self.form = form
+        self.maxsize = maxsize
+
+        self._func = _normalization_forms[form]
+        self._table = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, unistr):
+        result = self._func(unistr)
+        table = self._table
+
+        with self._lock:
+            try:
+                shared = table[result]
+            except KeyError:
+                pass
+            else:
+                table.move_to_end(result)
+                return shared
+
+            if self.maxsize > 0:
+                if len(table) >= self.maxsize:
+                    # Drop the least recently used string
+                    table.popitem(last=False)
+                table[result] = result
+
+        return result
+
+    def __len__(self):
+        return len(self._table)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.form!r})"
+
+    def clear(self):
+        """Remove all strings from the interning table."""
+
+        with self._lock:
+            self._table.clear()
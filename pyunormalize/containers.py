@@ -0,0 +1,202 @@
+"""Containers keyed by the normal form of Unicode strings."""
+
+from collections.abc import MutableMapping, MutableSet
+
+from pyunormalize.bulk import _screen
+from pyunormalize.normalization import _normalization_forms
+
+__all__ = [
+    "NormalizedDict",
+    "NormalizedSet",
+]
+
+
+class _NormalizedKeys:
+    # Shared key normalization for the normalized containers. Keys without
+    # any character which may need normalization are found by a fast scan
+    # and used as they are.
+
+    __slots__ = ("form", "_func", "_search", "_originals")
+
+    def __init__(self, form, keep_original):
+        self.form = form
+        self._func = _normalization_forms[form]
+        self._search = _screen(form).search
+        self._originals = {} if keep_original else None
+
+    def _normalize(self, key):
+        if self._search(key) is None:
+            return key
+        return self._func(key)
+
+    def _remember(self, nkey, key):
+        if self._originals is not None:
+            self._originals.setdefault(nkey, key)
+
+    def _forget(self, nkey):
+        if self._originals is not None:
+            self._originals.pop(nkey, None)
+
+    def original(self, key):
+        """Return the spelling with which the key equivalent to `key` was
+        first inserted, if original spellings are kept, or else its normal
+        form.
+
+        Raises:
+            KeyError: If no equivalent key is found.
+        """
+
+        if not isinstance(key, str):
+            raise KeyError(key)
+
+        nkey = self._normalize(key)
+
+        if nkey not in self._data:
+            raise KeyError(key)
+
+        if self._originals is None:
+            return nkey
+
+        return self._originals[nkey]
+
+
+class NormalizedDict(_NormalizedKeys, MutableMapping):
+    """Dictionary whose string keys are transformed into the normalization
+    form `form` on insertion and on lookup, so that equivalent keys under
+    this form refer to the same entry. Iteration yields the normalized keys.
+
+    If `keep_original` is true, the spelling with which each key was first
+    inserted is remembered, and is returned by the `original()` method.
+
+    Args:
+        data (mapping or iterable): The initial items, as for `dict`.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        keep_original (bool): Whether to remember the original spelling
+            of each key.
+
+    Examples:
+
+        >>> d = NormalizedDict(keep_original=True)
+        >>> d["cafe\\u0301"] = 1
+        >>> d["caf\\u00E9"] += 1
+        >>> d["caf\\u00E9"], len(d)
+        (2, 1)
+        >>> d.original("caf\\u00E9") == "cafe\\u0301"
+        True
+
+        >>> d = NormalizedDict({"ﬁle": 1}, form="NFKC")
+        >>> d
+        NormalizedDict({'file': 1}, form='NFKC')
+
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data=(), *, form="NFC", keep_original=False):
+        _NormalizedKeys.__init__(self, form, keep_original)
+        self._data = {}
+        self.update(data)
+
+    def __getitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        return self._data[self._normalize(key)]
+
+    def __setitem__(self, key, value):
+        nkey = self._normalize(key)
+        self._data[nkey] = value
+        self._remember(nkey, key)
+
+    def __delitem__(self, key):
+        if not isinstance(key, str):
+            raise KeyError(key)
+        nkey = self._normalize(key)
+        del self._data[nkey]
+        self._forget(nkey)
+
+    def __contains__(self, key):
+        if not isinstance(key, str):
+            return False
+        return self._normalize(key) in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r}, form={self.form!r})"
+
+
+class NormalizedSet(_NormalizedKeys, MutableSet):
+    """Set whose string elements are transformed into the normalization
+    form `form` on insertion and on lookup, so that equivalent strings under
+    this form are the same element. Iteration yields the normalized elements.
+
+    If `keep_original` is true, the spelling with which each element was
+    first inserted is remembered, and is returned by the `original()` method.
+
+    Args:
+        data (iterable): The initial elements.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        keep_original (bool): Whether to remember the original spelling
+            of each element.
+
+    Examples:
+
+        >>> s = NormalizedSet(["cafe\\u0301", "caf\\u00E9", "tea"])
+        >>> len(s), "caf\\u00E9" in s
+        (2, True)
+
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data=(), *, form="NFC", keep_original=False):
+        _NormalizedKeys.__init__(self, form, keep_original)
+        self._data = set()
+
+        for element in data:
+            self.add(element)
+
+    def add(self, element):
+        nkey = self._normalize(element)
+        self._data.add(nkey)
+        self._remember(nkey, element)
+
+    def discard(self, element):
+        if not isinstance(element, str):
+            return
+        nkey = self._normalize(element)
+        self._data.discard(nkey)
+        self._forget(nkey)
+
+    def __contains__(self, element):
+        if not isinstance(element, str):
+            return False
+        return self._normalize(element) in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._data!r}, form={self.form!r})"
+
+    def _from_iterable(self, iterable):
+        # Build the results of set operations with the same normalization,
+        # keeping original spellings if this set does
+        return type(self)(
+            iterable,
+            form=self.form,
+            keep_original=self._originals is not None,
+        )
@@ -0,0 +1,295 @@
+"""Caseless matching of Unicode strings."""
+
+from pyunormalize._unicode import _CASEFOLD_BY_CHARACTER
+from pyunormalize.normalization import (
+    _COMBINES_BACKWARD,
+    _FULL_CDECOMP_BY_CHAR,
+    _FULL_KDECOMP_BY_CHAR,
+    _NFD__QC_NO,
+    _NFKD_QC_NO,
+    _NON_ZERO_CCC_TABLE,
+    _SB,
+    _SL,
+    _compose,
+    _decompose,
+    _decompose_hangul_syllable,
+    _reorder,
+)
+
+__all__ = [
+    "canonical_caseless_key",
+    "compatibility_caseless_key",
+    "strip_marks",
+]
+
+# Dictionary mapping characters to the full canonical decomposition
+# of their full case folding
+_FULL_CDECOMP_OF_CASEFOLD = {}
+
+# Dictionary mapping characters to the full compatibility decomposition
+# of their full case folding, or to their full compatibility decomposition
+# if they have no case folding
+_FULL_KDECOMP_OF_CASEFOLD = dict(_FULL_KDECOMP_BY_CHAR)
+
+
+def _populate_casefold_dictionaries(casefold_by_character):
+    # Populate dictionaries with full decompositions of case foldings,
+    # so that case folding and decomposition take a single lookup.
+
+    for key, val in casefold_by_character.items():
+        cdecomp = []
+        kdecomp = []
+
+        for x in val:
+            cdecomp.extend(_FULL_CDECOMP_BY_CHAR.get(x, (x,)))
+            kdecomp.extend(_FULL_KDECOMP_BY_CHAR.get(x, (x,)))
+
+        _FULL_CDECOMP_OF_CASEFOLD[key] = cdecomp
+        _FULL_KDECOMP_OF_CASEFOLD[key] = kdecomp
+
+
+# Populate case folding dictionaries
+_populate_casefold_dictionaries(_CASEFOLD_BY_CHARACTER)
+
+# Dictionaries mapping characters to their full canonical and compatibility
+# decompositions, with non-starters removed
+_STRIPPED_CDECOMP_BY_CHAR = {}
+_STRIPPED_KDECOMP_BY_CHAR = {}
+
+
+def _populate_stripped_dictionaries():
+    # Populate dictionaries with full decompositions from which all
+    # characters with a non-zero canonical combining class are removed.
+
+    for full, stripped in [
+        (_FULL_CDECOMP_BY_CHAR, _STRIPPED_CDECOMP_BY_CHAR),
+        (_FULL_KDECOMP_BY_CHAR, _STRIPPED_KDECOMP_BY_CHAR),
+    ]:
+        for key, val in full.items():
+            stripped[key] = [x for x in val if x not in _NON_ZERO_CCC_TABLE]
+
+
+# Populate stripped decomposition dictionaries
+_populate_stripped_dictionaries()
+
+# Characters that cannot ever occur in a canonical caseless key
+_CANONICAL_CASELESS_QC_NO = _NFD__QC_NO | set(_CASEFOLD_BY_CHARACTER)
+
+# Characters that cannot ever occur in a compatibility caseless key
+_COMPATIBILITY_CASELESS_QC_NO = _NFKD_QC_NO | set(_CASEFOLD_BY_CHARACTER)
+
+
+def canonical_caseless_key(unistr):
+    """Return the key used for canonical caseless matching of the Unicode
+    string `unistr`, as defined by D145 in Section 3.13, "Default Case
+    Algorithms," of the Unicode core specification. Two strings are canonical
+    caseless matches if and only if their keys are equal.
+
+    The key is NFD(toCasefold(NFD(unistr))), computed in a single pipeline
+    over code points, with full case folding taken from the Unicode character
+    database rather than from the Python core Unicode database. For performance
+    optimization, the function verifies whether the input string is already
+    case folded and in NFD. If it is, the original string is returned directly
+    to avoid unnecessary processing.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+    Returns:
+        str: The canonical caseless matching key.
+
+    Examples:
+
+        >>> key = canonical_caseless_key
+        >>> key("Straße") == key("STRASSE")
+        True
+
+        >>> key = canonical_caseless_key("\\u212B")  # ANGSTROM SIGN
+        >>> " ".join(f"{ord(x):04X}" for x in key)
+        '0061 030A'
+
+        >>> canonical_caseless_key("x²") == canonical_caseless_key("X2")
+        False
+
+    """
+    prev_ccc = 0
+
+    for u in unistr:
+        u = ord(u)
+
+        if u in _CANONICAL_CASELESS_QC_NO:
+            break
+
+        if u not in _NON_ZERO_CCC_TABLE:
+            continue
+
+        curr_ccc = _NON_ZERO_CCC_TABLE[u]
+
+        if curr_ccc < prev_ccc:
+            break
+
+        prev_ccc = curr_ccc
+    else:
+        return unistr
+
+    elements = _reorder(_decompose(unistr))
+
+    if any(x in _CASEFOLD_BY_CHARACTER for x in elements):
+        elements = _casefold(elements, _FULL_CDECOMP_OF_CASEFOLD)
+
+    return "".join(map(chr, elements))
+
+
+def compatibility_caseless_key(unistr):
+    """Return the key used for compatibility caseless matching of the Unicode
+    string `unistr`, as defined by D146 in Section 3.13, "Default Case
+    Algorithms," of the Unicode core specification. Two strings are
+    compatibility caseless matches if and only if their keys are equal.
+
+    The key is NFKD(toCasefold(NFKD(toCasefold(NFD(unistr))))), computed in
+    a single pipeline over code points, with full case folding taken from the
+    Unicode character database rather than from the Python core Unicode
+    database. For performance optimization, the function verifies whether the
+    input string is already case folded and in NFKD. If it is, the original
+    string is returned directly to avoid unnecessary processing.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+    Returns:
+        str: The compatibility caseless matching key.
+
+    Examples:
+
+        >>> key = compatibility_caseless_key
+        >>> key("ﬁ") == key("FI")
+        True
+
+        >>> compatibility_caseless_key("\\u2121")  # TELEPHONE SIGN
+        'tel'
+
+    """
+    prev_ccc = 0
+
+    for u in unistr:
+        u = ord(u)
+
+        if u in _COMPATIBILITY_CASELESS_QC_NO:
+            break
+
+        if u not in _NON_ZERO_CCC_TABLE:
+            continue
+
+        curr_ccc = _NON_ZERO_CCC_TABLE[u]
+
+        if curr_ccc < prev_ccc:
+            break
+
+        prev_ccc = curr_ccc
+    else:
+        return unistr
+
+    elements = _reorder(_decompose(unistr))
+    elements = _casefold(elements, _FULL_KDECOMP_OF_CASEFOLD)
+
+    # Compatibility decomposition may produce characters that are not case
+    # folded yet, as with U+2121 TELEPHONE SIGN
+    if any(x in _CASEFOLD_BY_CHARACTER for x in elements):
+        elements = _casefold(elements, _FULL_KDECOMP_OF_CASEFOLD)
+
+    return "".join(map(chr, elements))
+
+
+def strip_marks(unistr, compatibility=False, recompose=True):
+    """Return the Unicode string `unistr` with all combining marks removed.
+    The string is fully decomposed, all characters with a non-zero canonical
+    combining class are dropped, and the remaining characters are composed
+    again, as for "accent folding" in search.
+
+    The result is the same as `NFC("".join(c for c in NFD(unistr) if ccc(c)
+    == 0))`, or with NFKC and NFKD if `compatibility` is true, or without the
+    composition if `recompose` is false. Non-starters are dropped while the
+    string is being decomposed, so that no canonical reordering is needed.
+    For performance optimization, the function verifies whether the input
+    string would be left unchanged. If it is, the original string is returned
+    directly to avoid unnecessary processing.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+        compatibility (bool): Whether to apply compatibility decomposition
+            rather than canonical decomposition.
+
+        recompose (bool): Whether to compose the result again.
+
+    Returns:
+        str: The Unicode string without combining marks.
+
+    Examples:
+
+        >>> strip_marks("Crème brûlée")
+        'Creme brulee'
+
+        >>> strip_marks("ﬁancé"), strip_marks("ﬁancé", compatibility=True)
+        ('ﬁance', 'fiance')
+
+        >>> strip_marks("Ἄλφα", recompose=False)
+        'Αλφα'
+        >>> jamo = strip_marks("각", recompose=False)
+        >>> " ".join(f"{ord(x):04X}" for x in jamo)
+        '1100 1161 11A8'
+
+    """
+    if compatibility:
+        decomp = _STRIPPED_KDECOMP_BY_CHAR
+        qc = _NFKD_QC_NO
+    else:
+        decomp = _STRIPPED_CDECOMP_BY_CHAR
+        qc = _NFD__QC_NO
+
+    for u in unistr:
+        u = ord(u)
+
+        if (u in qc
+                or u in _NON_ZERO_CCC_TABLE
+                or recompose and u in _COMBINES_BACKWARD):
+            break
+    else:
+        return unistr
+
+    result = []
+
+    for u in unistr:
+        u = ord(u)
+
+        if u in decomp:
+            result.extend(decomp[u])
+        elif u in _NON_ZERO_CCC_TABLE:
+            continue
+        elif _SB <= u <= _SL:
+            result.extend(_decompose_hangul_syllable(u))
+        else:
+            result.append(u)
+
+    if recompose:
+        result = _compose(result)
+
+    return "".join(map(chr, result))
+
+
+def _casefold(elements, decomp):
+    # Apply full case folding followed by full decomposition to a fully
+    # decomposed and canonically ordered string, then put the result back
+    # into canonical order. Case folding may change the canonical combining
+    # class of a character, as with U+0345 COMBINING GREEK YPOGEGRAMMENI,
+    # so both orderings are required.
+
+    result = []
+
+    for x in elements:
+        if x in decomp:
+            result.extend(decomp[x])
+        else:
+            result.append(x)
+
+    return _reorder(result)
@@ -0,0 +1,254 @@
+"""Incremental normalization of Unicode strings."""
+
+import re
+
+from pyunormalize.normalization import (
+    _boundary_sets,
+    _first_boundary,
+    _last_boundary,
+    _normalization_forms,
+    normalize,
+)
+
+__all__ = [
+    "IncrementalNormalizer",
+    "concat_normalized",
+    "renormalize_edit",
+]
+
+# Version of the format of the snapshots of incremental normalizers
+_SNAPSHOT_VERSION = 1
+
+# Regular expression matching a snapshot of an incremental normalizer: the
+# format version, the normalization form, a null byte, and the text held
+# back, in UTF-8
+_SNAPSHOT_RE = re.compile(
+    re.escape(bytes([_SNAPSHOT_VERSION])) + rb"([A-Z_]+)\x00(.*)", re.DOTALL
+)
+
+
+def concat_normalized(form, *parts):
+    """Return the concatenation of the Unicode strings `parts`, each already
+    in the normalization form `form`, transformed into the normalization form
+    `form`. Only the text between the last normalization boundary of a part
+    and the first normalization boundary of the next part is normalized again,
+    so the cost depends on the size of the joins rather than on the size of
+    the result.
+
+    The result is the same as `normalize(form, "".join(parts))` provided each
+    part is in the normalization form `form`. Parts which are not normalized
+    are not checked for.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        *parts (str): The normalized Unicode strings to concatenate.
+
+    Returns:
+        str: The normalized concatenation of `parts`.
+
+    Examples:
+
+        >>> nfc = concat_normalized("NFC", "cafe", "\\u0301", " au lait")
+        >>> nfc
+        'café au lait'
+        >>> " ".join(f"{ord(x):04X}" for x in nfc[:4])
+        '0063 0061 0066 00E9'
+
+        >>> concat_normalized("NFC", "\\u1100", "\\u1161", "\\u11A8")
+        '각'
+
+    """
+    result = []
+    tail = ""  # unstable end of the text concatenated so far
+
+    for part in parts:
+        if not part:
+            continue
+
+        if tail:
+            i = _first_boundary(part, form)
+            if i:
+                tail = normalize(form, tail + part[:i])
+            part = tail + part[i:]
+
+        i = _last_boundary(part, form)
+
+        result.append(part[:i])
+        tail = part[i:]
+
+    result.append(tail)
+
+    return "".join(result)
+
+
+def renormalize_edit(form, text, start, end, replacement):
+    """Replace `text[start:end]` with the Unicode string `replacement` in the
+    Unicode string `text`, already in the normalization form `form`, and
+    return the result transformed into the normalization form `form`. The
+    edited range is expanded outward to the nearest normalization boundaries,
+    and only the text in between is normalized again.
+
+    The result is the same as `normalize(form, text[:start] + replacement
+    + text[end:])` provided `text` is in the normalization form `form`.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        text (str): The normalized Unicode string to edit.
+
+        start (int): The index where the edited range starts.
+
+        end (int): The index where the edited range ends.
+
+        replacement (str): The Unicode string replacing the edited range.
+
+    Returns:
+        tuple: The new normalized text, followed by the start and end indexes
+            of the range of the new text which was normalized again.
+
+    Raises:
+        ValueError: If the edited range is not within `text`.
+
+    Examples:
+
+        >>> renormalize_edit("NFC", "cafe noir", 4, 4, "\u0301")
+        ('café noir', 3, 4)
+
+        >>> renormalize_edit("NFC", "\uAC00 ", 1, 1, "\u11A8")
+        ('각 ', 0, 1)
+
+    """
+    if not 0 <= start <= end <= len(text):
+        raise ValueError(f"invalid edit range: {start}:{end}")
+
+    no_before, no_after = _boundary_sets(form)
+
+    if start and ord(text[start - 1]) not in no_after:
+        left = start
+    else:
+        left = _last_boundary(text, form, start - 1) if start else 0
+
+    if end < len(text) and ord(text[end]) not in no_before:
+        right = end
+    else:
+        right = _first_boundary(text, form, end + 1)
+
+    window = normalize(form, text[left:start] + replacement + text[end:right])
+
+    return (
+        "".join([text[:left], window, text[right:]]),
+        left,
+        left + len(window),
+    )
+
+
+class IncrementalNormalizer:
+    """Normalizer transforming a Unicode text received in chunks of arbitrary
+    size, such as from a network stream, into the normalization form `form`.
+
+    A character at the start of a chunk may change how the end of the chunk
+    before it is normalized, so each call to `feed()` holds back the text
+    after the last normalization boundary of the text received so far, and
+    returns everything before it, normalized. The text held back is only the
+    trailing run of characters which may still interact with what follows,
+    usually a single character. Call `flush()` at the end of the stream to
+    get the rest of the text.
+
+    The state of the normalizer can be saved as bytes with `snapshot()`, and
+    restored with `IncrementalNormalizer.restore()`, possibly in another
+    process, so that a stream can be suspended and resumed without reading
+    it again from the start.
+
+    The concatenation of all returned strings is the same as the whole text
+    transformed into the normalization form `form`.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+    Examples:
+
+        >>> nfc = IncrementalNormalizer("NFC")
+        >>> nfc.feed("cafe")
+        'caf'
+        >>> nfc.feed("\u0301 au la")
+        'é au l'
+        >>> nfc.feed("it")
+        'ai'
+        >>> nfc.flush()
+        't'
+
+        >>> nfc.feed("cafe")
+        'caf'
+        >>> state = nfc.snapshot()
+        >>> state
+        b'\\x01NFC\\x00e'
+        >>> IncrementalNormalizer.restore(state).feed("\\u0301.")
+        'é.'
+
+    """
+
+    def __init__(self, form):
+        self.form = form
+        self._func = _normalization_forms[form]
+        self._tail = ""  # unstable end of the text received so far
+
+    def feed(self, chunk):
+        """Add the Unicode string `chunk` to the text, and return the text
+        up to its last normalization boundary which was not returned yet,
+        normalized."""
+
+        text = self._tail + chunk if self._tail else chunk
+        i = _last_boundary(text, self.form)
+        self._tail = text[i:]
+
+        return self._func(text[:i]) if i else ""
+
+    def flush(self):
+        """Return the rest of the text, normalized, and reset the normalizer
+        for a new text."""
+
+        text, self._tail = self._tail, ""
+
+        return self._func(text) if text else ""
+
+    def snapshot(self):
+        """Return the state of the normalizer, that is, its normalization
+        form and the text held back, as bytes."""
+
+        return b"".join([
+            bytes([_SNAPSHOT_VERSION]),
+            self.form.encode("ascii"),
+            b"\x00",
+            self._tail.encode("utf-8"),
+        ])
+
+    @classmethod
+    def restore(cls, snapshot):
+        """Return a new normalizer in the state saved as `snapshot` by the
+        `snapshot()` method.
+
+        Raises:
+            ValueError: If `snapshot` is not a valid snapshot.
+        """
+
+        match = _SNAPSHOT_RE.fullmatch(snapshot)
+
+        if match is None or match[1].decode() not in _normalization_forms:
+            raise ValueError("invalid normalizer snapshot")
+
+        try:
+            tail = match[2].decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError("invalid normalizer snapshot") from None
+
+        normalizer = cls(match[1].decode())
+        normalizer._tail = tail
+
+        return normalizer
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.form!r})"
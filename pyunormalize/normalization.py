@@ -5,6 +5,8 @@ from pyunormalize._unicode import (
     _DECOMP_BY_CHARACTER,
     _NFC__QC_NO_OR_MAYBE,
     _NFD__QC_NO,
+    _NFKC_CF_BY_CHARACTER,
+    _NFKC_CF_QC_NO_OR_MAYBE,
     _NFKC_QC_NO_OR_MAYBE,
     _NFKD_QC_NO,
     _NON_ZERO_CCC_TABLE,
@@ -101,6 +103,94 @@ _populate_decomposition_dictionaries(_DECOMP_BY_CHARACTER)
 
 del _DECOMP_BY_CHARACTER
 
+# Dictionary mapping characters to the full canonical decompositions
+# of their NFKC_Casefold mappings, or to their full canonical decompositions
+# if they have no such mapping, not including Hangul syllables. Hangul
+# syllables found in mappings are kept as they are, which is equivalent for
+# canonical ordering and composition.
+_FULL_CFDECOMP_BY_CHAR = {}
+
+
+def _populate_casefold_dictionary(nfkc_cf_by_character):
+    # Populate dictionary with full canonical decompositions
+    # of NFKC_Casefold mappings.
+
+    _FULL_CFDECOMP_BY_CHAR.update(_FULL_CDECOMP_BY_CHAR)
+
+    for key, val in nfkc_cf_by_character.items():
+        tmp = []
+
+        for x in val:
+            tmp.extend(_FULL_CDECOMP_BY_CHAR.get(x, (x,)))
+
+        _FULL_CFDECOMP_BY_CHAR[key] = tmp
+
+
+# Populate NFKC_Casefold decomposition dictionary
+_populate_casefold_dictionary(_NFKC_CF_BY_CHARACTER)
+
+del _NFKC_CF_BY_CHARACTER
+
+# Set of characters which may combine with a following character
+# to form a primary composite, including Hangul leading consonants
+# and LV syllables
+_COMBINES_FORWARD = set()
+
+# Set of characters which may combine with a preceding character
+# to form a primary composite, including Hangul vowels and trailing
+# consonants
+_COMBINES_BACKWARD = set()
+
+
+def _populate_composition_sets(composite_by_cdecomp):
+    # Populate sets with characters taking part in canonical composition
+    # as the first or the second element of a pair.
+
+    for (x, y), composite in composite_by_cdecomp.items():
+        if composite not in _COMPOSITION_EXCLUSIONS:
+            _COMBINES_FORWARD.add(x)
+            _COMBINES_BACKWARD.add(y)
+
+    _COMBINES_FORWARD.update(range(_LB, _LL + 1))
+    _COMBINES_FORWARD.update(range(_SB, _SL + 1, _TCOUNT))
+    _COMBINES_BACKWARD.update(range(_VB, _VL + 1))
+    _COMBINES_BACKWARD.update(range(_TB, _TL + 1))
+
+
+# Populate composition sets
+_populate_composition_sets(_COMPOSITE_BY_CDECOMP)
+
+# Dictionary mapping characters to the non-zero canonical combining class
+# of the first character of their full canonical decomposition
+_FCD_LEAD_CCC = {}
+
+# Dictionary mapping characters to the non-zero canonical combining class
+# of the last character of their full canonical decomposition
+_FCD_TRAIL_CCC = {}
+
+
+def _populate_fcd_dictionaries(full_cdecomp_by_char):
+    # Populate dictionaries with the lead and trail canonical combining
+    # classes used by the FCD check, as described in UTN #5, "Canonical
+    # Equivalence in Applications."
+
+    for key, val in _NON_ZERO_CCC_TABLE.items():
+        _FCD_LEAD_CCC[key] = _FCD_TRAIL_CCC[key] = val
+
+    for key, val in full_cdecomp_by_char.items():
+        _FCD_LEAD_CCC.pop(key, None)
+        _FCD_TRAIL_CCC.pop(key, None)
+
+        if val[0] in _NON_ZERO_CCC_TABLE:
+            _FCD_LEAD_CCC[key] = _NON_ZERO_CCC_TABLE[val[0]]
+
+        if val[-1] in _NON_ZERO_CCC_TABLE:
+            _FCD_TRAIL_CCC[key] = _NON_ZERO_CCC_TABLE[val[-1]]
+
+
+# Populate FCD dictionaries
+_populate_fcd_dictionaries(_FULL_CDECOMP_BY_CHAR)
+
 
 #
 # Public interface
@@ -169,9 +259,7 @@ def NFC(unistr):
     else:
         return unistr
 
-    result = map(chr, _compose([*map(ord, NFD(unistr))]))
-
-    return "".join(result)
+    return _normalize_segments(unistr, "NFC")
 
 
 def NFD(unistr):
@@ -284,9 +372,7 @@ def NFKC(unistr):
     else:
         return unistr
 
-    result = map(chr, _compose([*map(ord, NFKD(unistr))]))
-
-    return "".join(result)
+    return _normalize_segments(unistr, "NFKC")
 
 
 def NFKD(unistr):
@@ -336,21 +422,166 @@ def NFKD(unistr):
     return "".join(result)
 
 
+def NFKC_CF(unistr):
+    """Return the NFKC_Casefold form of the original Unicode string `unistr`,
+    as defined by the NFKC_Casefold (NFKC_CF) property of the Unicode character
+    database. This function removes case distinctions, compatibility variants,
+    and default ignorable code points from the Unicode string, with the result
+    in the Unicode "normalization form C". It is meant for the comparison
+    of identifiers and for building search keys.
+
+    The transformation is performed in a single pass of decomposition, using
+    the NFKC_Casefold mappings, followed by canonical ordering and composition.
+    For performance optimization, the function verifies whether the input
+    string is already in NFKC_Casefold form. If it is, the original string
+    is returned directly to avoid unnecessary processing.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+    Returns:
+        str: The NFKC_Casefold normalized Unicode string.
+
+    Examples:
+
+        >>> NFKC_CF("Straße")
+        'strasse'
+
+        >>> NFKC_CF("ﬁ \u2460 \u212B")  # fi ligature + circled 1 + Angstrom
+        'fi 1 å'
+
+        >>> NFKC_CF("soft\u00ADhyphen")
+        'softhyphen'
+
+    """
+    prev_ccc = 0
+
+    for u in unistr:
+        u = ord(u)
+
+        if u in _NFKC_CF_QC_NO_OR_MAYBE:
+            break
+
+        if u not in _NON_ZERO_CCC_TABLE:
+            continue
+
+        curr_ccc = _NON_ZERO_CCC_TABLE[u]
+
+        if curr_ccc < prev_ccc:
+            break
+
+        prev_ccc = curr_ccc
+    else:
+        return unistr
+
+    return _normalize_segments(unistr, "NFKC_CF")
+
+
+def FCC(unistr):
+    """Return the "Fast C Contiguous" form of the original Unicode string
+    `unistr`, as described in UTN #5, "Canonical Equivalence in Applications."
+    This form is like the Unicode "normalization form C", except that
+    a combining mark only combines with a preceding starter when no other
+    character remains between them. Unlike NFC strings, FCC strings always
+    pass the FCD check.
+
+    For performance optimization, the function verifies whether the input
+    string is already in FCC. If it is, the original string is returned
+    directly to avoid unnecessary processing.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+    Returns:
+        str: The FCC normalized Unicode string.
+
+    Examples:
+
+        >>> unistr = "a\u0335\u0301"  # a + short stroke overlay + acute
+        >>> " ".join(f"{ord(x):04X}" for x in NFC(unistr))
+        '00E1 0335'
+        >>> " ".join(f"{ord(x):04X}" for x in FCC(unistr))
+        '0061 0335 0301'
+
+        >>> FCC("e\u0301") == NFC("e\u0301") == "\u00E9"
+        True
+
+    """
+    prev_ccc = 0
+
+    for u in unistr:
+        u = ord(u)
+
+        if u in _NFC__QC_NO_OR_MAYBE:
+            break
+
+        if u in _FCD_LEAD_CCC and _FCD_LEAD_CCC[u] < prev_ccc:
+            break
+
+        prev_ccc = _FCD_TRAIL_CCC.get(u, 0)
+    else:
+        return unistr
+
+    return _normalize_segments(unistr, "FCC")
+
+
+def is_FCD(unistr):
+    """Return True if the Unicode string `unistr` passes the FCD check, as
+    described in UTN #5, "Canonical Equivalence in Applications." A string
+    is FCD if its canonical decomposition, taken character by character, is
+    canonically ordered. Processes that are insensitive to the composition
+    of characters, such as collation, can then skip the NFD normalization.
+
+    Both NFD and FCC strings always pass the FCD check, while NFC strings
+    generally do, with rare exceptions.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+    Returns:
+        bool: True if the string is FCD.
+
+    Examples:
+
+        >>> is_FCD("\u00E9\u0323")  # e-acute + dot below
+        False
+        >>> is_FCD("\u1EB9\u0301")  # e-dot below + acute
+        True
+        >>> is_FCD("\u00E1\u0335")  # a-acute + short stroke overlay
+        False
+
+    """
+    prev_ccc = 0
+
+    for u in unistr:
+        u = ord(u)
+
+        if u in _FCD_LEAD_CCC and _FCD_LEAD_CCC[u] < prev_ccc:
+            return False
+
+        prev_ccc = _FCD_TRAIL_CCC.get(u, 0)
+
+    return True
+
+
 # Dictionary for normalization forms dispatch
 _normalization_forms = {
     "NFC": NFC,
     "NFD": NFD,
     "NFKC": NFKC,
     "NFKD": NFKD,
+    "FCC": FCC,
+    "NFKC_CF": NFKC_CF,
 }
 
 def normalize(form, unistr):
     """Transform the Unicode string `unistr` into the Unicode normalization
-    form `form`. Valid values for `form` are "NFC", "NFD", "NFKC", and "NFKD".
+    form `form`. Valid values for `form` are "NFC", "NFD", "NFKC", "NFKD",
+    "FCC", and "NFKC_CF".
 
     Args:
         form (str): The normalization form to apply, one of "NFC", "NFD",
-            "NFKC", or "NFKD".
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
 
         unistr (str): The input Unicode string to be normalized.
 
@@ -370,23 +601,396 @@ def normalize(form, unistr):
     return _normalization_forms[form](unistr)
 
 
+def has_boundary_before(cp, form):
+    """Return True if the character with code point `cp` has a normalization
+    boundary before it for the normalization form `form`, meaning that text can
+    be split just before this character without changing the result of the
+    normalization, whatever precedes it.
+
+    Args:
+        cp (int): The code point of the character.
+
+        form (str): The normalization form, one of "NFC", "NFD", "NFKC",
+            "NFKD", "FCC", or "NFKC_CF".
+
+    Returns:
+        bool: True if the character has a boundary before it.
+
+    Examples:
+
+        >>> has_boundary_before(ord("e"), "NFC")
+        True
+        >>> has_boundary_before(0x0301, "NFC")
+        False
+        >>> has_boundary_before(0x1161, "NFD")  # Hangul vowel
+        True
+        >>> has_boundary_before(0x1161, "NFC")
+        False
+
+    """
+    return cp not in _boundary_sets(form)[0]
+
+
+def has_boundary_after(cp, form):
+    """Return True if the character with code point `cp` has a normalization
+    boundary after it for the normalization form `form`, meaning that text can
+    be split just after this character without changing the result of the
+    normalization, whatever follows it.
+
+    Args:
+        cp (int): The code point of the character.
+
+        form (str): The normalization form, one of "NFC", "NFD", "NFKC",
+            "NFKD", "FCC", or "NFKC_CF".
+
+    Returns:
+        bool: True if the character has a boundary after it.
+
+    Examples:
+
+        >>> has_boundary_after(ord("e"), "NFD")
+        True
+        >>> has_boundary_after(ord("e"), "NFC")
+        False
+        >>> has_boundary_after(ord("1"), "NFC")
+        True
+
+    """
+    return cp not in _boundary_sets(form)[1]
+
+
+def iter_segments(unistr, form):
+    """Split the Unicode string `unistr` at normalization boundaries for the
+    normalization form `form`, and return an iterator over (start, end,
+    needs_work) tuples covering the whole string. Each span can be normalized
+    independently of its neighbors, so that the concatenation of the
+    normalized spans is the normalized string.
+
+    Consecutive segments passing the quick check are merged into a single
+    span with `needs_work` set to False, as normalization leaves them
+    unchanged. Every other segment is reported as a span of its own, with
+    `needs_work` set to True.
+
+    Args:
+        unistr (str): The input Unicode string.
+
+        form (str): The normalization form, one of "NFC", "NFD", "NFKC",
+            "NFKD", "FCC", or "NFKC_CF".
+
+    Yields:
+        tuple: The (start, end, needs_work) spans of `unistr`.
+
+    Examples:
+
+        >>> [*iter_segments("cafe\u0301 au lait", "NFC")]
+        [(0, 3, False), (3, 5, True), (5, 13, False)]
+
+        >>> [*iter_segments("ﬁﬁx", "NFKC")]
+        [(0, 1, True), (1, 2, True), (2, 3, False)]
+
+    """
+
+    yield from _iter_segments(map(ord, unistr), form)
+
+
 #
 # Internals
 #
 
-def _decompose(unistr, *, compatibility=False):
-    # Compute the full decomposition of the Unicode string based
+# Dictionary mapping normalization forms to the set of characters
+# for which the quick check answer is not "Yes"
+_QUICK_CHECK_BY_FORM = {
+    "NFC": _NFC__QC_NO_OR_MAYBE,
+    "NFD": _NFD__QC_NO,
+    "NFKC": _NFKC_QC_NO_OR_MAYBE,
+    "NFKD": _NFKD_QC_NO,
+    "FCC": _NFC__QC_NO_OR_MAYBE,
+    "NFKC_CF": _NFKC_CF_QC_NO_OR_MAYBE,
+}
+
+# Dictionary mapping normalization forms to the lead and trail canonical
+# combining class tables checked by the quick check, when these differ
+# from the canonical combining class of the characters themselves
+_QUICK_CHECK_CCC_BY_FORM = {
+    "FCC": (_FCD_LEAD_CCC, _FCD_TRAIL_CCC),
+}
+
+# Normalization forms which apply canonical composition
+_COMPOSED_FORMS = {"NFC", "NFKC", "FCC", "NFKC_CF"}
+
+# Normalization forms which apply compatibility decomposition
+_COMPATIBILITY_FORMS = {"NFKC", "NFKD"}
+
+# Dictionary mapping composed normalization forms to a cache of normalized
+# segments, keyed by the raw segment text. Segments needing normalization,
+# such as a base character with its combining marks, repeat heavily across
+# texts. Decomposed forms do not use it, as decomposition and reordering
+# of the whole string cost no more than splitting it into segments.
+_SEGMENT_CACHE = {form: {} for form in _COMPOSED_FORMS}
+
+# Maximum number of cached segments per normalization form
+_SEGMENT_CACHE_SIZE = 4096
+
+# Maximum length of cached segments
+_SEGMENT_CACHE_MAX_LEN = 32
+
+# Dictionaries mapping normalization forms to the set of characters
+# with no normalization boundary before them, and to the set
+# of characters with no normalization boundary after them. Both are
+# computed on first use.
+_NO_BOUNDARY_BEFORE = {}
+_NO_BOUNDARY_AFTER = {}
+
+
+def _boundary_sets(form):
+    # Return the sets of characters with no normalization boundary before
+    # and after them for the given normalization form, so that boundary
+    # lookups take constant time. Text can be split between two characters
+    # without changing its normalization whenever the first has a boundary
+    # after it or the second has a boundary before it. Characters found
+    # in neither set have both boundaries.
+
+    if form in _NO_BOUNDARY_BEFORE:
+        return _NO_BOUNDARY_BEFORE[form], _NO_BOUNDARY_AFTER[form]
+
+    qc = _QUICK_CHECK_BY_FORM[form]
+    composed = form in _COMPOSED_FORMS
+    compatibility = form in _COMPATIBILITY_FORMS
+    casefold = form == "NFKC_CF"
+
+    if casefold:
+        decomp = _FULL_CFDECOMP_BY_CHAR
+    elif compatibility:
+        decomp = _FULL_KDECOMP_BY_CHAR
+    else:
+        decomp = _FULL_CDECOMP_BY_CHAR
+
+    no_before = set()
+    no_after = set()
+
+    candidates = set(decomp)
+    candidates.update(_NON_ZERO_CCC_TABLE, qc)
+    candidates.update(_COMBINES_FORWARD, _COMBINES_BACKWARD)
+
+    contiguous = form == "FCC"
+
+    for u in candidates:
+        elements = _reorder(
+            _decompose(chr(u), compatibility=compatibility, casefold=casefold)
+        )
+
+        if not elements:
+            # Characters removed by the mapping let the characters on both
+            # sides interact
+            no_before.add(u)
+            no_after.add(u)
+            continue
+
+        if casefold:
+            # The text is reordered before the NFKC_Casefold mappings apply,
+            # so the canonical decomposition decides which characters are
+            # reordered, even if they map to starters, like U+0345
+            canonical = _reorder(_decompose(chr(u)))
+            if canonical[0] in _NON_ZERO_CCC_TABLE:
+                no_before.add(u)
+            if canonical[-1] in _NON_ZERO_CCC_TABLE:
+                no_after.add(u)
+
+        first = elements[0]
+        last = elements[-1]
+
+        if (first in _NON_ZERO_CCC_TABLE
+                or composed and first in _COMBINES_BACKWARD):
+            no_before.add(u)
+
+        if last in _NON_ZERO_CCC_TABLE:
+            no_after.add(u)
+        elif composed:
+            # A preceding character may take up the first element,
+            # exposing the last one to composition with what follows
+            if first not in _COMBINES_BACKWARD:
+                last = _compose(elements, contiguous=contiguous)[-1]
+            if last in _COMBINES_FORWARD or last in _COMBINES_BACKWARD:
+                no_after.add(u)
+
+    _NO_BOUNDARY_BEFORE[form] = no_before
+    _NO_BOUNDARY_AFTER[form] = no_after
+
+    return no_before, no_after
+
+
+def _first_boundary(unistr, form, start=0):
+    # Return the lowest index, not lower than `start`, where the Unicode
+    # string can be split at a normalization boundary, or the length of
+    # the string if there is no such index. Whatever precedes the string,
+    # index 0 is a boundary only if the first character has a boundary
+    # before it.
+
+    no_before, no_after = _boundary_sets(form)
+
+    for i in range(start, len(unistr)):
+        if (ord(unistr[i]) not in no_before
+                or i and ord(unistr[i - 1]) not in no_after):
+            return i
+
+    return len(unistr)
+
+
+def _last_boundary(unistr, form, end=None):
+    # Return the highest index, not higher than `end`, where the Unicode
+    # string can be split at a normalization boundary, or 0 if there is
+    # no such index. Whatever follows the string, the end of the string
+    # is a boundary only if the last character has a boundary after it.
+
+    no_before, no_after = _boundary_sets(form)
+    n = len(unistr)
+
+    for i in range(n if end is None else end, 0, -1):
+        if (i < n and ord(unistr[i]) not in no_before
+                or ord(unistr[i - 1]) not in no_after):
+            return i
+
+    return 0
+
+
+def _iter_segments(codepoints, form):
+    # Split the sequence of code points at normalization boundaries for
+    # the given normalization form, as described for `iter_segments()`.
+
+    qc = _QUICK_CHECK_BY_FORM[form]
+    no_before, no_after = _boundary_sets(form)
+    lead_ccc, trail_ccc = _QUICK_CHECK_CCC_BY_FORM.get(
+        form, (_NON_ZERO_CCC_TABLE, _NON_ZERO_CCC_TABLE)
+    )
+
+    clean_start = seg_start = 0
+    needs_work = False
+    prev = None
+    prev_ccc = 0
+    i = -1
+
+    for i, u in enumerate(codepoints):
+        if i and (u not in no_before or prev not in no_after):
+            if needs_work:
+                if clean_start < seg_start:
+                    yield clean_start, seg_start, False
+                yield seg_start, i, True
+                clean_start = i
+                needs_work = False
+            seg_start = i
+
+        if u in qc or u in lead_ccc and lead_ccc[u] < prev_ccc:
+            needs_work = True
+
+        prev_ccc = trail_ccc.get(u, 0)
+
+        prev = u
+
+    n = i + 1
+
+    if needs_work:
+        if clean_start < seg_start:
+            yield clean_start, seg_start, False
+        yield seg_start, n, True
+    elif clean_start < n:
+        yield clean_start, n, False
+
+
+def _normalize_segments(unistr, form):
+    # Normalize the Unicode string into the composed normalization form
+    # segment by segment, copying segments that pass the quick check and
+    # looking up the others in the segment cache. Decomposition, reordering,
+    # and composition only run on cache misses. The cache is shared between
+    # threads, so each of its operations must be atomic on its own.
+
+    cache = _SEGMENT_CACHE[form]
+    result = []
+
+    for start, end, needs_work in iter_segments(unistr, form):
+        segment = unistr[start:end]
+
+        if needs_work:
+            try:
+                segment = cache[segment]
+            except KeyError:
+                normalized = _normalize_segment(segment, form)
+
+                if end - start <= _SEGMENT_CACHE_MAX_LEN:
+                    if len(cache) >= _SEGMENT_CACHE_SIZE:
+                        # Evict the oldest entry. Another thread may evict
+                        # it first, or change the cache while it is found.
+                        try:
+                            cache.pop(next(iter(cache), None), None)
+                        except RuntimeError:
+                            pass
+                    cache[segment] = normalized
+
+                segment = normalized
+
+        result.append(segment)
+
+    return "".join(result)
+
+
+def _normalize_segment(unistr, form):
+    # Normalize the Unicode string by full decomposition, canonical
+    # reordering, and, for composed forms, canonical composition.
+
+    return "".join(map(chr, _normalize_codepoints(map(ord, unistr), form)))
+
+
+def _normalize_codepoints(codepoints, form):
+    # Normalize the sequence of code points by full decomposition, canonical
+    # reordering, and, for composed forms, canonical composition, and return
+    # the list of resulting code points.
+
+    if form == "NFKC_CF":
+        # The NFKC_Casefold mappings apply to the canonical decomposition,
+        # in canonical order, as some of them change the combining class
+        # of a character, like U+0345 COMBINING GREEK YPOGEGRAMMENI.
+        elements = _reorder(_decompose_codepoints(
+            _reorder(_decompose_codepoints(codepoints)),
+            casefold=True,
+        ))
+    else:
+        elements = _reorder(_decompose_codepoints(
+            codepoints,
+            compatibility=form in _COMPATIBILITY_FORMS,
+        ))
+
+    if form in _COMPOSED_FORMS:
+        elements = _compose(elements, contiguous=form == "FCC")
+
+    return elements
+
+
+def _decompose(unistr, *, compatibility=False, casefold=False):
+    # Compute the full decomposition of the Unicode string, as a list
+    # of code points.
+
+    return _decompose_codepoints(
+        map(ord, unistr), compatibility=compatibility, casefold=casefold
+    )
+
+
+def _decompose_codepoints(codepoints, *, compatibility=False, casefold=False):
+    # Compute the full decomposition of the sequence of code points based
     # on the specified normalization form. The type of full decomposition
     # chosen depends on which Unicode normalization form is involved. For NFC
     # or NFD, it performs a full canonical decomposition. For NFKC or NFKD,
-    # it performs a full compatibility decomposition.
+    # it performs a full compatibility decomposition. For NFKC_CF, it performs
+    # the full canonical decomposition of the NFKC_Casefold mappings.
 
     result = []
-    decomp = _FULL_KDECOMP_BY_CHAR if compatibility else _FULL_CDECOMP_BY_CHAR
 
-    for u in unistr:
-        u = ord(u)
+    if casefold:
+        decomp = _FULL_CFDECOMP_BY_CHAR
+    elif compatibility:
+        decomp = _FULL_KDECOMP_BY_CHAR
+    else:
+        decomp = _FULL_CDECOMP_BY_CHAR
 
+    for u in codepoints:
         if u in decomp:
             result.extend(decomp[u])
         elif _SB <= u <= _SL:
@@ -454,10 +1058,12 @@ def _reorder(elements):
     return elements
 
 
-def _compose(elements):
+def _compose(elements, *, contiguous=False):
     # Canonical composition algorithm to transform a fully decomposed
     # and canonically ordered string into its most fully composed but still
-    # canonically equivalent sequence.
+    # canonically equivalent sequence. If `contiguous` is true, as for the
+    # FCC form, a character only combines with the preceding starter when
+    # every character in between has been combined with it.
 
     for i, x in enumerate(elements):
         if x is None or x in _NON_ZERO_CCC_TABLE:
@@ -489,7 +1095,7 @@ def _compose(elements):
                     precomp = _compose_hangul_syllable(*pair)
 
                 if precomp is None or precomp in _COMPOSITION_EXCLUSIONS:
-                    if blocked:
+                    if blocked or contiguous:
                         break
                 else:
                     elements[i] = x = precomp
@@ -500,6 +1106,9 @@ def _compose(elements):
                     else:
                         last_cc = False
 
+            elif contiguous:
+                break
+
     return [*filter(None, elements)]
 
 
@@ -0,0 +1,153 @@
+"""Normalization-aware substring search."""
+
+from bisect import bisect_right
+
+from pyunormalize.normalization import iter_segments, normalize
+
+__all__ = [
+    "find_normalized",
+    "finditer_normalized",
+]
+
+# Minimum amount of normalized text accumulated before searching it
+_SEARCH_CHUNK_SIZE = 4096
+
+
+def find_normalized(haystack, needle, form):
+    """Return the lowest index in the Unicode string `haystack` where the
+    normalization form `form` of `needle` is found within the normalization
+    form `form` of `haystack`, or -1 if it is not found. The haystack is
+    normalized lazily, and the search stops at the first match.
+
+    Indexes refer to the original, unnormalized haystack. When a match starts
+    in the middle of text changed by normalization, the index of the start of
+    the changed segment is returned.
+
+    Args:
+        haystack (str): The Unicode string to search in.
+
+        needle (str): The Unicode string to search for.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+    Returns:
+        int: The index of the first match in `haystack`, or -1.
+
+    Examples:
+
+        >>> find_normalized("Le ﬁnal", "final", "NFKC")
+        3
+
+        >>> find_normalized("Le ﬁnal", "final", "NFC")
+        -1
+
+    """
+    for start, _ in finditer_normalized(haystack, needle, form):
+        return start
+
+    return -1
+
+
+def finditer_normalized(haystack, needle, form):
+    """Return an iterator over all non-overlapping matches of the normalization
+    form `form` of `needle` within the normalization form `form` of the Unicode
+    string `haystack`. Each match is reported as a (start, end) tuple of
+    indexes into the original, unnormalized haystack.
+
+    The haystack is normalized lazily, segment by segment. Segments passing
+    the quick check are searched as they are, without being normalized.
+    When a match starts or ends in the middle of text changed by normalization,
+    it is widened to the boundaries of the changed segment.
+
+    Args:
+        haystack (str): The Unicode string to search in.
+
+        needle (str): The Unicode string to search for.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+    Yields:
+        tuple: The (start, end) span of each match in `haystack`.
+
+    Examples:
+
+        >>> s = "ﬁle, file, ﬁle"
+        >>> [*finditer_normalized(s, "file", "NFKC")]
+        [(0, 3), (5, 9), (11, 14)]
+
+        >>> s = "cafe\\u0301 café"
+        >>> [*finditer_normalized(s, "café", "NFC")]
+        [(0, 5), (6, 10)]
+
+    """
+    needle = normalize(form, needle)
+    size = len(needle)
+
+    if not size:
+        yield 0, 0
+        return
+
+    buf = ""     # window of normalized text being searched
+    base = 0     # offset of the window within the normalized haystack
+    pos = 0      # offset where the search resumes
+    total = 0    # length of the normalized haystack produced so far
+    starts = []  # offset of each piece within the normalized haystack
+    pieces = []  # (start, end, unchanged) spans of each piece in `haystack`
+    pending = []
+
+    def to_index(offset, end=False):
+        # Map an offset in the normalized haystack to an index
+        # in the original haystack.
+
+        i = bisect_right(starts, offset - 1 if end else offset) - 1
+        start, stop, unchanged = pieces[i]
+
+        if unchanged:
+            return start + offset - starts[i]
+
+        return stop if end else start
+
+    segments = iter_segments(haystack, form)
+    exhausted = False
+
+    while not exhausted:
+        for start, end, needs_work in segments:
+            chunk = haystack[start:end]
+
+            if needs_work:
+                chunk = normalize(form, chunk)
+                if not chunk:
+                    continue
+
+            starts.append(total)
+            pieces.append((start, end, not needs_work))
+            pending.append(chunk)
+            total += len(chunk)
+
+            if total - base >= _SEARCH_CHUNK_SIZE:
+                break
+        else:
+            exhausted = True
+
+        buf = "".join([buf, *pending])
+        pending.clear()
+
+        i = buf.find(needle, pos - base)
+
+        while i >= 0:
+            pos = base + i
+            yield to_index(pos), to_index(pos + size, end=True)
+            pos += size
+            i = buf.find(needle, pos - base)
+
+        # Keep enough text for a match straddling the next pieces
+        keep = max(pos, total - size + 1)
+        buf = buf[keep - base :]
+        base = pos = keep
+
+        i = bisect_right(starts, base) - 1
+        if i > 0:
+            del starts[:i]
+            del pieces[:i]
@@ -0,0 +1,280 @@
+"""Normalization of Unicode text streams."""
+
+import io
+
+from pyunormalize.incremental import IncrementalNormalizer
+
+__all__ = [
+    "NormalizingReader",
+    "NormalizingWriter",
+]
+
+# Default number of characters read from or written to the wrapped streams
+# at once
+_DEFAULT_BUFFER_SIZE = 1 << 16
+
+
+class NormalizingReader(io.TextIOBase):
+    """Text stream reading the Unicode text from the text stream `stream`,
+    transformed into the normalization form `form`, with `read()`,
+    `readline()`, or iteration over its lines.
+
+    The text is read from `stream` in chunks of `buffer_size` characters, or
+    line by line, up to `buffer_size` characters at a time, by `readline()`
+    and iteration, so that lines from pipes and terminals are returned as
+    soon as they are available. The text is normalized incrementally: the
+    text after the last normalization boundary of each chunk is held back
+    until the next chunk is read, so the result is the same as if the whole
+    text were normalized at once, while only a chunk at a time is kept in
+    memory.
+
+    Closing the reader closes `stream`, unless it has been detached.
+
+    Args:
+        stream (io.TextIOBase): The text stream to read from, such as
+            `sys.stdin` or a file opened in text mode.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        buffer_size (int): The number of characters read from `stream`
+            at once.
+
+    Examples:
+
+        >>> import io
+        >>> reader = NormalizingReader(io.StringIO("cafe\\u0301\\nte\\u0301"))
+        >>> [*reader]
+        ['café\\n', 'té']
+
+    """
+
+    def __init__(self, stream, form="NFC", buffer_size=_DEFAULT_BUFFER_SIZE):
+        self._stream = stream
+        self._normalizer = IncrementalNormalizer(form)
+        self.buffer_size = buffer_size
+
+        self._buffer = ""  # normalized text
+        self._pos = 0      # index of the first character not read yet
+        self._eof = False
+
+    @property
+    def form(self):
+        return self._normalizer.form
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        """Read and return at most `size` characters of normalized text,
+        or all the rest of the text if `size` is negative or None."""
+
+        self._checkClosed()
+
+        if size is None:
+            size = -1
+
+        parts = []
+
+        while size:
+            if self._pos == len(self._buffer) and not self._fill():
+                break
+
+            end = len(self._buffer) if size < 0 else self._pos + size
+            chunk = self._buffer[self._pos : end]
+            self._pos += len(chunk)
+            parts.append(chunk)
+
+            if size > 0:
+                size -= len(chunk)
+
+        return "".join(parts)
+
+    def readline(self, size=-1):
+        """Read and return the next line of normalized text, ending with
+        "\\n" unless it is the last one, or at most `size` characters of it,
+        if `size` is not negative."""
+
+        self._checkClosed()
+
+        if size is None:
+            size = -1
+
+        parts = []
+
+        while size:
+            if self._pos == len(self._buffer) and not self._fill(line=True):
+                break
+
+            end = self._buffer.find("\n", self._pos) + 1 or len(self._buffer)
+            if size > 0:
+                end = min(end, self._pos + size)
+                size -= end - self._pos
+
+            parts.append(self._buffer[self._pos : end])
+            self._pos = end
+
+            if parts[-1].endswith("\n"):
+                break
+
+        return "".join(parts)
+
+    def detach(self):
+        """Separate the reader from the wrapped stream, and return the
+        stream. The reader is unusable afterwards. Text already read from
+        the stream, but not from the reader, is lost."""
+
+        self._checkClosed()
+
+        stream = self._stream
+        super().close()
+        self._stream = None
+
+        return stream
+
+    def close(self):
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                self._stream.close()
+
+    def _fill(self, line=False):
+        # Replace the buffer, which must have been read entirely, with the
+        # next normalized text, and return whether there is any text left.
+        # If `line` is true, the text is read line by line, so that reading
+        # a line from a pipe or a terminal does not wait for the next ones.
+
+        while not self._eof:
+            if line:
+                chunk = self._stream.readline(self.buffer_size)
+            else:
+                chunk = self._stream.read(self.buffer_size)
+
+            if chunk:
+                text = self._normalizer.feed(chunk)
+            else:
+                text = self._normalizer.flush()
+                self._eof = True
+
+            if text:
+                self._buffer = text
+                self._pos = 0
+                return True
+
+        return False
+
+
+class NormalizingWriter(io.TextIOBase):
+    """Text stream writing the Unicode text passed to `write()` into the text
+    stream `stream`, transformed into the normalization form `form`.
+
+    The text is normalized incrementally: the text after the last
+    normalization boundary of the text written so far is held back until
+    more text is written, or until the writer is closed or detached, so the
+    result is the same as if the whole text were normalized at once. The
+    normalized text is written to `stream` in chunks of at least
+    `buffer_size` characters, or when the writer is flushed.
+
+    Closing the writer closes `stream`, unless it has been detached.
+
+    Args:
+        stream (io.TextIOBase): The text stream to write to, such as
+            `sys.stdout` or a file opened in text mode.
+
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        buffer_size (int): The minimum number of characters written to
+            `stream` at once, unless flushed.
+
+    Examples:
+
+        >>> import io
+        >>> writer = NormalizingWriter(io.StringIO(), "NFD")
+        >>> writer.write("caf\\u00E9")
+        4
+        >>> stream = writer.detach()
+        >>> stream.getvalue() == "cafe\\u0301"
+        True
+
+    """
+
+    def __init__(self, stream, form="NFC", buffer_size=_DEFAULT_BUFFER_SIZE):
+        self._stream = stream
+        self._normalizer = IncrementalNormalizer(form)
+        self.buffer_size = buffer_size
+
+        self._pending = []      # normalized text not written yet
+        self._pending_len = 0   # number of characters in `_pending`
+
+    @property
+    def form(self):
+        return self._normalizer.form
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        """Write the Unicode string `s`, and return its length."""
+
+        self._checkClosed()
+
+        text = self._normalizer.feed(s)
+
+        if text:
+            self._pending.append(text)
+            self._pending_len += len(text)
+
+            if self._pending_len >= self.buffer_size:
+                self._write_pending()
+
+        return len(s)
+
+    def flush(self):
+        """Write the normalized text to the wrapped stream, and flush it.
+        The text held back, which may still change, is not written."""
+
+        self._checkClosed()
+        self._write_pending()
+        self._stream.flush()
+
+    def detach(self):
+        """Write all the text to the wrapped stream, and flush it. Then,
+        separate the writer from the stream, and return the stream. The
+        writer is unusable afterwards."""
+
+        self._checkClosed()
+        self._write_held_back()
+
+        stream = self._stream
+        super().close()
+        self._stream = None
+
+        return stream
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._write_held_back()
+                super().close()
+            finally:
+                self._stream.close()
+
+    def _write_held_back(self):
+        # Normalize the text held back, and write it with the rest.
+
+        text = self._normalizer.flush()
+
+        if text:
+            self._pending.append(text)
+
+        self.flush()
+
+    def _write_pending(self):
+        # Write the normalized text to the wrapped stream.
+
+        if self._pending:
+            self._stream.write("".join(self._pending))
+            self._pending.clear()
+            self._pending_len = 0
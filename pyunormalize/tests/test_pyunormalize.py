@@ -1,20 +1,98 @@
 """Unit tests for pyunormalize."""
 
+import codecs
+import io
+import os
+import sys
+import tempfile
+import threading
 import unittest
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 from pyunormalize.normalization import _decompose, _reorder, _compose
+from pyunormalize.normalization import _NON_ZERO_CCC_TABLE
+from pyunormalize.normalization import (
+    _SEGMENT_CACHE,
+    _SEGMENT_CACHE_MAX_LEN,
+    _SEGMENT_CACHE_SIZE,
+    _normalize_segment,
+)
 from pyunormalize import (
+    FCC,
+    IncrementalNormalizer,
+    InterningNormalizer,
     NFC,
     NFD,
     NFKC,
+    NFKC_CF,
     NFKD,
+    NormalizedDict,
+    NormalizedSet,
+    NormalizingReader,
+    NormalizingWriter,
+    cached,
+    canonical_caseless_key,
+    compatibility_caseless_key,
+    concat_normalized,
+    dedupe,
+    find_normalized,
+    finditer_normalized,
+    group_equivalent,
+    has_boundary_after,
+    has_boundary_before,
+    is_FCD,
+    iter_segments,
     normalize,
+    normalize_array,
+    normalize_codepoints,
+    normalize_column,
+    normalize_file,
+    normalize_identifiers,
+    normalize_many,
+    normalize_utf8,
+    quick_check_many,
+    register_codecs,
+    renormalize_edit,
+    strip_marks,
     UNICODE_VERSION as _UNICODE_VERSION,
 )
 
 UNICODE_VERSION = "16.0.0"
 
 
+def run_threads(target, n=8):
+    # Call the function with each of the arguments 1 to n in its own thread,
+    # switching threads as often as possible, and return the exceptions
+    # raised in the threads.
+
+    errors = []
+
+    def run(arg):
+        try:
+            target(arg)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(1, n + 1)]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    return errors
+
+
 class Misc(unittest.TestCase):
 
     def test_UNICODE_VERSION(self):
@@ -40,6 +118,70 @@ class Misc(unittest.TestCase):
                 normalize("NFKD", s) == NFKD(s)
             )
 
+    def test_FCC(self):
+        # a + short stroke overlay + acute
+        s = "a\u0335\u0301"
+        self.assertEqual(NFC(s), "\u00E1\u0335")
+        self.assertEqual(FCC(s), s)
+        self.assertEqual(FCC("\u00E1\u0335"), s)
+        self.assertEqual(normalize("FCC", s), s)
+
+        # Long s + dot above + dot below
+        s = "\u017F\u0307\u0323"
+        self.assertEqual(NFC(s), "\u1E9B\u0323")
+        self.assertEqual(FCC(s), "\u017F\u0323\u0307")
+
+        # Contiguous compositions are the same as in NFC
+        for s in ["e\u0301", "\u1100\u1161\u11A8", "a\u0328\u0302\u0301",
+                  "\u1E0B\u0323", "ﬃ"]:
+            self.assertEqual(FCC(s), NFC(s))
+
+    def test_NFKC_CF(self):
+        self.assertEqual(NFKC_CF("Straße"), "strasse")
+        self.assertEqual(NFKC_CF("ﬁ \u2460 \u212B"), "fi 1 \u00E5")
+        self.assertEqual(NFKC_CF("\u0130"), "i\u0307")
+        self.assertEqual(normalize("NFKC_CF", "ǅ"), "dž")
+
+        # Default ignorable code points are removed
+        self.assertEqual(NFKC_CF("soft\u00ADhyphen"), "softhyphen")
+        self.assertEqual(NFKC_CF("e\u200B\u0301"), "\u00E9")
+
+        # U+0345 COMBINING GREEK YPOGEGRAMMENI is mapped after canonical
+        # reordering, so canonically equivalent strings are folded alike
+        self.assertEqual(NFKC_CF("\u1FB3"), "\u03B1\u03B9")
+        self.assertEqual(NFKC_CF("\u1FB4"), "\u03AC\u03B9")
+        self.assertEqual(NFKC_CF("\u03B1\u0345\u0301"), "\u03AC\u03B9")
+        self.assertEqual(NFKC_CF("A\u0345\u0301"), "\u00E1\u03B9")
+        self.assertEqual(NFKC_CF("x\u0345\u0316y"), "x\u0316\u03B9y")
+        for s in ["\u03B1\u0345\u0301", "\u1FB4", "A\u0345\u0301"]:
+            self.assertEqual(NFKC_CF(s), NFKC_CF(NFD(s)))
+
+        # Hangul syllables in mappings
+        self.assertEqual(NFKC_CF("\u320E\u11A8"), "(\uAC00)\u11A8")
+        self.assertEqual(NFKC_CF("\u3200"), "(\u1100)")
+
+        # Already folded strings are returned as they are
+        s = "already folded"
+        self.assertIs(NFKC_CF(s), s)
+
+        for s in ["ABC", "\u03D3", "\u1E9B\u0323", "ﬃ", "Å"]:
+            self.assertEqual(NFKC_CF(s), NFKC(NFKC(s).casefold()))
+
+    def test_is_FCD(self):
+        self.assertTrue(is_FCD(""))
+        self.assertTrue(is_FCD("abc"))
+        self.assertTrue(is_FCD("\u1EB9\u0301"))
+        self.assertFalse(is_FCD("\u00E9\u0323"))
+        self.assertFalse(is_FCD("a\u0301\u0323"))
+
+        # U+0344 COMBINING GREEK DIALYTIKA TONOS
+        self.assertTrue(is_FCD("\u0308\u0344"))
+        self.assertFalse(is_FCD("\u0344\u0323"))
+
+        for s in ["\u00E9\u0323", "a\u0335\u0301", "\u0F73\u0F71"]:
+            self.assertTrue(is_FCD(NFD(s)))
+            self.assertTrue(is_FCD(FCC(s)))
+
     def test_internals(self):
 
         self.assertEqual(
@@ -120,6 +262,1005 @@ class Misc(unittest.TestCase):
             [0x017A, 0x0335, 0x0327, 0x0324]
         )
 
+    def test_segment_cache(self):
+        cache = _SEGMENT_CACHE["NFC"]
+        cache.clear()
+
+        self.assertEqual(NFC("e\u0301 e\u0301 1"), "\u00E9 \u00E9 1")
+        self.assertEqual(cache, {"e\u0301": "\u00E9"})
+
+        # Cached segments are reused
+        cache["e\u0301"] = "cached"
+        self.assertEqual(NFC("be\u0301"), "bcached")
+        cache.clear()
+
+        # Long segments are not cached
+        NFC("a" + "\u0301" * (_SEGMENT_CACHE_MAX_LEN + 1))
+        self.assertEqual(len(cache), 0)
+
+        for i in range(_SEGMENT_CACHE_SIZE + 10):
+            NFC("\u0300" + chr(0x0300 + i // 100) + chr(0x0300 + i % 100))
+        self.assertEqual(len(cache), _SEGMENT_CACHE_SIZE)
+        cache.clear()
+
+    def test_segment_cache_threads(self):
+        # Threads evicting from the shared segment cache at the same time
+        marks = [chr(u) for u in range(0x0300, 0x0370)]
+
+        def work(seed):
+            for i in range(20000):
+                s = "abcdefghij"[i % 10] + marks[(i * seed) % 112] \
+                    + marks[(i * 7 + seed) % 112]
+                self.assertEqual(NFC(s), _normalize_segment(s, "NFC"))
+
+        self.assertEqual(run_threads(work), [])
+        self.assertLessEqual(len(_SEGMENT_CACHE["NFC"]), _SEGMENT_CACHE_SIZE)
+
+
+class Boundaries(unittest.TestCase):
+
+    def test_has_boundary(self):
+        forms = ["NFC", "NFD", "NFKC", "NFKD"]
+
+        # Starters not taking part in composition
+        for form in forms:
+            self.assertTrue(has_boundary_before(0x0031, form))
+            self.assertTrue(has_boundary_after(0x0031, form))
+
+        # Combining marks
+        for form in forms:
+            self.assertFalse(has_boundary_before(0x0301, form))
+            self.assertFalse(has_boundary_after(0x0301, form))
+
+        # Starters which combine with a following character
+        self.assertTrue(has_boundary_after(0x0065, "NFD"))
+        self.assertFalse(has_boundary_after(0x0065, "NFC"))
+        self.assertFalse(has_boundary_after(0x1100, "NFC"))
+        self.assertFalse(has_boundary_after(0xAC00, "NFC"))
+        self.assertTrue(has_boundary_after(0xAC01, "NFC"))
+
+        # Starters which combine with a preceding character
+        self.assertTrue(has_boundary_before(0x1161, "NFD"))
+        self.assertFalse(has_boundary_before(0x1161, "NFC"))
+
+        # Characters whose decomposition ends with a combining mark
+        self.assertFalse(has_boundary_after(0x00E9, "NFD"))
+        self.assertFalse(has_boundary_after(0x00E9, "NFC"))
+
+        with self.assertRaises(KeyError):
+            has_boundary_before(0x0031, "NFX")
+
+    def test_iter_segments(self):
+        self.assertEqual(
+            [*iter_segments("cafe\u0301 au lait", "NFC")],
+            [(0, 3, False), (3, 5, True), (5, 13, False)]
+        )
+        self.assertEqual(
+            [*iter_segments("cafe\u0301 au lait", "NFD")],
+            [(0, 13, False)]
+        )
+        self.assertEqual(
+            [*iter_segments("ﬁﬁx", "NFKC")],
+            [(0, 1, True), (1, 2, True), (2, 3, False)]
+        )
+        self.assertEqual([*iter_segments("", "NFC")], [])
+
+        s = "\u1E0B\u0323x\u1100\u1161\u11A8 \u0307\u0323ﬃ\u00C5"
+        for form in ["NFC", "NFD", "NFKC", "NFKD"]:
+            spans = [*iter_segments(s, form)]
+            self.assertEqual(
+                "".join(
+                    normalize(form, s[start:end]) if needs_work
+                    else s[start:end]
+                    for start, end, needs_work in spans
+                ),
+                normalize(form, s)
+            )
+
+
+class Search(unittest.TestCase):
+
+    def test_find_normalized(self):
+        self.assertEqual(find_normalized("Le ﬁnal", "final", "NFKC"), 3)
+        self.assertEqual(find_normalized("Le ﬁnal", "final", "NFC"), -1)
+        self.assertEqual(find_normalized("abc", "", "NFC"), 0)
+
+        # The needle is normalized too
+        self.assertEqual(find_normalized("x\u00E9", "e\u0301", "NFC"), 1)
+        self.assertEqual(find_normalized("x\u00E9", "e", "NFD"), 1)
+
+    def test_finditer_normalized(self):
+        s = "ﬁle, file, ﬁle"
+        self.assertEqual(
+            [*finditer_normalized(s, "file", "NFKC")],
+            [(0, 3), (5, 9), (11, 14)]
+        )
+
+        # Matches inside a changed segment are widened to the segment
+        s = "xﬃx"
+        self.assertEqual(
+            [*finditer_normalized(s, "fi", "NFKC")],
+            [(1, 2)]
+        )
+
+        # Matches straddling the internal search chunks
+        for form in ["NFC", "NFD", "NFKC", "NFKD"]:
+            s = "e\u0301 ﬁ 한 " * 2000
+            spans = [*finditer_normalized(s, "한 e", form)]
+            self.assertEqual(
+                len(spans),
+                normalize(form, s).count(normalize(form, "한 e"))
+            )
+            for start, end in spans:
+                self.assertTrue(s[start:end].startswith("한 e"))
+
+
+class Incremental(unittest.TestCase):
+
+    def test_concat_normalized(self):
+        self.assertEqual(
+            concat_normalized("NFC", "cafe", "\u0301", " au lait"),
+            "caf\u00E9 au lait"
+        )
+
+        # Hangul syllable composed across three parts
+        self.assertEqual(
+            concat_normalized("NFC", "\u1100", "\u1161", "\u11A8"),
+            "\uAC01"
+        )
+
+        # Combining marks reordered across parts
+        self.assertEqual(
+            concat_normalized("NFD", "a\u0301", "\u0323"),
+            "a\u0323\u0301"
+        )
+
+        self.assertEqual(concat_normalized("NFKC"), "")
+        self.assertEqual(concat_normalized("NFKC", "", "ab", ""), "ab")
+
+        parts = ["\u1E0B", "\u0323", "x", "", "\u0307\u0323", "e"]
+        for form in ["NFC", "NFD", "NFKC", "NFKD"]:
+            nf = [normalize(form, x) for x in parts]
+            self.assertEqual(
+                concat_normalized(form, *nf),
+                normalize(form, "".join(nf))
+            )
+
+    def test_incremental_normalizer(self):
+        nfc = IncrementalNormalizer("NFC")
+        self.assertEqual(nfc.feed("cafe"), "caf")
+        self.assertEqual(nfc.feed("\u0301"), "")
+        self.assertEqual(nfc.feed("s"), "\u00E9")
+        self.assertEqual(nfc.flush(), "s")
+        self.assertEqual(nfc.flush(), "")
+
+        # Hangul syllable composed across chunks
+        self.assertEqual(
+            [nfc.feed("\u1100"), nfc.feed("\u1161"), nfc.feed("\u11A8"),
+             nfc.flush()],
+            ["", "", "", "\uAC01"]
+        )
+
+        text = "\u1E0B\u0323x\u0307\u0323e\uFB01\u0345\uFF9E" * 3
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            for size in [1, 2, 5]:
+                normalizer = IncrementalNormalizer(form)
+                result = [
+                    normalizer.feed(text[i : i + size])
+                    for i in range(0, len(text), size)
+                ]
+                result.append(normalizer.flush())
+                self.assertEqual("".join(result), normalize(form, text))
+
+    def test_incremental_normalizer_snapshot(self):
+        text = "\u1E0B\u0323x\u0307\u0323e\uFB01\u0345\uFF9E\u1100\u1161"
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            for split in range(len(text) + 1):
+                normalizer = IncrementalNormalizer(form)
+                head = normalizer.feed(text[:split])
+                state = normalizer.snapshot()
+                self.assertIsInstance(state, bytes)
+
+                resumed = IncrementalNormalizer.restore(state)
+                self.assertEqual(resumed.form, form)
+                self.assertEqual(
+                    head + resumed.feed(text[split:]) + resumed.flush(),
+                    normalize(form, text)
+                )
+
+        for state in [b"", b"\x01NFC", b"\x02NFC\x00", b"\x01XYZ\x00",
+                      b"\x01NFC\x00\xff"]:
+            with self.assertRaises(ValueError):
+                IncrementalNormalizer.restore(state)
+
+    def test_renormalize_edit(self):
+        self.assertEqual(
+            renormalize_edit("NFC", "cafe noir", 4, 4, "\u0301"),
+            ("caf\u00E9 noir", 3, 4)
+        )
+
+        # Replacement composed with the following combining mark
+        self.assertEqual(
+            renormalize_edit("NFC", "\u0105\u0301b", 0, 1, "a"),
+            ("\u00E1b", 0, 1)
+        )
+
+        self.assertEqual(
+            renormalize_edit("NFKD", "ab", 0, 2, "ﬁ"),
+            ("fi", 0, 2)
+        )
+
+        text = normalize("NFD", "\u1E0B\u0323 \uAC00")
+        for start, end, replacement in [
+            (0, 0, "\u0307"),
+            (1, 2, "\u0301"),
+            (3, 6, ""),
+            (4, 4, "\u11A8"),
+            (len(text), len(text), "\u0323"),
+        ]:
+            new_text, left, right = renormalize_edit(
+                "NFD", text, start, end, replacement
+            )
+            self.assertEqual(
+                new_text,
+                normalize("NFD", text[:start] + replacement + text[end:])
+            )
+            self.assertEqual(new_text[:left], text[:left])
+
+        with self.assertRaises(ValueError):
+            renormalize_edit("NFC", "abc", 2, 1, "")
+
+
+class Caseless(unittest.TestCase):
+
+    def test_canonical_caseless_key(self):
+        key = canonical_caseless_key
+        self.assertEqual(key("Stra\u00DFe"), key("STRASSE"))
+        self.assertEqual(key("\u212B"), "a\u030A")
+        self.assertEqual(key("\u00C5"), key("A\u030A"))
+        self.assertEqual(key("\uFB01"), key("FI"))
+        self.assertNotEqual(key("x\u00B2"), key("X2"))
+
+        # U+0345 is reordered before being folded to U+03B9
+        self.assertEqual(key("\u1FB3\u0301"), "\u03B1\u0301\u03B9")
+
+        s = "already folded"
+        self.assertIs(key(s), s)
+
+    def test_compatibility_caseless_key(self):
+        key = compatibility_caseless_key
+        self.assertEqual(key("\uFB01"), key("FI"))
+        self.assertEqual(key("\u2121"), "tel")
+        self.assertEqual(key("\u037A"), " \u03B9")
+        self.assertEqual(key("\u2460"), "1")
+
+        s = "already folded"
+        self.assertIs(key(s), s)
+
+        for s in ["Stra\u00DFe", "\u1E9B\u0323", "\u1FB3\u0301", "\uAC00"]:
+            self.assertEqual(key(s), NFKD(key(s)))
+            self.assertEqual(key(key(s)), key(s))
+
+    def test_strip_marks(self):
+        self.assertEqual(strip_marks("br\u00FBl\u00E9e"), "brulee")
+        self.assertEqual(strip_marks("\u1E9B\u0323"), "\u017F")
+        self.assertEqual(strip_marks("\u1E9B\u0323", compatibility=True), "s")
+        self.assertEqual(strip_marks("\u0344\u0301"), "")
+        self.assertEqual(
+            strip_marks("\uAC01", recompose=False),
+            "\u1100\u1161\u11A8"
+        )
+
+        # Starters combining with each other are recomposed
+        self.assertEqual(strip_marks("\u0B47\u0300\u0B3E"), "\u0B4B")
+        self.assertEqual(
+            strip_marks("\u0B47\u0300\u0B3E", recompose=False),
+            "\u0B47\u0B3E"
+        )
+
+        s = "plain text"
+        self.assertIs(strip_marks(s), s)
+
+        for s in ["\u00C5\u0328", "\u2460\u0301", "\u1E0B\u0323"]:
+            for compatibility in (False, True):
+                nf = "NFKD" if compatibility else "NFD"
+                stripped = "".join(
+                    x for x in normalize(nf, s)
+                    if ord(x) not in _NON_ZERO_CCC_TABLE
+                )
+                self.assertEqual(
+                    strip_marks(s, compatibility, recompose=False),
+                    stripped
+                )
+
+
+class Bulk(unittest.TestCase):
+
+    def test_normalize_identifiers(self):
+        names = ["\uFB01le", "file", "\u210C", "", "x\u00B2", "\uFB01le"]
+        self.assertEqual(
+            [*normalize_identifiers(names)],
+            ["file", "file", "H", "", "x2", "file"]
+        )
+        self.assertEqual(
+            [*normalize_identifiers(iter(names))],
+            [NFKC(x) for x in names]
+        )
+
+        # ASCII identifiers are returned as is
+        name = "identifier"
+        self.assertIs(next(normalize_identifiers([name])), name)
+
+    def test_normalize_many(self):
+        strings = [
+            "caf\u00E9", "cafe\u0301", "", "line\nbreak", "\uFB01",
+            "\u1E0B\u0323", "\U0001D400", "\u0323", "a" * 5000,
+        ] * 300
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            expected = [normalize(form, x) for x in strings]
+            self.assertEqual(normalize_many(form, strings), expected)
+            self.assertEqual(
+                normalize_many(form, iter(strings), unique=True),
+                expected
+            )
+
+        self.assertEqual(normalize_many("NFC", []), [])
+
+        s = "plain"
+        self.assertIs(normalize_many("NFD", [s])[0], s)
+
+        with self.assertRaises(KeyError):
+            normalize_many("NFX", ["abc"])
+
+    def test_quick_check_many(self):
+        strings = [
+            "caf\u00E9", "cafe\u0301", "", "\uFB01", "a\u0323\u0301",
+            "a\u0301\u0323", "\uAC00", "\u1100\u1161", "ABC",
+        ] * 200
+        expected = {
+            "NFC": [1, 0, 1, 1, 0, 0, 1, 0, 1],
+            "NFD": [0, 1, 1, 1, 1, 0, 0, 1, 1],
+            "NFKC": [1, 0, 1, 0, 0, 0, 1, 0, 1],
+            "NFKD": [0, 1, 1, 0, 1, 0, 0, 1, 1],
+            "NFKC_CF": [1, 0, 1, 0, 0, 0, 1, 0, 0],
+        }
+        for form, mask in expected.items():
+            self.assertEqual(
+                quick_check_many(form, iter(strings)),
+                bytearray(mask * 200)
+            )
+            for s, yes in zip(strings, quick_check_many(form, strings)):
+                if yes:
+                    self.assertIs(normalize(form, s), s)
+
+        self.assertEqual(quick_check_many("NFC", []), bytearray())
+
+    def test_group_equivalent(self):
+        strings = ["cafe\u0301", "tea", "caf\u00E9", "\uFB01", "fi", "tea"]
+        self.assertEqual(
+            group_equivalent(strings, "NFC"),
+            {
+                "caf\u00E9": ["cafe\u0301", "caf\u00E9"],
+                "tea": ["tea", "tea"],
+                "\uFB01": ["\uFB01"],
+                "fi": ["fi"],
+            }
+        )
+        self.assertEqual(
+            group_equivalent(iter(strings), "NFKD"),
+            {
+                "cafe\u0301": ["cafe\u0301", "caf\u00E9"],
+                "tea": ["tea", "tea"],
+                "fi": ["\uFB01", "fi"],
+            }
+        )
+        self.assertEqual(group_equivalent([], "NFC"), {})
+
+    def test_dedupe(self):
+        strings = ["cafe\u0301", "tea", "caf\u00E9", "\uFB01", "fi", "tea"]
+        self.assertEqual(
+            [*dedupe(strings, "NFC")],
+            ["cafe\u0301", "tea", "\uFB01", "fi"]
+        )
+        self.assertEqual(
+            [*dedupe(iter(strings), "NFKC")],
+            ["cafe\u0301", "tea", "\uFB01"]
+        )
+
+
+class Caching(unittest.TestCase):
+
+    def test_cached(self):
+        nfc = cached("NFC", maxsize=3, max_len=10, max_chars=20)
+        self.assertEqual(nfc("cafe\u0301"), "caf\u00E9")
+        self.assertEqual(nfc("cafe\u0301"), "caf\u00E9")
+        self.assertEqual(nfc.cache_info(), (1, 1, 0, 1, 9))
+
+        # Normalized strings bypass the cache
+        s = "caf\u00E9"
+        self.assertIs(nfc(s), s)
+        self.assertEqual(nfc.cache_info().misses, 1)
+
+        # Long strings are normalized but not cached
+        self.assertEqual(nfc("e\u0301" * 6), "\u00E9" * 6)
+        self.assertEqual(nfc.cache_info(), (1, 2, 0, 1, 9))
+
+        # Least recently used entries are evicted first
+        for s in ["a\u0301", "e\u0301", "cafe\u0301", "o\u0301"]:
+            nfc(s)
+        info = nfc.cache_info()
+        self.assertEqual((info.evictions, info.currsize), (1, 3))
+        self.assertNotIn("a\u0301", nfc._cache)
+
+        # Bounded by the total number of characters
+        nfc("\u1E0B\u0323\u0307\u0323\u0307")
+        info = nfc.cache_info()
+        self.assertLessEqual(info.chars, 20)
+        self.assertEqual(
+            info.chars,
+            sum(len(k) + len(v) for k, v in nfc._cache.items())
+        )
+
+        nfc.cache_clear()
+        self.assertEqual(nfc.cache_info(), (0, 0, 0, 0, 0))
+
+        for form in ["NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            func = cached(form)
+            for s in ["\u1E0B\u0323", "\uFB01", "\u00C5", "\u1E0B\u0323"]:
+                self.assertEqual(func(s), normalize(form, s))
+
+        with self.assertRaises(KeyError):
+            cached("NFX")
+
+    def test_cached_threads(self):
+        nfc = cached("NFC", maxsize=64)
+        strings = [c + chr(u) for c in "aeiou" for u in range(0x0300, 0x0320)]
+
+        def work(seed):
+            for i in range(5000):
+                s = strings[(i * seed) % len(strings)]
+                self.assertEqual(nfc(s), NFC(s))
+
+        self.assertEqual(run_threads(work), [])
+
+        info = nfc.cache_info()
+        self.assertEqual(info.currsize, 64)
+        self.assertEqual(info.hits + info.misses, 8 * 5000)
+        self.assertEqual(
+            info.chars,
+            sum(len(k) + len(v) for k, v in nfc._cache.items())
+        )
+
+    def test_InterningNormalizer(self):
+        nfc = InterningNormalizer("NFC", maxsize=2)
+
+        a = nfc("".join(["caf", "e\u0301"]))
+        b = nfc("".join(["caf", "\u00E9"]))
+        self.assertEqual(a, "caf\u00E9")
+        self.assertIs(a, b)
+        self.assertEqual(len(nfc), 1)
+
+        # The least recently used strings are dropped first
+        nfc("x")
+        self.assertIs(nfc("".join(["caf", "e\u0301"])), a)
+        nfc("y")
+        self.assertEqual(len(nfc), 2)
+        self.assertIs(nfc("".join(["caf", "\u00E9"])), a)
+        nfc("z")
+        nfc("w")
+        self.assertIsNot(nfc("".join(["caf", "\u00E9"])), a)
+
+        nfc.clear()
+        self.assertEqual(len(nfc), 0)
+
+        nfkc = InterningNormalizer("NFKC", maxsize=0)
+        self.assertEqual(nfkc("\uFB01"), "fi")
+        self.assertEqual(len(nfkc), 0)
+
+    def test_InterningNormalizer_threads(self):
+        nfc = InterningNormalizer("NFC", maxsize=64)
+        hot = nfc("".join(["caf", "\u00E9"]))
+
+        def work(seed):
+            for i in range(5000):
+                s = chr(0x61 + i % 26) + chr(0x0300 + (i * seed) % 32)
+                self.assertEqual(nfc(s), NFC(s))
+                self.assertIs(nfc("".join(["cafe", "\u0301"])), hot)
+
+        self.assertEqual(run_threads(work), [])
+        self.assertEqual(len(nfc), 64)
+
+
+class Containers(unittest.TestCase):
+
+    def test_NormalizedDict(self):
+        d = NormalizedDict({"cafe\u0301": 1, "tea": 2})
+        self.assertEqual(d["caf\u00E9"], 1)
+        self.assertIn("cafe\u0301", d)
+        self.assertNotIn(1, d)
+        self.assertEqual(sorted(d), ["caf\u00E9", "tea"])
+
+        d["caf\u00E9"] = 3
+        self.assertEqual(len(d), 2)
+        self.assertEqual(d.get("cafe\u0301"), 3)
+        self.assertEqual(d.original("cafe\u0301"), "caf\u00E9")
+
+        del d["cafe\u0301"]
+        self.assertNotIn("caf\u00E9", d)
+        with self.assertRaises(KeyError):
+            d["caf\u00E9"]
+        with self.assertRaises(KeyError):
+            d.original("caf\u00E9")
+
+        # Keys other than strings are never found
+        self.assertIsNone(d.get(1))
+        for key in [1, None, b"tea"]:
+            with self.assertRaises(KeyError):
+                d[key]
+            with self.assertRaises(KeyError):
+                del d[key]
+            with self.assertRaises(KeyError):
+                d.original(key)
+
+        d = NormalizedDict(form="NFKC", keep_original=True)
+        d["\uFB01le"] = 1
+        d["file"] = 2
+        self.assertEqual(dict(d), {"file": 2})
+        self.assertEqual(d.original("fi\u006Ce"), "\uFB01le")
+
+        del d["file"]
+        d["file"] = 3
+        self.assertEqual(d.original("\uFB01le"), "file")
+
+        with self.assertRaises(KeyError):
+            NormalizedDict(form="NFX")
+
+    def test_NormalizedSet(self):
+        s = NormalizedSet(["cafe\u0301", "caf\u00E9", "tea"])
+        self.assertEqual(len(s), 2)
+        self.assertIn("cafe\u0301", s)
+        self.assertNotIn(None, s)
+
+        s.discard("caf\u00E9")
+        self.assertEqual(set(s), {"tea"})
+
+        s = NormalizedSet(["\u1E9B\u0323"], form="NFKD", keep_original=True)
+        self.assertIn("s\u0323\u0307", s)
+        self.assertEqual(s.original("\u1E69"), "\u1E9B\u0323")
+
+        union = s | ["\u1E69", "t"]
+        self.assertIsInstance(union, NormalizedSet)
+        self.assertEqual(union.form, "NFKD")
+        self.assertEqual(len(union), 2)
+        self.assertEqual(union.original("t"), "t")
+
+        s.discard(1)
+        with self.assertRaises(KeyError):
+            s.remove(1)
+        self.assertEqual(len(s), 1)
+
+
+class Buffers(unittest.TestCase):
+
+    def test_normalize_utf8(self):
+        self.assertEqual(
+            normalize_utf8("NFC", "cafe\u0301".encode()),
+            "caf\u00E9".encode()
+        )
+        self.assertEqual(
+            normalize_utf8("NFKC", memoryview("\uFB01x\u00B2".encode())),
+            b"fix2"
+        )
+
+        # ASCII letters may be changed by NFKC_CF
+        self.assertEqual(normalize_utf8("NFKC_CF", b"ABC"), b"abc")
+
+        # Normalized data is returned as it is
+        for data in [b"", b"plain", bytearray(b"plain"),
+                     "caf\u00E9".encode(), memoryview("\uAC00".encode())]:
+            self.assertIs(normalize_utf8("NFC", data), data)
+
+        # Marks in canonical order need no work
+        data = "a\u0323\u0301".encode()
+        self.assertIs(normalize_utf8("NFD", data), data)
+
+        strings = ["x<\u0338", "\u1100\u1161\u11A8!", "e\u0301\U0001D400"]
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            for s in strings:
+                self.assertEqual(
+                    normalize_utf8(form, s.encode()),
+                    normalize(form, s).encode()
+                )
+
+        # Regions needing normalization are spliced between long runs of
+        # ASCII characters copied as they are
+        plain = "plain text " * 10
+        for s in [plain + "cafe\u0301" + plain + "x\u0323\u0307" + plain,
+                  "e\u0301" + plain + "\uFB01", plain + "<\u0338"]:
+            for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+                self.assertEqual(
+                    normalize_utf8(form, memoryview(s.encode())),
+                    normalize(form, s).encode()
+                )
+
+        with self.assertRaises(UnicodeDecodeError):
+            normalize_utf8("NFC", b"\xff")
+        with self.assertRaises(UnicodeDecodeError):
+            normalize_utf8("NFC", plain.encode() + b"\xff" + plain.encode())
+
+    def test_normalize_codepoints(self):
+        def codepoints(s):
+            return array("I", map(ord, s))
+
+        strings = [
+            "", "plain", "cafe\u0301", "\u1E0B\u0323 \uFB01", "\uAC00\u11A8",
+            "\U0001D400\u0345", "a\u0335\u0301",
+        ]
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            for s in strings:
+                expected = codepoints(normalize(form, s))
+                self.assertEqual(
+                    normalize_codepoints(form, codepoints(s)),
+                    expected
+                )
+                self.assertEqual(
+                    normalize_codepoints(form, memoryview(codepoints(s))),
+                    expected
+                )
+                self.assertEqual(
+                    normalize_codepoints(form, codepoints(s).tobytes()),
+                    expected
+                )
+
+        # Output written into a caller-supplied buffer
+        out = array("I", [0] * 4)
+        n = normalize_codepoints("NFD", codepoints("\u00E9"), out)
+        self.assertEqual(n, 2)
+        self.assertEqual(out, array("I", [0x0065, 0x0301, 0, 0]))
+
+        out = bytearray(8)
+        n = normalize_codepoints("NFKC", codepoints("\uFB01"), out)
+        self.assertEqual(n, 2)
+        self.assertEqual(out, codepoints("fi").tobytes())
+
+        with self.assertRaises(ValueError):
+            normalize_codepoints("NFKD", codepoints("\uFB03"), bytearray(8))
+
+    def test_normalize_column(self):
+        def column(strings, typecode="i", prefix=b""):
+            data = [prefix]
+            offsets = array(typecode, [len(prefix)])
+            for s in strings:
+                data.append(s.encode())
+                offsets.append(offsets[-1] + len(data[-1]))
+            return offsets, b"".join(data)
+
+        def rows(offsets, data):
+            return [
+                bytes(data[offsets[i] : offsets[i + 1]]).decode()
+                for i in range(len(offsets) - 1)
+            ]
+
+        strings = [
+            "tea", "cafe\u0301", "", "\uFB01", "x\u0323\u0307", "ABC",
+            "\u1100\u1161", "\U0001D400",
+        ]
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            for typecode in ["i", "q"]:
+                offsets, data = column(strings, typecode, b"prefix")
+                new_offsets, new_data = normalize_column(form, offsets, data)
+                self.assertEqual(new_offsets.typecode, typecode)
+                if new_data is not data:
+                    self.assertEqual(new_offsets[0], 0)
+                    self.assertEqual(new_offsets[-1], len(new_data))
+                self.assertEqual(
+                    rows(new_offsets, new_data),
+                    [normalize(form, s) for s in strings]
+                )
+
+        # Input buffers are returned when no row changes
+        offsets, data = column(["tea", "caf\u00E9", ""])
+        result = normalize_column("NFC", memoryview(offsets), data)
+        self.assertIs(result[1], data)
+
+        offsets = array("q")
+        self.assertIs(normalize_column("NFC", offsets, b"")[0], offsets)
+
+    def test_normalize_file(self):
+        text = "tea\ncafe\u0301 \uFB01le x\u0323\u0307\n" * 50000
+        with tempfile.TemporaryDirectory() as tmp:
+            src = os.path.join(tmp, "src.txt")
+            dst = os.path.join(tmp, "dst.txt")
+            with open(src, "wb") as f:
+                f.write(text.encode())
+
+            for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+                expected = normalize(form, text)
+                changed = normalize_file(form, src, dst)
+                self.assertEqual(changed, expected != text)
+                if changed:
+                    with open(dst, "rb") as f:
+                        self.assertEqual(f.read().decode(), expected)
+                    os.remove(dst)
+
+            # Nothing is written when the text is already normalized, and
+            # a destination left from an earlier call is removed
+            with open(src, "wb") as f:
+                f.write(NFC(text).encode())
+            self.assertFalse(normalize_file("NFC", src, dst))
+            self.assertFalse(os.path.exists(dst))
+
+            self.assertTrue(normalize_file("NFD", src, dst))
+            self.assertTrue(os.path.exists(dst))
+            self.assertFalse(normalize_file("NFC", src, dst))
+            self.assertFalse(os.path.exists(dst))
+
+            with open(dst, "wb") as f:
+                f.write(b"stale")
+            with open(src, "wb"):
+                pass
+            self.assertFalse(normalize_file("NFD", src, dst))
+            self.assertFalse(os.path.exists(dst))
+
+            # Files are not normalized in place
+            with open(src, "wb") as f:
+                f.write(text.encode())
+            with self.assertRaises(ValueError):
+                normalize_file("NFC", src, src)
+            with open(src, "rb") as f:
+                self.assertEqual(f.read(), text.encode())
+
+            # The destination is left unchanged on errors
+            with open(src, "wb") as f:
+                f.write(b"e\xcc\x81" + b"a" * (1 << 21) + b"\xff")
+            with open(dst, "wb") as f:
+                f.write(b"old")
+            with self.assertRaises(UnicodeDecodeError):
+                normalize_file("NFC", src, dst)
+            with open(dst, "rb") as f:
+                self.assertEqual(f.read(), b"old")
+            self.assertEqual(sorted(os.listdir(tmp)), ["dst.txt", "src.txt"])
+
+
+@unittest.skipIf(np is None, "requires NumPy")
+class Vectorized(unittest.TestCase):
+
+    def test_normalize_array(self):
+        strings = [
+            "", "plain", "cafe\u0301", "caf\u00E9", "\u2126\u212B",
+            "\uAC00\uAC01\u11A8", "\u1100\u1161", "\u1E0B\u0323",
+            "\uFB01\u00B2", "ABC", "\u00C5\u0301\u0323", "\U0001D400",
+            "a\u0345\u0316",
+        ]
+        width = max(map(len, strings))
+        batch = np.zeros((len(strings), width), dtype=np.uint32)
+        for i, s in enumerate(strings):
+            batch[i, : len(s)] = [*map(ord, s)]
+
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            result = normalize_array(form, batch)
+            self.assertEqual(result.dtype, np.uint32)
+            for s, row in zip(strings, result.tolist()):
+                while row and not row[-1]:
+                    row.pop()
+                self.assertEqual("".join(map(chr, row)), normalize(form, s))
+
+        # The input array is left unchanged
+        self.assertEqual(batch[2, 4], 0x0301)
+
+        with self.assertRaises(ValueError):
+            normalize_array("NFC", [0x0041, 0x0301])
+
+
+class TextCodecs(unittest.TestCase):
+
+    def setUp(self):
+        register_codecs()
+
+    def test_codecs(self):
+        text = "cafe\u0301 \uFB01le x\u0323\u0307 \u1100\u1161\u11A8\n" * 3
+        for encoding in ["utf-8", "utf-16", "utf-16-be", "utf-32-le"]:
+            for name in ["nfc", "nfd", "nfkc", "nfkd", "fcc", "nfkc_cf"]:
+                codec = f"{encoding}-{name}"
+                expected = normalize(name.upper(), text)
+                data = text.encode(encoding)
+
+                self.assertEqual(codecs.lookup(codec).name, codec)
+                self.assertEqual(data.decode(codec), expected)
+                self.assertEqual(
+                    text.encode(codec).decode(encoding), expected
+                )
+
+                # Decoding byte by byte
+                decoder = codecs.getincrementaldecoder(codec)()
+                result = [decoder.decode(data[i : i + 1])
+                          for i in range(len(data))]
+                result.append(decoder.decode(b"", final=True))
+                self.assertEqual("".join(result), expected)
+
+        self.assertEqual(codecs.lookup("UTF_8 NFKC").name, "utf-8-nfkc")
+
+        with self.assertRaises(LookupError):
+            codecs.lookup("utf-7-nfc")
+
+    def test_text_io(self):
+        text = "e\u0301\u0323" * 5000
+        data = io.BytesIO(text.encode())
+        with io.TextIOWrapper(data, encoding="utf-8-nfc") as f:
+            self.assertEqual(f.read(7), "\u1EB9\u0301" * 3 + "\u1EB9")
+            position = f.tell()
+            rest = f.read()
+            f.seek(position)
+            self.assertEqual(f.read(), rest)
+            self.assertEqual(rest, NFC(text)[7:])
+
+        # The whole text written reaches the file
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "text.txt")
+            for encoding, text in [("utf-8", "hello cafe\u0301"),
+                                   ("utf-16", "abc"),
+                                   ("utf-32-le", "\u1100\u1161\u11A8")]:
+                with open(path, "w", encoding=f"{encoding}-nfc") as f:
+                    f.write(text)
+                with open(path, encoding=encoding) as f:
+                    self.assertEqual(f.read(), NFC(text))
+
+            with open(path, "w", encoding="utf-8-nfd") as f:
+                for line in ["caf\u00E9\n", "\u00C5ngstr\u00F6m\n", "x"]:
+                    f.write(line)
+                    f.flush()
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(
+                    f.read(), "cafe\u0301\nA\u030Angstro\u0308m\nx"
+                )
+
+            # Splitting a character from its combining marks fails loudly
+            with open(path, "w", encoding="utf-8-nfc") as f:
+                f.write("cafe")
+                with self.assertRaises(UnicodeEncodeError):
+                    f.write("\u0301")
+                f.write("s")
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "cafes")
+
+    def test_incremental_encoder(self):
+        # Base character and combining mark split between chunks
+        with self.assertRaises(UnicodeEncodeError):
+            b"".join(codecs.iterencode(["cafe", "\u0301"], "utf-8-nfc"))
+
+        # Text stable under concatenation may be split anywhere
+        chunks = ["cafe\u0301", "\u0301"]
+        self.assertEqual(
+            b"".join(codecs.iterencode(chunks, "utf-8-nfc")),
+            b"caf\xc3\xa9\xcc\x81"
+        )
+
+        text = "cafe\u0301 \uFB01le x\u0323\u0307 \u1100\u1161\u11A8"
+        for encoding in ["utf-8", "utf-16", "utf-32-be"]:
+            for name in ["nfc", "nfd", "nfkc", "nfkd", "fcc", "nfkc_cf"]:
+                codec = f"{encoding}-{name}"
+                encoder = codecs.getincrementalencoder(codec)()
+                result = []
+                for word in text.split(" "):
+                    result.append(encoder.encode(word + " "))
+
+                    # Resume with a new encoder in the same state
+                    state = encoder.getstate()
+                    encoder = codecs.getincrementalencoder(codec)()
+                    encoder.setstate(state)
+
+                result.append(encoder.encode("", final=True))
+                self.assertEqual(
+                    b"".join(result).decode(encoding),
+                    normalize(name.upper(), text + " ")
+                )
+
+        # The output of each chunk is complete, and a rejected chunk leaves
+        # the encoder unchanged
+        encoder = codecs.getincrementalencoder("utf-8-nfc")()
+        self.assertEqual(encoder.encode("cafe"), b"cafe")
+        state = encoder.getstate()
+        self.assertNotEqual(state, 0)
+        with self.assertRaises(UnicodeEncodeError):
+            encoder.encode("\u0301")
+        self.assertEqual(encoder.getstate(), state)
+        self.assertEqual(encoder.encode("s"), b"s")
+        encoder.reset()
+        self.assertEqual(encoder.getstate(), 0)
+        self.assertEqual(encoder.encode("", final=True), b"")
+
+
+class Streams(unittest.TestCase):
+
+    text = "cafe\u0301\n\uFB01le x\u0307\u0323\n\u1100\u1161\u11A8" * 20
+
+    def test_normalizing_reader(self):
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            expected = normalize(form, self.text)
+            for size in [1, 3, 1 << 16]:
+                stream = io.StringIO(self.text)
+                reader = NormalizingReader(stream, form, buffer_size=size)
+                self.assertEqual(reader.read(), expected)
+                self.assertEqual(reader.read(), "")
+
+                reader = NormalizingReader(
+                    io.StringIO(self.text), form, buffer_size=size
+                )
+                self.assertEqual([*reader], expected.splitlines(True))
+
+                reader = NormalizingReader(
+                    io.StringIO(self.text), form, buffer_size=size
+                )
+                result = [reader.read(5), reader.readline(2),
+                          reader.readline(), reader.read()]
+                self.assertEqual("".join(result), expected)
+                self.assertEqual(len(result[0]), 5)
+                self.assertLessEqual(len(result[1]), 2)
+
+        stream = io.StringIO("e\u0301")
+        with NormalizingReader(stream) as reader:
+            self.assertEqual(reader.read(), "\u00E9")
+        self.assertTrue(stream.closed)
+        with self.assertRaises(ValueError):
+            reader.read()
+
+        stream = io.StringIO()
+        self.assertIs(NormalizingReader(stream).detach(), stream)
+        self.assertFalse(stream.closed)
+
+    def test_normalizing_reader_pipe(self):
+        # Lines are returned without waiting for more text from a pipe
+        r, w = os.pipe()
+        lines = []
+
+        with NormalizingReader(open(r, encoding="utf-8")) as reader:
+            thread = threading.Thread(
+                target=lambda: lines.append(reader.readline()), daemon=True
+            )
+            try:
+                os.write(w, "cafe\u0301\n".encode())
+                thread.start()
+                thread.join(5)
+                self.assertEqual(lines, ["caf\u00E9\n"])
+
+                os.write(w, "tea\n".encode())
+                self.assertEqual(next(reader), "tea\n")
+            finally:
+                os.close(w)
+                thread.join()
+
+    def test_normalizing_writer(self):
+        for form in ["NFC", "NFD", "NFKC", "NFKD", "FCC", "NFKC_CF"]:
+            for size in [1, 3, 1 << 16]:
+                writer = NormalizingWriter(io.StringIO(), form, size)
+                for i in range(0, len(self.text), 4):
+                    chunk = self.text[i : i + 4]
+                    self.assertEqual(writer.write(chunk), len(chunk))
+                stream = writer.detach()
+                self.assertFalse(stream.closed)
+                self.assertEqual(
+                    stream.getvalue(), normalize(form, self.text)
+                )
+
+        # Text which may still change is held back on flush
+        stream = io.StringIO()
+        writer = NormalizingWriter(stream)
+        writer.write("tea\ncafe")
+        writer.flush()
+        self.assertEqual(stream.getvalue(), "tea\ncaf")
+        writer.write("\u0301")
+        self.assertIs(writer.detach(), stream)
+        self.assertEqual(stream.getvalue(), "tea\ncaf\u00E9")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "out.txt")
+            with NormalizingWriter(open(path, "w", encoding="utf-8")) as f:
+                f.write("cafe")
+                f.write("\u0301")
+            self.assertTrue(f.closed)
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "caf\u00E9")
+
 
 if __name__ == "__main__":
     unittest.main()
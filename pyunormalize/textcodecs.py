@@ -0,0 +1,231 @@
+"""Text codecs normalizing Unicode text while encoding and decoding."""
+
+import codecs
+import re
+import sys
+
+from pyunormalize.incremental import IncrementalNormalizer
+from pyunormalize.normalization import _last_boundary, _normalization_forms
+
+__all__ = [
+    "register_codecs",
+]
+
+# Dictionary mapping the names of the normalization forms, as used in codec
+# names, to the normalization forms
+_FORMS_BY_NAME = {
+    "nfc": "NFC",
+    "nfd": "NFD",
+    "nfkc": "NFKC",
+    "nfkd": "NFKD",
+    "fcc": "FCC",
+    "nfkc_cf": "NFKC_CF",
+}
+
+# Regular expression matching the name of a normalizing codec, with hyphens
+# and spaces replaced by underscores, and capturing the underlying encoding
+# and the name of the normalization form
+_CODEC_NAME_RE = re.compile(
+    r"(utf_8|utf_(?:16|32)(?:_[bl]e)?)_(nfkc_cf|nfc|nfd|nfkc|nfkd|fcc)"
+)
+
+# Whether the codec search function is registered
+_registered = False
+
+
+def register_codecs():
+    """Register text codecs which transform Unicode text into a normalization
+    form while encoding and decoding, so that text files and streams can be
+    normalized transparently while reading them with `open()` and the `io`
+    module, and while encoding with the `codecs` module.
+
+    The codec names are made of an encoding among "utf-8", "utf-16",
+    "utf-16-le", "utf-16-be", "utf-32", "utf-32-le", and "utf-32-be", and
+    a normalization form among "nfc", "nfd", "nfkc", "nfkd", "fcc", and
+    "nfkc_cf", joined by a hyphen, such as "utf-8-nfc" or "utf-16-nfkd".
+
+    The incremental decoders normalize the text chunk by chunk, holding back
+    only the text after the last normalization boundary until the next chunk,
+    so the result is the same as if the whole text were decoded at once.
+
+    The incremental encoders, used to write text files, encode the output
+    of each chunk completely, as text I/O never tells them that the last
+    chunk has been written. The result is the same as if the whole text
+    were encoded at once, as long as no character is separated from the
+    combining marks following it. A chunk which would change the
+    normalization of the text encoded before it raises UnicodeEncodeError
+    instead, like a lone combining mark written after its base character.
+    `NormalizingWriter` has no such restriction.
+
+    Calling this function more than once has no effect.
+
+    Examples:
+
+        >>> register_codecs()
+        >>> "cafe\\u0301".encode("utf-8-nfc")
+        b'caf\\xc3\\xa9'
+        >>> b"caf\\xc3\\xa9".decode("utf-8-nfd") == "cafe\\u0301"
+        True
+        >>> b"".join(codecs.iterencode(["cafe\\u0301", "s"], "utf-8-nfc"))
+        b'caf\\xc3\\xa9s'
+
+    """
+    global _registered
+
+    if not _registered:
+        codecs.register(_search_codec)
+        _registered = True
+
+
+def _search_codec(name):
+    # Return the codec information for the normalizing codec with the given
+    # name, or None if there is no such codec.
+
+    match = _CODEC_NAME_RE.fullmatch(name.lower().replace("-", "_")
+                                                 .replace(" ", "_"))
+
+    if match is None:
+        return None
+
+    encoding = match[1].replace("_", "-")
+    form = _FORMS_BY_NAME[match[2]]
+    func = _normalization_forms[form]
+
+    def encode(input, errors="strict"):
+        return codecs.encode(func(input), encoding, errors), len(input)
+
+    def decode(input, errors="strict"):
+        return func(codecs.decode(input, encoding, errors)), len(input)
+
+    class IncrementalEncoder(_NormalizingIncrementalEncoder):
+        pass
+
+    class IncrementalDecoder(_NormalizingIncrementalDecoder):
+        pass
+
+    for cls in IncrementalEncoder, IncrementalDecoder:
+        cls.encoding = encoding
+        cls.form = form
+
+    return codecs.CodecInfo(
+        encode,
+        decode,
+        incrementalencoder=IncrementalEncoder,
+        incrementaldecoder=IncrementalDecoder,
+        name=f"{encoding}-{match[2]}",
+    )
+
+
+class _NormalizingIncrementalEncoder(codecs.IncrementalEncoder):
+    # Incremental encoder normalizing the text before encoding it. The
+    # encoding and the normalization form are set by subclasses.
+    #
+    # Text I/O never calls encoders with `final=True`, so the output of each
+    # chunk is complete: the text after the last normalization boundary is
+    # encoded normalized right away, and only remembered, so that the next
+    # chunk can be checked against it. If the next chunk changes how that
+    # text is normalized, it cannot be taken back any more, and the chunk
+    # is rejected.
+
+    encoding = form = None
+
+    def __init__(self, errors="strict"):
+        codecs.IncrementalEncoder.__init__(self, errors)
+        self._encoder = codecs.getincrementalencoder(self.encoding)(errors)
+        self._func = _normalization_forms[self.form]
+        self._tail = ""     # unstable end of the text encoded so far
+        self._written = ""  # the same text, normalized, as encoded
+
+    def encode(self, input, final=False):
+        text = self._tail + input if self._tail else input
+        normalized = self._func(text)
+
+        if not normalized.startswith(self._written):
+            raise UnicodeEncodeError(
+                f"{self.encoding}-{self.form.lower()}", input, 0, len(input),
+                "changes the normalization of the text encoded before it; "
+                "a character and the combining marks following it must be "
+                "encoded in the same chunk",
+            )
+
+        output = normalized[len(self._written):]
+
+        if final:
+            self._tail = self._written = ""
+        else:
+            self._tail = text[_last_boundary(text, self.form):]
+            self._written = self._func(self._tail)
+
+        return self._encoder.encode(output, final)
+
+    def reset(self):
+        self._encoder.reset()
+        self._tail = self._written = ""
+
+    def getstate(self):
+        # The text after the last normalization boundary, if any, is packed
+        # above the lowest byte, holding the state of the underlying encoder,
+        # encoded in UTF-8 after a non-zero byte, so that it survives the
+        # conversion to an integer.
+        state = self._encoder.getstate()
+        if self._tail:
+            tail = b"\x01" + self._tail.encode("utf-8")
+            state |= int.from_bytes(tail, "big") << 8
+        return state
+
+    def setstate(self, state):
+        self._encoder.setstate(state & 0xFF)
+        state >>= 8
+        if state:
+            tail = state.to_bytes((state.bit_length() + 7) // 8, "big")
+            self._tail = tail[1:].decode("utf-8")
+        else:
+            self._tail = ""
+        self._written = self._func(self._tail)
+
+
+class _NormalizingIncrementalDecoder(codecs.IncrementalDecoder):
+    # Incremental decoder normalizing the text after decoding it. The
+    # encoding and the normalization form are set by subclasses.
+
+    encoding = form = None
+
+    def __init__(self, errors="strict"):
+        codecs.IncrementalDecoder.__init__(self, errors)
+        self._decoder = codecs.getincrementaldecoder(self.encoding)(errors)
+        self._normalizer = IncrementalNormalizer(self.form)
+
+    def decode(self, input, final=False):
+        text = self._normalizer.feed(self._decoder.decode(input, final))
+        if final:
+            text += self._normalizer.flush()
+        return text
+
+    def reset(self):
+        self._decoder.reset()
+        self._normalizer.flush()
+
+    def getstate(self):
+        # The text held back is not decoded output yet, so it is returned
+        # encoded again, in front of the bytes buffered by the underlying
+        # decoder, as text I/O expects.
+        buffer, flag = self._decoder.getstate()
+        pending = self._normalizer._tail
+        if pending:
+            buffer = pending.encode(self._pending_encoding(flag)) + buffer
+        return buffer, flag
+
+    def setstate(self, state):
+        buffer, flag = state
+        self._decoder.setstate((b"", flag))
+        self._normalizer.flush()
+        self.decode(buffer)
+
+    def _pending_encoding(self, flag):
+        # Return the encoding of the text held back, given the state flag of
+        # the underlying decoder. For UTF-16 and UTF-32 with a byte order
+        # mark, the flag is 0 if the byte order is native, 1 if it is not.
+        if self.encoding not in ("utf-16", "utf-32"):
+            return self.encoding
+        big = (sys.byteorder == "big") != bool(flag)
+        return f"{self.encoding}-{'be' if big else 'le'}"
@@ -1,6 +1,7 @@
 # This script generates the pyunormalize.unicode module.
 #
 # Input files:
+#     https://www.unicode.org/Public/16.0.0/ucd/CaseFolding.txt
 #     https://www.unicode.org/Public/16.0.0/ucd/CompositionExclusions.txt
 #     https://www.unicode.org/Public/16.0.0/ucd/DerivedNormalizationProps.txt
 #     https://www.unicode.org/Public/16.0.0/ucd/UnicodeData.txt
@@ -18,6 +19,7 @@ UNICODE_VERSION = "16.0.0"
 SCRIPT_PATH = "/".join(pathlib.Path(__file__).parts[-3:])
 
 # Files from the Unicode character database (UCD)
+CASE_FOLDING = "CaseFolding.txt"
 EXCLUSIONS = "CompositionExclusions.txt"
 PROPS = "DerivedNormalizationProps.txt"
 UNICODE_DATA = "UnicodeData.txt"
@@ -181,6 +183,53 @@ def main():
 
             tmp_list.append(f"           0x{code:0>5},")
 
+    NFKC_CF_list = []
+
+    for line in lines:
+        data = line.split("#")[0].split(";")
+        data = [d.strip() for d in data]
+
+        if len(data) != 3 or data[1] != "NFKC_CF":
+            continue
+
+        code, _, mapping = data
+        mapping = ", ".join([f"0x{c}" for c in mapping.split()])
+
+        if ".." in code:
+            start, end = code.split("..")
+            NFKC_CF_list.append(
+                f"    **dict.fromkeys(range(0x{start:0>5}, 0x{end:0>5} + 1), "
+                f"[{mapping}]),"
+            )
+        else:
+            NFKC_CF_list.append(f"    0x{code:0>5}: [{mapping}],")
+
+    #
+    # Unicode file: CaseFolding.txt
+    #
+
+    try:
+        lines = (cwd / CASE_FOLDING).read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        lines = read_remote(CASE_FOLDING)
+        print(".. Done.")
+
+    # Check file version
+    check_version(lines[0])
+
+    casefold_list = []
+
+    for line in lines:
+        if not line or line.startswith("#"):
+            continue
+
+        code, status, mapping, _ = line.split("; ", 3)
+
+        # Full case folding uses the common (C) and full (F) mappings
+        if status in ("C", "F"):
+            mapping = ", ".join([f"0x{c}" for c in mapping.split()])
+            casefold_list.append(f"    0x{code:0>5}: [{mapping}],")
+
 
     dcp = "\n".join(dcp_list)
     ccc = "\n".join(ccc_list)
@@ -191,6 +240,8 @@ def main():
     NFC_QC_M   = "\n".join(NFC_QC_MAYBE_list)
     NFKC_QC_N  = "\n".join(NFKC_QC_NO_list)
     NFKC_QC_M  = "\n".join(NFKC_QC_MAYBE_list)
+    NFKC_CF    = "\n".join(NFKC_CF_list)
+    casefold   = "\n".join(casefold_list)
 
     with open(cwd / "_unicode.py", "w", encoding="utf-8", newline="\n") as f:
         f.write(f'''\
@@ -262,6 +313,24 @@ _NFKD_QC_NO = set([
 {NFKD_QC_N}
 ])
 
+# Dictionary mapping characters to their NFKC_Casefold (NFKC_CF) mappings,
+# with an empty mapping for characters removed by NFKC_Casefold
+_NFKC_CF_BY_CHARACTER = {{
+{NFKC_CF}
+}}
+
+# Changes_When_NFKC_Casefolded=Yes, together with NFC_Quick_Check=No
+# or NFC_Quick_Check=Maybe
+# Characters that cannot ever occur, or may or may not occur, in the
+# NFKC_Casefold form
+_NFKC_CF_QC_NO_OR_MAYBE = set(_NFKC_CF_BY_CHARACTER) | _NFC__QC_NO_OR_MAYBE
+
+# Dictionary mapping characters to their full case foldings
+# (Case_Folding status C and F)
+_CASEFOLD_BY_CHARACTER = {{
+{casefold}
+}}
+
 del _NFC__QC_NO, _NFC__QC_MAYBE, _NFKC_QC_NO, _NFKC_QC_MAYBE
 ''')
 
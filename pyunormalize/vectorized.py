@@ -0,0 +1,238 @@
+"""Vectorized normalization of batches of Unicode strings, using NumPy."""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from pyunormalize.normalization import (
+    _COMPOSED_FORMS,
+    _COMPATIBILITY_FORMS,
+    _FULL_CDECOMP_BY_CHAR,
+    _FULL_CFDECOMP_BY_CHAR,
+    _FULL_KDECOMP_BY_CHAR,
+    _NON_ZERO_CCC_TABLE,
+    _QUICK_CHECK_BY_FORM,
+    _QUICK_CHECK_CCC_BY_FORM,
+    _SB,
+    _SL,
+    _LB,
+    _VB,
+    _TB,
+    _TCOUNT,
+    _VCOUNT,
+    _normalization_forms,
+)
+
+__all__ = [
+    "normalize_array",
+]
+
+# Number of Unicode code points
+_CODESPACE = 0x110000
+
+# Dictionary mapping normalization forms to the dense lookup tables used by
+# the vectorized engine, computed on first use
+_TABLES_BY_FORM = {}
+
+
+def normalize_array(form, codepoints):
+    """Transform a batch of Unicode strings, held as a two-dimensional array
+    of code points with one string per row, into the normalization form
+    `form`. Rows shorter than the array are padded at the end with zeros.
+    This requires NumPy.
+
+    The quick check is computed for the whole batch at once, with vectorized
+    lookups in dense tables. Characters whose full decomposition is a single
+    code point, and Hangul syllables for the decomposed forms, are also
+    mapped in bulk. Only the rows which still fail the quick check after that,
+    such as rows needing canonical reordering or composition, are normalized
+    one by one.
+
+    Args:
+        form (str): The normalization form to apply, one of "NFC", "NFD",
+            "NFKC", "NFKD", "FCC", or "NFKC_CF".
+
+        codepoints (array_like): The two-dimensional array of code points.
+
+    Returns:
+        numpy.ndarray: The two-dimensional array of normalized code points,
+            of type uint32, padded at the end of each row with zeros.
+
+    Raises:
+        ImportError: If NumPy is not available.
+
+        ValueError: If `codepoints` is not two-dimensional.
+
+    Examples:
+
+        >>> batch = [[0x00C5, 0x212B], [0xAC01, 0]]
+        >>> normalize_array("NFD", batch).tolist()  # doctest: +SKIP
+        [[65, 778, 65, 778], [4352, 4449, 4520, 0]]
+
+    """
+    if np is None:
+        raise ImportError("normalize_array() requires NumPy")
+
+    a = np.asarray(codepoints, dtype=np.uint32)
+
+    if a.ndim != 2:
+        raise ValueError(f"expected a two-dimensional array, not {a.ndim}")
+
+    tables = _tables(form)
+    keys, values = tables[3:]
+
+    rows = np.flatnonzero(_quick_check_rows(a, tables))
+    result = a.copy()
+
+    if not len(rows):
+        return result
+
+    # Map characters with a single code point decomposition
+    mapped = a[rows]
+    i = np.searchsorted(keys, mapped)
+    hit = keys[np.minimum(i, len(keys) - 1)] == mapped
+    mapped[hit] = values[i[hit]]
+
+    # Decompose Hangul syllables arithmetically
+    if form not in _COMPOSED_FORMS:
+        mapped = _decompose_hangul_syllables(mapped)
+
+    # Rows still failing the quick check are normalized one by one
+    dirty = _quick_check_rows(mapped, tables)
+
+    func = _normalization_forms[form]
+    lengths = _row_lengths(a[rows[dirty]])
+    results = [
+        func("".join(map(chr, a[row, :n].tolist())))
+        for row, n in zip(rows[dirty].tolist(), lengths.tolist())
+    ]
+
+    width = max(result.shape[1], mapped.shape[1], *map(len, results))
+    if width > result.shape[1]:
+        result = np.pad(result, ((0, 0), (0, width - result.shape[1])))
+
+    result[rows] = 0
+    result[rows, : mapped.shape[1]] = mapped
+
+    for row, normalized in zip(rows[dirty].tolist(), results):
+        result[row] = 0
+        result[row, : len(normalized)] = [*map(ord, normalized)]
+
+    return result
+
+
+def _quick_check_rows(a, tables):
+    # Return a boolean array telling which rows of the array fail the quick
+    # check, either by containing a character with a quick check answer
+    # other than "Yes", or by having combining marks out of canonical order.
+
+    qc, lead_ccc, trail_ccc, _, _ = tables
+
+    dirty = qc[a].any(axis=1)
+
+    if a.shape[1] > 1:
+        dirty |= (lead_ccc[a[:, 1:]] < trail_ccc[a[:, :-1]]).any(axis=1)
+
+    return dirty
+
+
+def _tables(form):
+    # Return the dense quick check table, the dense lead and trail canonical
+    # combining class tables, and the sorted keys and values of the single
+    # code point decompositions for the given normalization form.
+
+    try:
+        return _TABLES_BY_FORM[form]
+    except KeyError:
+        pass
+
+    qc = np.zeros(_CODESPACE, dtype=bool)
+    qc[np.fromiter(_QUICK_CHECK_BY_FORM[form], dtype=np.int64)] = True
+
+    ccc_tables = []
+    for table in _QUICK_CHECK_CCC_BY_FORM.get(
+        form, (_NON_ZERO_CCC_TABLE, _NON_ZERO_CCC_TABLE)
+    ):
+        dense = np.zeros(_CODESPACE, dtype=np.uint8)
+        dense[np.fromiter(table, dtype=np.int64)] = [*table.values()]
+        ccc_tables.append(dense)
+
+    # Lead classes of zero never fail the quick check
+    lead_ccc, trail_ccc = ccc_tables
+    lead_ccc = np.where(lead_ccc == 0, np.uint8(255), lead_ccc)
+
+    if form == "NFKC_CF":
+        decomp = _FULL_CFDECOMP_BY_CHAR
+    elif form in _COMPATIBILITY_FORMS:
+        decomp = _FULL_KDECOMP_BY_CHAR
+    else:
+        decomp = _FULL_CDECOMP_BY_CHAR
+
+    # A single code point decomposition can be substituted for a character
+    # without changing the full decomposition of the string, unless it has
+    # another canonical combining class, like the NFKC_Casefold mapping of
+    # U+0345, which applies after canonical reordering
+    singletons = sorted(
+        (key, val[0]) for key, val in decomp.items()
+        if len(val) == 1 and val[0] not in decomp
+        and not _SB <= val[0] <= _SL
+        and _NON_ZERO_CCC_TABLE.get(key) == _NON_ZERO_CCC_TABLE.get(val[0])
+    )
+    keys = np.array([key for key, _ in singletons], dtype=np.uint32)
+    values = np.array([val for _, val in singletons], dtype=np.uint32)
+
+    tables = qc, lead_ccc, trail_ccc, keys, values
+    _TABLES_BY_FORM[form] = tables
+
+    return tables
+
+
+def _decompose_hangul_syllables(a):
+    # Return the array with every precomposed Hangul syllable replaced by its
+    # leading consonant, vowel, and trailing consonant, if any, each row being
+    # padded at the end with zeros.
+
+    syllable = (a >= _SB) & (a <= _SL)
+
+    if not syllable.any():
+        return a
+
+    sindex = a.astype(np.int64) - _SB
+    tindex = sindex % _TCOUNT
+    counts = np.where(syllable, np.where(tindex > 0, 3, 2), 1)
+
+    # Position of each element within the flattened result
+    flat_counts = counts.ravel()
+    starts = np.cumsum(flat_counts) - flat_counts
+    flat = np.repeat(a.ravel(), flat_counts)
+
+    s = syllable.ravel()
+    si = sindex.ravel()[s]
+    ti = tindex.ravel()[s]
+    pos = starts[s]
+    flat[pos] = _LB + si // (_VCOUNT * _TCOUNT)
+    flat[pos + 1] = _VB + (si % (_VCOUNT * _TCOUNT)) // _TCOUNT
+    has_t = ti > 0
+    flat[pos[has_t] + 2] = _TB - 1 + ti[has_t]
+
+    # Spread the flattened rows back into a two-dimensional array
+    row_lengths = counts.sum(axis=1)
+    row_starts = np.cumsum(row_lengths) - row_lengths
+    rows = np.repeat(np.arange(len(a)), row_lengths)
+    cols = np.arange(len(flat)) - np.repeat(row_starts, row_lengths)
+
+    result = np.zeros((len(a), row_lengths.max()), dtype=np.uint32)
+    result[rows, cols] = flat
+
+    return result
+
+
+def _row_lengths(a):
+    # Return the length of each row of the array, not counting the zeros
+    # padding its end.
+
+    nonzero = a != 0
+    last = np.argmax(nonzero[:, ::-1], axis=1)
+
+    return np.where(nonzero.any(axis=1), a.shape[1] - last, 0)
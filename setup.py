@@ -42,6 +42,10 @@ setup(
         "NFD",
         "NFKC",
         "NFKD",
+        "NFKC_CF",
+        "NFKC_Casefold",
+        "FCC",
+        "FCD",
         "Unicode Normalization Forms",
         "Canonical Ordering Algorithm",
         "Canonical Composition Algorithm",